@@ -0,0 +1,45 @@
+"""Add Copr build status check schedule
+
+The babysit task checks only the Copr builds whose next status check is due.
+
+Revision ID: 3c1f9a27d5e4
+Revises: 846ecf4cb3c9
+Create Date: 2026-10-18 14:21:09.118734
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c1f9a27d5e4"
+down_revision = "846ecf4cb3c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "copr_build_targets",
+        sa.Column("next_status_check", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_copr_build_targets_next_status_check"),
+        "copr_build_targets",
+        ["next_status_check"],
+        unique=False,
+    )
+    # check the unfinished builds right away, they were checked by a periodic full scan
+    op.execute(
+        "UPDATE copr_build_targets SET next_status_check = now() at time zone 'utc' "
+        "WHERE build_id IS NOT NULL AND status IN ('pending', 'waiting_for_srpm')",
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_copr_build_targets_next_status_check"),
+        table_name="copr_build_targets",
+    )
+    op.drop_column("copr_build_targets", "next_status_check")
@@ -0,0 +1,127 @@
+"""Store packages configs once
+
+Project events reference the packages config by the hash of its content
+instead of storing a copy of it.
+
+Revision ID: 5d2b8e4f7a61
+Revises: a7e3c9d1f5b2
+Create Date: 2026-10-18 17:34:52.671209
+
+"""
+
+import hashlib
+import json
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d2b8e4f7a61"
+down_revision = "a7e3c9d1f5b2"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+project_events = sa.table(
+    "project_events",
+    sa.column("id", sa.Integer),
+    sa.column("packages_config", sa.JSON),
+    sa.column("packages_config_hash", sa.String),
+)
+packages_configs = sa.table(
+    "packages_configs",
+    sa.column("hash", sa.String),
+    sa.column("packages_config", sa.JSON),
+)
+
+
+def get_hash(packages_config: dict) -> str:
+    # same as PackagesConfigModel.get_hash
+    return hashlib.sha256(
+        json.dumps(packages_config, sort_keys=True, separators=(",", ":")).encode(),
+    ).hexdigest()
+
+
+def upgrade():
+    op.create_table(
+        "packages_configs",
+        sa.Column("hash", sa.String(), nullable=False),
+        sa.Column("packages_config", sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint("hash"),
+    )
+    op.add_column(
+        "project_events",
+        sa.Column("packages_config_hash", sa.String(), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_project_events_packages_config_hash"),
+        "project_events",
+        ["packages_config_hash"],
+        unique=False,
+    )
+    op.create_foreign_key(
+        "project_events_packages_config_hash_fkey",
+        "project_events",
+        "packages_configs",
+        ["packages_config_hash"],
+        ["hash"],
+        ondelete="SET NULL",
+    )
+
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(project_events.c.id, project_events.c.packages_config)
+            .where(
+                project_events.c.id > last_id,
+                project_events.c.packages_config.isnot(None),
+                sa.cast(project_events.c.packages_config, sa.Text) != "null",
+            )
+            .order_by(project_events.c.id)
+            .limit(BATCH_SIZE),
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        hashes = {row.id: get_hash(row.packages_config) for row in rows}
+        configs = {hashes[row.id]: row.packages_config for row in rows}
+        bind.execute(
+            postgresql.insert(packages_configs)
+            .values([{"hash": h, "packages_config": c} for h, c in configs.items()])
+            .on_conflict_do_nothing(),
+        )
+        bind.execute(
+            project_events.update()
+            .where(project_events.c.id == sa.bindparam("event_id"))
+            .values(packages_config_hash=sa.bindparam("config_hash")),
+            [{"event_id": id_, "config_hash": h} for id_, h in hashes.items()],
+        )
+
+    op.drop_column("project_events", "packages_config")
+
+
+def downgrade():
+    op.add_column(
+        "project_events",
+        sa.Column("packages_config", sa.JSON(), nullable=True),
+    )
+    op.execute(
+        "UPDATE project_events SET packages_config = packages_configs.packages_config "
+        "FROM packages_configs WHERE project_events.packages_config_hash = packages_configs.hash",
+    )
+    op.drop_constraint(
+        "project_events_packages_config_hash_fkey",
+        "project_events",
+        type_="foreignkey",
+    )
+    op.drop_index(
+        op.f("ix_project_events_packages_config_hash"),
+        table_name="project_events",
+    )
+    op.drop_column("project_events", "packages_config_hash")
+    op.drop_table("packages_configs")
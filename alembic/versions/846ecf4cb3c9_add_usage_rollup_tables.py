@@ -0,0 +1,89 @@
+"""Add usage rollup tables
+
+Hourly buckets of project events and jobs the usage statistics
+are computed from, filled by the update_usage_rollup task.
+
+Revision ID: 846ecf4cb3c9
+Revises: b705ac677052
+Create Date: 2026-10-18 10:12:41.503122
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "846ecf4cb3c9"
+down_revision = "b705ac677052"
+branch_labels = None
+depends_on = None
+
+project_event_model_type = postgresql.ENUM(
+    "pull_request",
+    "branch_push",
+    "release",
+    "issue",
+    "koji_build_tag",
+    "anitya_version",
+    "anitya_multiple_versions",
+    name="projecteventmodeltype",
+    create_type=False,
+)
+
+
+def upgrade():
+    op.create_table(
+        "project_event_usage",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("bucket", sa.DateTime(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("project_event_type", project_event_model_type, nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "bucket",
+            "project_event_type",
+            "event_id",
+            name="uq_project_event_usage_bucket_project_event_type_event_id",
+        ),
+    )
+    op.create_index(
+        op.f("ix_project_event_usage_project_id"),
+        "project_event_usage",
+        ["project_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "job_usage",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("bucket", sa.DateTime(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("project_event_type", project_event_model_type, nullable=False),
+        sa.Column("job_type", sa.String(), nullable=False),
+        sa.Column("job_runs", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "bucket",
+            "project_id",
+            "project_event_type",
+            "job_type",
+            name="uq_job_usage_bucket_project_id_project_event_type_job_type",
+        ),
+    )
+    op.create_index(op.f("ix_job_usage_project_id"), "job_usage", ["project_id"], unique=False)
+
+    # the rollup goes through the pipelines by their creation time
+    op.create_index(op.f("ix_pipelines_datetime"), "pipelines", ["datetime"], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_pipelines_datetime"), table_name="pipelines")
+
+    op.drop_index(op.f("ix_job_usage_project_id"), table_name="job_usage")
+    op.drop_table("job_usage")
+
+    op.drop_index(op.f("ix_project_event_usage_project_id"), table_name="project_event_usage")
+    op.drop_table("project_event_usage")
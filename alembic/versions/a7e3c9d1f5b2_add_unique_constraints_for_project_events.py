@@ -0,0 +1,228 @@
+"""Add unique constraints for project events
+
+Projects, project event objects and project events are inserted
+with `INSERT … ON CONFLICT DO NOTHING`, which needs unique constraints.
+The constraints treat NULLs as equal, so that rows with NULL identifiers
+conflict too. The duplicates created by concurrent workers are merged first.
+
+Revision ID: a7e3c9d1f5b2
+Revises: 3c1f9a27d5e4
+Create Date: 2026-10-18 16:02:47.385102
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7e3c9d1f5b2"
+down_revision = "3c1f9a27d5e4"
+branch_labels = None
+depends_on = None
+
+# project event objects: project event type, table and the columns identifying them
+PROJECT_EVENT_OBJECTS = (
+    ("pull_request", "pull_requests", ("pr_id", "project_id")),
+    ("branch_push", "git_branches", ("name", "project_id")),
+    ("release", "project_releases", ("tag_name", "project_id")),
+    ("issue", "project_issues", ("issue_id", "project_id")),
+    ("koji_build_tag", "koji_build_tags", ("task_id", "koji_tag_name", "project_id")),
+)
+
+# unique keys of the referencing tables and the columns summed when their rows are merged
+UNIQUE_KEYS = {
+    "job_usage": ((("bucket", "project_id", "project_event_type", "job_type"), ("job_runs",)),),
+    "project_event_usage": ((("bucket", "project_event_type", "event_id"), ()),),
+    "source_git_pr_dist_git_pr": (
+        (("source_git_pull_request_id",), ()),
+        (("dist_git_pull_request_id",), ()),
+    ),
+}
+
+
+def merge_colliding_rows(
+    table: str,
+    column: str,
+    condition: str,
+    key: tuple[str, ...],
+    summed: tuple[str, ...],
+):
+    """
+    Merge the rows which would violate the unique key once their references
+    point to the kept rows into the oldest one, summing the given columns.
+
+    Args:
+        table: Referencing table.
+        column: Column referencing the table with the duplicates.
+        condition: Additional condition for the referencing rows (or an empty string).
+        key: Columns of the unique key.
+        summed: Columns summed into the oldest row, e.g. counts of the rollups.
+    """
+    partition = ", ".join(
+        f"coalesce(duplicates.kept_id, {table}.{column})"
+        if key_column == column
+        else f"{table}.{key_column}"
+        for key_column in key
+    )
+    op.execute(
+        f"""
+        CREATE TEMPORARY TABLE colliding AS
+        SELECT id, kept_id FROM (
+            SELECT {table}.id, min({table}.id) OVER (PARTITION BY {partition}) AS kept_id
+            FROM {table}
+            LEFT JOIN duplicates ON duplicates.id = {table}.{column}
+            {f"AND {condition}" if condition else ""}
+            WHERE {" AND ".join(f"{table}.{key_column} IS NOT NULL" for key_column in key)}
+        ) AS rows
+        WHERE id != kept_id
+        """,
+    )
+    if summed:
+        op.execute(
+            f"""
+            UPDATE {table} SET {", ".join(f"{c} = {table}.{c} + merged.{c}" for c in summed)}
+            FROM (
+                SELECT colliding.kept_id, {", ".join(f"sum({table}.{c}) AS {c}" for c in summed)}
+                FROM colliding JOIN {table} ON {table}.id = colliding.id
+                GROUP BY colliding.kept_id
+            ) AS merged
+            WHERE {table}.id = merged.kept_id
+            """,
+        )
+    op.execute(f"DELETE FROM {table} USING colliding WHERE {table}.id = colliding.id")
+    op.execute("DROP TABLE colliding")
+
+
+def merge_duplicates(
+    table: str,
+    columns: tuple[str, ...],
+    references: list[tuple[str, str, str]],
+    array_references: tuple[tuple[str, str], ...] = (),
+):
+    """
+    Point the references of the duplicate rows to the oldest one and delete the duplicates.
+
+    The referencing rows which would violate their unique keys (see `UNIQUE_KEYS`)
+    by that are merged first.
+
+    Args:
+        table: Table with the duplicates.
+        columns: Columns identifying the duplicates.
+        references: Tables and columns referencing the table together with
+            an additional condition for the referencing rows (or an empty string).
+        array_references: Tables and array columns referencing the table.
+    """
+    op.execute(
+        f"""
+        CREATE TEMPORARY TABLE duplicates AS
+        SELECT id, kept_id FROM (
+            SELECT id, min(id) OVER (PARTITION BY {", ".join(columns)}) AS kept_id
+            FROM {table}
+        ) AS rows
+        WHERE id != kept_id
+        """,
+    )
+    for referencing_table, column, condition in references:
+        for key, summed in UNIQUE_KEYS.get(referencing_table, ()):
+            if column in key:
+                merge_colliding_rows(referencing_table, column, condition, key, summed)
+        op.execute(
+            f"UPDATE {referencing_table} SET {column} = duplicates.kept_id FROM duplicates "
+            f"WHERE {referencing_table}.{column} = duplicates.id"
+            + (f" AND {condition}" if condition else ""),
+        )
+    for referencing_table, column in array_references:
+        op.execute(
+            f"""
+            UPDATE {referencing_table} SET {column} = ARRAY(
+                SELECT coalesce(duplicates.kept_id, item)
+                FROM unnest({referencing_table}.{column}) WITH ORDINALITY AS items(item, position)
+                LEFT JOIN duplicates ON duplicates.id = item
+                ORDER BY position
+            )
+            WHERE {referencing_table}.{column} && ARRAY(SELECT id FROM duplicates)
+            """,
+        )
+    op.execute(f"DELETE FROM {table} USING duplicates WHERE {table}.id = duplicates.id")
+    op.execute("DROP TABLE duplicates")
+
+
+def get_foreign_keys_to(table: str) -> list[tuple[str, str, str]]:
+    inspector = sa.inspect(op.get_bind())
+    return [
+        (referencing_table, foreign_key["constrained_columns"][0], "")
+        for referencing_table in inspector.get_table_names()
+        for foreign_key in inspector.get_foreign_keys(referencing_table)
+        if foreign_key["referred_table"] == table
+    ]
+
+
+def upgrade():
+    # projects first, merging them can make duplicates of the project event objects
+    # and those of the project events
+    merge_duplicates(
+        "git_projects",
+        ("namespace", "repo_name", "project_url"),
+        [
+            *get_foreign_keys_to("git_projects"),
+            ("project_event_usage", "project_id", ""),
+            ("job_usage", "project_id", ""),
+        ],
+        # without a real foreign key
+        array_references=(("github_installations", "repositories"),),
+    )
+    op.create_unique_constraint(
+        "uq_git_projects_namespace_repo_name_project_url",
+        "git_projects",
+        ["namespace", "repo_name", "project_url"],
+        postgresql_nulls_not_distinct=True,
+    )
+
+    for project_event_type, table, columns in PROJECT_EVENT_OBJECTS:
+        merge_duplicates(
+            table,
+            columns,
+            [
+                *get_foreign_keys_to(table),
+                ("project_events", "event_id", f"project_events.type = '{project_event_type}'"),
+                (
+                    "project_event_usage",
+                    "event_id",
+                    f"project_event_usage.project_event_type = '{project_event_type}'",
+                ),
+            ],
+        )
+        op.create_unique_constraint(
+            f"uq_{table}_{'_'.join(columns)}",
+            table,
+            list(columns),
+            postgresql_nulls_not_distinct=True,
+        )
+
+    merge_duplicates(
+        "project_events",
+        ("type", "event_id", "commit_sha"),
+        get_foreign_keys_to("project_events"),
+    )
+    op.create_unique_constraint(
+        "uq_project_events_type_event_id_commit_sha",
+        "project_events",
+        ["type", "event_id", "commit_sha"],
+        postgresql_nulls_not_distinct=True,
+    )
+
+
+def downgrade():
+    op.drop_constraint(
+        "uq_project_events_type_event_id_commit_sha",
+        "project_events",
+        type_="unique",
+    )
+    for _, table, columns in reversed(PROJECT_EVENT_OBJECTS):
+        op.drop_constraint(f"uq_{table}_{'_'.join(columns)}", table, type_="unique")
+    op.drop_constraint(
+        "uq_git_projects_namespace_repo_name_project_url",
+        "git_projects",
+        type_="unique",
+    )
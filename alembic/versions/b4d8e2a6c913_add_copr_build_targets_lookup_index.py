@@ -0,0 +1,35 @@
+"""Add a covering index for the lookups of Copr project builds
+
+The builds of a Copr project for a target with a given status (e.g. the base
+builds for the OpenScanHub scans) are looked up for multiple commits at once.
+
+Revision ID: b4d8e2a6c913
+Revises: 5d2b8e4f7a61
+Create Date: 2026-10-18 19:12:36.540218
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b4d8e2a6c913"
+down_revision = "5d2b8e4f7a61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_copr_build_targets_project_name_owner_target_status",
+        "copr_build_targets",
+        ["project_name", "owner", "target", "status"],
+        unique=False,
+        postgresql_include=["copr_build_group_id"],
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_copr_build_targets_project_name_owner_target_status",
+        table_name="copr_build_targets",
+    )
@@ -0,0 +1,132 @@
+"""Add composite indexes for the lookups by the commit SHA
+
+The builds and test runs are looked up by the commit SHA (and project name,
+target, ...) through the project events, pipelines and groups, the indexes
+cover the columns used on each step of the joins. The single-column indexes
+become prefixes of the composite ones and are dropped.
+
+Revision ID: c7e1f3a9d204
+Revises: b4d8e2a6c913
+Create Date: 2026-10-18 21:04:52.118364
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c7e1f3a9d204"
+down_revision = "b4d8e2a6c913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_project_events_commit_sha_id",
+        "project_events",
+        ["commit_sha", "id"],
+        unique=False,
+    )
+    op.drop_index("ix_project_events_commit_sha", table_name="project_events")
+
+    op.create_index(
+        "ix_pipelines_project_event_id_copr_build_group_id",
+        "pipelines",
+        ["project_event_id", "copr_build_group_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_pipelines_project_event_id_koji_build_group_id",
+        "pipelines",
+        ["project_event_id", "koji_build_group_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_pipelines_project_event_id_test_run_group_id",
+        "pipelines",
+        ["project_event_id", "test_run_group_id"],
+        unique=False,
+    )
+    op.drop_index("ix_pipelines_project_event_id", table_name="pipelines")
+
+    op.create_index(
+        "ix_copr_build_targets_copr_build_group_id_project_name_target",
+        "copr_build_targets",
+        ["copr_build_group_id", "project_name", "target"],
+        unique=False,
+    )
+    op.drop_index("ix_copr_build_targets_copr_build_group_id", table_name="copr_build_targets")
+
+    op.create_index(
+        "ix_koji_build_targets_koji_build_group_id_target",
+        "koji_build_targets",
+        ["koji_build_group_id", "target"],
+        unique=False,
+    )
+
+    op.create_index(
+        "ix_tft_test_run_targets_tft_test_run_group_id_target",
+        "tft_test_run_targets",
+        ["tft_test_run_group_id", "target"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_tft_test_run_targets_tft_test_run_group_id",
+        table_name="tft_test_run_targets",
+    )
+
+
+def downgrade():
+    op.create_index(
+        "ix_tft_test_run_targets_tft_test_run_group_id",
+        "tft_test_run_targets",
+        ["tft_test_run_group_id"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_tft_test_run_targets_tft_test_run_group_id_target",
+        table_name="tft_test_run_targets",
+    )
+
+    op.drop_index(
+        "ix_koji_build_targets_koji_build_group_id_target",
+        table_name="koji_build_targets",
+    )
+
+    op.create_index(
+        "ix_copr_build_targets_copr_build_group_id",
+        "copr_build_targets",
+        ["copr_build_group_id"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_copr_build_targets_copr_build_group_id_project_name_target",
+        table_name="copr_build_targets",
+    )
+
+    op.create_index(
+        "ix_pipelines_project_event_id",
+        "pipelines",
+        ["project_event_id"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_pipelines_project_event_id_test_run_group_id",
+        table_name="pipelines",
+    )
+    op.drop_index(
+        "ix_pipelines_project_event_id_koji_build_group_id",
+        table_name="pipelines",
+    )
+    op.drop_index(
+        "ix_pipelines_project_event_id_copr_build_group_id",
+        table_name="pipelines",
+    )
+
+    op.create_index(
+        "ix_project_events_commit_sha",
+        "project_events",
+        ["commit_sha"],
+        unique=False,
+    )
+    op.drop_index("ix_project_events_commit_sha_id", table_name="project_events")
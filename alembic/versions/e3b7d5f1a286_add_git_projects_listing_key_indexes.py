@@ -0,0 +1,43 @@
+"""Add indexes backing the listings of the projects
+
+The projects are listed by the namespace (the ones without it last) and the ID,
+the pages requested by a cursor are looked up by comparing the same key.
+NULL is not comparable, so the key is made of expressions and so are
+the indexes.
+
+Revision ID: e3b7d5f1a286
+Revises: c7e1f3a9d204
+Create Date: 2026-10-19 09:12:37.482915
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e3b7d5f1a286"
+down_revision = "c7e1f3a9d204"
+branch_labels = None
+depends_on = None
+
+LISTING_KEY = [sa.text("(namespace IS NULL)"), sa.text("coalesce(namespace, '')"), "id"]
+
+
+def upgrade():
+    op.create_index(
+        "ix_git_projects_listing_key",
+        "git_projects",
+        LISTING_KEY,
+        unique=False,
+    )
+    op.create_index(
+        "ix_git_projects_instance_url_listing_key",
+        "git_projects",
+        ["instance_url", *LISTING_KEY],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_git_projects_instance_url_listing_key", table_name="git_projects")
+    op.drop_index("ix_git_projects_listing_key", table_name="git_projects")
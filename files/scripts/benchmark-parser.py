@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Replay the JSON fixtures from tests/data through the event parser
+and report per-event-type parse latency of the classifying dispatch
+(Parser.parse_event) compared to the previous linear probe of all parsers.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from packit_service.worker.parser import Parser
+
+# order in which Parser.parse_event used to probe all the parsers
+LINEAR_PROBE_ORDER = (
+    "parse_pr_event",
+    "parse_pull_request_comment_event",
+    "parse_issue_comment_event",
+    "parse_release_event",
+    "parse_github_push_event",
+    "parse_check_rerun_event",
+    "parse_installation_event",
+    "parse_testing_farm_results_event",
+    "parse_copr_event",
+    "parse_mr_event",
+    "parse_koji_task_event",
+    "parse_koji_build_event",
+    "parse_koji_build_tag_event",
+    "parse_merge_request_comment_event",
+    "parse_gitlab_issue_comment_event",
+    "parse_gitlab_commit_comment_event",
+    "parse_gitlab_push_event",
+    "parse_pipeline_event",
+    "parse_pagure_push_event",
+    "parse_pagure_pr_flag_event",
+    "parse_pagure_pull_request_comment_event",
+    "parse_new_hotness_update_event",
+    "parse_gitlab_release_event",
+    "parse_gitlab_tag_push_event",
+    "parse_anitya_version_update_event",
+    "parse_openscanhub_task_finished_event",
+    "parse_openscanhub_task_started_event",
+    "parse_commit_comment_event",
+    "parse_pagure_pull_request_event",
+    "parse_logdetective_analysis_event",
+)
+
+
+def parse_with_linear_probe(event: dict):
+    for name in LINEAR_PROBE_ORDER:
+        if response := getattr(Parser, name)(event):
+            return response
+    return None
+
+
+def load_events(data_dir: Path) -> dict[str, dict]:
+    events = {}
+    for path in sorted(data_dir.glob("**/*.json")):
+        event = json.loads(path.read_text())
+        if not isinstance(event, dict):
+            continue
+        # squash fedmsg messages the same way the listener does
+        if body := event.get("body") or event.get("msg"):
+            body["topic"] = event["topic"]
+            event = body
+        events[str(path.relative_to(data_dir))] = event
+    return events
+
+
+def measure(parse, event: dict, number: int) -> float:
+    """Return the average parse latency in microseconds."""
+    return timeit.timeit(lambda: parse(event), number=number) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "data_dir",
+        type=Path,
+        nargs="?",
+        default=Path(__file__).parents[2] / "tests" / "data",
+        help="Directory with the JSON fixtures. Defaults to tests/data.",
+    )
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=1000,
+        help="How many times to parse each event. Defaults to 1000.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'event':<60} {'parser':<40} {'before [us]':>12} {'after [us]':>12}")
+    for name, event in load_events(args.data_dir).items():
+        try:
+            parsers = Parser.get_parsers_for_event(event)
+            before = measure(parse_with_linear_probe, event, args.number)
+            after = measure(Parser.parse_event, event, args.number)
+        except Exception as ex:
+            print(f"{name:<60} failed to parse: {ex!r}")
+            continue
+        parser_names = ",".join(p.__name__.removeprefix("parse_") for p in parsers) or "-"
+        print(f"{name:<60} {parser_names[:40]:<40} {before:>12.1f} {after:>12.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,7 @@ from packit_service.worker.database module for manual DB cleanup.
 
 import argparse
 import sys
+from datetime import timedelta
 
 from packit_service.worker.database import delete_old_data
 
@@ -34,11 +35,34 @@ See get_pg_url() for details.
         help="Remove data older than this. For example: "
         "'1 year' or '6 months'. Defaults to '1 year'.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Number of rows deleted in a single transaction. "
+        "Defaults to DELETE_OLD_DATA_BATCH_SIZE env var or 1000.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count the rows to delete.",
+    )
+    parser.add_argument(
+        "--max-minutes",
+        type=int,
+        help="Stop after this number of minutes, the next run continues where this one ended.",
+    )
 
     args = parser.parse_args()
 
     try:
-        delete_old_data(age=args.age)
+        finished = delete_old_data(
+            age=args.age,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            max_duration=timedelta(minutes=args.max_minutes) if args.max_minutes else None,
+        )
+        if not finished:
+            print("Out of time, run the script again to delete the rest.")
         return 0
     except Exception as e:
         print(f"Error during cleanup: {e}")
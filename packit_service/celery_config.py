@@ -19,14 +19,16 @@ task_routes = {
     "task.babysit_vm_image_build": "long-running",
     "task.babysit_copr_build": "long-running",
     "packit_service.service.tasks.get_past_usage_data": "long-running",
-    "packit_service.service.tasks.get_usage_interval_data": "long-running",
+    # the intervals are computed in a single pass over the usage rollup, quick enough
+    "packit_service.service.tasks.get_usage_interval_data": "short-running",
 }
 
 # https://docs.celeryq.dev/en/stable/userguide/periodic-tasks.html
 beat_schedule = {
     "update-pending-copr-builds": {
         "task": "packit_service.worker.tasks.babysit_pending_copr_builds",
-        "schedule": 3600.0,
+        # only the builds whose check is due are checked
+        "schedule": 60.0,
         "options": {"queue": "long-running"},
     },
     "update-pending-tft-runs": {
@@ -49,6 +51,11 @@ beat_schedule = {
         "schedule": crontab(minute=0, hour=2),  # nightly at 2AM
         "options": {"queue": "long-running"},
     },
+    "update-usage-rollup": {
+        "task": "packit_service.worker.tasks.update_usage_rollup",
+        "schedule": 600.0,
+        "options": {"queue": "long-running"},
+    },
     "get_usage_statistics": {
         "task": "packit_service.worker.tasks.get_usage_statistics",
         "schedule": 10800.0,
@@ -124,6 +124,17 @@ class ServiceConfig(Config):
         logdetective_enabled: bool = False,
         logdetective_url: str = LOGDETECTIVE_PACKIT_SERVER_URL,
         logdetective_token: str = "",
+        package_config_cache_in_redis: bool = False,
+        db_pool_size: Optional[int] = None,
+        db_max_overflow: Optional[int] = None,
+        db_pool_recycle: Optional[int] = None,
+        db_pool_pre_ping: bool = True,
+        koji_build_submission_concurrency: int = 4,
+        sync_release_concurrency: int = 1,
+        repository_mirrors_path: Optional[str] = None,
+        repository_mirrors_disk_budget: int = 20,
+        srpm_cache_path: Optional[str] = None,
+        srpm_cache_disk_budget: int = 5,
         **kwargs,
     ):
         if "authentication" in kwargs:
@@ -219,6 +230,41 @@ class ServiceConfig(Config):
         # Token to be used with Log Detective interface server
         self.logdetective_token = logdetective_token
 
+        # Share the cache of parsed package configs among the workers through Redis,
+        # otherwise each worker caches them in memory only.
+        self.package_config_cache_in_redis = package_config_cache_in_redis
+
+        # Connection pool of the database engine: number of the kept connections
+        # (defaults to the worker concurrency, at least 5), how many more can be opened
+        # under load, after how many seconds the connections are reopened and whether
+        # the connections are tested (and reopened if broken) before being used.
+        self.db_pool_size = db_pool_size
+        self.db_max_overflow = db_max_overflow
+        self.db_pool_recycle = db_pool_recycle
+        self.db_pool_pre_ping = db_pool_pre_ping
+
+        # How many downstream Koji builds (for different dist-git branches)
+        # can be submitted at once.
+        self.koji_build_submission_concurrency = koji_build_submission_concurrency
+
+        # How many dist-git branches can be synced at once by propose-downstream
+        # and pull-from-upstream, each in its own worktree. If more than 1,
+        # the first branch is synced alone and the upstream archives it downloads
+        # are reused by the rest of the branches.
+        self.sync_release_concurrency = sync_release_concurrency
+
+        # Pool of bare mirrors of the cloned repositories, used instead of
+        # the repository cache if set, and the disk space (in GiB) the mirrors
+        # can take before the least recently used ones are removed.
+        self.repository_mirrors_path = repository_mirrors_path
+        self.repository_mirrors_disk_budget = repository_mirrors_disk_budget
+
+        # Cache of the SRPMs downloaded for the OpenScanHub scans (shared by the workers)
+        # and the disk space (in GiB) it can take before the least recently used SRPMs
+        # are removed.
+        self.srpm_cache_path = srpm_cache_path
+        self.srpm_cache_disk_budget = srpm_cache_disk_budget
+
     service_config = None
 
     def __repr__(self):
@@ -248,6 +294,17 @@ class ServiceConfig(Config):
             f"comment_command_prefix='{self.comment_command_prefix}', "
             f"redhat_api_refresh_token='{hide(self.redhat_api_refresh_token)}', "
             f"package_config_path_override='{self.package_config_path_override}', "
+            f"package_config_cache_in_redis='{self.package_config_cache_in_redis}', "
+            f"db_pool_size='{self.db_pool_size}', "
+            f"db_max_overflow='{self.db_max_overflow}', "
+            f"db_pool_recycle='{self.db_pool_recycle}', "
+            f"db_pool_pre_ping='{self.db_pool_pre_ping}', "
+            f"koji_build_submission_concurrency='{self.koji_build_submission_concurrency}', "
+            f"sync_release_concurrency='{self.sync_release_concurrency}', "
+            f"repository_mirrors_path='{self.repository_mirrors_path}', "
+            f"repository_mirrors_disk_budget='{self.repository_mirrors_disk_budget}', "
+            f"srpm_cache_path='{self.srpm_cache_path}', "
+            f"srpm_cache_disk_budget='{self.srpm_cache_disk_budget}', "
             f"logdetective_enabled='{self.logdetective_enabled}', "
             f"logdetective_url='{self.logdetective_url}', "
             f"fedora_ci_run_by_default='{self.fedora_ci_run_by_default}', "
@@ -60,6 +60,20 @@ TESTING_FARM_EXTRA_PARAM_MERGED_SUBTREES = (
     "settings",
 )
 TESTING_FARM_ARTIFACTS_KEY = "artifacts"
+# how many pending Testing Farm requests are polled at once in the babysit task
+TESTING_FARM_POLLING_CONCURRENCY = 20
+# timeout (in seconds) for getting the details of a single Testing Farm request
+TESTING_FARM_POLLING_TIMEOUT = 30
+# the catalog of the composes of a Testing Farm ranch is shared by the workers (via Redis),
+# it's refreshed after the TTL and a stale one is still used (while being refreshed
+# in the background) for the given time after that
+TESTING_FARM_COMPOSES_CACHE_TTL = 600  # 10 minutes
+TESTING_FARM_COMPOSES_CACHE_STALE_TTL = 3600  # 1 hour
+# how long one worker is allowed to refresh a stale catalog before another one can try
+TESTING_FARM_COMPOSES_REFRESH_TIMEOUT = 60
+
+# how many check statuses are set at once when reporting a batch of them
+STATUS_REPORTING_CONCURRENCY = 8
 
 ELN_PACKAGE_LIST = "https://tiny.distro.builders/view-all-source-package-name-list--view-eln.txt"
 ELN_EXTRAS_PACKAGE_LIST = (
@@ -149,15 +163,41 @@ BASE_RETRY_INTERVAL_IN_SECONDS_FOR_INTERNAL_ERRORS = 10
 # timeout/internal error. Nothing should hopefully run for 7 days.
 DEFAULT_JOB_TIMEOUT = 7 * 24 * 3600
 
+# Copr builds are checked by the babysit task according to a schedule stored in the DB,
+# the next check is planned when the build is expected to end (based on the average
+# duration of the recent builds in the same chroot) and backs off once it is overdue.
+COPR_BUILD_FIRST_CHECK_DELAY = timedelta(minutes=2)
+COPR_BUILD_CHECK_MIN_INTERVAL = timedelta(minutes=1)
+COPR_BUILD_CHECK_MAX_INTERVAL = timedelta(hours=1)
+# expected duration of builds in chroots without any recent builds
+COPR_BUILD_DEFAULT_DURATION = timedelta(minutes=15)
+# how many of the latest builds the expected durations are computed from
+COPR_BUILD_DURATION_SAMPLE = 10000
+COPR_BUILD_DURATION_TTL = 3600  # 1 hour
+# how many due builds are checked at once and for how long they are not picked again
+COPR_BUILD_CHECK_BATCH = 100
+COPR_BUILD_CHECK_LEASE = timedelta(minutes=10)
+# how many Copr builds are checked concurrently
+COPR_BUILD_CHECK_CONCURRENCY = 10
+
 # SRPM builds older than this number of days are considered
 # outdated and their logs can be discarded.
 SRPMBUILDS_OUTDATED_AFTER_DAYS = 30
 
 PACKAGE_CONFIGS_OUTDATED_AFTER_DAYS = 1
 
+# Parsed package configs are cached per commit in each worker (and optionally in Redis)
+PACKAGE_CONFIG_CACHE_MAXSIZE = 1000
+PACKAGE_CONFIG_CACHE_TTL = 3600  # 1 hour
+
 # Pipelines older than this number of days are considered
 # outdated and can be deleted along with related data.
 PIPELINES_OUTDATED_AFTER_DAYS = 365
+# Old data are deleted in batches of this number of rows, each in its own transaction.
+DELETE_OLD_DATA_BATCH_SIZE = 1000
+# The nightly maintenance doesn't start new batches after this time,
+# the rest of the old data is deleted by the next run.
+DELETE_OLD_DATA_MAX_DURATION = timedelta(minutes=15)
 
 ALLOWLIST_CONSTANTS = {
     "approved_automatically": "approved_automatically",
@@ -173,6 +213,10 @@ CELERY_TASK_RATE_LIMITED_QUEUE = "rate-limited"
 RATE_LIMIT_THRESHOLD = 200
 # Jobs in rate-limited queue expire after 1 hour
 RATE_LIMITED_QUEUE_EXPIRES_SECONDS = 3600
+# How long a rate limit without a known reset time is trusted [s]
+RATE_LIMIT_BUDGET_UNKNOWN_RESET = 60
+# Weight of the latest measurement in the smoothed consumption of a rate limit budget
+RATE_LIMIT_BUDGET_CONSUMPTION_SMOOTHING = 0.3
 
 CELERY_DEFAULT_MAIN_TASK_NAME = "task.steve_jobs.process_message"
 
@@ -354,6 +398,19 @@ USAGE_PAST_MONTH_DATE_STR = (datetime.now() - timedelta(days=30)).strftime("%Y-%
 USAGE_PAST_YEAR_DATE_STR = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
 USAGE_DATE_IN_THE_PAST = USAGE_CURRENT_DATE.replace(year=USAGE_CURRENT_DATE.year - 100)
 USAGE_DATE_IN_THE_PAST_STR = USAGE_DATE_IN_THE_PAST.strftime("%Y-%m-%d")
+# the last rolled up hours of usage data are recomputed on each rollup
+# since jobs can be attached to already existing pipelines later on
+USAGE_ROLLUP_SETTLE_PERIOD = timedelta(days=1)
+# how much of the pipelines history is rolled up in a single transaction
+USAGE_ROLLUP_CHUNK = timedelta(days=7)
+
+# how many times to try getting or creating a database row, the rows inserted
+# by concurrent workers are visible only to the subsequent attempts
+GET_OR_CREATE_ATTEMPTS = 3
+
+# width of the first range of IDs the merged rows (e.g. builds for multiple chroots)
+# of a page of the API are looked up in, it's doubled until the page is filled
+MERGED_ROWS_ID_WINDOW = 1000
 
 OPEN_SCAN_HUB_FEATURE_DESCRIPTION = (
     ":warning: You can see the list of known issues and also provide your feedback"
@@ -362,6 +419,10 @@ OPEN_SCAN_HUB_FEATURE_DESCRIPTION = (
     "setting `osh_diff_scan_after_copr_build` to `false`. For more information, "
     f"see [docs]({DOCS_URL}/configuration#osh_diff_scan_after_copr_build)."
 )
+# how many commits of the target branch are searched for the base build at once
+OPEN_SCAN_HUB_BASE_BUILD_COMMITS_CHUNK = 100
+# how many times to try (resume) downloading an SRPM to the cache
+SRPM_CACHE_DOWNLOAD_ATTEMPTS = 3
 
 
 # Default URL of the logdetective-packit interface server for sending the Log Detective requests.
@@ -7,12 +7,16 @@ Data layer on top of PSQL using sqlalch
 
 import datetime as dt
 import enum
+import hashlib
+import json
 import logging
 import re
+import time
 from collections import Counter
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from os import getenv
 from typing import (
     TYPE_CHECKING,
@@ -25,44 +29,72 @@ from urllib.parse import urlparse
 from cachetools import TTLCache, cached
 from cachetools.func import ttl_cache
 from packit.config import JobConfigTriggerType
+from packit.exceptions import PackitException
 from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    ColumnElement,
     DateTime,
+    Engine,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Text,
+    UniqueConstraint,
     asc,
     case,
+    cast,
     create_engine,
     desc,
+    distinct,
+    false,
     func,
+    inspect,
+    literal,
     null,
     or_,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
 )
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.dialects.postgresql import array as psql_array
+from sqlalchemy.dialects.postgresql import insert as psql_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import (
-    Session as SQLASession,
-)
-from sqlalchemy.orm import (
+    Query,
+    aliased,
+    joinedload,
     relationship,
     scoped_session,
-    sessionmaker,
+    selectinload,
+)
+from sqlalchemy.orm import (
+    Session as SQLASession,
 )
-from sqlalchemy.sql.functions import count
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.types import ARRAY
 
-from packit_service.constants import ALLOWLIST_CONSTANTS
+from packit_service.config import ServiceConfig
+from packit_service.constants import (
+    ALLOWLIST_CONSTANTS,
+    GET_OR_CREATE_ATTEMPTS,
+    MERGED_ROWS_ID_WINDOW,
+    USAGE_ROLLUP_SETTLE_PERIOD,
+)
 
 logger = logging.getLogger(__name__)
 
 _CACHE_MAXSIZE = 100
 _CACHE_TTL = timedelta(hours=1).total_seconds()
+# namespaces approved/denied by other processes are picked up after this time
+_ALLOWLIST_CACHE_TTL = timedelta(minutes=1).total_seconds()
 
 
 def get_pg_url() -> str:
@@ -82,8 +114,6 @@ sqlalchemy_echo = getenv("SQLALCHEMY_ECHO", "False").lower() in (
     "y",
     "1",
 )
-engine = create_engine(get_pg_url(), echo=sqlalchemy_echo)
-Session = sessionmaker(bind=engine)
 
 
 def is_multi_threaded() -> bool:
@@ -91,15 +121,81 @@ def is_multi_threaded() -> bool:
     return getenv("POOL", "solo") in ("gevent", "eventlet") and int(getenv("CONCURRENCY", 1)) > 1
 
 
+class MonitoredQueuePool(QueuePool):
+    """
+    Connection pool keeping track of how long the checkouts waited for a connection
+    (either a free one or a newly opened one), exported by the Pushgateway.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_wait_time = 0.0
+        self.max_checkout_wait_time = 0.0
+
+    def _do_get(self):
+        start = time.monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            wait_time = time.monotonic() - start
+            self.checkouts += 1
+            self.checkout_wait_time += wait_time
+            self.max_checkout_wait_time = max(self.max_checkout_wait_time, wait_time)
+
+
+def get_engine_options() -> dict:
+    """
+    Options of the engine and its connection pool, configured in the service config.
+
+    Each task of a multi-(green)threaded worker uses its own session and thus
+    holds a connection while running, so the pool is by default as big
+    as the worker concurrency.
+    """
+    try:
+        config = ServiceConfig.get_service_config()
+    except PackitException:
+        # e.g. database migrations, use the defaults
+        config = ServiceConfig()
+
+    options = {
+        "echo": sqlalchemy_echo,
+        "poolclass": MonitoredQueuePool,
+        "pool_pre_ping": config.db_pool_pre_ping,
+        "pool_size": config.db_pool_size or max(5, int(getenv("CONCURRENCY", 1))),
+    }
+    if config.db_max_overflow is not None:
+        options["max_overflow"] = config.db_max_overflow
+    if config.db_pool_recycle is not None:
+        options["pool_recycle"] = config.db_pool_recycle
+    return options
+
+
+@cache
+def get_engine() -> Engine:
+    """
+    Get the engine of the database.
+
+    It's created on the first use rather than on import, so that its options
+    are taken from the service config loaded by then.
+    """
+    return create_engine(get_pg_url(), **get_engine_options())
+
+
+def create_session() -> SQLASession:
+    return SQLASession(bind=get_engine())
+
+
 if is_multi_threaded():
-    # Multi-(green)threaded workers can't use scoped_session()
-    # Downside of a single session is that if postgres is (oom)killed and a transaction
-    # fails to rollback you have to restart the workers so that they pick another session.
-    singleton_session = Session()
-    logger.debug("Going to use a single SQLAlchemy session.")
+    from greenlet import getcurrent
+
+    # Each greenlet (i.e. task) gets its own session, removed after the task
+    # is finished (see worker/tasks.py), so that a failed transaction
+    # (e.g. postgres got (oom)killed) doesn't break the other tasks.
+    Session = scoped_session(create_session, scopefunc=getcurrent)
+    logger.debug("Going to use a SQLAlchemy session per greenlet.")
 else:  # service/httpd
-    Session = scoped_session(Session)
-    singleton_session = None
+    Session = scoped_session(create_session)
 
 
 @contextmanager
@@ -115,8 +211,8 @@ def sa_session_transaction(commit: bool = False) -> SQLASession:
         commit: Whether to call `Session.commit()` upon exiting the context. Should be set to True
             if any changes are made within the context. Defaults to False.
     """
-    # if we use single session, use it, otherwise get a new session from registry
-    session = singleton_session or Session()
+    # get the session of this thread/greenlet from the registry
+    session = Session()
     try:
         yield session
         if commit:
@@ -127,6 +223,145 @@ def sa_session_transaction(commit: bool = False) -> SQLASession:
         raise
 
 
+def _get_or_insert_cte(name: str, model, identifiers: dict, index_elements: list, **values):
+    """
+    Build a CTE with the ID of the row of the `model` with the given identifiers.
+
+    The row is inserted unless it exists (`INSERT … ON CONFLICT DO NOTHING`), otherwise
+    it's looked up. The CTE is empty if the row was inserted by a concurrent transaction
+    that committed after the statement started (the row is not visible to it yet).
+
+    The unique constraint of the identifiers has to treat NULLs as equal
+    (`NULLS NOT DISTINCT`), otherwise a row with a NULL identifier never conflicts.
+
+    Args:
+        name: Name of the CTE.
+        model: Model of the row.
+        identifiers: Column names mapped to values (or SQL expressions, e.g. columns
+            of other CTEs) identifying the row.
+        index_elements: Columns (or expressions) of the unique index of the identifiers.
+        **values: Other values of the row, set only when it's inserted.
+
+    Returns:
+        CTE with a single `id` column.
+    """
+
+    def as_expression(column_name: str, value) -> ColumnElement:
+        if isinstance(value, ColumnElement):
+            return value
+        return literal(value, getattr(model, column_name).type)
+
+    columns = {**identifiers, **values}
+    inserted = (
+        psql_insert(model)
+        .from_select(
+            list(columns),
+            select(*(as_expression(column_name, value) for column_name, value in columns.items())),
+        )
+        .on_conflict_do_nothing(index_elements=index_elements)
+        .returning(model.id)
+        .cte(f"inserted_{name}")
+    )
+    existing = select(model.id).where(
+        *(getattr(model, column_name) == value for column_name, value in identifiers.items()),
+    )
+    return union_all(select(inserted.c.id), existing).limit(1).cte(name)
+
+
+def _get_or_create(model, row):
+    """
+    Get or create the row of the `model` using a single statement,
+    safe to be run by concurrent workers.
+
+    Args:
+        model: Model of the row.
+        row: CTE with the ID of the row, see `_get_or_insert_cte`.
+
+    Returns:
+        The model instance.
+    """
+    (instance,) = _get_or_create_all((model, row))
+    return instance
+
+
+def _get_or_create_all(*models_and_rows) -> tuple:
+    """
+    Get or create rows of multiple models (e.g. depending on each other)
+    using a single statement, safe to be run by concurrent workers.
+
+    Args:
+        *models_and_rows: Models of the rows and CTEs with their IDs,
+            see `_get_or_insert_cte`.
+
+    Returns:
+        The model instances in the same order.
+    """
+    rows = [row for _, row in models_and_rows]
+    # each of the CTEs has at most one row, a row is returned only if each of them has one
+    joined = rows[0]
+    for row in rows[1:]:
+        joined = joined.join(row, true())
+    statement = select(*(row.c.id for row in rows)).select_from(joined)
+    for _ in range(GET_OR_CREATE_ATTEMPTS):
+        with sa_session_transaction(commit=True) as session:
+            if ids := session.execute(statement).first():
+                return tuple(
+                    session.get(model, id_) for (model, _), id_ in zip(models_and_rows, ids)
+                )
+
+    names = ", ".join(model.__name__ for model, _ in models_and_rows)
+    raise PackitException(f"Failed to get or create {names}.")
+
+
+def _get_merged_page(
+    query: Query,
+    id_column: ColumnElement,
+    in_range: Callable[[int, int], ColumnElement],
+    before: Optional[int],
+    count: int,
+) -> list:
+    """
+    Get a page of the merged rows (e.g. builds for multiple chroots) ordered by
+    the lowest ID of the rows merged, descending, without aggregating the whole table.
+
+    The merged rows are looked up in the ranges of IDs below `before`, starting
+    with `MERGED_ROWS_ID_WINDOW` wide one and doubling it until the page is filled.
+    Only the merged rows with the lowest ID within the range are taken from it,
+    the rest of them follow in the lower ranges.
+
+    Args:
+        query: Query of the merged rows (grouped).
+        id_column: ID of the rows.
+        in_range: Condition selecting the rows of the merged rows with any row
+            with the ID within the given range (inclusive lower, exclusive upper bound).
+        before: Lowest ID of the last merged row of the previous page,
+            `None` for the first page.
+        count: Number of the merged rows on the page.
+
+    Returns:
+        The merged rows.
+    """
+    with sa_session_transaction() as session:
+        lowest_id, highest_id = session.query(func.min(id_column), func.max(id_column)).one()
+    if lowest_id is None:
+        return []
+
+    top = highest_id + 1 if before is None else min(before, highest_id + 1)
+    window = MERGED_ROWS_ID_WINDOW
+    merged: list = []
+    while len(merged) < count and top > lowest_id:
+        bottom = top - window
+        merged.extend(
+            query.filter(in_range(bottom, top))
+            .having(func.min(id_column) >= bottom, func.min(id_column) < top)
+            .order_by(desc(func.min(id_column)))
+            .limit(count - len(merged)),
+        )
+        top = bottom
+        window *= 2
+    return merged
+
+
 def optional_time(
     datetime_object: Union[datetime, None],
     fmt: str = "%d/%m/%Y %H:%M:%S",
@@ -348,8 +583,41 @@ class ProjectAndEventsConnector:
     to share methods for accessing project and project events models.
     """
 
+    id: Column[int]
     runs: Optional[list["PipelineModel"]]
 
+    @classmethod
+    def get_by_ids(
+        cls, ids: Iterable[int], *relationships
+    ) -> dict[int, "ProjectAndEventsConnector"]:
+        """
+        Get the models with the given IDs using a single query.
+
+        The pipelines together with their project events and the given
+        relationships (e.g. `CoprBuildGroupModel.copr_build_targets`) are loaded
+        eagerly so that accessing them does not query the database again.
+
+        Args:
+            ids: IDs of the models.
+            *relationships: Relationships of the model to load eagerly.
+
+        Returns:
+            Dictionary mapping the ID to the model.
+        """
+        if not (ids := set(ids)):
+            return {}
+
+        with sa_session_transaction() as session:
+            return {
+                model.id: model
+                for model in session.query(cls)
+                .filter(cls.id.in_(ids))
+                .options(
+                    selectinload(cls.runs).joinedload(PipelineModel.project_event),
+                    *(selectinload(relationship_) for relationship_ in relationships),
+                )
+            }
+
     def get_project_event_model(self) -> Optional["ProjectEventModel"]:
         return self.runs[0].project_event if self.runs else None
 
@@ -600,6 +868,15 @@ class AnityaVersionModel(BuildsAndTestsConnector, Base):
 
 class GitProjectModel(Base):
     __tablename__ = "git_projects"
+    __table_args__ = (
+        UniqueConstraint(
+            "namespace",
+            "repo_name",
+            "project_url",
+            name="uq_git_projects_namespace_repo_name_project_url",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
     id = Column(Integer, primary_key=True)
     # github.com/NAMESPACE/REPO_NAME
     namespace = Column(String, index=True)
@@ -634,6 +911,17 @@ class GitProjectModel(Base):
             self.onboarded_downstream = onboarded
             session.add(self)
 
+    @classmethod
+    def get_or_insert_cte(cls, namespace: str, repo_name: str, project_url: str):
+        """CTE with the ID of the project, inserted unless it exists."""
+        return _get_or_insert_cte(
+            "project",
+            GitProjectModel,
+            {"namespace": namespace, "repo_name": repo_name, "project_url": project_url},
+            ["namespace", "repo_name", "project_url"],
+            instance_url=urlparse(project_url).hostname,
+        )
+
     @classmethod
     def get_or_create(
         cls,
@@ -641,24 +929,14 @@ class GitProjectModel(Base):
         repo_name: str,
         project_url: str,
     ) -> "GitProjectModel":
-        with sa_session_transaction(commit=True) as session:
-            project = (
-                session.query(GitProjectModel)
-                .filter_by(
-                    namespace=namespace,
-                    repo_name=repo_name,
-                    project_url=project_url,
-                )
-                .first()
-            )
-            if not project:
-                project = cls(
-                    repo_name=repo_name,
-                    namespace=namespace,
-                    project_url=project_url,
-                )
-                session.add(project)
-            return project
+        return _get_or_create(
+            GitProjectModel,
+            cls.get_or_insert_cte(
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            ),
+        )
 
     @classmethod
     def get_all(cls) -> Iterable["GitProjectModel"]:
@@ -673,29 +951,69 @@ class GitProjectModel(Base):
             return session.query(GitProjectModel).filter_by(id=id_).first()
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["GitProjectModel"]:
+    def get_project_urls(cls, ids: Iterable[int]) -> dict[int, str]:
+        """Get the URLs of the projects with the given IDs using a single query."""
+        if not (ids := set(ids)):
+            return {}
+
         with sa_session_transaction() as session:
-            return (
-                session.query(GitProjectModel)
-                .order_by(GitProjectModel.namespace)
-                .slice(first, last)
+            return dict(
+                session.query(GitProjectModel.id, GitProjectModel.project_url).filter(
+                    GitProjectModel.id.in_(ids)
+                ),
             )
 
+    @classmethod
+    def listing_key(cls) -> tuple[ColumnElement, ...]:
+        """
+        Key the projects are listed by: the namespace with the projects without it last
+        (the same as ordering by the namespace) and the ID. None of its values is NULL,
+        so it can be compared with the cursor of a page.
+        """
+        return (cls.namespace.is_(None), func.coalesce(cls.namespace, ""), cls.id)
+
+    def get_listing_key(self) -> tuple:
+        """Value of the `listing_key` of this project."""
+        return self.namespace is None, self.namespace or "", self.id
+
+    @classmethod
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        after: Optional[tuple[bool, str, int]] = None,
+    ) -> Iterable["GitProjectModel"]:
+        """
+        Return projects ordered by the namespace (the ones without it last).
+
+        Args:
+            first: Index of the first project.
+            last: Index after the last project.
+            after: Listing key (see `listing_key`) of the project the returned
+                ones follow, the indices are relative to it.
+        """
+        key = cls.listing_key()
+        with sa_session_transaction() as session:
+            query = session.query(GitProjectModel).order_by(*key)
+            if after:
+                query = query.filter(tuple_(*key) > after)
+            return query.slice(first, last)
+
     @classmethod
     def get_by_forge(
         cls,
         first: int,
         last: int,
         forge: str,
+        after: Optional[tuple[bool, str, int]] = None,
     ) -> Iterable["GitProjectModel"]:
-        """Return projects of given forge"""
+        """Return projects of given forge, see `get_range`"""
+        key = cls.listing_key()
         with sa_session_transaction() as session:
-            return (
-                session.query(GitProjectModel)
-                .filter_by(instance_url=forge)
-                .order_by(GitProjectModel.namespace)
-                .slice(first, last)
-            )
+            query = session.query(GitProjectModel).filter_by(instance_url=forge).order_by(*key)
+            if after:
+                query = query.filter(tuple_(*key) > after)
+            return query.slice(first, last)
 
     @classmethod
     def get_by_forge_namespace(
@@ -915,44 +1233,16 @@ class GitProjectModel(Base):
         Get the number of projects (at least one pipeline during the time period)
         per each GIT instances.
         """
-        projects_per_instance: dict[str, set[str]] = {}
-
         with sa_session_transaction() as session:
-            for project_event_type in ProjectEventModelType:
-                project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
-                query = (
-                    session.query(
-                        GitProjectModel.instance_url,
-                        GitProjectModel.project_url,
-                    )
-                    .join(
-                        project_event_model,
-                        GitProjectModel.id == project_event_model.project_id,
-                    )
-                    .join(
-                        ProjectEventModel,
-                        ProjectEventModel.event_id == project_event_model.id,
-                    )
-                    .join(
-                        PipelineModel,
-                        PipelineModel.project_event_id == ProjectEventModel.id,
-                    )
-                    .filter(ProjectEventModel.type == project_event_type)
-                )
-                if datetime_from:
-                    query = query.filter(PipelineModel.datetime >= datetime_from)
-                if datetime_to:
-                    query = query.filter(PipelineModel.datetime <= datetime_to)
-
-                query = query.group_by(
-                    GitProjectModel.project_url,
-                    GitProjectModel.instance_url,
-                )
-                for instance, project in query.all():
-                    projects_per_instance.setdefault(instance, set())
-                    projects_per_instance[instance].add(project)
-
-        return {instance: len(projects) for instance, projects in projects_per_instance.items()}
+            query = session.query(
+                GitProjectModel.instance_url,
+                func.count(distinct(GitProjectModel.project_url)),
+            ).join(
+                ProjectEventUsageModel,
+                GitProjectModel.id == ProjectEventUsageModel.project_id,
+            )
+            query = _filter_usage_buckets(query, ProjectEventUsageModel, datetime_from, datetime_to)
+            return dict(query.group_by(GitProjectModel.instance_url).all())
 
     @classmethod
     @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
@@ -992,45 +1282,18 @@ class GitProjectModel(Base):
         Order from the highest numbers.
         All if `top` not set, the first `top` projects returned otherwise.
         """
-        project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
+        events_handled = func.count(distinct(ProjectEventUsageModel.event_id))
         with sa_session_transaction() as session:
             query = (
-                session.query(
-                    GitProjectModel.project_url,
-                    count(project_event_model.id).over(
-                        partition_by=GitProjectModel.project_url,
-                    ),
-                )
+                session.query(GitProjectModel.project_url, events_handled)
                 .join(
-                    project_event_model,
-                    GitProjectModel.id == project_event_model.project_id,
-                )
-                .join(
-                    ProjectEventModel,
-                    ProjectEventModel.event_id == project_event_model.id,
-                )
-                .join(
-                    PipelineModel,
-                    PipelineModel.project_event_id == ProjectEventModel.id,
-                )
-                .filter(ProjectEventModel.type == project_event_type)
-            )
-            if datetime_from:
-                query = query.filter(PipelineModel.datetime >= datetime_from)
-            if datetime_to:
-                query = query.filter(PipelineModel.datetime <= datetime_to)
-
-            query = (
-                query.group_by(GitProjectModel.project_url, project_event_model.id)
-                .distinct()
-                .order_by(
-                    desc(
-                        count(project_event_model.id).over(
-                            partition_by=GitProjectModel.project_url,
-                        ),
-                    ),
+                    ProjectEventUsageModel,
+                    GitProjectModel.id == ProjectEventUsageModel.project_id,
                 )
+                .filter(ProjectEventUsageModel.project_event_type == project_event_type)
             )
+            query = _filter_usage_buckets(query, ProjectEventUsageModel, datetime_from, datetime_to)
+            query = query.group_by(GitProjectModel.project_url).order_by(desc(events_handled))
 
             if top:
                 query = query.limit(top)
@@ -1098,54 +1361,20 @@ class GitProjectModel(Base):
         Order from the highest numbers.
         All if `top` not set, the first `top` projects returned otherwise.
         """
-        project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
-        pipeline_attribute = {
-            SRPMBuildModel: PipelineModel.srpm_build_id,
-            CoprBuildGroupModel: PipelineModel.copr_build_group_id,
-            KojiBuildGroupModel: PipelineModel.koji_build_group_id,
-            VMImageBuildTargetModel: PipelineModel.vm_image_build_id,
-            TFTTestRunGroupModel: PipelineModel.test_run_group_id,
-            SyncReleaseModel: PipelineModel.sync_release_run_id,
-            LogDetectiveRunGroupModel: PipelineModel.log_detective_run_group_id,
-        }[job_result_model]
-
+        job_runs = func.sum(JobUsageModel.job_runs)
         with sa_session_transaction() as session:
             query = (
-                session.query(
-                    GitProjectModel.project_url,
-                    count(job_result_model.id).over(
-                        partition_by=GitProjectModel.project_url,
-                    ),
-                )
-                .join(
-                    project_event_model,
-                    GitProjectModel.id == project_event_model.project_id,
-                )
-                .join(
-                    ProjectEventModel,
-                    ProjectEventModel.event_id == project_event_model.id,
-                )
-                .join(
-                    PipelineModel,
-                    PipelineModel.project_event_id == ProjectEventModel.id,
+                session.query(GitProjectModel.project_url, job_runs)
+                .join(JobUsageModel, GitProjectModel.id == JobUsageModel.project_id)
+                .filter(
+                    JobUsageModel.project_event_type == project_event_type,
+                    JobUsageModel.job_type == job_result_model.__tablename__,
                 )
-                .join(job_result_model, job_result_model.id == pipeline_attribute)
-                .filter(ProjectEventModel.type == project_event_type)
             )
-            if datetime_from:
-                query = query.filter(PipelineModel.datetime >= datetime_from)
-            if datetime_to:
-                query = query.filter(PipelineModel.datetime <= datetime_to)
+            query = _filter_usage_buckets(query, JobUsageModel, datetime_from, datetime_to)
             return dict(
-                query.group_by(GitProjectModel.project_url, job_result_model.id)
-                .distinct()
-                .order_by(
-                    desc(
-                        count(job_result_model.id).over(
-                            partition_by=GitProjectModel.project_url,
-                        ),
-                    ),
-                )
+                query.group_by(GitProjectModel.project_url)
+                .order_by(desc(job_runs))
                 .limit(top)
                 .all(),
             )
@@ -1201,6 +1430,15 @@ class GitProjectModel(Base):
         )
 
 
+# back the listings of the projects (and their pages by cursors), see `listing_key`
+Index("ix_git_projects_listing_key", *GitProjectModel.listing_key())
+Index(
+    "ix_git_projects_instance_url_listing_key",
+    GitProjectModel.instance_url,
+    *GitProjectModel.listing_key(),
+)
+
+
 sync_release_pr_association_table = Table(
     "sync_release_pr_association",
     Base.metadata,  # type: ignore
@@ -1307,6 +1545,14 @@ class SyncReleasePullRequestModel(Base):
 
 class PullRequestModel(BuildsAndTestsConnector, Base):
     __tablename__ = "pull_requests"
+    __table_args__ = (
+        UniqueConstraint(
+            "pr_id",
+            "project_id",
+            name="uq_pull_requests_pr_id_project_id",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
     id = Column(Integer, primary_key=True)  # our database PK
     # GitHub PR ID
     # this is not our PK b/c:
@@ -1320,6 +1566,27 @@ class PullRequestModel(BuildsAndTestsConnector, Base):
     job_config_trigger_type = JobConfigTriggerType.pull_request
     project_event_model_type = ProjectEventModelType.pull_request
 
+    @classmethod
+    def get_or_insert_cte(
+        cls,
+        pr_id: int,
+        namespace: str,
+        repo_name: str,
+        project_url: str,
+    ):
+        """CTE with the ID of the pull request, inserted (with its project) unless it exists."""
+        project = GitProjectModel.get_or_insert_cte(
+            namespace=namespace,
+            repo_name=repo_name,
+            project_url=project_url,
+        )
+        return _get_or_insert_cte(
+            "pull_request",
+            PullRequestModel,
+            {"pr_id": pr_id, "project_id": project.c.id},
+            ["pr_id", "project_id"],
+        )
+
     @classmethod
     def get_or_create(
         cls,
@@ -1328,23 +1595,15 @@ class PullRequestModel(BuildsAndTestsConnector, Base):
         repo_name: str,
         project_url: str,
     ) -> "PullRequestModel":
-        with sa_session_transaction(commit=True) as session:
-            project = GitProjectModel.get_or_create(
+        return _get_or_create(
+            PullRequestModel,
+            cls.get_or_insert_cte(
+                pr_id=pr_id,
                 namespace=namespace,
                 repo_name=repo_name,
                 project_url=project_url,
-            )
-            pr = (
-                session.query(PullRequestModel)
-                .filter_by(pr_id=pr_id, project_id=project.id)
-                .first()
-            )
-            if not pr:
-                pr = PullRequestModel()
-                pr.pr_id = pr_id
-                pr.project_id = project.id
-                session.add(pr)
-            return pr
+            ),
+        )
 
     @classmethod
     def get(
@@ -1377,6 +1636,14 @@ class PullRequestModel(BuildsAndTestsConnector, Base):
 
 class IssueModel(BuildsAndTestsConnector, Base):
     __tablename__ = "project_issues"
+    __table_args__ = (
+        UniqueConstraint(
+            "issue_id",
+            "project_id",
+            name="uq_project_issues_issue_id_project_id",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
     id = Column(Integer, primary_key=True)  # our database PK
     issue_id = Column(Integer, index=True)
     project_id = Column(Integer, ForeignKey("git_projects.id"), index=True)
@@ -1385,6 +1652,27 @@ class IssueModel(BuildsAndTestsConnector, Base):
     job_config_trigger_type = JobConfigTriggerType.release
     project_event_model_type = ProjectEventModelType.issue
 
+    @classmethod
+    def get_or_insert_cte(
+        cls,
+        issue_id: int,
+        namespace: str,
+        repo_name: str,
+        project_url: str,
+    ):
+        """CTE with the ID of the issue, inserted (with its project) unless it exists."""
+        project = GitProjectModel.get_or_insert_cte(
+            namespace=namespace,
+            repo_name=repo_name,
+            project_url=project_url,
+        )
+        return _get_or_insert_cte(
+            "issue",
+            IssueModel,
+            {"issue_id": issue_id, "project_id": project.c.id},
+            ["issue_id", "project_id"],
+        )
+
     @classmethod
     def get_or_create(
         cls,
@@ -1393,23 +1681,15 @@ class IssueModel(BuildsAndTestsConnector, Base):
         repo_name: str,
         project_url: str,
     ) -> "IssueModel":
-        with sa_session_transaction(commit=True) as session:
-            project = GitProjectModel.get_or_create(
+        return _get_or_create(
+            IssueModel,
+            cls.get_or_insert_cte(
+                issue_id=issue_id,
                 namespace=namespace,
                 repo_name=repo_name,
                 project_url=project_url,
-            )
-            issue = (
-                session.query(IssueModel)
-                .filter_by(issue_id=issue_id, project_id=project.id)
-                .first()
-            )
-            if not issue:
-                issue = IssueModel()
-                issue.issue_id = issue_id
-                issue.project_id = project.id
-                session.add(issue)
-            return issue
+            ),
+        )
 
     @classmethod
     def get_by_id(cls, id_: int) -> Optional["IssueModel"]:
@@ -1422,6 +1702,14 @@ class IssueModel(BuildsAndTestsConnector, Base):
 
 class GitBranchModel(BuildsAndTestsConnector, Base):
     __tablename__ = "git_branches"
+    __table_args__ = (
+        UniqueConstraint(
+            "name",
+            "project_id",
+            name="uq_git_branches_name_project_id",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
     id = Column(Integer, primary_key=True)  # our database PK
     name = Column(String)
     project_id = Column(Integer, ForeignKey("git_projects.id"), index=True)
@@ -1431,30 +1719,43 @@ class GitBranchModel(BuildsAndTestsConnector, Base):
     project_event_model_type = ProjectEventModelType.branch_push
 
     @classmethod
-    def get_or_create(
+    def get_or_insert_cte(
         cls,
         branch_name: str,
         namespace: str,
         repo_name: str,
         project_url: str,
-    ) -> "GitBranchModel":
-        with sa_session_transaction(commit=True) as session:
-            project = GitProjectModel.get_or_create(
-                namespace=namespace,
-                repo_name=repo_name,
-                project_url=project_url,
-            )
-            git_branch = (
-                session.query(GitBranchModel)
-                .filter_by(name=branch_name, project_id=project.id)
-                .first()
-            )
-            if not git_branch:
-                git_branch = GitBranchModel()
-                git_branch.name = branch_name
-                git_branch.project_id = project.id
-                session.add(git_branch)
-            return git_branch
+    ):
+        """CTE with the ID of the branch, inserted (with its project) unless it exists."""
+        project = GitProjectModel.get_or_insert_cte(
+            namespace=namespace,
+            repo_name=repo_name,
+            project_url=project_url,
+        )
+        return _get_or_insert_cte(
+            "git_branch",
+            GitBranchModel,
+            {"name": branch_name, "project_id": project.c.id},
+            ["name", "project_id"],
+        )
+
+    @classmethod
+    def get_or_create(
+        cls,
+        branch_name: str,
+        namespace: str,
+        repo_name: str,
+        project_url: str,
+    ) -> "GitBranchModel":
+        return _get_or_create(
+            GitBranchModel,
+            cls.get_or_insert_cte(
+                branch_name=branch_name,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            ),
+        )
 
     @classmethod
     def get_by_id(cls, id_: int) -> Optional["GitBranchModel"]:
@@ -1467,6 +1768,14 @@ class GitBranchModel(BuildsAndTestsConnector, Base):
 
 class ProjectReleaseModel(BuildsAndTestsConnector, Base):
     __tablename__ = "project_releases"
+    __table_args__ = (
+        UniqueConstraint(
+            "tag_name",
+            "project_id",
+            name="uq_project_releases_tag_name_project_id",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
     id = Column(Integer, primary_key=True)  # our database PK
     tag_name = Column(String)
     commit_hash = Column(String)
@@ -1476,6 +1785,29 @@ class ProjectReleaseModel(BuildsAndTestsConnector, Base):
     job_config_trigger_type = JobConfigTriggerType.release
     project_event_model_type = ProjectEventModelType.release
 
+    @classmethod
+    def get_or_insert_cte(
+        cls,
+        tag_name: str,
+        namespace: str,
+        repo_name: str,
+        project_url: str,
+        commit_hash: Optional[str] = None,
+    ):
+        """CTE with the ID of the release, inserted (with its project) unless it exists."""
+        project = GitProjectModel.get_or_insert_cte(
+            namespace=namespace,
+            repo_name=repo_name,
+            project_url=project_url,
+        )
+        return _get_or_insert_cte(
+            "project_release",
+            ProjectReleaseModel,
+            {"tag_name": tag_name, "project_id": project.c.id},
+            ["tag_name", "project_id"],
+            commit_hash=commit_hash,
+        )
+
     @classmethod
     def get_or_create(
         cls,
@@ -1485,24 +1817,16 @@ class ProjectReleaseModel(BuildsAndTestsConnector, Base):
         project_url: str,
         commit_hash: Optional[str] = None,
     ) -> "ProjectReleaseModel":
-        with sa_session_transaction(commit=True) as session:
-            project = GitProjectModel.get_or_create(
+        return _get_or_create(
+            ProjectReleaseModel,
+            cls.get_or_insert_cte(
+                tag_name=tag_name,
                 namespace=namespace,
                 repo_name=repo_name,
                 project_url=project_url,
-            )
-            project_release = (
-                session.query(ProjectReleaseModel)
-                .filter_by(tag_name=tag_name, project_id=project.id)
-                .first()
-            )
-            if not project_release:
-                project_release = ProjectReleaseModel()
-                project_release.tag_name = tag_name
-                project_release.project = project
-                project_release.commit_hash = commit_hash
-                session.add(project_release)
-            return project_release
+                commit_hash=commit_hash,
+            ),
+        )
 
     @classmethod
     def get_by_id(cls, id_: int) -> Optional["ProjectReleaseModel"]:
@@ -1515,6 +1839,15 @@ class ProjectReleaseModel(BuildsAndTestsConnector, Base):
 
 class KojiBuildTagModel(BuildsAndTestsConnector, Base):
     __tablename__ = "koji_build_tags"
+    __table_args__ = (
+        UniqueConstraint(
+            "task_id",
+            "koji_tag_name",
+            "project_id",
+            name="uq_koji_build_tags_task_id_koji_tag_name_project_id",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
     id = Column(Integer, primary_key=True)  # our database PK
     task_id = Column(String, index=True)
     koji_tag_name = Column(String, index=True)
@@ -1525,6 +1858,30 @@ class KojiBuildTagModel(BuildsAndTestsConnector, Base):
     job_config_trigger_type = JobConfigTriggerType.koji_build
     project_event_model_type = ProjectEventModelType.koji_build_tag
 
+    @classmethod
+    def get_or_insert_cte(
+        cls,
+        task_id: str,
+        koji_tag_name: str,
+        target: Optional[str],
+        namespace: str,
+        repo_name: str,
+        project_url: str,
+    ):
+        """CTE with the ID of the Koji build tag, inserted (with its project) unless it exists."""
+        project = GitProjectModel.get_or_insert_cte(
+            namespace=namespace,
+            repo_name=repo_name,
+            project_url=project_url,
+        )
+        return _get_or_insert_cte(
+            "koji_build_tag",
+            KojiBuildTagModel,
+            {"task_id": task_id, "koji_tag_name": koji_tag_name, "project_id": project.c.id},
+            ["task_id", "koji_tag_name", "project_id"],
+            target=target,
+        )
+
     @classmethod
     def get_or_create(
         cls,
@@ -1535,29 +1892,17 @@ class KojiBuildTagModel(BuildsAndTestsConnector, Base):
         repo_name: str,
         project_url: str,
     ) -> "KojiBuildTagModel":
-        with sa_session_transaction(commit=True) as session:
-            project = GitProjectModel.get_or_create(
+        return _get_or_create(
+            KojiBuildTagModel,
+            cls.get_or_insert_cte(
+                task_id=task_id,
+                koji_tag_name=koji_tag_name,
+                target=target,
                 namespace=namespace,
                 repo_name=repo_name,
                 project_url=project_url,
-            )
-            koji_build_tag = (
-                session.query(KojiBuildTagModel)
-                .filter_by(
-                    task_id=task_id,
-                    koji_tag_name=koji_tag_name,
-                    project_id=project.id,
-                )
-                .first()
-            )
-            if not koji_build_tag:
-                koji_build_tag = KojiBuildTagModel()
-                koji_build_tag.task_id = task_id
-                koji_build_tag.koji_tag_name = koji_tag_name
-                koji_build_tag.target = target
-                koji_build_tag.project_id = project.id
-                session.add(koji_build_tag)
-            return koji_build_tag
+            ),
+        )
 
     @classmethod
     def get_by_id(cls, id_: int) -> Optional["KojiBuildTagModel"]:
@@ -1595,6 +1940,65 @@ MODEL_FOR_PROJECT_EVENT: dict[
 }
 
 
+class PackagesConfigModel(Base):
+    """
+    Packages config (`.packit.yaml` with the defaults) stored only once
+    for all the project events using it, identified by the hash of its content.
+
+    Packages configs no longer referenced by any project event are deleted
+    periodically, see `delete_unreferenced`.
+    """
+
+    __tablename__ = "packages_configs"
+    # SHA-256 of the canonical JSON representation of the packages config
+    hash = Column(String, primary_key=True)
+    packages_config = Column(JSON)
+
+    @staticmethod
+    def get_hash(packages_config: dict) -> str:
+        return hashlib.sha256(
+            json.dumps(packages_config, sort_keys=True, separators=(",", ":")).encode(),
+        ).hexdigest()
+
+    @classmethod
+    def delete_unreferenced(cls) -> int:
+        """
+        Delete the packages configs not referenced by any project event.
+
+        The packages configs being referenced by a concurrent `set_packages_config`
+        are locked by it and skipped.
+
+        Returns:
+            Number of the deleted packages configs.
+        """
+        unreferenced = (
+            ~select(ProjectEventModel.id)
+            .where(ProjectEventModel.packages_config_hash == PackagesConfigModel.hash)
+            .exists()
+        )
+        with sa_session_transaction(commit=True) as session:
+            hashes = session.scalars(
+                select(PackagesConfigModel.hash)
+                .where(unreferenced)
+                .with_for_update(skip_locked=True),
+            ).all()
+            if not hashes:
+                return 0
+            # checked again by a new statement (seeing the references committed
+            # in the meantime), no new ones can be added to the locked rows
+            return session.execute(
+                inspect(PackagesConfigModel)
+                .local_table.delete()
+                .where(
+                    PackagesConfigModel.hash.in_(hashes),
+                    unreferenced,
+                ),
+            ).rowcount
+
+    def __repr__(self):
+        return f"PackagesConfigModel(hash={self.hash})"
+
+
 class ProjectEventModel(Base):
     """
     Model representing a "project event" which triggers some packit task.
@@ -1613,13 +2017,57 @@ class ProjectEventModel(Base):
     """
 
     __tablename__ = "project_events"
+    __table_args__ = (
+        # project events without a commit SHA (e.g. issues) are unique too
+        UniqueConstraint(
+            "type",
+            "event_id",
+            "commit_sha",
+            name="uq_project_events_type_event_id_commit_sha",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
     id = Column(Integer, primary_key=True)  # our database PK
     type = Column(Enum(ProjectEventModelType))
     event_id = Column(Integer, index=True)
-    commit_sha = Column(String, index=True)
-    packages_config = Column(JSON)
+    # indexed together with the ID, see `ix_project_events_commit_sha_id`
+    commit_sha = Column(String)
+    # packages configs are shared by the project events, see `packages_config`
+    packages_config_hash = Column(
+        String,
+        ForeignKey("packages_configs.hash", ondelete="SET NULL"),
+        index=True,
+    )
 
     runs = relationship("PipelineModel", back_populates="project_event")
+    stored_packages_config = relationship("PackagesConfigModel")
+
+    @classmethod
+    def _add_event(cls, model, row, commit_sha: Optional[str]) -> tuple:
+        """
+        Get or create the project event object together with its project
+        and project event using a single statement.
+
+        Args:
+            model: Model of the project event object.
+            row: CTE with the ID of the project event object,
+                e.g. `PullRequestModel.get_or_insert_cte`.
+            commit_sha: Commit SHA of the project event.
+
+        Returns:
+            Tuple of the project event object and the project event.
+        """
+        return _get_or_create_all(
+            (model, row),
+            (
+                ProjectEventModel,
+                cls.get_or_insert_cte(
+                    type=model.project_event_model_type,
+                    event_id=row.c.id,
+                    commit_sha=commit_sha,
+                ),
+            ),
+        )
 
     @classmethod
     def add_pull_request_event(
@@ -1630,18 +2078,16 @@ class ProjectEventModel(Base):
         project_url: str,
         commit_sha: str,
     ) -> tuple[PullRequestModel, "ProjectEventModel"]:
-        pull_request = PullRequestModel.get_or_create(
-            pr_id=pr_id,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=pull_request.project_event_model_type,
-            event_id=pull_request.id,
+        return cls._add_event(
+            PullRequestModel,
+            PullRequestModel.get_or_insert_cte(
+                pr_id=pr_id,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            ),
             commit_sha=commit_sha,
         )
-        return (pull_request, event)
 
     @classmethod
     def add_branch_push_event(
@@ -1652,18 +2098,16 @@ class ProjectEventModel(Base):
         project_url: str,
         commit_sha: str,
     ) -> tuple[GitBranchModel, "ProjectEventModel"]:
-        branch_push = GitBranchModel.get_or_create(
-            branch_name=branch_name,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=branch_push.project_event_model_type,
-            event_id=branch_push.id,
+        return cls._add_event(
+            GitBranchModel,
+            GitBranchModel.get_or_insert_cte(
+                branch_name=branch_name,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            ),
             commit_sha=commit_sha,
         )
-        return (branch_push, event)
 
     @classmethod
     def add_release_event(
@@ -1674,19 +2118,17 @@ class ProjectEventModel(Base):
         project_url: str,
         commit_hash: str,
     ) -> tuple[ProjectReleaseModel, "ProjectEventModel"]:
-        release = ProjectReleaseModel.get_or_create(
-            tag_name=tag_name,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-            commit_hash=commit_hash,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=release.project_event_model_type,
-            event_id=release.id,
+        return cls._add_event(
+            ProjectReleaseModel,
+            ProjectReleaseModel.get_or_insert_cte(
+                tag_name=tag_name,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+                commit_hash=commit_hash,
+            ),
             commit_sha=commit_hash,
         )
-        return (release, event)
 
     @classmethod
     def add_anitya_version_event(
@@ -1738,18 +2180,16 @@ class ProjectEventModel(Base):
         repo_name: str,
         project_url: str,
     ) -> tuple[IssueModel, "ProjectEventModel"]:
-        issue = IssueModel.get_or_create(
-            issue_id=issue_id,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=issue.project_event_model_type,
-            event_id=issue.id,
+        return cls._add_event(
+            IssueModel,
+            IssueModel.get_or_insert_cte(
+                issue_id=issue_id,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            ),
             commit_sha=None,
         )
-        return (issue, event)
 
     @classmethod
     def add_koji_build_tag_event(
@@ -1760,23 +2200,42 @@ class ProjectEventModel(Base):
         repo_name: str,
         project_url: str,
     ) -> tuple[KojiBuildTagModel, "ProjectEventModel"]:
-        target = None
-        if sidetag := SidetagModel.get_by_koji_name(koji_tag_name):
-            target = sidetag.target
-        koji_build_tag = KojiBuildTagModel.get_or_create(
-            task_id=task_id,
-            koji_tag_name=koji_tag_name,
-            target=target,
-            namespace=namespace,
-            repo_name=repo_name,
-            project_url=project_url,
-        )
-        event = ProjectEventModel.get_or_create(
-            type=koji_build_tag.project_event_model_type,
-            event_id=koji_build_tag.id,
+        return cls._add_event(
+            KojiBuildTagModel,
+            KojiBuildTagModel.get_or_insert_cte(
+                task_id=task_id,
+                koji_tag_name=koji_tag_name,
+                # the target of the sidetag, if it's one
+                target=select(SidetagModel.target)
+                .where(SidetagModel.koji_name == koji_tag_name)
+                .scalar_subquery(),
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            ),
             commit_sha=None,
         )
-        return (koji_build_tag, event)
+
+    @classmethod
+    def get_or_insert_cte(
+        cls,
+        type: ProjectEventModelType,
+        event_id: Union[int, ColumnElement],
+        commit_sha: Optional[str],
+    ):
+        """
+        CTE with the ID of the project event, inserted unless it exists.
+
+        The `event_id` can be a column of the CTE of the project event object
+        (see e.g. `PullRequestModel.get_or_insert_cte`), so that both are
+        created by a single statement.
+        """
+        return _get_or_insert_cte(
+            "project_event",
+            ProjectEventModel,
+            {"type": type, "event_id": event_id, "commit_sha": commit_sha},
+            ["type", "event_id", "commit_sha"],
+        )
 
     @classmethod
     def get_or_create(
@@ -1785,19 +2244,10 @@ class ProjectEventModel(Base):
         event_id: int,
         commit_sha: str,
     ) -> "ProjectEventModel":
-        with sa_session_transaction(commit=True) as session:
-            project_event = (
-                session.query(ProjectEventModel)
-                .filter_by(type=type, event_id=event_id, commit_sha=commit_sha)
-                .first()
-            )
-            if not project_event:
-                project_event = ProjectEventModel()
-                project_event.type = type
-                project_event.event_id = event_id
-                project_event.commit_sha = commit_sha
-                session.add(project_event)
-            return project_event
+        return _get_or_create(
+            ProjectEventModel,
+            cls.get_or_insert_cte(type=type, event_id=event_id, commit_sha=commit_sha),
+        )
 
     @classmethod
     def get_by_id(cls, id_: int) -> Optional["ProjectEventModel"]:
@@ -1811,37 +2261,79 @@ class ProjectEventModel(Base):
     ) -> Iterable["ProjectEventModel"]:
         """Return project events with all runs older than delta
         and set to null their stored packages config.
-        Cleanup project events here to speed up the process."""
+        Cleanup project events here to speed up the process.
+
+        The packages configs themselves are deleted once they are not referenced
+        by any project event, see `PackagesConfigModel.delete_unreferenced`."""
         delta_ago = datetime.now(timezone.utc) - delta
         with sa_session_transaction(commit=True) as session:
-            events = (
-                session.query(ProjectEventModel)
-                .filter(ProjectEventModel.packages_config.isnot(null()))
-                .filter(
+            return session.scalars(
+                update(ProjectEventModel)
+                .where(
+                    ProjectEventModel.packages_config_hash.isnot(null()),
                     ~ProjectEventModel.runs.any(PipelineModel.datetime >= delta_ago),
                 )
-            )
-            # After we reset the packages config
-            # the query will be empty.
-            # Store the query result in a new list
-            events_list = list(events)
-            for event in events:
-                event.packages_config = null()
-                session.add(event)
-            return events_list
+                .values(packages_config_hash=null())
+                .returning(ProjectEventModel),
+            ).all()
+
+    @property
+    def packages_config(self) -> Optional[dict]:
+        return self.stored_packages_config.packages_config if self.stored_packages_config else None
 
     def set_packages_config(self, packages_config: dict):
+        packages_config_hash = PackagesConfigModel.get_hash(packages_config)
         with sa_session_transaction(commit=True) as session:
-            self.packages_config = packages_config
+            session.execute(
+                psql_insert(PackagesConfigModel)
+                .values(hash=packages_config_hash, packages_config=packages_config)
+                # the existing row is not updated, but it's locked until the reference
+                # is committed, so that it's not deleted by `delete_unreferenced` meanwhile
+                .on_conflict_do_update(
+                    index_elements=[PackagesConfigModel.hash],
+                    set_={"hash": PackagesConfigModel.hash},
+                    where=false(),
+                ),
+            )
+            self.packages_config_hash = packages_config_hash
             session.add(self)
 
     def get_project_event_object(self) -> Optional[AbstractProjectObjectDbType]:
         with sa_session_transaction() as session:
-            return (
-                session.query(MODEL_FOR_PROJECT_EVENT[self.type])
-                .filter_by(id=self.event_id)
-                .first()
-            )
+            return session.get(MODEL_FOR_PROJECT_EVENT[self.type], self.event_id)
+
+    @staticmethod
+    def load_project_event_objects(
+        project_events: Iterable["ProjectEventModel"],
+    ) -> dict[tuple[ProjectEventModelType, int], AbstractProjectObjectDbType]:
+        """
+        Load the project event objects (together with their projects) of the given
+        project events using a single query per project event type.
+
+        Args:
+            project_events: Project events to load the objects for.
+
+        Returns:
+            Dictionary mapping the type and the event ID of a project event
+            to its project event object.
+        """
+        event_ids_per_type: dict[ProjectEventModelType, set[int]] = {}
+        for project_event in project_events:
+            event_ids_per_type.setdefault(project_event.type, set()).add(project_event.event_id)
+
+        project_event_objects = {}
+        with sa_session_transaction() as session:
+            for project_event_type, event_ids in event_ids_per_type.items():
+                model = MODEL_FOR_PROJECT_EVENT[project_event_type]
+                for project_event_object in (
+                    session.query(model)
+                    .filter(model.id.in_(event_ids))
+                    .options(joinedload(model.project))
+                ):
+                    project_event_objects[(project_event_type, project_event_object.id)] = (
+                        project_event_object
+                    )
+        return project_event_objects
 
     def __repr__(self):
         return (
@@ -1850,6 +2342,15 @@ class ProjectEventModel(Base):
         )
 
 
+# the lookups of the builds and tests by the commit SHA start here, the pipelines
+# are joined to the IDs of the project events read from the index only
+Index(
+    "ix_project_events_commit_sha_id",
+    ProjectEventModel.commit_sha,
+    ProjectEventModel.id,
+)
+
+
 class PipelineModel(Base):
     """
     Represents one pipeline.
@@ -1869,9 +2370,11 @@ class PipelineModel(Base):
     id = Column(Integer, primary_key=True)  # our database PK
     # datetime.utcnow instead of datetime.utcnow() because it's an argument to the function,
     # so it will run when the model is initiated, not when the table is made
-    datetime = Column(DateTime, default=datetime.utcnow)
+    datetime = Column(DateTime, default=datetime.utcnow, index=True)
 
-    project_event_id = Column(Integer, ForeignKey("project_events.id"), index=True)
+    # indexed together with the groups,
+    # see `ix_pipelines_project_event_id_copr_build_group_id` (and the like)
+    project_event_id = Column(Integer, ForeignKey("project_events.id"))
     package_name = Column(String, index=True)
 
     project_event = relationship("ProjectEventModel", back_populates="runs")
@@ -2003,18 +2506,52 @@ class PipelineModel(Base):
             )
 
     @classmethod
-    def get_merged_chroots(cls, first: int, last: int) -> Iterable["PipelineModel"]:
-        return (
-            cls.__query_merged_runs()
-            .group_by(
-                PipelineModel.srpm_build_id,
-                case(
-                    (PipelineModel.srpm_build_id.isnot(null()), 0),
-                    else_=PipelineModel.id,
+    def get_merged_chroots(
+        cls,
+        first: int,
+        last: int,
+        before: Optional[int] = None,
+    ) -> Iterable["PipelineModel"]:
+        """
+        Return the runs merged by their SRPM, from the latest.
+
+        Args:
+            first: Index of the first merged run.
+            last: Index after the last merged run.
+            before: Merged ID of the merged run the returned ones follow,
+                the indices are relative to it.
+        """
+        query = cls.__query_merged_runs().group_by(
+            PipelineModel.srpm_build_id,
+            case(
+                (PipelineModel.srpm_build_id.isnot(null()), 0),
+                else_=PipelineModel.id,
+            ),
+        )
+        if before is None and first:
+            return query.order_by(desc("merged_id")).slice(first, last)
+
+        runs = aliased(PipelineModel)
+        window = aliased(PipelineModel)
+
+        def in_range(bottom: int, top: int) -> ColumnElement:
+            in_window = (window.id >= bottom, window.id < top)
+            return PipelineModel.id.in_(
+                union_all(
+                    select(runs.id).where(
+                        runs.srpm_build_id.in_(select(window.srpm_build_id).where(*in_window)),
+                    ),
+                    # the runs without SRPM are not merged
+                    select(window.id).where(window.srpm_build_id.is_(None), *in_window),
                 ),
             )
-            .order_by(desc("merged_id"))
-            .slice(first, last)
+
+        return _get_merged_page(
+            query,
+            PipelineModel.id,
+            in_range,
+            before=before,
+            count=last - first,
         )
 
     @classmethod
@@ -2039,6 +2576,25 @@ class PipelineModel(Base):
             return session.query(PipelineModel).filter_by(id=id_).first()
 
 
+# the groups of the pipelines of a project event are read from the indexes only
+# when looking up the builds and tests by the commit SHA
+Index(
+    "ix_pipelines_project_event_id_copr_build_group_id",
+    PipelineModel.project_event_id,
+    PipelineModel.copr_build_group_id,
+)
+Index(
+    "ix_pipelines_project_event_id_koji_build_group_id",
+    PipelineModel.project_event_id,
+    PipelineModel.koji_build_group_id,
+)
+Index(
+    "ix_pipelines_project_event_id_test_run_group_id",
+    PipelineModel.project_event_id,
+    PipelineModel.test_run_group_id,
+)
+
+
 class CoprBuildGroupModel(ProjectAndEventsConnector, GroupModel, Base):
     __tablename__ = "copr_build_groups"
     id = Column(Integer, primary_key=True)
@@ -2293,6 +2849,9 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
     submitted_time = Column(DateTime, default=datetime.utcnow)
     build_start_time = Column(DateTime)
     build_finished_time = Column(DateTime)
+    # when the babysit task should check the state of the build in Copr,
+    # None if the build is not checked (anymore)
+    next_status_check = Column(DateTime, index=True)
 
     # project name as shown in copr
     project_name = Column(String)
@@ -2313,10 +2872,11 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
     #   }
     # ]
     built_packages = Column(JSON)
+    # indexed together with the project name and target,
+    # see `ix_copr_build_targets_copr_build_group_id_project_name_target`
     copr_build_group_id = Column(
         Integer,
         ForeignKey("copr_build_groups.id"),
-        index=True,
     )
 
     group_of_targets = relationship(
@@ -2386,13 +2946,20 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
         cls,
         first: int,
         last: int,
+        before: Optional[int] = None,
     ) -> Iterable["CoprBuildTargetModel"]:
         """Returns a list of unique build ids with merged status, chroots
         Details:
         https://github.com/packit/packit-service/pull/674#discussion_r439819852
+
+        Args:
+            first: Index of the first merged build.
+            last: Index after the last merged build.
+            before: New ID of the merged build the returned ones follow,
+                the indices are relative to it.
         """
         with sa_session_transaction() as session:
-            return (
+            query = (
                 session.query(
                     # We need something to order our merged builds by,
                     # so set new_id to be min(ids of to-be-merged rows)
@@ -2400,15 +2967,25 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
                     # Select identical element(s)
                     CoprBuildTargetModel.build_id,
                     # Merge chroots and statuses from different rows into one
-                    func.array_agg(psql_array([CoprBuildTargetModel.target])).label(
-                        "target",
-                    ),
-                    func.json_agg(psql_array([CoprBuildTargetModel.status])).label(
-                        "status",
-                    ),
-                    func.array_agg(psql_array([CoprBuildTargetModel.id])).label(
-                        "packit_id_per_chroot",
-                    ),
+                    # (in the order of the rows, not the one they are stored in)
+                    func.array_agg(
+                        aggregate_order_by(
+                            psql_array([CoprBuildTargetModel.target]),
+                            CoprBuildTargetModel.id,
+                        ),
+                    ).label("target"),
+                    func.json_agg(
+                        aggregate_order_by(
+                            psql_array([CoprBuildTargetModel.status]),
+                            CoprBuildTargetModel.id,
+                        ),
+                    ).label("status"),
+                    func.array_agg(
+                        aggregate_order_by(
+                            psql_array([CoprBuildTargetModel.id]),
+                            CoprBuildTargetModel.id,
+                        ),
+                    ).label("packit_id_per_chroot"),
                 )
                 .filter(
                     # Exclude builds without build_id (to not mix targets from
@@ -2426,27 +3003,179 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
                 .group_by(
                     CoprBuildTargetModel.build_id,
                 )  # Group by identical element(s)
-                .order_by(desc("new_id"))
-                .slice(first, last)
             )
+        if before is None and first:
+            return query.order_by(desc("new_id")).slice(first, last)
+
+        window = aliased(CoprBuildTargetModel)
+        return _get_merged_page(
+            query,
+            CoprBuildTargetModel.id,
+            lambda bottom, top: CoprBuildTargetModel.build_id.in_(
+                select(window.build_id).where(window.id >= bottom, window.id < top),
+            ),
+            before=before,
+            count=last - first,
+        )
+
+    # Returns all builds with that build_id, irrespective of target
+    @classmethod
+    def get_all_by_build_id(
+        cls,
+        build_id: Union[str, int],
+    ) -> Iterable["CoprBuildTargetModel"]:
+        if isinstance(build_id, int):
+            # See the comment in get_by_task_id()
+            build_id = str(build_id)
+        with sa_session_transaction() as session:
+            return session.query(CoprBuildTargetModel).filter_by(build_id=build_id)
+
+    @classmethod
+    def get_all_by_build_ids(
+        cls,
+        build_ids: Iterable[Union[str, int]],
+    ) -> Iterable["CoprBuildTargetModel"]:
+        """Returns all builds (targets) of the given Copr builds."""
+        with sa_session_transaction() as session:
+            return session.query(CoprBuildTargetModel).filter(
+                CoprBuildTargetModel.build_id.in_({str(build_id) for build_id in build_ids}),
+            )
+
+    @classmethod
+    def get_all_by_status(cls, status: BuildStatus) -> Iterable["CoprBuildTargetModel"]:
+        """Returns all builds which currently have the given status."""
+        with sa_session_transaction() as session:
+            return session.query(CoprBuildTargetModel).filter_by(status=status)
+
+    @classmethod
+    def schedule_status_check(
+        cls,
+        build_id: Union[str, int],
+        check_time: Optional[datetime],
+    ) -> None:
+        """
+        Set when the state of the Copr build (all its targets) should be checked,
+        None stops the checking.
+        """
+        with sa_session_transaction(commit=True) as session:
+            session.execute(
+                update(CoprBuildTargetModel)
+                .where(CoprBuildTargetModel.build_id == str(build_id))
+                .values(next_status_check=check_time),
+            )
+
+    @classmethod
+    def update_status_checks(
+        cls,
+        check_times: dict[int, Optional[datetime]],
+        errored_ids: Iterable[int] = (),
+    ) -> None:
+        """
+        Update the results of the status checks of multiple Copr builds at once.
+
+        Args:
+            check_times: Copr build IDs mapped to the time of their next check,
+                `None` stops the checking.
+            errored_ids: IDs of the builds (targets) to set to the error status.
+        """
+        with sa_session_transaction(commit=True) as session:
+            if errored_ids := list(errored_ids):
+                session.execute(
+                    update(CoprBuildTargetModel)
+                    .where(CoprBuildTargetModel.id.in_(errored_ids))
+                    .values(status=BuildStatus.error),
+                )
+            if check_times:
+                # build IDs are stored as strings
+                next_checks = {str(build_id): time for build_id, time in check_times.items()}
+                session.execute(
+                    update(CoprBuildTargetModel)
+                    .where(CoprBuildTargetModel.build_id.in_(next_checks))
+                    .values(
+                        next_status_check=cast(
+                            case(next_checks, value=CoprBuildTargetModel.build_id),
+                            DateTime,
+                        ),
+                    ),
+                )
+
+    @classmethod
+    def pop_due_status_checks(cls, limit: int, lease: timedelta) -> list[int]:
+        """
+        Get IDs of the unfinished Copr builds whose status check is due,
+        the most overdue first.
+
+        The next check of the returned builds is postponed by `lease`, so that
+        they are not picked again while being checked, nor lost if the check fails.
+
+        Args:
+            limit: Maximum number of builds to return.
+            lease: How long the returned builds are not going to be picked again.
+
+        Returns:
+            IDs of the Copr builds.
+        """
+        now = datetime.utcnow()
+        due_builds = (
+            select(CoprBuildTargetModel.build_id)
+            .where(
+                CoprBuildTargetModel.next_status_check <= now,
+                CoprBuildTargetModel.status.in_(
+                    (BuildStatus.pending, BuildStatus.waiting_for_srpm),
+                ),
+            )
+            .group_by(CoprBuildTargetModel.build_id)
+            .order_by(func.min(CoprBuildTargetModel.next_status_check))
+            .limit(limit)
+        )
+        with sa_session_transaction(commit=True) as session:
+            # rows are re-checked after being locked, so a build can't be
+            # popped by two concurrent callers
+            build_ids = session.execute(
+                update(CoprBuildTargetModel)
+                .where(
+                    CoprBuildTargetModel.build_id.in_(due_builds.scalar_subquery()),
+                    CoprBuildTargetModel.next_status_check <= now,
+                )
+                .values(next_status_check=now + lease)
+                .returning(CoprBuildTargetModel.build_id),
+            ).scalars()
+            # our DB uses str(build_id) but our code expects int(build_id)
+            return list(dict.fromkeys(int(build_id) for build_id in build_ids))
 
-    # Returns all builds with that build_id, irrespective of target
     @classmethod
-    def get_all_by_build_id(
-        cls,
-        build_id: Union[str, int],
-    ) -> Iterable["CoprBuildTargetModel"]:
-        if isinstance(build_id, int):
-            # See the comment in get_by_task_id()
-            build_id = str(build_id)
-        with sa_session_transaction() as session:
-            return session.query(CoprBuildTargetModel).filter_by(build_id=build_id)
+    def get_average_build_durations(cls, sample_size: int) -> dict[str, timedelta]:
+        """
+        Get average duration of the successful builds per target.
 
-    @classmethod
-    def get_all_by_status(cls, status: BuildStatus) -> Iterable["CoprBuildTargetModel"]:
-        """Returns all builds which currently have the given status."""
+        Args:
+            sample_size: Number of the latest builds the averages are computed from.
+
+        Returns:
+            Dictionary mapping targets to the average build durations.
+        """
         with sa_session_transaction() as session:
-            return session.query(CoprBuildTargetModel).filter_by(status=status)
+            latest_builds = (
+                session.query(CoprBuildTargetModel)
+                .order_by(CoprBuildTargetModel.id.desc())
+                .limit(sample_size)
+                .subquery()
+            )
+            return dict(
+                session.query(
+                    latest_builds.c.target,
+                    func.avg(
+                        latest_builds.c.build_finished_time - latest_builds.c.build_start_time,
+                    ),
+                )
+                .filter(
+                    latest_builds.c.status == BuildStatus.success,
+                    latest_builds.c.build_start_time.isnot(None),
+                    latest_builds.c.build_finished_time.isnot(None),
+                )
+                .group_by(latest_builds.c.target)
+                .all(),
+            )
 
     # returns the build matching the build_id and the target
     @classmethod
@@ -2474,7 +3203,7 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
         owner: Optional[str] = None,
         target: Optional[str] = None,
         status: BuildStatus = None,
-    ) -> Iterable["CoprBuildTargetModel"]:
+    ) -> "Query[CoprBuildTargetModel]":
         """
         All owner/project_name builds sorted from latest to oldest
         with the given commit_sha and optional target.
@@ -2508,8 +3237,57 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
 
             return query
 
+    @staticmethod
+    def get_latest_srpm_build_for_commits(
+        commit_shas: list[str],
+        project_name: str,
+        owner: str,
+        target: str,
+        status: BuildStatus,
+    ) -> Optional["SRPMBuildModel"]:
+        """
+        Get the SRPM build of the latest owner/project_name build for the target
+        with the given status from the first of the commits that has any.
+
+        Args:
+            commit_shas: Commits to search in, in the order of preference.
+            project_name: Name of the Copr project.
+            owner: Owner of the Copr project.
+            target: Target (chroot) of the build.
+            status: Status of the build.
+
+        Returns:
+            The SRPM build or `None` if there is no such build.
+        """
+        if not commit_shas:
+            return None
+
+        with sa_session_transaction() as session:
+            return (
+                session.query(SRPMBuildModel)
+                .join(PipelineModel, PipelineModel.srpm_build_id == SRPMBuildModel.id)
+                .join(
+                    CoprBuildTargetModel,
+                    CoprBuildTargetModel.copr_build_group_id == PipelineModel.copr_build_group_id,
+                )
+                .join(ProjectEventModel, PipelineModel.project_event_id == ProjectEventModel.id)
+                .filter(ProjectEventModel.commit_sha.in_(commit_shas))
+                .filter(CoprBuildTargetModel.project_name == project_name)
+                .filter(CoprBuildTargetModel.owner == owner)
+                .filter(CoprBuildTargetModel.target == target)
+                .filter(CoprBuildTargetModel.status == status)
+                .order_by(
+                    case(
+                        {commit_sha: i for i, commit_sha in enumerate(commit_shas)},
+                        value=ProjectEventModel.commit_sha,
+                    ),
+                    CoprBuildTargetModel.id.desc(),
+                )
+                .first()
+            )
+
     @classmethod
-    def get_all_by_commit(cls, commit_sha: str) -> Iterable["CoprBuildTargetModel"]:
+    def get_all_by_commit(cls, commit_sha: str) -> "Query[CoprBuildTargetModel]":
         """Returns all builds that match a given commit sha"""
         with sa_session_transaction() as session:
             return (
@@ -2602,7 +3380,7 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
 
         raise: IntegrityError if the scan model already exists
         """
-        session = singleton_session or Session()
+        session = Session()
         try:
             scan = OSHScanModel()
             scan.copr_build_target = self
@@ -2629,6 +3407,25 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
             raise
 
 
+# covers the lookups of the builds of a Copr project (e.g. the base builds for the scans)
+Index(
+    "ix_copr_build_targets_project_name_owner_target_status",
+    CoprBuildTargetModel.project_name,
+    CoprBuildTargetModel.owner,
+    CoprBuildTargetModel.target,
+    CoprBuildTargetModel.status,
+    postgresql_include=["copr_build_group_id"],
+)
+
+# covers the lookups of the builds of a Copr project by the commit SHA
+Index(
+    "ix_copr_build_targets_copr_build_group_id_project_name_target",
+    CoprBuildTargetModel.copr_build_group_id,
+    CoprBuildTargetModel.project_name,
+    CoprBuildTargetModel.target,
+)
+
+
 class KojiBuildGroupModel(ProjectAndEventsConnector, GroupModel, Base):
     __tablename__ = "koji_build_groups"
     id = Column(Integer, primary_key=True)
@@ -2790,13 +3587,19 @@ class BodhiUpdateTargetModel(GroupAndTargetModelConnector, Base):
             return session.query(BodhiUpdateTargetModel)
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["BodhiUpdateTargetModel"]:
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        before: Optional[int] = None,
+    ) -> Iterable["BodhiUpdateTargetModel"]:
         with sa_session_transaction() as session:
-            return (
-                session.query(BodhiUpdateTargetModel)
-                .order_by(desc(BodhiUpdateTargetModel.id))
-                .slice(first, last)
+            query = session.query(BodhiUpdateTargetModel).order_by(
+                desc(BodhiUpdateTargetModel.id),
             )
+            if before is not None:
+                query = query.filter(BodhiUpdateTargetModel.id < before)
+            return query.slice(first, last)
 
     @classmethod
     def get_all_projects(cls) -> set["GitProjectModel"]:
@@ -3025,6 +3828,7 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
         first: int,
         last: int,
         scratch: Optional[bool] = None,
+        before: Optional[int] = None,
     ) -> Iterable["KojiBuildTargetModel"]:
         with sa_session_transaction() as session:
             query = session.query(KojiBuildTargetModel).order_by(
@@ -3033,6 +3837,8 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
 
             if scratch is not None:
                 query = query.filter_by(scratch=scratch)
+            if before is not None:
+                query = query.filter(KojiBuildTargetModel.id < before)
 
             return query.slice(first, last)
 
@@ -3127,15 +3933,15 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
             )
 
     @classmethod
-    def get_all_successful_or_in_progress_by_nvr(
+    def get_all_successful_or_in_progress_by_nvrs(
         cls,
-        nvr: str,
+        nvrs: Iterable[str],
     ) -> set["KojiBuildTargetModel"]:
         with sa_session_transaction() as session:
             return set(
                 session.query(KojiBuildTargetModel)
                 .filter(
-                    KojiBuildTargetModel.nvr == nvr,
+                    KojiBuildTargetModel.nvr.in_(set(nvrs)),
                     KojiBuildTargetModel.scratch == False,  # noqa
                     KojiBuildTargetModel.status.in_(
                         ("queued", "pending", "retry", "running", "success"),
@@ -3174,6 +3980,14 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
             return set(projects)
 
 
+# covers the lookups of the (scratch) builds by the commit SHA and target
+Index(
+    "ix_koji_build_targets_koji_build_group_id_target",
+    KojiBuildTargetModel.koji_build_group_id,
+    KojiBuildTargetModel.target,
+)
+
+
 class KojiTagRequestGroupModel(ProjectAndEventsConnector, GroupModel, Base):
     __tablename__ = "koji_tag_request_groups"
     id = Column(Integer, primary_key=True)
@@ -3272,11 +4086,14 @@ class KojiTagRequestTargetModel(GroupAndTargetModelConnector, Base):
         cls,
         first: int,
         last: int,
+        before: Optional[int] = None,
     ) -> Iterable["KojiTagRequestTargetModel"]:
         with sa_session_transaction() as session:
             query = session.query(KojiTagRequestTargetModel).order_by(
                 desc(KojiTagRequestTargetModel.id),
             )
+            if before is not None:
+                query = query.filter(KojiTagRequestTargetModel.id < before)
 
             return query.slice(first, last)
 
@@ -3386,11 +4203,17 @@ class SRPMBuildModel(ProjectAndEventsConnector, Base):
             return session.query(SRPMBuildModel).filter_by(id=id_).first()
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["SRPMBuildModel"]:
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        before: Optional[int] = None,
+    ) -> Iterable["SRPMBuildModel"]:
         with sa_session_transaction() as session:
-            return (
-                session.query(SRPMBuildModel).order_by(desc(SRPMBuildModel.id)).slice(first, last)
-            )
+            query = session.query(SRPMBuildModel).order_by(desc(SRPMBuildModel.id))
+            if before is not None:
+                query = query.filter(SRPMBuildModel.id < before)
+            return query.slice(first, last)
 
     @classmethod
     def get_by_copr_build_id(
@@ -3402,6 +4225,18 @@ class SRPMBuildModel(ProjectAndEventsConnector, Base):
         with sa_session_transaction() as session:
             return session.query(SRPMBuildModel).filter_by(copr_build_id=copr_build_id).first()
 
+    @classmethod
+    def get_all_by_copr_build_ids(
+        cls,
+        copr_build_ids: Iterable[Union[str, int]],
+    ) -> Iterable["SRPMBuildModel"]:
+        with sa_session_transaction() as session:
+            return session.query(SRPMBuildModel).filter(
+                SRPMBuildModel.copr_build_id.in_(
+                    {str(copr_build_id) for copr_build_id in copr_build_ids},
+                ),
+            )
+
     @classmethod
     def get_older_than(cls, delta: timedelta) -> Iterable["SRPMBuildModel"]:
         """Return builds older than delta, whose logs/artifacts haven't been discarded yet."""
@@ -3463,6 +4298,9 @@ class AllowlistStatus(str, enum.Enum):
     denied = ALLOWLIST_CONSTANTS["denied"]
 
 
+_allowlist_trie_cache: TTLCache = TTLCache(maxsize=1, ttl=_ALLOWLIST_CACHE_TTL)
+
+
 class AllowlistModel(Base):
     __tablename__ = "allowlist"
     id = Column(Integer, primary_key=True)
@@ -3504,7 +4342,9 @@ class AllowlistModel(Base):
                 namespace_entry.fas_account = fas_account
 
             session.add(namespace_entry)
-            return namespace_entry
+
+        cls.invalidate_cache()
+        return namespace_entry
 
     @classmethod
     def get_namespace(cls, namespace: str) -> Optional["AllowlistModel"]:
@@ -3544,6 +4384,58 @@ class AllowlistModel(Base):
             if namespace_entry.one_or_none():
                 namespace_entry.delete()
 
+        cls.invalidate_cache()
+
+    @staticmethod
+    def invalidate_cache():
+        """
+        Drop the in-process cache of the allowlist so that the next lookup
+        of the namespace statuses reloads the table.
+        """
+        _allowlist_trie_cache.clear()
+
+    @classmethod
+    @cached(cache=_allowlist_trie_cache, key=lambda cls: "allowlist")
+    def _get_namespace_trie(cls) -> dict:
+        """
+        Load the whole allowlist table into a trie of namespace path segments.
+
+        Every node is a dictionary mapping the path segments to the child nodes,
+        the status of the namespace ending in the node (if it is present
+        in the allowlist) is stored under the `None` key.
+        """
+        trie: dict = {}
+        for entry in cls.get_all():
+            node = trie
+            for segment in entry.namespace.split("/"):
+                node = node.setdefault(segment, {})
+            node[None] = AllowlistStatus(entry.status)
+
+        return trie
+
+    @classmethod
+    def get_namespace_and_parents_statuses(cls, namespace: str) -> list[AllowlistStatus]:
+        """
+        Get statuses of the namespace and all its parent namespaces that are present
+        in the allowlist. The lookup is served from the in-process cache of the table.
+
+        Args:
+            namespace (str): Namespace in format `example.com/namespace/repository.git`,
+                where `/repository.git` is optional.
+
+        Returns:
+            List of the statuses, the most specific namespace first.
+        """
+        statuses = []
+        node = cls._get_namespace_trie()
+        for segment in namespace.split("/"):
+            if (node := node.get(segment)) is None:
+                break
+            if (status := node.get(None)) is not None:
+                statuses.append(status)
+
+        return statuses[::-1]
+
     @classmethod
     def get_all(cls) -> Iterable["AllowlistModel"]:
         with sa_session_transaction() as session:
@@ -3757,7 +4649,9 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
     # so it will run when the model is initiated, not when the table is made
     submitted_time = Column(DateTime, default=datetime.utcnow)
     data = Column(JSON)
-    tft_test_run_group_id = Column(Integer, ForeignKey("tft_test_run_groups.id"), index=True)
+    # indexed together with the target,
+    # see `ix_tft_test_run_targets_tft_test_run_group_id_target`
+    tft_test_run_group_id = Column(Integer, ForeignKey("tft_test_run_groups.id"))
 
     copr_builds = relationship(
         "CoprBuildTargetModel",
@@ -3876,7 +4770,7 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
     def get_all_by_commit_target(
         commit_sha: str,
         target: Optional[str] = None,
-    ) -> Iterable["TFTTestRunTargetModel"]:
+    ) -> "Query[TFTTestRunTargetModel]":
         """
         All tests with the given commit_sha and optional target.
         """
@@ -3902,18 +4796,32 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
             return query
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["TFTTestRunTargetModel"]:
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        before: Optional[int] = None,
+    ) -> Iterable["TFTTestRunTargetModel"]:
         with sa_session_transaction() as session:
-            return (
-                session.query(TFTTestRunTargetModel)
-                .order_by(desc(TFTTestRunTargetModel.id))
-                .slice(first, last)
+            query = session.query(TFTTestRunTargetModel).order_by(
+                desc(TFTTestRunTargetModel.id),
             )
+            if before is not None:
+                query = query.filter(TFTTestRunTargetModel.id < before)
+            return query.slice(first, last)
 
     def __repr__(self):
         return f"TFTTestRunTargetModel(id={self.id}, pipeline_id={self.pipeline_id})"
 
 
+# covers the lookups of the test runs by the commit SHA and target
+Index(
+    "ix_tft_test_run_targets_tft_test_run_group_id_target",
+    TFTTestRunTargetModel.tft_test_run_group_id,
+    TFTTestRunTargetModel.target,
+)
+
+
 class SyncReleaseTargetStatus(str, enum.Enum):
     queued = "queued"
     running = "running"
@@ -4118,14 +5026,17 @@ class SyncReleaseModel(ProjectAndEventsConnector, Base):
         first: int,
         last: int,
         job_type: SyncReleaseJobType = SyncReleaseJobType.propose_downstream,
+        before: Optional[int] = None,
     ) -> Iterable["SyncReleaseModel"]:
         with sa_session_transaction() as session:
-            return (
+            query = (
                 session.query(SyncReleaseModel)
                 .order_by(desc(SyncReleaseModel.id))
                 .filter_by(job_type=job_type)
-                .slice(first, last)
             )
+            if before is not None:
+                query = query.filter(SyncReleaseModel.id < before)
+            return query.slice(first, last)
 
 
 AbstractBuildTestDbType = Union[
@@ -4750,9 +5661,17 @@ class OSHScanModel(Base):
             return session.query(OSHScanModel).filter_by(id=id_).first()
 
     @classmethod
-    def get_range(cls, first: int, last: int) -> Iterable["OSHScanModel"]:
+    def get_range(
+        cls,
+        first: int,
+        last: int,
+        before: Optional[int] = None,
+    ) -> Iterable["OSHScanModel"]:
         with sa_session_transaction() as session:
-            return session.query(OSHScanModel).order_by(desc(OSHScanModel.id)).slice(first, last)
+            query = session.query(OSHScanModel).order_by(desc(OSHScanModel.id))
+            if before is not None:
+                query = query.filter(OSHScanModel.id < before)
+            return query.slice(first, last)
 
 
 class LogDetectiveBuildSystem(enum.Enum):
@@ -4986,11 +5905,14 @@ class LogDetectiveRunModel(GroupAndTargetModelConnector, Base):
         cls,
         first: int,
         last: int,
+        before: Optional[int] = None,
     ) -> Iterable["LogDetectiveRunModel"]:
         with sa_session_transaction() as session:
             query = session.query(LogDetectiveRunModel).order_by(
                 desc(LogDetectiveRunModel.id),
             )
+            if before is not None:
+                query = query.filter(LogDetectiveRunModel.id < before)
 
             return query.slice(first, last)
 
@@ -5084,6 +6006,237 @@ class LogDetectiveRunGroupModel(ProjectAndEventsConnector, GroupModel, Base):
             return q
 
 
+class ProjectEventUsageModel(Base):
+    """
+    Hourly rollup of the project events with at least one pipeline,
+    used for the usage statistics instead of going through all the pipelines.
+
+    There is a single row for each project event object (e.g. pull request)
+    with at least one pipeline created during the given hour.
+    """
+
+    __tablename__ = "project_event_usage"
+    __table_args__ = (
+        UniqueConstraint(
+            "bucket",
+            "project_event_type",
+            "event_id",
+            name="uq_project_event_usage_bucket_project_event_type_event_id",
+        ),
+    )
+    id = Column(Integer, primary_key=True)
+    bucket = Column(DateTime, nullable=False)
+    # ID of the project of the project event object
+    project_id = Column(Integer, index=True, nullable=False)
+    project_event_type = Column(Enum(ProjectEventModelType), nullable=False)
+    # ID of the project event object (e.g. PullRequestModel)
+    event_id = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"ProjectEventUsageModel(bucket={self.bucket}, project_id={self.project_id}, "
+            f"project_event_type={self.project_event_type}, event_id={self.event_id})"
+        )
+
+
+class JobUsageModel(Base):
+    """
+    Hourly rollup of the number of jobs (e.g. Copr build groups) per project
+    and project event type, used for the usage statistics instead of going through
+    all the pipelines.
+
+    Each job is counted once, in the hour its first pipeline (of the project event
+    type) was created in, so the buckets can be summed up.
+    """
+
+    __tablename__ = "job_usage"
+    __table_args__ = (
+        UniqueConstraint(
+            "bucket",
+            "project_id",
+            "project_event_type",
+            "job_type",
+            name="uq_job_usage_bucket_project_id_project_event_type_job_type",
+        ),
+    )
+    id = Column(Integer, primary_key=True)
+    bucket = Column(DateTime, nullable=False)
+    # ID of the project of the project event object
+    project_id = Column(Integer, index=True, nullable=False)
+    project_event_type = Column(Enum(ProjectEventModelType), nullable=False)
+    # table name of the job model, e.g. copr_build_groups
+    job_type = Column(String, nullable=False)
+    job_runs = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"JobUsageModel(bucket={self.bucket}, project_id={self.project_id}, "
+            f"project_event_type={self.project_event_type}, job_type={self.job_type}, "
+            f"job_runs={self.job_runs})"
+        )
+
+
+# job models whose runs are counted in the usage statistics
+USAGE_JOB_MODELS = (
+    SRPMBuildModel,
+    CoprBuildGroupModel,
+    KojiBuildGroupModel,
+    VMImageBuildTargetModel,
+    TFTTestRunGroupModel,
+    SyncReleaseModel,
+    LogDetectiveRunGroupModel,
+)
+
+
+def _filter_usage_buckets(
+    query,
+    usage_model: Union[type[ProjectEventUsageModel], type[JobUsageModel]],
+    datetime_from=None,
+    datetime_to=None,
+):
+    """
+    Filter the hourly buckets of the usage rollup by the given period.
+
+    Both ends of the period are inclusive and matched at the hour granularity,
+    i.e. the hours containing the beginning and the end are included.
+    """
+    if datetime_from:
+        query = query.filter(
+            usage_model.bucket >= func.date_trunc("hour", cast(datetime_from, DateTime)),
+        )
+    if datetime_to:
+        query = query.filter(usage_model.bucket <= datetime_to)
+    return query
+
+
+def refresh_usage_rollup(datetime_from: datetime, datetime_to: datetime) -> None:
+    """
+    (Re)compute the hourly usage rollup for the pipelines created in the given period.
+
+    The rollup is idempotent: the buckets from the given period are replaced
+    (and upserted, so that an overlapping run does not duplicate them).
+
+    Args:
+        datetime_from: Beginning of the period, a whole hour.
+        datetime_to: End of the period (exclusive), a whole hour.
+    """
+    pipeline_attribute_for_job_model = {
+        SRPMBuildModel: PipelineModel.srpm_build_id,
+        CoprBuildGroupModel: PipelineModel.copr_build_group_id,
+        KojiBuildGroupModel: PipelineModel.koji_build_group_id,
+        VMImageBuildTargetModel: PipelineModel.vm_image_build_id,
+        TFTTestRunGroupModel: PipelineModel.test_run_group_id,
+        SyncReleaseModel: PipelineModel.sync_release_run_id,
+        LogDetectiveRunGroupModel: PipelineModel.log_detective_run_group_id,
+    }
+    in_period = (PipelineModel.datetime >= datetime_from, PipelineModel.datetime < datetime_to)
+    pipelines_in_period = aliased(PipelineModel)
+
+    with sa_session_transaction(commit=True) as session:
+        for usage_model in (ProjectEventUsageModel, JobUsageModel):
+            session.query(usage_model).filter(
+                usage_model.bucket >= datetime_from,
+                usage_model.bucket < datetime_to,
+            ).delete(synchronize_session=False)
+
+        for project_event_type in ProjectEventModelType:
+            project_event_model = MODEL_FOR_PROJECT_EVENT[project_event_type]
+            pipelines = (
+                session.query(PipelineModel)
+                .join(
+                    ProjectEventModel,
+                    PipelineModel.project_event_id == ProjectEventModel.id,
+                )
+                .join(
+                    project_event_model,
+                    ProjectEventModel.event_id == project_event_model.id,
+                )
+                .filter(
+                    ProjectEventModel.type == project_event_type,
+                    project_event_model.project_id.isnot(None),
+                )
+            )
+
+            session.execute(
+                psql_insert(ProjectEventUsageModel)
+                .from_select(
+                    ["bucket", "project_id", "project_event_type", "event_id"],
+                    pipelines.filter(*in_period)
+                    .with_entities(
+                        func.date_trunc("hour", PipelineModel.datetime),
+                        project_event_model.project_id,
+                        ProjectEventModel.type,
+                        ProjectEventModel.event_id,
+                    )
+                    .distinct()
+                    .statement,
+                )
+                .on_conflict_do_nothing(
+                    constraint="uq_project_event_usage_bucket_project_event_type_event_id",
+                ),
+            )
+
+            for job_model, pipeline_attribute in pipeline_attribute_for_job_model.items():
+                # the first pipeline of each job with a pipeline in the period
+                first_pipelines = (
+                    pipelines.filter(
+                        pipeline_attribute.in_(
+                            select(getattr(pipelines_in_period, pipeline_attribute.key)).where(
+                                pipelines_in_period.datetime >= datetime_from,
+                                pipelines_in_period.datetime < datetime_to,
+                            ),
+                        ),
+                    )
+                    .with_entities(
+                        PipelineModel.datetime.label("datetime"),
+                        project_event_model.project_id.label("project_id"),
+                    )
+                    .distinct(pipeline_attribute)
+                    .order_by(pipeline_attribute, PipelineModel.datetime)
+                    .subquery()
+                )
+                bucket = func.date_trunc("hour", first_pipelines.c.datetime)
+                insert_job_usage = psql_insert(JobUsageModel).from_select(
+                    ["bucket", "project_id", "project_event_type", "job_type", "job_runs"],
+                    select(
+                        bucket,
+                        first_pipelines.c.project_id,
+                        literal(project_event_type, JobUsageModel.project_event_type.type),
+                        literal(inspect(job_model).local_table.name),
+                        func.count(),
+                    )
+                    .where(
+                        first_pipelines.c.datetime >= datetime_from,
+                        first_pipelines.c.datetime < datetime_to,
+                    )
+                    .group_by(bucket, first_pipelines.c.project_id),
+                )
+                session.execute(
+                    insert_job_usage.on_conflict_do_update(
+                        constraint="uq_job_usage_bucket_project_id_project_event_type_job_type",
+                        set_={"job_runs": insert_job_usage.excluded.job_runs},
+                    ),
+                )
+
+
+def get_usage_rollup_start() -> Optional[datetime]:
+    """
+    Get the beginning of the period that needs to be rolled up (again).
+
+    The last rolled up hours are recomputed since jobs can be attached
+    to the already existing pipelines later on.
+
+    Returns:
+        Beginning of the period (a whole hour) or `None` if there are no pipelines.
+    """
+    with sa_session_transaction() as session:
+        if last_bucket := session.query(func.max(ProjectEventUsageModel.bucket)).scalar():
+            return last_bucket - USAGE_ROLLUP_SETTLE_PERIOD
+
+        first_pipeline = session.query(func.min(PipelineModel.datetime)).scalar()
+        return first_pipeline.replace(minute=0, second=0, microsecond=0) if first_pipeline else None
+
+
 @cached(cache=TTLCache(maxsize=2048, ttl=(60 * 60 * 24)))
 def get_usage_data(datetime_from=None, datetime_to=None, top=10) -> dict:
     """
@@ -5176,15 +6329,7 @@ def get_usage_data(datetime_from=None, datetime_to=None, top=10) -> dict:
     ```
     """
     jobs = {}
-    for job_model in [
-        SRPMBuildModel,
-        CoprBuildGroupModel,
-        KojiBuildGroupModel,
-        VMImageBuildTargetModel,
-        TFTTestRunGroupModel,
-        SyncReleaseModel,
-        LogDetectiveRunGroupModel,
-    ]:
+    for job_model in USAGE_JOB_MODELS:
         if not hasattr(job_model, "__tablename__"):
             # otherwise mypi complains:
             # "type[ProjectAndEventsConnector]" has no attribute "__tablename__"
@@ -5244,6 +6389,143 @@ def get_usage_data(datetime_from=None, datetime_to=None, top=10) -> dict:
     }
 
 
+class ProjectIdSet:
+    """
+    Set of project IDs stored as a bitmap (an arbitrarily long int),
+    cheap to merge and count even with tens of thousands of projects.
+    """
+
+    __slots__ = ("bitmap",)
+
+    def __init__(self, bitmap: int = 0):
+        self.bitmap = bitmap
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> "ProjectIdSet":
+        ids = list(ids)
+        if not ids:
+            return cls()
+        bitmap = bytearray(max(ids) // 8 + 1)
+        for id_ in ids:
+            bitmap[id_ // 8] |= 1 << (id_ % 8)
+        return cls(int.from_bytes(bitmap, "little"))
+
+    def __or__(self, other: "ProjectIdSet") -> "ProjectIdSet":
+        return ProjectIdSet(self.bitmap | other.bitmap)
+
+    def __sub__(self, other: "ProjectIdSet") -> "ProjectIdSet":
+        return ProjectIdSet(self.bitmap & ~other.bitmap)
+
+    def __len__(self) -> int:
+        return bin(self.bitmap).count("1")
+
+    def __iter__(self):
+        return (id_ for id_, bit in enumerate(reversed(bin(self.bitmap)[2:])) if bit == "1")
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ProjectIdSet) and self.bitmap == other.bitmap
+
+    def __repr__(self):
+        return f"ProjectIdSet({sorted(self)})"
+
+
+@cached(cache=TTLCache(maxsize=32, ttl=(60 * 60 * 24)))
+def get_usage_intervals(datetime_to: datetime, delta: timedelta, count: int) -> dict:
+    """
+    Get the usage data for `count` consecutive intervals of the length `delta`
+    ending at `datetime_to` using a single grouped query per usage rollup table.
+
+    The hourly buckets before the first interval are merged into a single "past" one.
+
+    Args:
+        datetime_to: End of the last interval (exclusive), a whole hour.
+        delta: Length of the intervals, whole hours.
+        count: Number of the intervals.
+
+    Returns:
+        Dictionary with lists of values for the intervals (from the oldest one)::
+
+            {
+                "events": {project event type: [number of events handled]},
+                "jobs": {job type: [number of job runs]},
+                "active_projects": [ProjectIdSet],
+                "job_projects": {job type: [ProjectIdSet]},
+                "past_active_projects": ProjectIdSet,
+                "past_job_projects": {job type: ProjectIdSet},
+            }
+    """
+    datetime_from = datetime_to - count * delta
+    job_types = [job_model.__tablename__ for job_model in USAGE_JOB_MODELS]
+
+    def interval(usage_model):
+        # -1 for the past before the first interval
+        return case(
+            (usage_model.bucket < datetime_from, -1),
+            else_=cast(
+                func.floor(
+                    func.extract("epoch", usage_model.bucket - datetime_from)
+                    / delta.total_seconds(),
+                ),
+                Integer,
+            ),
+        ).label("interval")
+
+    events = {event_type.value: [0] * count for event_type in ProjectEventModelType}
+    jobs = {job_type: [0] * count for job_type in job_types}
+    project_ids: dict[tuple[Optional[str], int], list[int]] = {}
+
+    with sa_session_transaction() as session:
+        event_interval = interval(ProjectEventUsageModel)
+        for i, event_type, project_id, events_handled in (
+            session.query(
+                event_interval,
+                ProjectEventUsageModel.project_event_type,
+                ProjectEventUsageModel.project_id,
+                func.count(distinct(ProjectEventUsageModel.event_id)),
+            )
+            .filter(ProjectEventUsageModel.bucket < datetime_to)
+            .group_by(
+                event_interval,
+                ProjectEventUsageModel.project_event_type,
+                ProjectEventUsageModel.project_id,
+            )
+        ):
+            project_ids.setdefault((None, i), []).append(project_id)
+            if i >= 0:
+                events[event_type.value][i] += events_handled
+
+        job_interval = interval(JobUsageModel)
+        for i, job_type, project_id, job_runs in (
+            session.query(
+                job_interval,
+                JobUsageModel.job_type,
+                JobUsageModel.project_id,
+                func.sum(JobUsageModel.job_runs),
+            )
+            .filter(JobUsageModel.bucket < datetime_to)
+            .group_by(job_interval, JobUsageModel.job_type, JobUsageModel.project_id)
+        ):
+            if job_type not in jobs:
+                continue
+            project_ids.setdefault((job_type, i), []).append(project_id)
+            if i >= 0:
+                jobs[job_type][i] += job_runs
+
+    def projects(job_type: Optional[str], i: int) -> ProjectIdSet:
+        return ProjectIdSet.from_ids(project_ids.get((job_type, i), ()))
+
+    return {
+        "events": events,
+        "jobs": jobs,
+        "active_projects": [projects(None, i) for i in range(count)],
+        "job_projects": {
+            job_type: [projects(job_type, i) for i in range(count)] for job_type in job_types
+        },
+        "past_active_projects": projects(None, -1),
+        "past_job_projects": {job_type: projects(job_type, -1) for job_type in job_types},
+    }
+
+
 @cached(cache=TTLCache(maxsize=1, ttl=(60 * 60 * 24)))
 def get_onboarded_projects() -> tuple[dict[int, str], dict[int, str]]:
     """Returns a tuple with two dictionaries of project IDs and URLs:
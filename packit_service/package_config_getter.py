@@ -1,9 +1,14 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
 import logging
+import re
+from threading import Lock
 from typing import Optional
 
+import redis
+from cachetools import TTLCache
 from ogr.abstract import GitProject
 from packit.config import (
     PackageConfig,
@@ -14,18 +19,121 @@ from packit.exceptions import (
     PackitMissingConfigException,
 )
 
+from packit_service.celerizer import get_redis_config
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
     CONTACTS_URL,
     DOCS_HOW_TO_CONFIGURE_URL,
     DOCS_VALIDATE_CONFIG,
     DOCS_VALIDATE_HOOKS,
+    PACKAGE_CONFIG_CACHE_MAXSIZE,
+    PACKAGE_CONFIG_CACHE_TTL,
 )
+from packit_service.utils import dump_package_config, load_package_config
 from packit_service.worker.reporting import comment_without_duplicating, create_issue_if_needed
 
 logger = logging.getLogger(__name__)
 
 
+class PackageConfigCache:
+    """
+    Cache of the package configs parsed from the repositories.
+
+    Only configs read from a commit SHA are cached since the content of a commit
+    can't change (unlike a branch). The configs are stored serialized, so each hit
+    returns a fresh `PackageConfig` instance.
+
+    The configs are kept in a bounded in-memory TTL cache of the worker and,
+    if `package_config_cache_in_redis` is enabled in the service config, also in Redis
+    so that they are shared among the workers.
+    """
+
+    REDIS_KEY_PREFIX = "package-config"
+
+    def __init__(
+        self,
+        maxsize: int = PACKAGE_CONFIG_CACHE_MAXSIZE,
+        ttl: int = PACKAGE_CONFIG_CACHE_TTL,
+    ):
+        self.ttl = ttl
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+        self._redis: Optional[redis.Redis] = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(
+        project: GitProject,
+        reference: Optional[str],
+        package_config_path: Optional[str],
+    ) -> Optional[str]:
+        """
+        Get the cache key for the config of the project on the given reference
+        or `None` if the reference is not a commit SHA and can't be cached.
+        """
+        if not (reference and re.fullmatch(r"[0-9a-f]{40}|[0-9a-f]{64}", reference)):
+            return None
+
+        project_url = f"{project.service.instance_url}/{project.namespace}/{project.repo}"
+        return f"{project_url}:{reference}:{package_config_path or ''}"
+
+    @property
+    def redis(self) -> redis.Redis:
+        if self._redis is None:
+            redis_config = get_redis_config()
+            self._redis = redis.Redis(
+                host=redis_config["host"],
+                port=int(redis_config["port"]),
+                db=int(redis_config["db"]),
+                password=redis_config["password"],
+            )
+        return self._redis
+
+    def get(self, key: str, use_redis: bool = False) -> Optional[PackageConfig]:
+        with self._lock:
+            package_config = self._cache.get(key)
+
+        if package_config is None and use_redis:
+            try:
+                if raw_package_config := self.redis.get(f"{self.REDIS_KEY_PREFIX}:{key}"):
+                    package_config = json.loads(raw_package_config)
+                    with self._lock:
+                        self._cache[key] = package_config
+            except redis.RedisError as ex:
+                logger.warning(f"Failed to get the package config from Redis: {ex}")
+
+        if package_config is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return load_package_config(package_config)
+
+    def set(self, key: str, package_config: PackageConfig, use_redis: bool = False) -> None:
+        dumped_package_config = dump_package_config(package_config)
+        with self._lock:
+            self._cache[key] = dumped_package_config
+
+        if use_redis:
+            try:
+                self.redis.set(
+                    f"{self.REDIS_KEY_PREFIX}:{key}",
+                    json.dumps(dumped_package_config),
+                    ex=self.ttl,
+                )
+            except redis.RedisError as ex:
+                logger.warning(f"Failed to store the package config in Redis: {ex}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+        self.hits = self.misses = 0
+
+
+package_config_cache = PackageConfigCache()
+
+
 class PackageConfigGetter:
     @staticmethod
     def get_package_config_from_repo(
@@ -43,11 +151,23 @@ class PackageConfigGetter:
             return None
 
         project_to_search_in = base_project or project
+        service_config = ServiceConfig.get_service_config()
+        package_config_path = service_config.package_config_path_override
+        if cache_key := PackageConfigCache.get_key(
+            project_to_search_in,
+            reference,
+            package_config_path,
+        ):
+            use_redis = service_config.package_config_cache_in_redis
+            if cached_package_config := package_config_cache.get(cache_key, use_redis):
+                logger.debug(f"Using the cached package config for {cache_key}.")
+                return cached_package_config
+
         try:
             package_config: PackageConfig = get_package_config_from_repo(
                 project=project_to_search_in,
                 ref=reference,
-                package_config_path=ServiceConfig.get_service_config().package_config_path_override,
+                package_config_path=package_config_path,
             )
             if not package_config and fail_when_missing:
                 raise PackitMissingConfigException(
@@ -82,4 +202,7 @@ class PackageConfigGetter:
                 )
             raise ex
 
+        if cache_key and package_config:
+            package_config_cache.set(cache_key, package_config, use_redis)
+
         return package_config
@@ -102,6 +102,17 @@ class ServiceConfigSchema(UserConfigSchema):
     logdetective_enabled = fields.Bool(missing=False, default=False)
     logdetective_url = fields.String()
     logdetective_token = fields.String()
+    package_config_cache_in_redis = fields.Bool(missing=False)
+    db_pool_size = fields.Integer(missing=None)
+    db_max_overflow = fields.Integer(missing=None)
+    db_pool_recycle = fields.Integer(missing=None)
+    db_pool_pre_ping = fields.Bool(missing=True)
+    koji_build_submission_concurrency = fields.Integer(missing=4)
+    sync_release_concurrency = fields.Integer(missing=1)
+    repository_mirrors_path = fields.String(missing=None)
+    repository_mirrors_disk_budget = fields.Integer(missing=20)
+    srpm_cache_path = fields.String(missing=None)
+    srpm_cache_disk_budget = fields.Integer(missing=5)
 
     @post_load
     def make_instance(self, data, **kwargs):
@@ -11,8 +11,12 @@ from packit_service.models import (
     BodhiUpdateTargetModel,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import get_page, pagination_arguments
+from packit_service.service.api.utils import (
+    get_project_info_from_build,
+    paginated_response,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -25,10 +29,13 @@ class BodhiUpdatesList(Resource):
     @ns.response(HTTPStatus.PARTIAL_CONTENT, "Bodhi updates list follows")
     def get(self):
         """List all Bodhi updates."""
-        first, last = indices()
+        page = get_page(int)
         result = []
 
-        for update in BodhiUpdateTargetModel.get_range(first, last):
+        updates = list(
+            BodhiUpdateTargetModel.get_range(page.first, page.last, before=page.after_id)
+        )
+        for update in updates:
             update_dict = {
                 "packit_id": update.id,
                 "status": update.status,
@@ -50,12 +57,12 @@ class BodhiUpdatesList(Resource):
 
             result.append(update_dict)
 
-        resp = response_maker(
+        return paginated_response(
             result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+            "bodhi-updates",
+            page,
+            next_cursor=page.get_next_cursor(updates, key=lambda update: (update.id,)),
         )
-        resp.headers["Content-Range"] = f"bodhi-updates {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/<int:id>")
@@ -12,10 +12,11 @@ from packit_service.models import (
     KojiBuildTargetModel,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import get_page, pagination_arguments
 from packit_service.service.api.utils import (
     get_log_detective_runs,
     get_project_info_from_build,
+    paginated_response,
     response_maker,
 )
 
@@ -33,10 +34,13 @@ class KojiBuildsList(Resource):
         scratch = (
             request.args.get("scratch").lower() == "true" if "scratch" in request.args else None
         )
-        first, last = indices()
+        page = get_page(int)
         result = []
 
-        for build in KojiBuildTargetModel.get_range(first, last, scratch):
+        builds = list(
+            KojiBuildTargetModel.get_range(page.first, page.last, scratch, before=page.after_id),
+        )
+        for build in builds:
             build_dict = {
                 "packit_id": build.id,
                 "task_id": build.task_id,
@@ -59,12 +63,12 @@ class KojiBuildsList(Resource):
 
             result.append(build_dict)
 
-        resp = response_maker(
+        return paginated_response(
             result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+            "koji-builds",
+            page,
+            next_cursor=page.get_next_cursor(builds, key=lambda build: (build.id,)),
         )
-        resp.headers["Content-Range"] = f"koji-builds {first + 1}-{last}/*"
-        return resp
 
 
 @koji_builds_ns.route("/<int:id>")
@@ -11,8 +11,12 @@ from packit_service.models import (
     KojiTagRequestTargetModel,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import get_page, pagination_arguments
+from packit_service.service.api.utils import (
+    get_project_info_from_build,
+    paginated_response,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -25,10 +29,13 @@ class KojiTagRequestsList(Resource):
     @koji_tag_requests_ns.response(HTTPStatus.PARTIAL_CONTENT, "Koji tagging requests list follows")
     def get(self):
         """List all Koji tagging requests."""
-        first, last = indices()
+        page = get_page(int)
         result = []
 
-        for tag_request in KojiTagRequestTargetModel.get_range(first, last):
+        tag_requests = list(
+            KojiTagRequestTargetModel.get_range(page.first, page.last, before=page.after_id),
+        )
+        for tag_request in tag_requests:
             tag_request_dict = {
                 "packit_id": tag_request.id,
                 "task_id": tag_request.task_id,
@@ -51,12 +58,15 @@ class KojiTagRequestsList(Resource):
 
             result.append(tag_request_dict)
 
-        resp = response_maker(
+        return paginated_response(
             result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+            "koji-tag-requests",
+            page,
+            next_cursor=page.get_next_cursor(
+                tag_requests,
+                key=lambda tag_request: (tag_request.id,),
+            ),
         )
-        resp.headers["Content-Range"] = f"koji-tag-requests {first + 1}-{last}/*"
-        return resp
 
 
 @koji_tag_requests_ns.route("/<int:id>")
@@ -11,8 +11,12 @@ from packit_service.models import (
     LogDetectiveRunModel,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import get_page, pagination_arguments
+from packit_service.service.api.utils import (
+    get_project_info_from_build,
+    paginated_response,
+    response_maker,
+)
 
 logger = logging.getLogger("packit_service")
 
@@ -91,10 +95,13 @@ class LogDetectiveResultList(Resource):
     def get(self):
         """List all Log Detective results."""
 
-        first, last = indices()
+        page = get_page(int)
         result = []
 
-        for log_detective_run_model in LogDetectiveRunModel.get_range(first, last):
+        log_detective_run_models = list(
+            LogDetectiveRunModel.get_range(page.first, page.last, before=page.after_id),
+        )
+        for log_detective_run_model in log_detective_run_models:
             run_ids = []
             if log_detective_run_model.group_of_targets.runs:
                 run_ids = sorted(run.id for run in log_detective_run_model.group_of_targets.runs)
@@ -112,9 +119,12 @@ class LogDetectiveResultList(Resource):
             log_detective_result_dict.update(get_project_info_from_build(log_detective_run_model))
             result.append(log_detective_result_dict)
 
-        resp = response_maker(
+        return paginated_response(
             result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+            "log-detective-results",
+            page,
+            next_cursor=page.get_next_cursor(
+                log_detective_run_models,
+                key=lambda log_detective_run_model: (log_detective_run_model.id,),
+            ),
         )
-        resp.headers["Content-Range"] = f"log-detective-results {first + 1}-{last}/*"
-        return resp
@@ -10,8 +10,12 @@ from packit_service.models import (
     OSHScanModel,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import get_page, pagination_arguments
+from packit_service.service.api.utils import (
+    get_project_info_from_build,
+    paginated_response,
+    response_maker,
+)
 
 logger = getLogger("packit_service")
 
@@ -25,20 +29,21 @@ class ScansList(Resource):
     def get(self):
         """List all scans."""
 
-        first, last = indices()
+        page = get_page(int)
         result = []
 
-        for scan in OSHScanModel.get_range(first, last):
+        scans = list(OSHScanModel.get_range(page.first, page.last, before=page.after_id))
+        for scan in scans:
             scan_dict = get_scan_info(scan)
             scan_dict["packit_id"] = scan.id
             result.append(scan_dict)
 
-        resp = response_maker(
+        return paginated_response(
             result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+            "openscanhub-scans",
+            page,
+            next_cursor=page.get_next_cursor(scans, key=lambda scan: (scan.id,)),
         )
-        resp.headers["Content-Range"] = f"openscanhub-scans {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/<int:id>")
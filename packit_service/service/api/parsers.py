@@ -1,8 +1,14 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import base64
+import json
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any, NamedTuple, Optional
+
 from flask import request
-from flask_restx import reqparse
+from flask_restx import abort, reqparse
 
 DEFAULT_PAGE = 1
 DEFAULT_PER_PAGE = 10
@@ -23,6 +29,12 @@ pagination_arguments.add_argument(
     default=DEFAULT_PER_PAGE,
     help="Results per page",
 )
+pagination_arguments.add_argument(
+    "cursor",
+    type=str,
+    required=False,
+    help="Cursor of the page (from the `next` link of the previous page), replaces `page`",
+)
 
 
 def indices():
@@ -35,3 +47,72 @@ def indices():
     first = (page - 1) * per_page
     last = page * per_page
     return first, last
+
+
+class Page(NamedTuple):
+    """Page of a list requested either by its number or by a cursor."""
+
+    first: int
+    last: int
+    # sort key of the last entry of the previous page, if requested by a cursor
+    after: Optional[tuple] = None
+
+    @property
+    def after_id(self) -> Optional[int]:
+        """ID of the last entry of the previous page (of a list ordered by the ID)."""
+        return self.after[0] if self.after else None
+
+    def get_next_cursor(self, entries: list, key: Callable[[Any], tuple]) -> Optional[str]:
+        """
+        Get the cursor of the next page.
+
+        Args:
+            entries: Entries of this page.
+            key: Sort key of an entry.
+
+        Returns:
+            The cursor or `None` if this is the last page.
+        """
+        if not entries or len(entries) < self.last - self.first:
+            return None
+        return encode_cursor(key(entries[-1]))
+
+
+def encode_cursor(key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str, key_types: tuple[type, ...]) -> tuple:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        key = None
+    if (
+        not isinstance(key, list)
+        or len(key) != len(key_types)
+        or not all(isinstance(value, type_) for value, type_ in zip(key, key_types))
+    ):
+        abort(HTTPStatus.BAD_REQUEST, "Invalid cursor.")
+    return tuple(key)
+
+
+def get_page(*key_types: type) -> Page:
+    """
+    Get the page requested by the arguments.
+
+    A page requested by a cursor is looked up by the sort key of the last entry
+    of the previous page (keyset pagination), so it doesn't get slower
+    the further it is.
+
+    Args:
+        key_types: Types of the values of the sort key of the list.
+
+    Returns:
+        The page.
+    """
+    args = pagination_arguments.parse_args(request)
+    if cursor := args.get("cursor"):
+        per_page = args.get("per_page", DEFAULT_PER_PAGE)
+        return Page(first=0, last=per_page, after=decode_cursor(cursor, key_types))
+    first, last = indices()
+    return Page(first=first, last=last)
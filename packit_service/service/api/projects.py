@@ -7,8 +7,8 @@ from logging import getLogger
 from flask_restx import Namespace, Resource
 
 from packit_service.models import GitProjectModel
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import response_maker
+from packit_service.service.api.parsers import get_page, indices, pagination_arguments
+from packit_service.service.api.utils import paginated_response, response_maker
 from packit_service.service.urls import get_srpm_build_info_url
 
 logger = getLogger("packit_service")
@@ -28,9 +28,10 @@ class ProjectsList(Resource):
         """List all GitProjects"""
 
         result = []
-        first, last = indices()
+        page = get_page(bool, str, int)
 
-        for project in GitProjectModel.get_range(first, last):
+        projects = list(GitProjectModel.get_range(page.first, page.last, after=page.after))
+        for project in projects:
             project_info = {
                 "namespace": project.namespace,
                 "repo_name": project.repo_name,
@@ -42,12 +43,16 @@ class ProjectsList(Resource):
             }
             result.append(project_info)
 
-        resp = response_maker(
+        return paginated_response(
             result,
+            "git-projects",
+            page,
+            next_cursor=page.get_next_cursor(
+                projects,
+                key=GitProjectModel.get_listing_key,
+            ),
             status=HTTPStatus.PARTIAL_CONTENT if result else HTTPStatus.OK,
         )
-        resp.headers["Content-Range"] = f"git-projects {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/<forge>/<path:namespace>/<repo_name>")
@@ -86,9 +91,12 @@ class ProjectsForge(Resource):
         """List of projects of given forge (e.g. github.com, gitlab.com)"""
 
         result = []
-        first, last = indices()
+        page = get_page(bool, str, int)
 
-        for project in GitProjectModel.get_by_forge(first, last, forge):
+        projects = list(
+            GitProjectModel.get_by_forge(page.first, page.last, forge, after=page.after)
+        )
+        for project in projects:
             project_info = {
                 "namespace": project.namespace,
                 "repo_name": project.repo_name,
@@ -100,12 +108,16 @@ class ProjectsForge(Resource):
             }
             result.append(project_info)
 
-        resp = response_maker(
+        return paginated_response(
             result,
+            "git-projects",
+            page,
+            next_cursor=page.get_next_cursor(
+                projects,
+                key=GitProjectModel.get_listing_key,
+            ),
             status=HTTPStatus.PARTIAL_CONTENT if result else HTTPStatus.OK,
         )
-        resp.headers["Content-Range"] = f"git-projects {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/<forge>/<path:namespace>")
@@ -11,10 +11,11 @@ from packit_service.models import (
     SyncReleaseModel,
     SyncReleaseTargetModel,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import get_page, pagination_arguments
 from packit_service.service.api.utils import (
     get_sync_release_info,
     get_sync_release_target_info,
+    paginated_response,
     response_maker,
 )
 
@@ -30,19 +31,29 @@ class ProposeDownstreamList(Resource):
     def get(self):
         """List of all Propose Downstreams results."""
 
-        first, last = indices()
+        page = get_page(int)
+        sync_releases = list(
+            SyncReleaseModel.get_range(
+                page.first,
+                page.last,
+                job_type=SyncReleaseJobType.propose_downstream,
+                before=page.after_id,
+            ),
+        )
         result = [
             get_sync_release_info(propose_downstream_results)
-            for propose_downstream_results in SyncReleaseModel.get_range(
-                first,
-                last,
-                job_type=SyncReleaseJobType.propose_downstream,
-            )
+            for propose_downstream_results in sync_releases
         ]
 
-        resp = response_maker(result, status=HTTPStatus.PARTIAL_CONTENT)
-        resp.headers["Content-Range"] = f"propose-downstreams {first + 1}-{last}/*"
-        return resp
+        return paginated_response(
+            result,
+            "propose-downstreams",
+            page,
+            next_cursor=page.get_next_cursor(
+                sync_releases,
+                key=lambda sync_release: (sync_release.id,),
+            ),
+        )
 
 
 @ns.route("/<int:id>")
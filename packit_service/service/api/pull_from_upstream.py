@@ -11,10 +11,11 @@ from packit_service.models import (
     SyncReleaseModel,
     SyncReleaseTargetModel,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import get_page, pagination_arguments
 from packit_service.service.api.utils import (
     get_sync_release_info,
     get_sync_release_target_info,
+    paginated_response,
     response_maker,
 )
 
@@ -30,19 +31,26 @@ class PullFromUpstreamList(Resource):
     def get(self):
         """List of all Pull from upstream results."""
 
-        first, last = indices()
-        result = [
-            get_sync_release_info(pull_results)
-            for pull_results in SyncReleaseModel.get_range(
-                first,
-                last,
+        page = get_page(int)
+        sync_releases = list(
+            SyncReleaseModel.get_range(
+                page.first,
+                page.last,
                 job_type=SyncReleaseJobType.pull_from_upstream,
-            )
-        ]
+                before=page.after_id,
+            ),
+        )
+        result = [get_sync_release_info(pull_results) for pull_results in sync_releases]
 
-        resp = response_maker(result, status=HTTPStatus.PARTIAL_CONTENT)
-        resp.headers["Content-Range"] = f"pull-from-upstreams {first + 1}-{last}/*"
-        return resp
+        return paginated_response(
+            result,
+            "pull-from-upstreams",
+            page,
+            next_cursor=page.get_next_cursor(
+                sync_releases,
+                key=lambda sync_release: (sync_release.id,),
+            ),
+        )
 
 
 @ns.route("/<int:id>")
@@ -12,15 +12,17 @@ from packit_service.models import (
     CoprBuildGroupModel,
     KojiBuildGroupModel,
     PipelineModel,
+    ProjectEventModel,
     SRPMBuildModel,
     SyncReleaseModel,
     TFTTestRunGroupModel,
     VMImageBuildTargetModel,
     optional_timestamp,
 )
-from packit_service.service.api.parsers import indices, pagination_arguments
+from packit_service.service.api.parsers import get_page, pagination_arguments
 from packit_service.service.api.utils import (
     get_project_info_from_build,
+    paginated_response,
     response_maker,
 )
 
@@ -63,11 +65,74 @@ def flatten_and_remove_none(ids):
     return filter(None, (arr[0] for arr in ids))
 
 
+def _load_runs_models(runs: list) -> tuple[dict, dict]:
+    """
+    Load all the models referenced by the given merged runs.
+
+    Each model family is fetched by a single query with the pipelines, project
+    events and targets loaded eagerly, the project event objects (and their projects)
+    are then fetched with one query per project event type.
+
+    Args:
+        runs: List of merged `PipelineModel`s.
+
+    Returns:
+        Dictionary mapping the model class to the dictionary of its instances
+        by their IDs and dictionary mapping the type and the event ID of a project
+        event to its project event object.
+    """
+    models = {
+        SRPMBuildModel: SRPMBuildModel.get_by_ids(
+            pipeline.srpm_build_id for pipeline in runs if pipeline.srpm_build_id
+        ),
+        SyncReleaseModel: SyncReleaseModel.get_by_ids(
+            (
+                ids[0]
+                for pipeline in runs
+                if (ids := list(flatten_and_remove_none(pipeline.sync_release_run_id)))
+            ),
+            SyncReleaseModel.sync_release_targets,
+        ),
+        VMImageBuildTargetModel: VMImageBuildTargetModel.get_by_ids(
+            id_ for pipeline in runs for id_ in flatten_and_remove_none(pipeline.vm_image_build_id)
+        ),
+    }
+    for Model, targets, column in (
+        (CoprBuildGroupModel, CoprBuildGroupModel.copr_build_targets, "copr_build_group_id"),
+        (KojiBuildGroupModel, KojiBuildGroupModel.koji_build_targets, "koji_build_group_id"),
+        (TFTTestRunGroupModel, TFTTestRunGroupModel.tft_test_run_targets, "test_run_group_id"),
+        (
+            BodhiUpdateGroupModel,
+            BodhiUpdateGroupModel.bodhi_update_targets,
+            "bodhi_update_group_id",
+        ),
+    ):
+        models[Model] = Model.get_by_ids(
+            (
+                id_
+                for pipeline in runs
+                for id_ in flatten_and_remove_none(getattr(pipeline, column))
+            ),
+            targets,
+        )
+
+    project_event_objects = ProjectEventModel.load_project_event_objects(
+        project_event
+        for models_by_id in models.values()
+        for model in models_by_id.values()
+        if (project_event := model.get_project_event_model())
+    )
+    return models, project_event_objects
+
+
 def process_runs(runs):
     """
     Process `PipelineModel`s and construct a JSON that is returned from the endpoints
     that return merged chroots.
 
+    All the models referenced by the runs are loaded in bulk beforehand,
+    so the number of queries does not depend on the number of runs.
+
     Args:
         runs: Iterator over merged `PipelineModel`s.
 
@@ -76,6 +141,11 @@ def process_runs(runs):
     """
     result = []
 
+    runs = list(runs)
+    # the project event objects are kept referenced for the whole page, so that
+    # the models get them from the identity map of the session without a query
+    models, _project_event_objects = _load_runs_models(runs)
+
     for pipeline in runs:
         response_dict = {
             "merged_run_id": pipeline.merged_id,
@@ -89,7 +159,7 @@ def process_runs(runs):
             "vm_image_build": [],
         }
 
-        if srpm_build := SRPMBuildModel.get_by_id(pipeline.srpm_build_id):
+        if srpm_build := models[SRPMBuildModel].get(pipeline.srpm_build_id):
             response_dict["srpm"] = {
                 "packit_id": srpm_build.id,
                 "status": srpm_build.status,
@@ -106,7 +176,7 @@ def process_runs(runs):
             ("bodhi_update", BodhiUpdateGroupModel, pipeline.bodhi_update_group_id),
         ):
             for packit_id in set(flatten_and_remove_none(packit_ids)):
-                group_row = Model.get_by_id(packit_id)
+                group_row = models[Model][packit_id]
                 for row in group_row.grouped_targets:
                     if row.status == BuildStatus.waiting_for_srpm:
                         continue
@@ -121,23 +191,17 @@ def process_runs(runs):
                         response_dict["time_submitted"] = optional_timestamp(
                             row.submitted_time,
                         )
-                        response_dict["trigger"] = get_project_info_from_build(row)
+                        response_dict["trigger"] = get_project_info_from_build(group_row)
 
         # handle propose-downstream and pull-from-upstream
         if sync_release := list(flatten_and_remove_none(pipeline.sync_release_run_id)):
-            _add_sync_release(
-                SyncReleaseModel.get_by_id(sync_release[0]),
-                response_dict,
-            )
+            _add_sync_release(models[SyncReleaseModel][sync_release[0]], response_dict)
 
         # handle VM image builds
         for vm_image_build_id in set(
             flatten_and_remove_none(pipeline.vm_image_build_id),
         ):
-            _add_vm_image_build(
-                VMImageBuildTargetModel.get_by_id(vm_image_build_id),
-                response_dict,
-            )
+            _add_vm_image_build(models[VMImageBuildTargetModel][vm_image_build_id], response_dict)
 
         result.append(response_dict)
 
@@ -150,14 +214,14 @@ class RunsList(Resource):
     @ns.response(HTTPStatus.PARTIAL_CONTENT.value, "List of runs follows")
     def get(self):
         """List all runs."""
-        first, last = indices()
-        result = process_runs(PipelineModel.get_merged_chroots(first, last))
-        resp = response_maker(
-            result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+        page = get_page(int)
+        runs = list(PipelineModel.get_merged_chroots(page.first, page.last, before=page.after_id))
+        return paginated_response(
+            process_runs(runs),
+            "runs",
+            page,
+            next_cursor=page.get_next_cursor(runs, key=lambda run: (run.merged_id,)),
         )
-        resp.headers["Content-Range"] = f"runs {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/merged/<int:id>")
@@ -17,8 +17,12 @@ from packit_service.models import (
     optional_timestamp,
 )
 from packit_service.service.api.errors import ValidationFailed
-from packit_service.service.api.parsers import indices, pagination_arguments
-from packit_service.service.api.utils import get_project_info_from_build, response_maker
+from packit_service.service.api.parsers import get_page, pagination_arguments
+from packit_service.service.api.utils import (
+    get_project_info_from_build,
+    paginated_response,
+    response_maker,
+)
 
 logger = logging.getLogger("packit_service")
 
@@ -111,10 +115,13 @@ class TestingFarmResults(Resource):
 
         result = []
 
-        first, last = indices()
+        page = get_page(int)
         # results have nothing other than ref in common, so it doesn't make sense to
         # merge them like copr builds
-        for tf_result in TFTTestRunTargetModel.get_range(first, last):
+        tf_results = list(
+            TFTTestRunTargetModel.get_range(page.first, page.last, before=page.after_id),
+        )
+        for tf_result in tf_results:
             result_dict = {
                 "packit_id": tf_result.id,
                 "pipeline_id": tf_result.pipeline_id,
@@ -133,12 +140,12 @@ class TestingFarmResults(Resource):
 
             result.append(result_dict)
 
-        resp = response_maker(
+        return paginated_response(
             result,
-            status=HTTPStatus.PARTIAL_CONTENT,
+            "test-results",
+            page,
+            next_cursor=page.get_next_cursor(tf_results, key=lambda tf_result: (tf_result.id,)),
         )
-        resp.headers["Content-Range"] = f"test-results {first + 1}-{last}/*"
-        return resp
 
 
 @ns.route("/<int:id>")
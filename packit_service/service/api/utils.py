@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: MIT
 
 from http import HTTPStatus
-from typing import Any, Union
+from typing import Any, Optional, Union
+from urllib.parse import urlencode
 
+from flask import request
 from flask.json import jsonify
 
 from packit_service.models import (
@@ -24,6 +26,7 @@ from packit_service.models import (
     VMImageBuildTargetModel,
     optional_timestamp,
 )
+from packit_service.service.api.parsers import Page
 
 
 def response_maker(result: Any, status: HTTPStatus = HTTPStatus.OK):
@@ -33,6 +36,37 @@ def response_maker(result: Any, status: HTTPStatus = HTTPStatus.OK):
     return resp
 
 
+def paginated_response(
+    result: list,
+    name: str,
+    page: Page,
+    next_cursor: Optional[str],
+    status: HTTPStatus = HTTPStatus.PARTIAL_CONTENT,
+):
+    """
+    Make a response with a page of a list.
+
+    Args:
+        result: Entries of the page.
+        name: Name of the list for the `Content-Range` header, which is sent
+            only for the pages requested by their number.
+        page: The page.
+        next_cursor: Cursor of the next page, sent in the `X-Next-Cursor` header
+            and in the `next` link (`Link` header), if any.
+        status: Status of the response.
+    """
+    resp = response_maker(result, status=status)
+    if not page.after:
+        resp.headers["Content-Range"] = f"{name} {page.first + 1}-{page.last}/*"
+    if next_cursor:
+        args = request.args.to_dict()
+        args.pop("page", None)
+        args["cursor"] = next_cursor
+        resp.headers["X-Next-Cursor"] = next_cursor
+        resp.headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    return resp
+
+
 def get_project_info_from_build(
     build: Union[
         SRPMBuildModel,
@@ -4,10 +4,10 @@
 import hmac
 import json
 import os
+import time
 from hashlib import sha256
 from http import HTTPStatus
 from logging import getLogger
-from os import getenv
 
 import jwt
 from flask import request
@@ -15,11 +15,11 @@ from flask_restx import Namespace, Resource, fields
 from ogr.parsing import parse_git_repo
 from prometheus_client import Counter
 
-from packit_service.celerizer import celery_app
 from packit_service.config import ServiceConfig
-from packit_service.constants import CELERY_DEFAULT_MAIN_TASK_NAME, GITLAB_ISSUE
+from packit_service.constants import GITLAB_ISSUE
 from packit_service.models import ProjectAuthenticationIssueModel
 from packit_service.service.api.errors import ValidationFailed
+from packit_service.service.ingress import PublishingFailed, webhook_publisher
 
 logger = getLogger("packit_service")
 config = ServiceConfig.get_service_config()
@@ -62,12 +62,14 @@ class GithubWebhook(Resource):
     )
     @ns.response(HTTPStatus.BAD_REQUEST.value, "Bad request data")
     @ns.response(HTTPStatus.UNAUTHORIZED.value, "X-Hub-Signature validation failed")
+    @ns.response(HTTPStatus.SERVICE_UNAVAILABLE.value, "Webhook couldn't be enqueued")
     # Just to be able to specify some payload in Swagger UI
     @ns.expect(ping_payload)
     def post(self):
         """
         A webhook used by Packit-as-a-Service GitHub App.
         """
+        received = time.monotonic()
         msg = request.json
 
         if not msg:
@@ -97,14 +99,20 @@ class GithubWebhook(Resource):
             ).inc()
             return "Thanks but we don't care about this event", HTTPStatus.ACCEPTED
 
-        celery_app.send_task(
-            name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
-            kwargs={
-                "event": msg,
-                "source": "github",
-                "event_type": request.headers.get("X-GitHub-Event"),
-            },
-        )
+        try:
+            webhook_publisher.publish(
+                event=msg,
+                source="github",
+                event_type=request.headers.get("X-GitHub-Event"),
+                received=received,
+            )
+        except PublishingFailed as exc:
+            logger.error(f"/webhooks/github {exc}")
+            github_webhook_calls.labels(
+                result="not_published",
+                process_id=os.getpid(),
+            ).inc()
+            return str(exc), HTTPStatus.SERVICE_UNAVAILABLE
         github_webhook_calls.labels(result="accepted", process_id=os.getpid()).inc()
 
         return "Webhook accepted. We thank you, Github.", HTTPStatus.ACCEPTED
@@ -177,12 +185,14 @@ class GitlabWebhook(Resource):
     )
     @ns.response(HTTPStatus.BAD_REQUEST.value, "Bad request data")
     @ns.response(HTTPStatus.UNAUTHORIZED.value, "X-Gitlab-Token validation failed")
+    @ns.response(HTTPStatus.SERVICE_UNAVAILABLE.value, "Webhook couldn't be enqueued")
     # Just to be able to specify some payload in Swagger UI
     @ns.expect(ping_payload_gitlab)
     def post(self):
         """
         A webhook used by Packit-as-a-Service Gitlab hook.
         """
+        received = time.monotonic()
         msg = request.json
 
         if not msg:
@@ -202,14 +212,16 @@ class GitlabWebhook(Resource):
         if not self.interested():
             return "Thanks but we don't care about this event", HTTPStatus.ACCEPTED
 
-        celery_app.send_task(
-            name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
-            kwargs={
-                "event": msg,
-                "source": "gitlab",
-                "event_type": request.headers.get("X-Gitlab-Event"),
-            },
-        )
+        try:
+            webhook_publisher.publish(
+                event=msg,
+                source="gitlab",
+                event_type=request.headers.get("X-Gitlab-Event"),
+                received=received,
+            )
+        except PublishingFailed as exc:
+            logger.error(f"/webhooks/gitlab {exc}")
+            return str(exc), HTTPStatus.SERVICE_UNAVAILABLE
 
         return "Webhook accepted. We thank you, Gitlab.", HTTPStatus.ACCEPTED
 
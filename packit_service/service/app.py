@@ -80,7 +80,7 @@ def get_flask_application():
 
 packit_as_a_service = Proxy(get_flask_application)
 
-CORS(packit_as_a_service)
+CORS(packit_as_a_service, expose_headers=["Link", "X-Next-Cursor"])
 
 INLINE = [
     "'unsafe-inline'",
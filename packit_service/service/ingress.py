@@ -0,0 +1,244 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Publishing of the accepted webhooks to the Celery broker.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from logging import getLogger
+from os import getenv
+from typing import Any, Optional
+
+from prometheus_client import Histogram
+
+from packit_service.celerizer import celery_app
+from packit_service.constants import CELERY_DEFAULT_MAIN_TASK_NAME
+
+logger = getLogger("packit_service")
+
+# Keys of the GitHub/GitLab webhook payloads read by the `Parser`
+# (on any level of nesting), keep in sync with `packit_service.worker.parser`.
+PARSED_WEBHOOK_KEYS = frozenset(
+    {
+        "account",
+        "action",
+        "after",
+        "app",
+        "base",
+        "before",
+        "body",
+        "check_run",
+        "checkout_sha",
+        "comment",
+        "commit",
+        "commit_id",
+        "commits",
+        "created_at",
+        "deleted",
+        "description",
+        "detailed_status",
+        "external_id",
+        "full_name",
+        "head",
+        "head_commit",
+        "head_sha",
+        "html_url",
+        "id",
+        "iid",
+        "installation",
+        "issue",
+        "last_commit",
+        "login",
+        "merge_request",
+        "message",
+        "name",
+        "note",
+        "number",
+        "object_attributes",
+        "object_kind",
+        "oldrev",
+        "owner",
+        "project",
+        "pull_request",
+        "pusher",
+        "ref",
+        "release",
+        "repo",
+        "repositories",
+        "repository",
+        "sender",
+        "sha",
+        "size",
+        "slug",
+        "source",
+        "source_branch",
+        "state",
+        "status",
+        "tag",
+        "tag_name",
+        "target_branch",
+        "title",
+        "total_commits_count",
+        "type",
+        "url",
+        "user",
+        "user_username",
+        "username",
+        "web_url",
+    },
+)
+
+webhook_enqueue_latency = Histogram(
+    "webhook_enqueue_latency",
+    "Time from receiving a webhook to publishing it to the broker [s]",
+    # process_id = label the metric with respective process ID, so we can aggregate
+    ["source", "event_type", "process_id"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+def strip_payload(payload: Any) -> Any:
+    """
+    Remove the parts of the webhook payload the `Parser` doesn't read,
+    e.g. the API URLs of all the objects or the changed files of the pushed commits.
+
+    Args:
+        payload: Webhook payload (or its part).
+
+    Returns:
+        Payload containing only the keys from `PARSED_WEBHOOK_KEYS`.
+    """
+    if isinstance(payload, dict):
+        return {
+            key: strip_payload(value)
+            for key, value in payload.items()
+            if key in PARSED_WEBHOOK_KEYS
+        }
+    if isinstance(payload, list):
+        return [strip_payload(item) for item in payload]
+    return payload
+
+
+class PublishingFailed(Exception):
+    """The webhook couldn't be published to the broker."""
+
+
+class WebhookPublisher:
+    """
+    Publishes the webhooks to the broker from a background thread.
+
+    Requests put their message into a small buffer and wait until it's published,
+    the webhook is accepted only after that (at-least-once delivery, a webhook
+    we failed to publish can be redelivered by the forge). The thread publishes
+    all the messages buffered in the meantime using a single producer,
+    so a burst of webhooks doesn't make each request acquire its own broker
+    connection. The messages are compressed.
+    """
+
+    def __init__(self, buffer_size: int = 64, timeout: float = 10.0) -> None:
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self._buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _ensure_running(self) -> None:
+        # the thread doesn't survive a fork of the (httpd) process
+        with self._lock:
+            if self._thread and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            self._buffer = queue.Queue(maxsize=self.buffer_size)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="webhook-publisher",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def publish(
+        self,
+        event: dict,
+        source: str,
+        event_type: Optional[str],
+        received: float,
+    ) -> None:
+        """
+        Publish the webhook and wait for it to be published.
+
+        Args:
+            event: Webhook payload.
+            source: Source of the event, `github` or `gitlab`.
+            event_type: Type of the event from the headers.
+            received: Time (`time.monotonic()`) the webhook was received.
+
+        Raises:
+            PublishingFailed: If the webhook wasn't published in time.
+        """
+        self._ensure_running()
+        message = {
+            "event": strip_payload(event),
+            "source": source,
+            "event_type": event_type,
+        }
+        published: Future = Future()
+        try:
+            self._buffer.put((message, received, published), timeout=self.timeout)
+            published.result(timeout=self.timeout)
+        except queue.Full as ex:
+            raise PublishingFailed("Buffer of the webhooks to publish is full.") from ex
+        except FutureTimeoutError as ex:
+            raise PublishingFailed("Publishing of the webhook timed out.") from ex
+        except Exception as ex:
+            raise PublishingFailed(f"Publishing of the webhook failed: {ex}") from ex
+
+    def _run(self) -> None:
+        buffer = self._buffer
+        while True:
+            batch = [buffer.get()]
+            while len(batch) < self.buffer_size:
+                try:
+                    batch.append(buffer.get_nowait())
+                except queue.Empty:  # noqa: PERF203
+                    break
+            self.publish_batch(batch)
+
+    @staticmethod
+    def publish_batch(batch: list[tuple[dict, float, Future]]) -> None:
+        """Publish the buffered messages using a single producer."""
+        task_name = getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME
+        try:
+            with celery_app.producer_or_acquire() as producer:
+                for message, received, published in batch:
+                    try:
+                        celery_app.send_task(
+                            name=task_name,
+                            kwargs=message,
+                            compression="zlib",
+                            producer=producer,
+                        )
+                    except Exception as ex:
+                        logger.warning(f"Failed to publish {message['event_type']} webhook: {ex}")
+                        published.set_exception(ex)
+                        continue
+                    webhook_enqueue_latency.labels(
+                        source=message["source"],
+                        event_type=message["event_type"],
+                        process_id=os.getpid(),
+                    ).observe(time.monotonic() - received)
+                    published.set_result(None)
+        except Exception as ex:
+            logger.warning(f"Failed to acquire a producer to publish the webhooks: {ex}")
+            for _, _, published in batch:
+                if not published.done():
+                    published.set_exception(ex)
+
+
+webhook_publisher = WebhookPublisher()
@@ -7,13 +7,13 @@ from datetime import timedelta
 from typing import Union
 
 from packit_service.celerizer import celery_app
-from packit_service.constants import (
-    USAGE_CURRENT_DATE,
-    USAGE_DATE_IN_THE_PAST,
-)
+from packit_service.constants import USAGE_CURRENT_DATE
 from packit_service.models import (
+    GitProjectModel,
+    ProjectIdSet,
     get_onboarded_projects,
     get_usage_data,
+    get_usage_intervals,
 )
 
 logger = logging.getLogger(__name__)
@@ -28,7 +28,10 @@ def get_usage_interval_data(
     days: int,
     hours: int,
     count: int,
-) -> dict[str, Union[str, CHART_DATA_TYPE, dict[str, CHART_DATA_TYPE]]]:
+) -> dict[
+    str,
+    Union[str, list[str], CHART_DATA_TYPE, dict[str, CHART_DATA_TYPE], dict[str, list[str]]],
+]:
     """
     :param days: number of days for the interval length
     :param hours: number of days for the interval length
@@ -43,88 +46,65 @@ def get_usage_interval_data(
     for _ in range(count):
         days_legend.append(current_date)
         current_date -= delta
-
-    result_jobs: dict[str, CHART_DATA_TYPE] = {}
-    result_jobs_project_count: dict[str, CHART_DATA_TYPE] = {}
-    result_jobs_project_cumulative_count: dict[str, CHART_DATA_TYPE] = {}
-    result_events: dict[str, CHART_DATA_TYPE] = {}
-    result_active_projects: CHART_DATA_TYPE = []
-    result_active_projects_cumulative: CHART_DATA_TYPE = []
-
-    logger.warn(
-        f"Getting usage data datetime_from {USAGE_DATE_IN_THE_PAST} datetime_to {days_legend[-1]}",
-    )
-    past_data = get_usage_data(
-        datetime_from=USAGE_DATE_IN_THE_PAST,
-        datetime_to=days_legend[-1],
-        top=100000,
-    )
-    logger.warn("Got usage data ")
-    cumulative_projects_past = set(
-        past_data["active_projects"]["top_projects_by_events_handled"].keys(),
-    )
-    cumulative_projects = cumulative_projects_past.copy()
-    cumulative_projects_for_jobs_past = {
-        job: set(data["top_projects_by_job_runs"].keys()) for job, data in past_data["jobs"].items()
+    legends = [
+        day.strftime("%H:%M" if (hours and not days) else "%Y-%m-%d")
+        for day in reversed(days_legend)
+    ]
+
+    logger.debug(f"Getting usage data for {count} intervals of {delta} till {USAGE_CURRENT_DATE}")
+    usage = get_usage_intervals(datetime_to=USAGE_CURRENT_DATE, delta=delta, count=count)
+    logger.debug("Got usage data.")
+
+    def chart(values: list) -> CHART_DATA_TYPE:
+        return [{"x": legend, "y": value} for legend, value in zip(legends, values)]
+
+    def cumulative_counts(past: ProjectIdSet, intervals: list[ProjectIdSet]) -> list[int]:
+        counts = []
+        for projects in intervals:
+            past |= projects
+            counts.append(len(past))
+        return counts
+
+    # projects are considered onboarded if they were not active
+    # before the end of the first interval
+    def onboarded(past: ProjectIdSet, intervals: list[ProjectIdSet]) -> set[int]:
+        before = past | intervals[0]
+        after = ProjectIdSet()
+        for projects in intervals[1:]:
+            after |= projects
+        return set(after - before)
+
+    onboarded_projects = onboarded(usage["past_active_projects"], usage["active_projects"])
+    onboarded_projects_per_job = {
+        job: onboarded(usage["past_job_projects"][job], projects)
+        for job, projects in usage["job_projects"].items()
     }
-    cumulative_projects_for_jobs = cumulative_projects_for_jobs_past.copy()
-
-    for day in reversed(days_legend):
-        day_from = (day - delta).isoformat()
-        day_to = day.isoformat()
-        legend = day.strftime("%H:%M" if (hours and not days) else "%Y-%m-%d")
-
-        interval_result = get_usage_data(
-            datetime_from=day_from,
-            datetime_to=day_to,
-            top=100000,
-        )
-
-        for job, data in interval_result["jobs"].items():
-            result_jobs.setdefault(job, [])
-            result_jobs[job].append({"x": legend, "y": data["job_runs"]})
-            result_jobs_project_count.setdefault(job, [])
-            result_jobs_project_count[job].append(
-                {"x": legend, "y": len(data["top_projects_by_job_runs"])},
-            )
-
-            cumulative_projects_for_jobs[job] |= data["top_projects_by_job_runs"].keys()
-            result_jobs_project_cumulative_count.setdefault(job, [])
-            result_jobs_project_cumulative_count[job].append(
-                {"x": legend, "y": len(cumulative_projects_for_jobs[job])},
-            )
-
-        for event, data in interval_result["events"].items():
-            result_events.setdefault(event, [])
-            result_events[event].append({"x": legend, "y": data["events_handled"]})
-
-        result_active_projects.append(
-            {"x": legend, "y": interval_result["active_projects"].get("project_count")},
-        )
-        cumulative_projects |= interval_result["active_projects"][
-            "top_projects_by_events_handled"
-        ].keys()
-        result_active_projects_cumulative.append(
-            {"x": legend, "y": len(cumulative_projects)},
-        )
-
-    onboarded_projects_per_job = {}
-    for job in past_data["jobs"]:
-        onboarded_projects_per_job[job] = list(
-            cumulative_projects_for_jobs[job] - cumulative_projects_for_jobs_past[job],
-        )
+    project_urls = GitProjectModel.get_project_urls(
+        onboarded_projects.union(*onboarded_projects_per_job.values()),
+    )
 
     return {
-        "jobs": result_jobs,
-        "jobs_project_count": result_jobs_project_count,
-        "jobs_project_cumulative_count": result_jobs_project_cumulative_count,
-        "events": result_events,
+        "jobs": {job: chart(job_runs) for job, job_runs in usage["jobs"].items()},
+        "jobs_project_count": {
+            job: chart([len(projects) for projects in intervals])
+            for job, intervals in usage["job_projects"].items()
+        },
+        "jobs_project_cumulative_count": {
+            job: chart(cumulative_counts(usage["past_job_projects"][job], intervals))
+            for job, intervals in usage["job_projects"].items()
+        },
+        "events": {event: chart(events) for event, events in usage["events"].items()},
         "from": days_legend[0].isoformat(),
         "to": days_legend[-1].isoformat(),
-        "active_projects": result_active_projects,
-        "active_projects_cumulative": result_active_projects_cumulative,
-        "onboarded_projects": list(cumulative_projects - cumulative_projects_past),
-        "onboarded_projects_per_job": onboarded_projects_per_job,
+        "active_projects": chart([len(projects) for projects in usage["active_projects"]]),
+        "active_projects_cumulative": chart(
+            cumulative_counts(usage["past_active_projects"], usage["active_projects"]),
+        ),
+        "onboarded_projects": [project_urls[id_] for id_ in onboarded_projects],
+        "onboarded_projects_per_job": {
+            job: [project_urls[id_] for id_ in project_ids]
+            for job, project_ids in onboarded_projects_per_job.items()
+        },
     }
 
 
@@ -5,8 +5,12 @@ import argparse
 import itertools
 import logging
 import os
+import shutil
 import tempfile
+import threading
 from argparse import RawTextHelpFormatter
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from io import StringIO
 from logging import StreamHandler
@@ -17,9 +21,11 @@ from urllib.parse import urlparse
 
 import requests
 from cachetools.func import ttl_cache
+from git import Repo
 from ogr.abstract import PullRequest
 from packit.config import JobConfig, PackageConfig, aliases
 from packit.config.aliases import Distro
+from packit.local_project import CALCULATE, LocalProject, LocalProjectBuilder
 from packit.schema import JobConfigSchema, PackageConfigSchema
 from packit.utils import PackitFormatter
 
@@ -112,6 +118,7 @@ def log_package_versions(package_versions: list[tuple[str, str]]):
 # https://stackoverflow.com/a/41215655/14294700
 def gather_packit_logs_to_buffer(
     logging_level: LoggingLevel,
+    current_thread_only: bool = False,
 ) -> tuple[StringIO, StreamHandler]:
     """
     Redirect packit logs into buffer with a given logging level to collect them later.
@@ -120,6 +127,8 @@ def gather_packit_logs_to_buffer(
 
     Args:
         logging_level: Logs with this logging level will be collected.
+        current_thread_only: Whether to collect only the logs of the current thread,
+            e.g. when more threads are running packit at once.
 
     Returns:
         A tuple of values which you have to pass them to `collect_packit_logs()` function later.
@@ -130,6 +139,9 @@ def gather_packit_logs_to_buffer(
     """
     buffer = StringIO()
     handler = StreamHandler(buffer)
+    if current_thread_only:
+        thread_id = threading.get_ident()
+        handler.addFilter(lambda record: record.thread == thread_id)
     packit_logger = logging.getLogger("packit")
     packit_logger.setLevel(logging_level)
     packit_logger.addHandler(handler)
@@ -163,6 +175,57 @@ def collect_packit_logs(buffer: StringIO, handler: StreamHandler) -> str:
     return buffer.read()
 
 
+@contextmanager
+def create_worktrees(
+    git_repo: Repo, count: int, directory: Union[str, Path]
+) -> Iterator[list[Repo]]:
+    """
+    Create worktrees of the repository so that more branches can be checked out
+    at once and remove them afterwards.
+
+    Args:
+        git_repo: Repository to create the worktrees of.
+        count: Number of the worktrees.
+        directory: Directory to create the worktrees in.
+
+    Returns:
+        Repositories of the worktrees, with detached HEAD at the current commit.
+    """
+    head = git_repo.head
+    original_ref = head.commit.hexsha if head.is_detached else head.ref.name
+    # a branch checked out in a worktree can't be checked out anywhere else
+    git_repo.git.checkout("--detach")
+    worktrees_dir = Path(tempfile.mkdtemp(prefix="worktrees-", dir=directory)).absolute()
+    try:
+        worktrees = []
+        for i in range(count):
+            git_repo.git.worktree("add", "--detach", str(worktrees_dir / str(i)))
+            worktree = Repo(worktrees_dir / str(i))
+            if git_repo.submodules:
+                worktree.git.submodule("update", "--init", "--recursive")
+            worktrees.append(worktree)
+        yield worktrees
+    finally:
+        shutil.rmtree(worktrees_dir, ignore_errors=True)
+        git_repo.git.worktree("prune")
+        git_repo.git.checkout(original_ref)
+
+
+def get_worktree_local_project(worktree: Repo, local_project: LocalProject) -> LocalProject:
+    """
+    Get local project for the worktree of the repository of the given local project.
+    """
+    return LocalProjectBuilder().build(
+        working_dir=Path(worktree.working_tree_dir),
+        git_repo=worktree,
+        git_project=local_project.git_project,
+        git_url=local_project.git_url,
+        full_name=CALCULATE,
+        namespace=CALCULATE,
+        repo_name=CALCULATE,
+    )
+
+
 def is_timezone_naive_datetime(datetime_to_check: datetime) -> bool:
     """
     Check whether the given datetime is timezone naive.
@@ -414,12 +477,26 @@ def pr_labels_match_configuration(
     pr_labels = [label.name for label in pull_request.labels]
     logger.info(f"Labels on PR: {pr_labels}")
 
+    return labels_match_configuration(
+        pr_labels,
+        configured_labels_present=configured_labels_present,
+        configured_labels_absent=configured_labels_absent,
+    )
+
+
+def labels_match_configuration(
+    labels: list[str],
+    configured_labels_present: list[str],
+    configured_labels_absent: list[str],
+) -> bool:
+    """
+    Do the (already fetched) labels match the configuration of the labels?
+    """
     return (
-        not configured_labels_present
-        or any(label in pr_labels for label in configured_labels_present)
+        not configured_labels_present or any(label in labels for label in configured_labels_present)
     ) and (
         not configured_labels_absent
-        or all(label not in pr_labels for label in configured_labels_absent)
+        or all(label not in labels for label in configured_labels_absent)
     )
 
 
@@ -183,17 +183,12 @@ class Allowlist:
         if not namespace:
             return False
 
-        separated_path = [namespace, None]
-        while len(separated_path) > 1:
-            if matching_namespace := AllowlistModel.get_namespace(separated_path[0]):
-                status = AllowlistStatus(matching_namespace.status)
-                if status != AllowlistStatus.waiting:
-                    return status in (
-                        AllowlistStatus.approved_automatically,
-                        AllowlistStatus.approved_manually,
-                    )
-
-            separated_path = separated_path[0].rsplit("/", 1)
+        for status in AllowlistModel.get_namespace_and_parents_statuses(namespace):
+            if status != AllowlistStatus.waiting:
+                return status in (
+                    AllowlistStatus.approved_automatically,
+                    AllowlistStatus.approved_manually,
+                )
 
         logger.info(f"Could not find approved entry for: {namespace}")
         return False
@@ -213,15 +208,9 @@ class Allowlist:
         if not namespace:
             return False
 
-        separated_path = [namespace, None]
-        while len(separated_path) > 1:
-            if matching_namespace := AllowlistModel.get_namespace(separated_path[0]):
-                status = AllowlistStatus(matching_namespace.status)
-                if status == AllowlistStatus.denied:
-                    logger.info(f"Namespace {namespace} is denied.")
-                    return True
-
-            separated_path = separated_path[0].rsplit("/", 1)
+        if AllowlistStatus.denied in AllowlistModel.get_namespace_and_parents_statuses(namespace):
+            logger.info(f"Namespace {namespace} is denied.")
+            return True
 
         logger.info(f"Could not find denied entry for: {namespace}")
         return False
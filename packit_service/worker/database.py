@@ -1,20 +1,22 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import time
 from datetime import timedelta
 from gzip import open as gzip_open
 from logging import DEBUG, INFO, getLogger
 from os import getenv
 from pathlib import Path
 from shutil import copyfileobj
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from boto3 import client as boto3_client
 from botocore.exceptions import ClientError
 from packit.utils.commands import run_command
-from sqlalchemy import create_engine, delete, distinct, func, select, union
+from sqlalchemy import ColumnElement, Engine, Select, create_engine, delete, func, select, union
 
 from packit_service.constants import (
+    DELETE_OLD_DATA_BATCH_SIZE,
     PACKAGE_CONFIGS_OUTDATED_AFTER_DAYS,
     PIPELINES_OUTDATED_AFTER_DAYS,
     SRPMBUILDS_OUTDATED_AFTER_DAYS,
@@ -32,6 +34,7 @@ from packit_service.models import (
     KojiTagRequestGroupModel,
     KojiTagRequestTargetModel,
     OSHScanModel,
+    PackagesConfigModel,
     PipelineModel,
     ProjectAuthenticationIssueModel,
     ProjectEventModel,
@@ -87,6 +90,8 @@ def discard_old_package_configs():
         f"ProjectEventModels with ids [{event_ids}] have all runs older than '{ago}'. "
         "Discarded package configs.",
     )
+    deleted = PackagesConfigModel.delete_unreferenced()
+    logger.debug(f"Deleted {deleted} package configs not used by any event.")
 
 
 def gzip_file(file: Path) -> Path:
@@ -192,275 +197,359 @@ def backup():
             compressed_file.unlink()
 
 
-def delete_old_data(age: Optional[str] = None):
-    """
-    Remove old data from the DB.
-
-    Args:
-        age: PostgreSQL interval string (e.g., '1 year', '6 months', '365 days').
-             If not provided, reads from PIPELINES_OUTDATED_AFTER_DAYS env var.
-    """
-    if age is None:
-        outdated_after_days = getenv(
-            "PIPELINES_OUTDATED_AFTER_DAYS",
-            PIPELINES_OUTDATED_AFTER_DAYS,
-        )
-        age = f"{outdated_after_days} days"
+class PurgeStep(NamedTuple):
+    """Rows to delete by `delete_old_data`."""
 
-    logger.info(f"About to delete data older than {age}")
+    # name of the rows for the logs
+    name: str
+    # primary key of the rows, the rows are deleted in batches ordered by it
+    id_column: ColumnElement
+    # select of the primary keys of the rows to delete
+    candidates: Select
+    # columns of the rows referencing the deleted ones, deleted in the same batch
+    dependents: tuple[ColumnElement, ...] = ()
 
-    engine = create_engine(get_pg_url(), echo=True)
 
-    with engine.begin() as conn:
-        # Delete the pipelines older than AGE
-        stmt = delete(PipelineModel).where(func.age(PipelineModel.datetime) >= age)
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} pipelines older than {age}")
+class DataPurger:
+    """
+    Deletes rows in batches ordered by their primary key, each batch in its
+    own transaction, so that no lock is held for long and the deleted rows
+    stay deleted even if the process is killed. The rows to delete are found
+    again by every run, so the next run continues where the previous one ended.
+    """
 
-        # Delete ProjectEventModels which don't belong to any pipeline
-        orphaned_events = (
-            select(distinct(ProjectEventModel.id))
-            .outerjoin(PipelineModel, PipelineModel.project_event_id == ProjectEventModel.id)
-            .filter(PipelineModel.id == None)  # noqa
-        )
-        stmt = delete(ProjectEventModel).where(ProjectEventModel.id.in_(orphaned_events))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned ProjectEventModels")
-
-        # Delete SRPMBuilds and VMImageBuilds which don't belong to a pipeline
-        attr = [
-            (SRPMBuildModel, PipelineModel.srpm_build_id),
-            (VMImageBuildTargetModel, PipelineModel.vm_image_build_id),
-        ]
-        for model, field in attr:
-            orphaned = (
-                select(distinct(model.id))  # type: ignore
-                .outerjoin(PipelineModel, field == model.id)  # type: ignore
-                .filter(PipelineModel.id == None)  # noqa
-            )
-            stmt = delete(model).where(model.id.in_(orphaned))  # type: ignore
-            result = conn.execute(stmt)
-            logger.info(f"Deleted {result.rowcount} orphaned {model.__name__}")
-
-        # Delete CoprBuildTargets and tf-copr associations which don't belong to a pipeline
-        orphaned = (
-            select(distinct(CoprBuildTargetModel.id))
-            .outerjoin_from(
-                CoprBuildGroupModel,
-                CoprBuildTargetModel,
-                CoprBuildTargetModel.copr_build_group_id == CoprBuildGroupModel.id,
-            )
-            .outerjoin(
-                PipelineModel,
-                PipelineModel.copr_build_group_id == CoprBuildGroupModel.id,
-            )
-            .filter(PipelineModel.id == None)  # noqa
-        )
-        stmt = delete(tf_copr_association_table).where(
-            tf_copr_association_table.c.copr_id.in_(orphaned),
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned tf-copr associations")
-
-        # Delete OpenScanHub scans that reference orphaned copr build targets
-        stmt = delete(OSHScanModel).where(OSHScanModel.copr_build_target_id.in_(orphaned))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned OSHScanModel records")
-
-        stmt = delete(CoprBuildTargetModel).where(CoprBuildTargetModel.id.in_(orphaned))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned CoprBuildTargets")
-
-        # Delete KojiBuildTargets and tf-koji associations which don't belong to a pipeline
-        orphaned_koji = (
-            select(distinct(KojiBuildTargetModel.id))
-            .outerjoin_from(
-                KojiBuildGroupModel,
-                KojiBuildTargetModel,
-                KojiBuildTargetModel.koji_build_group_id == KojiBuildGroupModel.id,
-            )
-            .outerjoin(
-                PipelineModel,
-                PipelineModel.koji_build_group_id == KojiBuildGroupModel.id,
-            )
-            .filter(PipelineModel.id == None)  # noqa
-        )
-        stmt = delete(tf_koji_association_table).where(
-            tf_koji_association_table.c.koji_id.in_(orphaned_koji),
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned tf-koji associations")
-
-        stmt = delete(KojiBuildTargetModel).where(KojiBuildTargetModel.id.in_(orphaned_koji))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned KojiBuildTargets")
-
-        # Delete TFTTestRunTargets and their associations
-        logger.info("Working on TFTTestRunTargetModel...")
-        orphaned_tft = (
-            select(distinct(TFTTestRunTargetModel.id))
-            .outerjoin_from(
-                TFTTestRunGroupModel,
-                TFTTestRunTargetModel,
-                TFTTestRunTargetModel.tft_test_run_group_id == TFTTestRunGroupModel.id,
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int,
+        dry_run: bool = False,
+        deadline: Optional[float] = None,
+    ):
+        """
+        Args:
+            engine: Engine to connect to the DB with.
+            batch_size: Maximum number of rows deleted in a single transaction.
+            dry_run: Only count the rows to delete.
+            deadline: Value of `time.monotonic()` after which no batch is started.
+        """
+        self.engine = engine
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.deadline = deadline
+
+    @property
+    def out_of_time(self) -> bool:
+        return self.deadline is not None and time.monotonic() > self.deadline
+
+    def count(self, step: PurgeStep) -> int:
+        with self.engine.connect() as conn:
+            return conn.execute(
+                select(func.count()).select_from(step.candidates.subquery()),
+            ).scalar_one()
+
+    def purge(self, step: PurgeStep) -> bool:
+        """
+        Delete the rows of the step.
+
+        Args:
+            step: Rows to delete.
+
+        Returns:
+            Whether all the rows were deleted, False if the deadline has passed.
+        """
+        total = self.count(step)
+        if self.dry_run:
+            logger.info(f"Would delete {total} {step.name}")
+            return True
+        if not total:
+            logger.info(f"No {step.name} to delete")
+            return True
+
+        deleted = 0
+        last_id = None
+        started = time.monotonic()
+        while True:
+            if self.out_of_time:
+                logger.info(
+                    f"Deleted {deleted} {step.name}, out of time, "
+                    "the rest is going to be deleted by the next run",
+                )
+                return False
+
+            batch = step.candidates.order_by(step.id_column).limit(self.batch_size)
+            if last_id is not None:
+                batch = batch.where(step.id_column > last_id)
+            with self.engine.begin() as conn:
+                ids = conn.execute(batch).scalars().all()
+                if not ids:
+                    break
+                for column in step.dependents:
+                    conn.execute(delete(column.table).where(column.in_(ids)))
+                conn.execute(delete(step.id_column.table).where(step.id_column.in_(ids)))
+
+            deleted += len(ids)
+            last_id = ids[-1]
+            rate = deleted / max(time.monotonic() - started, 1e-6)
+            remaining = max(total - deleted, 0)
+            logger.info(
+                f"Deleted {deleted}/{total} {step.name} ({rate:.0f} rows/s, "
+                f"{remaining} remaining, ~{remaining / rate:.0f}s)",
             )
-            .outerjoin(
-                PipelineModel,
-                PipelineModel.test_run_group_id == TFTTestRunGroupModel.id,
-            )
-            .filter(PipelineModel.id == None)  # noqa
-        )
 
-        # Delete associations referencing these orphaned TFT targets
-        stmt = delete(tf_copr_association_table).where(
-            tf_copr_association_table.c.tft_id.in_(orphaned_tft)
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} tf-copr associations (by tft_id)")
+        logger.info(f"Deleted {deleted} {step.name}")
+        return True
 
-        stmt = delete(tf_koji_association_table).where(
-            tf_koji_association_table.c.tft_id.in_(orphaned_tft)
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} tf-koji associations (by tft_id)")
-
-        stmt = delete(TFTTestRunTargetModel).where(TFTTestRunTargetModel.id.in_(orphaned_tft))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned TFTTestRunTargets")
-
-        # Delete SyncReleaseTargets and their associations
-        logger.info("Working on SyncReleaseTargetModel...")
-        orphaned_sync = (
-            select(distinct(SyncReleaseTargetModel.id))
-            .outerjoin_from(
-                SyncReleaseModel,
-                SyncReleaseTargetModel,
-                SyncReleaseTargetModel.sync_release_id == SyncReleaseModel.id,
-            )
-            .outerjoin(
-                PipelineModel,
-                PipelineModel.sync_release_run_id == SyncReleaseModel.id,
-            )
-            .filter(PipelineModel.id == None)  # noqa
-        )
 
-        # Delete associations referencing these orphaned SyncRelease targets
-        stmt = delete(sync_release_pr_association_table).where(
-            sync_release_pr_association_table.c.sync_release_target_id.in_(orphaned_sync)
-        )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} sync-release-pr associations")
+def orphaned_targets(target, group, target_group_id, pipeline_group_id) -> Select:
+    """Select IDs of the targets whose group doesn't belong to any pipeline."""
+    return (
+        select(target.id)
+        .join_from(group, target, target_group_id == group.id)
+        .outerjoin(PipelineModel, pipeline_group_id == group.id)
+        .filter(PipelineModel.id == None)  # noqa
+    )
 
-        stmt = delete(SyncReleaseTargetModel).where(SyncReleaseTargetModel.id.in_(orphaned_sync))
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned SyncReleaseTargets")
 
-        # Delete remaining target types (BodhiUpdate and KojiTagRequest) using generic logic
-        attr = [
-            (  # type: ignore
-                BodhiUpdateTargetModel,
-                BodhiUpdateGroupModel,
-                PipelineModel.bodhi_update_group_id,
-                BodhiUpdateTargetModel.bodhi_update_group_id,
-            ),
-            (  # type: ignore
-                KojiTagRequestTargetModel,
-                KojiTagRequestGroupModel,
-                PipelineModel.koji_tag_request_group_id,
-                KojiTagRequestTargetModel.koji_tag_request_group_id,
+def get_purge_steps(age: str) -> list[PurgeStep]:
+    """
+    Get the rows to delete by `delete_old_data` in the order they have to be deleted.
+
+    Args:
+        age: PostgreSQL interval string, pipelines older than that are deleted
+            together with the data that don't belong to any other pipeline.
+    """
+    steps = [
+        PurgeStep(
+            f"pipelines older than {age}",
+            PipelineModel.id,
+            select(PipelineModel.id).where(func.age(PipelineModel.datetime) >= age),
+        ),
+        # ProjectEventModels which don't belong to any pipeline
+        PurgeStep(
+            "orphaned ProjectEventModels",
+            ProjectEventModel.id,
+            select(ProjectEventModel.id)
+            .outerjoin(PipelineModel, PipelineModel.project_event_id == ProjectEventModel.id)
+            .filter(PipelineModel.id == None),  # noqa
+        ),
+    ]
+
+    # SRPMBuilds and VMImageBuilds which don't belong to a pipeline
+    for model, field in (
+        (SRPMBuildModel, PipelineModel.srpm_build_id),
+        (VMImageBuildTargetModel, PipelineModel.vm_image_build_id),
+    ):
+        steps.append(
+            PurgeStep(
+                f"orphaned {model.__name__}",  # type: ignore
+                model.id,  # type: ignore
+                select(model.id)  # type: ignore
+                .outerjoin(PipelineModel, field == model.id)  # type: ignore
+                .filter(PipelineModel.id == None),  # noqa
             ),
-        ]
-        for target_m, group_m, id_f, model_group_id in attr:  # type: ignore
-            logger.info(f"Working on {target_m.__name__}...")
-            orphaned = (
-                select(distinct(target_m.id))  # type: ignore
-                .outerjoin_from(group_m, target_m, model_group_id == group_m.id)  # type: ignore
-                .outerjoin(PipelineModel, id_f == group_m.id)  # type: ignore
-                .filter(PipelineModel.id == None)  # noqa
-            )
-            stmt = delete(target_m).where(target_m.id.in_(orphaned))  # type: ignore
-            result = conn.execute(stmt)
-            logger.info(f"Deleted {result.rowcount} orphaned {target_m.__name__}")
+        )
 
-        # Delete orphaned Groups
-        groups = [  # type: ignore
-            (
-                CoprBuildGroupModel,
+    steps += [
+        # together with tf-copr associations and OpenScanHub scans
+        PurgeStep(
+            "orphaned CoprBuildTargets",
+            CoprBuildTargetModel.id,
+            orphaned_targets(
                 CoprBuildTargetModel,
+                CoprBuildGroupModel,
                 CoprBuildTargetModel.copr_build_group_id,
                 PipelineModel.copr_build_group_id,
             ),
-            (
-                KojiBuildGroupModel,
+            (tf_copr_association_table.c.copr_id, OSHScanModel.copr_build_target_id),
+        ),
+        # together with tf-koji associations
+        PurgeStep(
+            "orphaned KojiBuildTargets",
+            KojiBuildTargetModel.id,
+            orphaned_targets(
                 KojiBuildTargetModel,
+                KojiBuildGroupModel,
                 KojiBuildTargetModel.koji_build_group_id,
                 PipelineModel.koji_build_group_id,
             ),
-            (
-                TFTTestRunGroupModel,
+            (tf_koji_association_table.c.koji_id,),
+        ),
+        # together with their tf-copr and tf-koji associations
+        PurgeStep(
+            "orphaned TFTTestRunTargets",
+            TFTTestRunTargetModel.id,
+            orphaned_targets(
                 TFTTestRunTargetModel,
+                TFTTestRunGroupModel,
                 TFTTestRunTargetModel.tft_test_run_group_id,
                 PipelineModel.test_run_group_id,
             ),
-            (
-                BodhiUpdateGroupModel,
+            (tf_copr_association_table.c.tft_id, tf_koji_association_table.c.tft_id),
+        ),
+        # together with sync-release-pr associations
+        PurgeStep(
+            "orphaned SyncReleaseTargets",
+            SyncReleaseTargetModel.id,
+            orphaned_targets(
+                SyncReleaseTargetModel,
+                SyncReleaseModel,
+                SyncReleaseTargetModel.sync_release_id,
+                PipelineModel.sync_release_run_id,
+            ),
+            (sync_release_pr_association_table.c.sync_release_target_id,),
+        ),
+        PurgeStep(
+            "orphaned BodhiUpdateTargetModel",
+            BodhiUpdateTargetModel.id,
+            orphaned_targets(
                 BodhiUpdateTargetModel,
+                BodhiUpdateGroupModel,
                 BodhiUpdateTargetModel.bodhi_update_group_id,
                 PipelineModel.bodhi_update_group_id,
             ),
-            (
-                KojiTagRequestGroupModel,
+        ),
+        PurgeStep(
+            "orphaned KojiTagRequestTargetModel",
+            KojiTagRequestTargetModel.id,
+            orphaned_targets(
                 KojiTagRequestTargetModel,
+                KojiTagRequestGroupModel,
                 KojiTagRequestTargetModel.koji_tag_request_group_id,
                 PipelineModel.koji_tag_request_group_id,
             ),
-        ]
-        for group, target, target_group_id, pipeline_group_id in groups:  # type: ignore
-            orphaned_groups = (
-                select(distinct(group.id))  # type: ignore
+        ),
+    ]
+
+    # Orphaned Groups
+    for group, target, target_group_id, pipeline_group_id in (  # type: ignore
+        (
+            CoprBuildGroupModel,
+            CoprBuildTargetModel,
+            CoprBuildTargetModel.copr_build_group_id,
+            PipelineModel.copr_build_group_id,
+        ),
+        (
+            KojiBuildGroupModel,
+            KojiBuildTargetModel,
+            KojiBuildTargetModel.koji_build_group_id,
+            PipelineModel.koji_build_group_id,
+        ),
+        (
+            TFTTestRunGroupModel,
+            TFTTestRunTargetModel,
+            TFTTestRunTargetModel.tft_test_run_group_id,
+            PipelineModel.test_run_group_id,
+        ),
+        (
+            BodhiUpdateGroupModel,
+            BodhiUpdateTargetModel,
+            BodhiUpdateTargetModel.bodhi_update_group_id,
+            PipelineModel.bodhi_update_group_id,
+        ),
+        (
+            KojiTagRequestGroupModel,
+            KojiTagRequestTargetModel,
+            KojiTagRequestTargetModel.koji_tag_request_group_id,
+            PipelineModel.koji_tag_request_group_id,
+        ),
+    ):
+        steps.append(
+            PurgeStep(
+                f"orphaned {group.__name__}",  # type: ignore
+                group.id,  # type: ignore
+                select(group.id)  # type: ignore
                 .outerjoin(target, group.id == target_group_id)  # type: ignore
                 .outerjoin(PipelineModel, pipeline_group_id == group.id)  # type: ignore
                 .filter(target.id == None)  # type: ignore  # noqa
-                .filter(PipelineModel.id == None)  # noqa
-            )
-            stmt = delete(group).where(group.id.in_(orphaned_groups))  # type: ignore
-            result = conn.execute(stmt)
-            logger.info(f"Deleted {result.rowcount} orphaned {group.__name__}")
-
-        # Delete orphaned project event trigger objects
-        trigger_types = [
-            (ProjectEventModelType.pull_request, PullRequestModel),
-            (ProjectEventModelType.branch_push, GitBranchModel),
-            (ProjectEventModelType.release, ProjectReleaseModel),
-            (ProjectEventModelType.issue, IssueModel),
-        ]
-        for event_type, trigger_model in trigger_types:
-            # Find trigger objects not referenced by any ProjectEventModel
-            project_events = (
-                select(ProjectEventModel).filter(ProjectEventModel.type == event_type).subquery()
-            )
-            orphaned_triggers = (
+                .filter(PipelineModel.id == None),  # noqa
+            ),
+        )
+
+    # Project event trigger objects not referenced by any ProjectEventModel
+    for event_type, trigger_model in (
+        (ProjectEventModelType.pull_request, PullRequestModel),
+        (ProjectEventModelType.branch_push, GitBranchModel),
+        (ProjectEventModelType.release, ProjectReleaseModel),
+        (ProjectEventModelType.issue, IssueModel),
+    ):
+        project_events = (
+            select(ProjectEventModel).filter(ProjectEventModel.type == event_type).subquery()
+        )
+        steps.append(
+            PurgeStep(
+                f"orphaned {trigger_model.__name__}",  # type: ignore
+                trigger_model.id,  # type: ignore
                 select(trigger_model.id)  # type: ignore
                 .outerjoin(project_events, trigger_model.id == project_events.c.event_id)  # type: ignore
-                .filter(project_events.c.event_id == None)  # noqa
-            )
-            stmt = delete(trigger_model).where(trigger_model.id.in_(orphaned_triggers))  # type: ignore
-            result = conn.execute(stmt)
-            logger.info(f"Deleted {result.rowcount} orphaned {trigger_model.__name__}")
-
-        # Delete orphaned GitProjectModel records
-        referenced_projects = union(
-            select(PullRequestModel.project_id),
-            select(GitBranchModel.project_id),
-            select(ProjectReleaseModel.project_id),
-            select(IssueModel.project_id),
-            select(ProjectAuthenticationIssueModel.project_id),
-            select(SyncReleasePullRequestModel.project_id),
+                .filter(project_events.c.event_id == None),  # noqa
+            ),
         )
-        stmt = delete(GitProjectModel).where(
-            GitProjectModel.id.not_in(referenced_projects),
+
+    # GitProjectModels not referenced by anything
+    referenced_projects = union(
+        select(PullRequestModel.project_id),
+        select(GitBranchModel.project_id),
+        select(ProjectReleaseModel.project_id),
+        select(IssueModel.project_id),
+        select(ProjectAuthenticationIssueModel.project_id),
+        select(SyncReleasePullRequestModel.project_id),
+    )
+    steps.append(
+        PurgeStep(
+            "orphaned GitProjectModels",
+            GitProjectModel.id,
+            select(GitProjectModel.id).where(GitProjectModel.id.not_in(referenced_projects)),
+        ),
+    )
+    return steps
+
+
+def delete_old_data(
+    age: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    dry_run: bool = False,
+    max_duration: Optional[timedelta] = None,
+) -> bool:
+    """
+    Remove old data from the DB.
+
+    The data are deleted in batches, each in its own transaction, so the function
+    can be interrupted at any time and called again to continue.
+
+    Args:
+        age: PostgreSQL interval string (e.g., '1 year', '6 months', '365 days').
+             If not provided, reads from PIPELINES_OUTDATED_AFTER_DAYS env var.
+        batch_size: Maximum number of rows deleted in a single transaction.
+             If not provided, reads from DELETE_OLD_DATA_BATCH_SIZE env var.
+        dry_run: Only count the rows to delete. Rows which would become orphaned
+             by deleting the old pipelines are not counted.
+        max_duration: Do not start a new batch after this time.
+
+    Returns:
+        Whether all the old data were deleted, False if `max_duration` has passed.
+    """
+    if age is None:
+        outdated_after_days = getenv(
+            "PIPELINES_OUTDATED_AFTER_DAYS",
+            PIPELINES_OUTDATED_AFTER_DAYS,
         )
-        result = conn.execute(stmt)
-        logger.info(f"Deleted {result.rowcount} orphaned GitProjectModels")
+        age = f"{outdated_after_days} days"
+    if batch_size is None:
+        batch_size = int(getenv("DELETE_OLD_DATA_BATCH_SIZE", DELETE_OLD_DATA_BATCH_SIZE))
+
+    logger.info(f"About to {'count' if dry_run else 'delete'} data older than {age}")
+
+    purger = DataPurger(
+        engine=create_engine(get_pg_url()),
+        batch_size=batch_size,
+        dry_run=dry_run,
+        deadline=(
+            time.monotonic() + max_duration.total_seconds() if max_duration is not None else None
+        ),
+    )
+    for step in get_purge_steps(age):
+        if not purger.purge(step):
+            return False
 
     logger.info("Finished deleting old data from database")
+    return True
@@ -10,6 +10,7 @@ import gc
 import logging
 import resource
 import shutil
+import time
 from collections import defaultdict
 from datetime import datetime
 from os import getenv
@@ -28,6 +29,7 @@ from packit.exceptions import PackitConfigException
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
     CELERY_TASK_RATE_LIMITED_QUEUE,
+    RATE_LIMIT_BUDGET_UNKNOWN_RESET,
     RATE_LIMIT_THRESHOLD,
     RATE_LIMITED_QUEUE_EXPIRES_SECONDS,
 )
@@ -40,6 +42,7 @@ from packit_service.sentry_integration import push_scope_to_sentry
 from packit_service.utils import dump_job_config, dump_package_config
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.checker.abstract import Checker
+from packit_service.worker.helpers.rate_limit import RateLimitSnapshot, rate_limit_budgets
 from packit_service.worker.mixin import (
     Config,
     PackitAPIProtocol,
@@ -440,6 +443,8 @@ class JobHandler(Handler):
 
         self._db_project_object: Optional[AbstractProjectObjectDbType] = None
         self._project: Optional[GitProject] = None
+        # project whose rate limit budget is updated after the task runs
+        self._rate_limit_project: Optional[GitProject] = None
         self._clean_workplace()
 
     def get_package_name(self) -> Optional[str]:
@@ -497,7 +502,10 @@ class JobHandler(Handler):
 
     def run(self) -> TaskResults:
         self.check_rate_limit_remaining()
-        return self._run()
+        try:
+            return self._run()
+        finally:
+            self.update_rate_limit_budget()
 
     def _run(self) -> TaskResults:
         raise NotImplementedError("This should have been implemented.")
@@ -506,7 +514,8 @@ class JobHandler(Handler):
         """
         Check the remaining rate limit towards the service.
         To be used when running in a task context.
-        If it is low, enqueue the task to the rate-limited queue.
+        If it is low, or the task needs to be paced not to exhaust
+        the rate limit before it resets, enqueue the task to the rate-limited queue.
         """
         # We need to import celery_app here to avoid circular imports.
         # pylint: disable=import-outside-toplevel
@@ -532,9 +541,28 @@ class JobHandler(Handler):
             logger.warning(f"Failed to get project for rate limit check: {ex}")
             return
         try:
-            remaining = project.service.get_rate_limit_remaining(
-                namespace=project.namespace, repo=project.repo
-            )
+            # the budget is updated from the responses to the requests of the task
+            rate_limit_budgets.observe(project.service)
+            self._rate_limit_project = project
+            if budget := rate_limit_budgets.get(project):
+                remaining = budget.remaining
+                self.pushgateway.rate_limit_time_to_exhaustion.labels(
+                    budget=rate_limit_budgets.get_key(project),
+                ).set(budget.time_to_exhaustion)
+            else:
+                remaining = project.service.get_rate_limit_remaining(
+                    namespace=project.namespace, repo=project.repo
+                )
+                if remaining is not None:
+                    rate_limit_budgets.update(
+                        project,
+                        RateLimitSnapshot(
+                            remaining=remaining,
+                            limit=None,
+                            reset=time.time() + RATE_LIMIT_BUDGET_UNKNOWN_RESET,
+                            observed=time.time(),
+                        ),
+                    )
         except Exception as ex:
             # Safely get namespace and repo for logging, in case project is a mock
             namespace = getattr(project, "namespace", "unknown")
@@ -549,13 +577,16 @@ class JobHandler(Handler):
             if self.service_config.rate_limit_threshold is not None
             else RATE_LIMIT_THRESHOLD
         )
-        # Check if rate limit is below threshold and enqueue to rate-limited queue if so.
-        if remaining is not None and rate_limit_threshold and remaining < rate_limit_threshold:
-            # Check if the task is already running from the rate-limited queue
-            # by checking the routing_key from delivery_info
-            current_routing_key = celery_task.request.delivery_info.get("routing_key")
-            logger.debug(f"Current routing_key: {current_routing_key}")
+        if remaining is None or not rate_limit_threshold:
+            return
 
+        # Check if the task is already running from the rate-limited queue
+        # by checking the routing_key from delivery_info
+        current_routing_key = celery_task.request.delivery_info.get("routing_key")
+        logger.debug(f"Current routing_key: {current_routing_key}")
+
+        # Check if rate limit is below threshold and enqueue to rate-limited queue if so.
+        if remaining < rate_limit_threshold:
             if current_routing_key == CELERY_TASK_RATE_LIMITED_QUEUE:
                 logger.info(
                     f"{remaining} requests remaining until rate limit is exceeded, "
@@ -571,37 +602,82 @@ class JobHandler(Handler):
                 f"which is below the threshold of {rate_limit_threshold}. "
                 "enqueuing task to the rate-limited queue."
             )
-            # Increment the metric for tasks enqueued to the rate-limited queue
-            self.pushgateway.rate_limited_tasks_enqueued.inc()
-            # Push metrics immediately since we're about to raise an exception
-            # that will prevent the normal push() call in run_job()
-            self.pushgateway.push()
-            # Use apply_async to reschedule the task to the rate-limited queue
-            # retry() isn't working, the chosen queue is the one defined in the task definition,
-            # not the one passed to retry()
-            try:
-                task_name = celery_task.name.value
-            except AttributeError:
-                task_name = str(celery_task.name)
-            task_kwargs = celery_task.request.kwargs.copy()
-            task_signature = signature(
-                task_name,
-                kwargs=task_kwargs,
-            )
-            task_signature.apply_async(
-                queue=CELERY_TASK_RATE_LIMITED_QUEUE,
-                expires=RATE_LIMITED_QUEUE_EXPIRES_SECONDS,
-            )
-            # Raise a custom exception to stop execution since we've scheduled a new task
-            # RateLimitRequeueException is NOT in autoretry_for,
-            # so it won't trigger automatic retries
-            raise RateLimitRequeueException(
-                "Task re-enqueued to rate-limited queue due to low rate limit"
-            )
+            self.enqueue_to_rate_limited_queue(celery_task)
+
         logger.info(
             f"{remaining} requests remaining until rate limit is exceeded, "
             f"which is above the threshold of {rate_limit_threshold}."
         )
+        if current_routing_key == CELERY_TASK_RATE_LIMITED_QUEUE:
+            return
+
+        # Pace the tasks if the rate limit would be exhausted before it resets.
+        if delay := rate_limit_budgets.acquire(project, rate_limit_threshold):
+            logger.warning(
+                f"Rate limit of {rate_limit_budgets.get_key(project)} is predicted to be "
+                f"exhausted before it resets, enqueuing task to the rate-limited queue "
+                f"to be run in {delay:.0f}s."
+            )
+            self.enqueue_to_rate_limited_queue(celery_task, countdown=delay)
+
+    def enqueue_to_rate_limited_queue(
+        self,
+        celery_task: Task,
+        countdown: Optional[float] = None,
+    ) -> None:
+        """
+        Enqueue the task to the rate-limited queue and stop its execution.
+
+        Args:
+            celery_task: Currently executing task.
+            countdown: Delay of the enqueued task [s].
+
+        Raises:
+            RateLimitRequeueException: Always, to stop the execution.
+        """
+        # Increment the metric for tasks enqueued to the rate-limited queue
+        self.pushgateway.rate_limited_tasks_enqueued.inc()
+        # Push metrics immediately since we're about to raise an exception
+        # that will prevent the normal push() call in run_job()
+        self.pushgateway.push()
+        # Use apply_async to reschedule the task to the rate-limited queue
+        # retry() isn't working, the chosen queue is the one defined in the task definition,
+        # not the one passed to retry()
+        try:
+            task_name = celery_task.name.value
+        except AttributeError:
+            task_name = str(celery_task.name)
+        task_kwargs = celery_task.request.kwargs.copy()
+        task_signature = signature(
+            task_name,
+            kwargs=task_kwargs,
+        )
+        task_signature.apply_async(
+            queue=CELERY_TASK_RATE_LIMITED_QUEUE,
+            # the task must not expire before it's due
+            expires=(countdown or 0) + RATE_LIMITED_QUEUE_EXPIRES_SECONDS,
+            **({"countdown": countdown} if countdown else {}),
+        )
+        # Raise a custom exception to stop execution since we've scheduled a new task
+        # RateLimitRequeueException is NOT in autoretry_for,
+        # so it won't trigger automatic retries
+        raise RateLimitRequeueException(
+            "Task re-enqueued to rate-limited queue due to low rate limit"
+        )
+
+    def update_rate_limit_budget(self) -> None:
+        """
+        Update the shared rate limit budget by the rate limit reported
+        in the responses to the requests made by the task.
+        """
+        if not (project := self._rate_limit_project):
+            return
+        if not (snapshot := rate_limit_budgets.get_snapshot(project)):
+            return
+        if budget := rate_limit_budgets.update(project, snapshot):
+            self.pushgateway.rate_limit_time_to_exhaustion.labels(
+                budget=rate_limit_budgets.get_key(project),
+            ).set(budget.time_to_exhaustion)
 
 
 class RetriableJobHandler(JobHandler):
@@ -7,18 +7,25 @@ This file defines classes for job handlers specific for distgit
 
 import abc
 import logging
+import os
 import re
 import shutil
+import time
 from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from functools import cmp_to_key, partial
 from os import getenv
+from pathlib import Path
 from typing import ClassVar, Optional
 
 from celery import Task
 from ogr.abstract import AuthMethod, PullRequest
 from ogr.parsing import RepoUrl, parse_git_repo
 from ogr.services.github import GithubService
+from packit.api import PackitAPI
 from packit.config import Deployment, JobConfig, JobType, aliases
 from packit.config.package_config import PackageConfig
 from packit.exceptions import (
@@ -75,9 +82,11 @@ from packit_service.service.urls import (
 )
 from packit_service.utils import (
     collect_packit_logs,
+    create_worktrees,
     gather_packit_logs_to_buffer,
     get_koji_task_id_and_url_from_stdout,
     get_packit_commands_from_comment,
+    get_worktree_local_project,
 )
 from packit_service.worker.checker.abstract import Checker
 from packit_service.worker.checker.distgit import (
@@ -263,6 +272,40 @@ class AbstractSyncReleaseHandler(
             )
         return self.helper
 
+    def get_sync_release_kwargs(
+        self,
+        branch: str,
+        tag: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> dict:
+        """Get the arguments of `PackitAPI.sync_release` for the branch."""
+        is_pull_from_upstream_job = (
+            self.sync_release_job_type == SyncReleaseJobType.pull_from_upstream
+        )
+        kwargs = {
+            "dist_git_branch": branch,
+            "create_pr": True,
+            "local_pr_branch_suffix": f"update-{self.sync_release_job_type.value}",
+            "use_downstream_specfile": is_pull_from_upstream_job,
+            "add_pr_instructions": True,
+            "resolved_bugs": self.get_resolved_bugs(),
+            "release_monitoring_project_id": self.data.event_dict.get(
+                "anitya_project_id",
+            ),
+            "sync_acls": True,
+            "pr_description_footer": DistgitAnnouncement.get_announcement(),
+            # [TODO] Remove for CentOS support once it gets refined
+            "add_new_sources": self.package_config.pkg_tool in (None, "fedpkg"),
+            "fast_forward_merge_branches": (
+                self.sync_release_helper.get_fast_forward_merge_branches_for(branch)
+            ),
+        }
+        if tag:
+            kwargs["tag"] = tag
+        elif version:
+            kwargs["versions"] = [version]
+        return kwargs
+
     def sync_branch(
         self,
         branch: str,
@@ -271,33 +314,9 @@ class AbstractSyncReleaseHandler(
         version: Optional[str] = None,
     ) -> Optional[tuple[PullRequest, dict[str, PullRequest]]]:
         try:
-            branch_suffix = f"update-{self.sync_release_job_type.value}"
-            is_pull_from_upstream_job = (
-                self.sync_release_job_type == SyncReleaseJobType.pull_from_upstream
+            downstream_pr, additional_prs = self.packit_api.sync_release(
+                **self.get_sync_release_kwargs(branch, tag=tag, version=version),
             )
-            kwargs = {
-                "dist_git_branch": branch,
-                "create_pr": True,
-                "local_pr_branch_suffix": branch_suffix,
-                "use_downstream_specfile": is_pull_from_upstream_job,
-                "add_pr_instructions": True,
-                "resolved_bugs": self.get_resolved_bugs(),
-                "release_monitoring_project_id": self.data.event_dict.get(
-                    "anitya_project_id",
-                ),
-                "sync_acls": True,
-                "pr_description_footer": DistgitAnnouncement.get_announcement(),
-                # [TODO] Remove for CentOS support once it gets refined
-                "add_new_sources": self.package_config.pkg_tool in (None, "fedpkg"),
-                "fast_forward_merge_branches": self.helper.get_fast_forward_merge_branches_for(
-                    branch,
-                ),
-            }
-            if tag:
-                kwargs["tag"] = tag
-            elif version:
-                kwargs["versions"] = [version]
-            downstream_pr, additional_prs = self.packit_api.sync_release(**kwargs)
         except PackitDownloadFailedException as ex:
             # the archive has not been uploaded to PyPI yet
             # retry for the archive to become available
@@ -368,25 +387,12 @@ class AbstractSyncReleaseHandler(
 
         return sync_release_model
 
-    def run_for_target(
-        self,
-        sync_release_run_model: SyncReleaseModel,
-        model: SyncReleaseTargetModel,
-        tag: Optional[str] = None,
-        version: Optional[str] = None,
-    ) -> Optional[str]:
+    def start_target(self, model: SyncReleaseTargetModel) -> Optional[str]:
         """
-        Run sync-release for the single target specified by the given model.
-
-        Args:
-            sync_release_run_model: Model for the whole sync release run.
-            model: Model for the single target that is to be executed.
+        Mark the target as running and report it.
 
         Returns:
-            String representation of the exception, if occurs.
-
-        Raises:
-            AbortSyncRelease: In case the archives cannot be downloaded.
+            URL of the target details or `None` if the target was already processed.
         """
         branch = model.branch
 
@@ -407,7 +413,6 @@ class AbstractSyncReleaseHandler(
         # for now the url is used only for propose-downstream
         # so it does not matter URL may not be valid for pull-from-upstream
         url = get_propose_downstream_info_url(model.id)
-        buffer, handler = gather_packit_logs_to_buffer(logging_level=logging.DEBUG)
 
         model.set_start_time(start_time=datetime.utcnow())
         self.sync_release_helper.report_status_for_branch(
@@ -416,14 +421,35 @@ class AbstractSyncReleaseHandler(
             state=BaseCommitStatus.running,
             url=url,
         )
+        return url
 
+    def finish_target(
+        self,
+        model: SyncReleaseTargetModel,
+        url: str,
+        collect_logs: Callable[[], str],
+        result: Optional[tuple[PullRequest, dict[str, PullRequest]]] = None,
+        exception: Optional[Exception] = None,
+    ) -> Optional[str]:
+        """
+        Store and report the result of the sync-release for the target.
+
+        Args:
+            model: Model of the target.
+            url: URL of the target details.
+            collect_logs: Returns the packit logs of the sync-release.
+            result: Downstream PR and additional (fast-forward merge) PRs.
+            exception: Exception the sync-release failed with.
+
+        Returns:
+            String representation of the exception, if occurs.
+        """
+        branch = model.branch
         try:
-            downstream_pr, additional_prs = self.sync_branch(
-                branch=branch,
-                model=sync_release_run_model,
-                tag=tag,
-                version=version,
-            )
+            if exception:
+                raise exception
+
+            downstream_pr, additional_prs = result
             logger.debug("Downstream PR(s) created successfully.")
             model.set_downstream_pr_url(downstream_pr_url=downstream_pr.url)
             downstream_pr_project = downstream_pr.target_project
@@ -454,8 +480,6 @@ class AbstractSyncReleaseHandler(
 
             model.set_downstream_prs(downstream_prs=pr_models)
 
-        except AbortSyncRelease:
-            raise
         except Exception as ex:
             logger.debug(f"{self.sync_release_job_type} failed: {ex}")
             # make sure exception message is propagated to the logs
@@ -478,7 +502,7 @@ class AbstractSyncReleaseHandler(
             return str(ex)
         finally:
             model.set_finished_time(finished_time=datetime.utcnow())
-            model.set_logs(collect_packit_logs(buffer=buffer, handler=handler))
+            model.set_logs(collect_logs())
 
         dashboard_url = self.get_dashboard_url(model.id)
         self.report_dashboard_url(
@@ -496,6 +520,195 @@ class AbstractSyncReleaseHandler(
         # no error occurred
         return None
 
+    def run_for_target(
+        self,
+        sync_release_run_model: SyncReleaseModel,
+        model: SyncReleaseTargetModel,
+        tag: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Run sync-release for the single target specified by the given model.
+
+        Args:
+            sync_release_run_model: Model for the whole sync release run.
+            model: Model for the single target that is to be executed.
+
+        Returns:
+            String representation of the exception, if occurs.
+
+        Raises:
+            AbortSyncRelease: In case the archives cannot be downloaded.
+        """
+        if not (url := self.start_target(model)):
+            return None
+
+        buffer, handler = gather_packit_logs_to_buffer(logging_level=logging.DEBUG)
+        collect_logs = partial(collect_packit_logs, buffer=buffer, handler=handler)
+        try:
+            result = self.sync_branch(
+                branch=model.branch,
+                model=sync_release_run_model,
+                tag=tag,
+                version=version,
+            )
+        except AbortSyncRelease:
+            model.set_finished_time(finished_time=datetime.utcnow())
+            model.set_logs(collect_logs())
+            raise
+        except Exception as ex:
+            return self.finish_target(model, url, collect_logs, exception=ex)
+
+        return self.finish_target(model, url, collect_logs, result=result)
+
+    @contextmanager
+    def get_packit_apis_for_branches(self, branches: list[str]) -> Iterator[dict[str, PackitAPI]]:
+        """
+        Get Packit API to sync the release with for each of the branches.
+
+        Each of the branches gets its own worktrees of the upstream and dist-git
+        repositories. The upstream archives already downloaded to the dist-git
+        repository are linked into the dist-git worktrees, so that they are not
+        downloaded again.
+        """
+        dg_local_project = self.packit_api.dg.local_project
+        dg_source_dir = self.packit_api.dg.absolute_source_dir.relative_to(
+            dg_local_project.working_dir,
+        )
+        archives = [
+            archive
+            for name in self.packit_api.dg.upstream_archive_names
+            if (archive := self.packit_api.dg.absolute_source_dir / name).is_file()
+        ]
+        up_local_project = self.packit_api.upstream_local_project
+        with ExitStack() as stack:
+            dg_worktrees = stack.enter_context(
+                create_worktrees(
+                    dg_local_project.git_repo,
+                    len(branches),
+                    self.service_config.command_handler_work_dir,
+                ),
+            )
+            up_worktrees = (
+                stack.enter_context(
+                    create_worktrees(
+                        up_local_project.git_repo,
+                        len(branches),
+                        self.service_config.command_handler_work_dir,
+                    ),
+                )
+                if up_local_project
+                else [None] * len(branches)
+            )
+
+            packit_apis = {}
+            for branch, dg_worktree, up_worktree in zip(branches, dg_worktrees, up_worktrees):
+                source_dir = Path(dg_worktree.working_tree_dir) / dg_source_dir
+                for archive in archives:
+                    try:
+                        os.link(archive, source_dir / archive.name)
+                    except OSError:  # noqa: PERF203
+                        shutil.copy2(archive, source_dir / archive.name)
+
+                packit_apis[branch] = PackitAPI(
+                    self.service_config,
+                    self.job_config,
+                    upstream_local_project=(
+                        get_worktree_local_project(up_worktree, up_local_project)
+                        if up_worktree
+                        else None
+                    ),
+                    downstream_local_project=get_worktree_local_project(
+                        dg_worktree,
+                        dg_local_project,
+                    ),
+                    non_git_upstream=self.packit_api.non_git_upstream,
+                )
+                # do not run kinit concurrently
+                packit_apis[branch].init_kerberos_ticket()
+            yield packit_apis
+
+    def sync_branch_concurrently(
+        self,
+        packit_api: PackitAPI,
+        kwargs: dict,
+    ) -> tuple[Optional[tuple[PullRequest, dict[str, PullRequest]]], Optional[Exception], str]:
+        """
+        Sync the release to a branch, can be run in a separate thread
+        and therefore doesn't touch the database.
+
+        Returns:
+            Downstream PR and additional PRs, the exception the sync-release failed with
+            and the packit logs.
+        """
+        buffer, handler = gather_packit_logs_to_buffer(
+            logging_level=logging.DEBUG,
+            current_thread_only=True,
+        )
+        result, exception = None, None
+        try:
+            result = packit_api.sync_release(**kwargs)
+        except Exception as ex:
+            exception = ex
+            # make sure exception message is propagated to the logs
+            logging.getLogger("packit").error(str(ex))
+        return result, exception, collect_packit_logs(buffer=buffer, handler=handler)
+
+    def run_for_targets_concurrently(
+        self,
+        sync_release_run_model: SyncReleaseModel,
+        tag: Optional[str] = None,
+        version: Optional[str] = None,
+    ) -> dict[str, str]:
+        """
+        Run sync-release for all the targets, the first one prepares
+        the upstream archives and the rest of them are run concurrently.
+
+        Returns:
+            Dict of branch → error message for branches that failed.
+
+        Raises:
+            AbortSyncRelease: In case the archives cannot be downloaded.
+        """
+        errors = {}
+        first, *rest = sync_release_run_model.sync_release_targets
+        if error := self.run_for_target(sync_release_run_model, first, tag=tag, version=version):
+            errors[first.branch] = error
+
+        targets = [(model, url) for model in rest if (url := self.start_target(model))]
+        if not targets:
+            return errors
+
+        branches = [model.branch for model, _ in targets]
+        with (
+            self.get_packit_apis_for_branches(branches) as packit_apis,
+            ThreadPoolExecutor(
+                max_workers=self.service_config.sync_release_concurrency,
+            ) as executor,
+        ):
+            futures = [
+                executor.submit(
+                    self.sync_branch_concurrently,
+                    packit_apis[model.branch],
+                    self.get_sync_release_kwargs(model.branch, tag=tag, version=version),
+                )
+                for model, _ in targets
+            ]
+            # a failure of one branch doesn't affect the others
+            for (model, url), future in zip(targets, futures):
+                result, exception, logs = future.result()
+                if error := self.finish_target(
+                    model,
+                    url,
+                    # the logs have already been collected by the thread
+                    partial(str, logs),
+                    result=result,
+                    exception=exception,
+                ):
+                    errors[model.branch] = error
+
+        return errors
+
     def _filter_tags(self, tags: list[str]) -> list[str]:
         """Filter the given tags using upstream_tag_include and
         upstream_tag_exclude from the job config.
@@ -613,11 +826,21 @@ class AbstractSyncReleaseHandler(
         )
 
         try:
-            for model in sync_release_run_model.sync_release_targets:
-                if error := self.run_for_target(
-                    sync_release_run_model, model, tag=tag, version=version
-                ):
-                    errors[model.branch] = error
+            if (
+                self.service_config.sync_release_concurrency > 1
+                and len(sync_release_run_model.sync_release_targets) > 1
+            ):
+                errors = self.run_for_targets_concurrently(
+                    sync_release_run_model,
+                    tag=tag,
+                    version=version,
+                )
+            else:
+                for model in sync_release_run_model.sync_release_targets:
+                    if error := self.run_for_target(
+                        sync_release_run_model, model, tag=tag, version=version
+                    ):
+                        errors[model.branch] = error
         except AbortSyncRelease:
             logger.debug(
                 f"{self.sync_release_job_type} is being retried because "
@@ -1238,6 +1461,108 @@ class AbstractDownstreamKojiBuildHandler(
 
         return False
 
+    def get_koji_build_models_to_submit(
+        self,
+        group: KojiBuildGroupModel,
+    ) -> list[KojiBuildTargetModel]:
+        """
+        Get the Koji builds of the group that should be submitted,
+        skip those already processed or (for non-scratch builds) already triggered.
+        """
+        # a retried task submits only the builds that failed to be submitted
+        statuses = (
+            ["queued", "retry"]
+            if self._koji_group_model_id is not None
+            else ["queued", "pending", "retry"]
+        )
+        koji_build_models = []
+        for koji_build_model in group.grouped_targets:
+            # skip submitting build for a branch if we already did that (even if it failed)
+            if koji_build_model.status not in statuses:
+                logger.debug(
+                    f"Skipping downstream Koji build for branch {koji_build_model.target} "
+                    f"that was already processed.",
+                )
+                continue
+            koji_build_models.append(koji_build_model)
+
+        if self.job_config.scratch or not koji_build_models:
+            return koji_build_models
+
+        existing_models = KojiBuildTargetModel.get_all_successful_or_in_progress_by_nvrs(
+            koji_build_model.nvr for koji_build_model in koji_build_models
+        )
+        to_submit = []
+        for koji_build_model in koji_build_models:
+            if {model for model in existing_models if model.nvr == koji_build_model.nvr} - {
+                koji_build_model
+            } or self.is_already_triggered(koji_build_model.nvr):
+                logger.info(
+                    f"Skipping downstream Koji build {koji_build_model.nvr} "
+                    f"for branch {koji_build_model.target} that was already triggered.",
+                )
+                koji_build_model.set_status("skipped")
+                continue
+            to_submit.append(koji_build_model)
+
+        return to_submit
+
+    @contextmanager
+    def get_packit_apis_for_branches(self, branches: list[str]) -> Iterator[dict[str, PackitAPI]]:
+        """
+        Get Packit API to submit the Koji build with for each of the branches.
+
+        Submitting a build checks out the branch, so when there are more branches
+        to be built concurrently, each of them gets its own worktree
+        of the dist-git repository.
+        """
+        if len(branches) == 1:
+            yield {branches[0]: self.packit_api}
+            return
+
+        local_project = self.packit_api.dg.local_project
+        with create_worktrees(
+            local_project.git_repo,
+            len(branches),
+            self.service_config.command_handler_work_dir,
+        ) as worktrees:
+            packit_apis = {}
+            for branch, worktree in zip(branches, worktrees):
+                packit_apis[branch] = PackitAPI(
+                    self.service_config,
+                    self.job_config,
+                    downstream_local_project=get_worktree_local_project(worktree, local_project),
+                )
+                # do not run kinit concurrently
+                packit_apis[branch].init_kerberos_ticket()
+            yield packit_apis
+
+    def submit_koji_build(
+        self,
+        packit_api: PackitAPI,
+        koji_build_model: KojiBuildTargetModel,
+    ) -> Optional[str]:
+        """
+        Submit the Koji build, can be run in a separate thread
+        and therefore doesn't touch the database.
+
+        Returns:
+            The 'stdout' of the build command.
+        """
+        start = time.monotonic()
+        try:
+            return packit_api.build(
+                dist_git_branch=koji_build_model.target,
+                scratch=self.job_config.scratch,
+                nowait=True,
+                from_upstream=False,
+                koji_target=koji_build_model.sidetag,
+            )
+        finally:
+            self.pushgateway.downstream_koji_build_submission_time.observe(
+                time.monotonic() - start,
+            )
+
     def _run(self) -> TaskResults:
         if getenv("CANCEL_RUNNING_JOBS"):
             self.koji_build_helper.cancel_running_builds()
@@ -1248,82 +1573,86 @@ class AbstractDownstreamKojiBuildHandler(
             logger.debug(f"Koji build failed to be submitted: {ex}")
             return TaskResults(success=True, details={})
 
-        errors = {}
-        for koji_build_model in group.grouped_targets:
-            branch = koji_build_model.target
-
-            # skip submitting build for a branch if we already did that (even if it failed)
-            if koji_build_model.status not in ["queued", "pending", "retry"]:
-                logger.debug(
-                    f"Skipping downstream Koji build for branch {branch} "
-                    f"that was already processed.",
-                )
-                continue
-
-            if not self.job_config.scratch:
-                existing_models = KojiBuildTargetModel.get_all_successful_or_in_progress_by_nvr(
-                    koji_build_model.nvr,
-                )
-                if existing_models - {koji_build_model} or self.is_already_triggered(
-                    koji_build_model.nvr,
-                ):
-                    logger.info(
-                        f"Skipping downstream Koji build {koji_build_model.nvr} "
-                        f"for branch {branch} that was already triggered.",
-                    )
-                    koji_build_model.set_status("skipped")
-                    continue
+        koji_build_models = self.get_koji_build_models_to_submit(group)
+        if not koji_build_models:
+            return TaskResults(success=True, details={})
 
-            logger.debug(f"Running downstream Koji build for {branch}")
+        for koji_build_model in koji_build_models:
+            logger.debug(f"Running downstream Koji build for {koji_build_model.target}")
             koji_build_model.set_status("pending")
 
-            try:
-                stdout = self.packit_api.build(
-                    dist_git_branch=koji_build_model.target,
-                    scratch=self.job_config.scratch,
-                    nowait=True,
-                    from_upstream=False,
-                    koji_target=koji_build_model.sidetag,
+        failures: dict[str, PackitException] = {}
+        with (
+            self.get_packit_apis_for_branches(
+                [koji_build_model.target for koji_build_model in koji_build_models],
+            ) as packit_apis,
+            ThreadPoolExecutor(
+                max_workers=self.service_config.koji_build_submission_concurrency,
+            ) as executor,
+        ):
+            futures = [
+                executor.submit(
+                    self.submit_koji_build,
+                    packit_apis[koji_build_model.target],
+                    koji_build_model,
                 )
+                for koji_build_model in koji_build_models
+            ]
+            # a failure of one branch doesn't affect the others
+            for koji_build_model, future in zip(koji_build_models, futures):
+                try:
+                    stdout = future.result()
+                except PackitException as ex:
+                    failures[koji_build_model.target] = ex
+                    continue
                 if stdout:
                     task_id, web_url = get_koji_task_id_and_url_from_stdout(stdout)
                     koji_build_model.set_task_id(str(task_id))
                     koji_build_model.set_web_url(web_url)
                     koji_build_model.set_build_submission_stdout(stdout)
-            except PackitException as ex:
-                if (
-                    self.celery_task
-                    and self.celery_task.can_retry_for(ex)
-                    and not self.celery_task.is_last_try()
-                ):
-                    kargs = self.celery_task.task.request.kwargs.copy()
-                    kargs["koji_group_model_id"] = group.id
-                    for model in group.grouped_targets:
-                        model.set_status("retry")
 
-                    logger.debug(
-                        "Celery task will be retried. User will not be notified about the failure.",
-                    )
-                    retry_backoff = int(
-                        getenv("CELERY_RETRY_BACKOFF", DEFAULT_RETRY_BACKOFF),
-                    )
-                    delay = retry_backoff * 2**self.celery_task.retries
-                    self.celery_task.task.retry(exc=ex, countdown=delay, kwargs=kargs)
-                    return TaskResults(
-                        success=True,
-                        details={
-                            "msg": f"There was an error: {ex}. Task will be retried.",
-                        },
-                    )
-                error = str(ex)
-                if isinstance(ex, PackitCommandFailedError):
-                    error += f"\n{ex.stderr_output}"
-                    koji_build_model.set_build_submission_stdout(ex.stdout_output)
-
-                errors[branch] = get_koji_build_info_url(koji_build_model.id)
-                koji_build_model.set_data({"error": error})
-                koji_build_model.set_status("error")
+        retriable = next(
+            (
+                ex
+                for ex in failures.values()
+                if self.celery_task and self.celery_task.can_retry_for(ex)
+            ),
+            None,
+        )
+        if retriable and not self.celery_task.is_last_try():
+            kargs = self.celery_task.task.request.kwargs.copy()
+            kargs["koji_group_model_id"] = group.id
+            for koji_build_model in koji_build_models:
+                if koji_build_model.target in failures:
+                    koji_build_model.set_status("retry")
+
+            logger.debug(
+                "Celery task will be retried. User will not be notified about the failure.",
+            )
+            retry_backoff = int(
+                getenv("CELERY_RETRY_BACKOFF", DEFAULT_RETRY_BACKOFF),
+            )
+            delay = retry_backoff * 2**self.celery_task.retries
+            self.celery_task.task.retry(exc=retriable, countdown=delay, kwargs=kargs)
+            return TaskResults(
+                success=True,
+                details={
+                    "msg": f"There was an error: {retriable}. Task will be retried.",
+                },
+            )
+
+        errors = {}
+        for koji_build_model in koji_build_models:
+            if not (failure := failures.get(koji_build_model.target)):
                 continue
+            error = str(failure)
+            if isinstance(failure, PackitCommandFailedError):
+                error += f"\n{failure.stderr_output}"
+                koji_build_model.set_build_submission_stdout(failure.stdout_output)
+
+            errors[koji_build_model.target] = get_koji_build_info_url(koji_build_model.id)
+            koji_build_model.set_data({"error": error})
+            koji_build_model.set_status("error")
 
         if errors:
             self.report_in_issue_repository(errors)
@@ -1,28 +1,44 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-import collections
 import logging
+import time
 from collections.abc import Iterable
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from enum import Enum
+from http import HTTPStatus
 from typing import Any, Optional
 
 import celery
 import copr.v3
 import requests
+from cachetools.func import ttl_cache
 from celery.canvas import Signature
 from copr.v3 import Client as CoprClient
+from munch import Munch
 from requests import HTTPError
 
 from packit_service.constants import (
     COPR_API_FAIL_STATE,
     COPR_API_SUCC_STATE,
+    COPR_BUILD_CHECK_BATCH,
+    COPR_BUILD_CHECK_CONCURRENCY,
+    COPR_BUILD_CHECK_LEASE,
+    COPR_BUILD_CHECK_MAX_INTERVAL,
+    COPR_BUILD_CHECK_MIN_INTERVAL,
+    COPR_BUILD_DEFAULT_DURATION,
+    COPR_BUILD_DURATION_SAMPLE,
+    COPR_BUILD_DURATION_TTL,
     COPR_FAIL_STATE,
     COPR_SRPM_CHROOT,
     COPR_SUCC_STATE,
     DEFAULT_JOB_TIMEOUT,
     TESTING_FARM_API_URL,
+    TESTING_FARM_POLLING_CONCURRENCY,
+    TESTING_FARM_POLLING_TIMEOUT,
 )
 from packit_service.events import copr as copr_events
 from packit_service.events import (
@@ -53,10 +69,29 @@ from packit_service.worker.handlers.testing_farm import (
 )
 from packit_service.worker.jobs import SteveJobs
 from packit_service.worker.mixin import ConfigFromUrlMixin
+from packit_service.worker.monitoring import Pushgateway
 from packit_service.worker.parser import Parser
 
 logger = logging.getLogger(__name__)
 
+# states of the chroots of the pending Copr builds as observed during the last check,
+# used to skip the chroots that have not changed since
+_observed_copr_build_states: dict[int, dict[str, str]] = {}
+
+
+@dataclass
+class ObservedTestingFarmState:
+    """Testing Farm request of a pending run as observed during the last check."""
+
+    state: Optional[str]
+    updated: Optional[str]
+    etag: Optional[str]
+
+
+# Testing Farm requests of the pending runs as observed during the last check,
+# used to send the requests conditionally and skip the ones that have not changed since
+_observed_testing_farm_states: dict[str, ObservedTestingFarmState] = {}
+
 
 def celery_run_async(signatures: list[Signature]) -> None:
     logger.debug("Signatures are going to be sent to Celery (from babysit task).")
@@ -77,6 +112,51 @@ def celery_run_async(signatures: list[Signature]) -> None:
     logger.debug("Signatures were sent to Celery.")
 
 
+def get_testing_farm_run_details(
+    session: requests.Session,
+    run: TFTTestRunTargetModel,
+    pushgateway: Pushgateway,
+    etag: Optional[str] = None,
+) -> Optional[requests.Response]:
+    """
+    Get the details of the Testing Farm request corresponding to the run.
+
+    Args:
+        session: HTTP session shared by all the requests of one check.
+        run: Pending Testing Farm run.
+        pushgateway: Pushgateway to record the request latency to.
+        etag: ETag of the details from the previous check, the details
+            are sent only if they have changed since.
+
+    Returns:
+        Response with the details (or `304 Not Modified`) or `None`
+        if they could not be obtained.
+    """
+    run_url = f"{TESTING_FARM_API_URL}requests/{run.pipeline_id}"
+    headers = {"If-None-Match": etag} if etag else {}
+    start = time.monotonic()
+    try:
+        response = session.get(run_url, headers=headers, timeout=TESTING_FARM_POLLING_TIMEOUT)
+    except requests.RequestException as ex:
+        logger.info(
+            f"Failed to obtain state of TF pipeline {run.pipeline_id}: {ex}. "
+            "Let's try again later.",
+        )
+        return None
+    finally:
+        pushgateway.testing_farm_request_time.observe(time.monotonic() - start)
+
+    if not response.ok:
+        logger.info(
+            f"Failed to obtain state of TF pipeline {run.pipeline_id}. "
+            f"Status code {response.status_code}. Reason: {response.reason}. "
+            "Let's try again later.",
+        )
+        return None
+
+    return response
+
+
 def check_pending_testing_farm_runs() -> None:
     """Checks the status of pending TFT runs and updates it if needed."""
     logger.info("Getting pending TFT runs from DB")
@@ -87,9 +167,8 @@ def check_pending_testing_farm_runs() -> None:
         TestingFarmResult.running,
         TestingFarmResult.cancel_requested,
     )
-    pending_test_runs = TFTTestRunTargetModel.get_all_by_status(*not_completed)
-    for run in pending_test_runs:
-        logger.debug(f"Checking status of TF pipeline {run.pipeline_id}")
+    runs_to_check = []
+    for run in TFTTestRunTargetModel.get_all_by_status(*not_completed):
         # .submitted_time can be None, we'll set it later
         if run.submitted_time:
             elapsed = elapsed_seconds(begin=run.submitted_time, end=current_time)
@@ -101,43 +180,112 @@ def check_pending_testing_farm_runs() -> None:
                 )
                 run.set_status(TestingFarmResult.error)
                 continue
-        run_url = f"{TESTING_FARM_API_URL}requests/{run.pipeline_id}"
-        response = requests.get(run_url)
-        if not response.ok:
-            logger.info(
-                f"Failed to obtain state of TF pipeline {run.pipeline_id}. "
-                f"Status code {response.status_code}. Reason: {response.reason}. "
-                "Let's try again later.",
+        runs_to_check.append(run)
+
+    if not runs_to_check:
+        return
+
+    observed_states: dict[str, ObservedTestingFarmState] = {}
+    # pending runs with their state from the last check
+    runs_to_request = [
+        (run, _observed_testing_farm_states.get(run.pipeline_id)) for run in runs_to_check
+    ]
+
+    pushgateway = Pushgateway()
+    start = time.monotonic()
+    # the requests are sent concurrently, but the responses are processed one by one
+    # so that the DB is accessed from this thread only
+    with requests.Session() as session:
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=TESTING_FARM_POLLING_CONCURRENCY)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        with ThreadPoolExecutor(max_workers=TESTING_FARM_POLLING_CONCURRENCY) as executor:
+            responses = executor.map(
+                lambda run_observed: get_testing_farm_run_details(
+                    session,
+                    run_observed[0],
+                    pushgateway,
+                    etag=run_observed[1].etag if run_observed[1] else None,
+                ),
+                runs_to_request,
             )
-            continue
+            for (run, observed), response in zip(runs_to_request, responses):
+                logger.debug(f"Checking status of TF pipeline {run.pipeline_id}")
+                if response is None:
+                    if observed:
+                        observed_states[run.pipeline_id] = observed
+                    continue
+
+                details = (
+                    None if response.status_code == HTTPStatus.NOT_MODIFIED else response.json()
+                )
+                if observed and (
+                    details is None
+                    or (details.get("state"), details.get("updated"))
+                    == (observed.state, observed.updated)
+                ):
+                    logger.debug(
+                        f"TF pipeline {run.pipeline_id} has not changed since the last check.",
+                    )
+                    observed_states[run.pipeline_id] = observed
+                    continue
+
+                if update_testing_farm_run_from_details(run, details, not_completed):
+                    observed_states[run.pipeline_id] = ObservedTestingFarmState(
+                        state=details.get("state"),
+                        updated=details.get("updated"),
+                        etag=response.headers.get("ETag"),
+                    )
+
+    # remember only the runs that are still pending
+    _observed_testing_farm_states.clear()
+    _observed_testing_farm_states.update(observed_states)
+
+    elapsed = time.monotonic() - start
+    logger.info(f"Checked {len(runs_to_check)} pending TF runs in {elapsed:.1f}s.")
+    pushgateway.testing_farm_runs_check_time.observe(elapsed)
+    pushgateway.push()
+
+
+def update_testing_farm_run_from_details(
+    run: TFTTestRunTargetModel,
+    details: dict,
+    not_completed: tuple[TestingFarmResult, ...],
+) -> bool:
+    """
+    Update the run from the details of the Testing Farm request.
 
-        details = response.json()
-        data = Parser.parse_data_from_testing_farm(run, details)
+    Returns:
+        Whether the run is still pending.
+    """
+    data = Parser.parse_data_from_testing_farm(run, details)
 
-        logger.debug(f"Result for the TF pipeline {run.pipeline_id} is {data.result}.")
-        if data.result in not_completed:
-            logger.debug("Skip updating a pipeline which is not yet completed.")
-            continue
-        event = testing_farm.Result(
-            pipeline_id=details["id"],
-            result=data.result,
-            compose=data.compose,
-            summary=data.summary,
-            log_url=data.log_url,
-            copr_build_id=data.copr_build_id,
-            copr_chroot=data.copr_chroot,
-            commit_sha=data.ref,
-            project_url=data.project_url,
-            created=data.created,
-            identifier=data.identifier,
+    logger.debug(f"Result for the TF pipeline {run.pipeline_id} is {data.result}.")
+    if data.result in not_completed:
+        logger.debug("Skip updating a pipeline which is not yet completed.")
+        return True
+
+    event = testing_farm.Result(
+        pipeline_id=details["id"],
+        result=data.result,
+        compose=data.compose,
+        summary=data.summary,
+        log_url=data.log_url,
+        copr_build_id=data.copr_build_id,
+        copr_chroot=data.copr_chroot,
+        commit_sha=data.ref,
+        project_url=data.project_url,
+        created=data.created,
+        identifier=data.identifier,
+    )
+    try:
+        update_testing_farm_run(event, run)
+    except Exception as ex:
+        logger.debug(
+            f"There was an exception when updating the Testing farm run "
+            f"with pipeline ID {run.pipeline_id}: {ex}",
         )
-        try:
-            update_testing_farm_run(event, run)
-        except Exception as ex:
-            logger.debug(
-                f"There was an exception when updating the Testing farm run "
-                f"with pipeline ID {run.pipeline_id}: {ex}",
-            )
+    return False
 
 
 def update_testing_farm_run(event: testing_farm.Result, run: TFTTestRunTargetModel):
@@ -214,17 +362,189 @@ def update_testing_farm_run(event: testing_farm.Result, run: TFTTestRunTargetMod
             )
 
 
+@ttl_cache(maxsize=1, ttl=COPR_BUILD_DURATION_TTL)
+def get_expected_copr_build_durations() -> dict[str, timedelta]:
+    """Expected durations of Copr builds per chroot."""
+    return CoprBuildTargetModel.get_average_build_durations(COPR_BUILD_DURATION_SAMPLE)
+
+
+def get_next_copr_build_check_delay(builds: Iterable["CoprBuildTargetModel"]) -> timedelta:
+    """
+    Get the delay of the next status check of a Copr build.
+
+    The build is checked when the first of its unfinished chroots is expected
+    to end. Once all of them are overdue, the delay grows with the time
+    they are overdue.
+
+    Args:
+        builds: Models of the Copr build chroots.
+
+    Returns:
+        Delay of the next check.
+    """
+    durations = get_expected_copr_build_durations()
+    now = datetime.utcnow()
+    remaining = [
+        (build.build_start_time or build.submitted_time or now)
+        + durations.get(build.target, COPR_BUILD_DEFAULT_DURATION)
+        - now
+        for build in builds
+        if build.status in (BuildStatus.pending, BuildStatus.waiting_for_srpm)
+    ]
+    if not remaining:
+        return COPR_BUILD_CHECK_MIN_INTERVAL
+
+    if ahead := [delay for delay in remaining if delay > timedelta(0)]:
+        delay = min(ahead)
+    else:
+        # all the chroots are overdue, back off
+        delay = -max(remaining) / 2
+    return min(max(delay, COPR_BUILD_CHECK_MIN_INTERVAL), COPR_BUILD_CHECK_MAX_INTERVAL)
+
+
+@dataclass
+class CoprBuildStatus:
+    """State of a Copr build as reported by Copr."""
+
+    # `None` if the build is no longer available
+    build: Optional[Munch]
+    # chroots of the build by their names, empty if the build has not started yet
+    chroots: dict[str, Munch] = field(default_factory=dict)
+    # SRPM build (source chroot), fetched only for the pending SRPM builds,
+    # `None` if it is no longer available
+    srpm: Optional[Munch] = None
+
+    @property
+    def observed_states(self) -> dict[str, str]:
+        """
+        States of the chroots (and of the SRPM build, under `COPR_SRPM_CHROOT`)
+        used to find out which of them have changed since the last check.
+        """
+        states = {name: chroot.state for name, chroot in self.chroots.items()}
+        if self.srpm:
+            states[COPR_SRPM_CHROOT] = self.srpm.state
+        return states
+
+
+def get_copr_build_status(
+    copr_client: CoprClient,
+    build_id: int,
+    srpm_pending: bool,
+) -> CoprBuildStatus:
+    """
+    Get the state of the Copr build, its chroots and, if it's pending, its SRPM build.
+
+    Args:
+        copr_client: Copr client to use for the API calls.
+        build_id: ID of the Copr build.
+        srpm_pending: Whether the SRPM build is pending in our DB.
+
+    Returns:
+        State of the build.
+    """
+    try:
+        build = copr_client.build_proxy.get(build_id)
+    except copr.v3.CoprNoResultException:
+        return CoprBuildStatus(build=None)
+    if not build.ended_on and not build.started_on:
+        return CoprBuildStatus(build=build)
+
+    chroots = copr_client.build_chroot_proxy.get_list(build_id)
+    srpm = None
+    if srpm_pending:
+        with suppress(copr.v3.CoprNoResultException):
+            srpm = copr_client.build_proxy.get_source_chroot(build_id)
+    return CoprBuildStatus(
+        build=build,
+        chroots={chroot.name: chroot for chroot in chroots},
+        srpm=srpm,
+    )
+
+
 def check_pending_copr_builds() -> None:
-    """Checks the status of pending copr builds and updates it if needed."""
-    pending_copr_builds = CoprBuildTargetModel.get_all_by_status(BuildStatus.pending)
-    builds_grouped_by_id = collections.defaultdict(list)
-    for build in pending_copr_builds:
-        # our DB uses str(build_id) but our code expects int(build_id)
-        builds_grouped_by_id[int(build.build_id)].append(build)
+    """
+    Checks the status of the pending copr builds whose check is due,
+    updates it if needed and schedules the next check.
+    """
+    build_ids = CoprBuildTargetModel.pop_due_status_checks(
+        limit=COPR_BUILD_CHECK_BATCH,
+        lease=COPR_BUILD_CHECK_LEASE,
+    )
+    if not build_ids:
+        return
 
+    builds_by_build_id: dict[int, list[CoprBuildTargetModel]] = {
+        build_id: [] for build_id in build_ids
+    }
+    for build in CoprBuildTargetModel.get_all_by_build_ids(build_ids):
+        builds_by_build_id[int(build.build_id)].append(build)
+    pending_srpm_builds = {
+        int(srpm_build.copr_build_id): srpm_build
+        for srpm_build in SRPMBuildModel.get_all_by_copr_build_ids(build_ids)
+        if srpm_build.status == BuildStatus.pending
+    }
+
+    pushgateway = Pushgateway()
+    start = time.monotonic()
     copr_client = CoprClient.create_from_config_file()
-    for build_id, builds in builds_grouped_by_id.items():
-        update_copr_builds(build_id, builds, copr_client=copr_client)
+    check_times: dict[int, Optional[datetime]] = {}
+    errored_ids: list[int] = []
+    # the requests are sent concurrently, but the responses are processed one by one
+    # so that the DB is accessed from this thread only
+    with ThreadPoolExecutor(max_workers=COPR_BUILD_CHECK_CONCURRENCY) as executor:
+        statuses = {
+            build_id: executor.submit(
+                get_copr_build_status,
+                copr_client,
+                build_id,
+                build_id in pending_srpm_builds,
+            )
+            for build_id in build_ids
+        }
+        for build_id, future in statuses.items():
+            builds = builds_by_build_id[build_id]
+            try:
+                status = future.result()
+                ended, errored = update_copr_builds(
+                    build_id,
+                    builds,
+                    status,
+                    pending_srpm_builds.get(build_id),
+                    _observed_copr_build_states.get(build_id),
+                )
+            except Exception as ex:
+                # the build is picked again once the lease expires
+                logger.warning(f"Failed to check copr build {build_id}: {ex!r}")
+                _observed_copr_build_states.pop(build_id, None)
+                continue
+
+            errored_ids.extend(build.id for build in errored)
+            pending = [build for build in builds if build not in errored]
+            if ended:
+                _observed_copr_build_states.pop(build_id, None)
+                # the builds are finished by the end handler, until their status
+                # is final they are checked again in case the handler fails
+                check_times[build_id] = (
+                    datetime.utcnow() + COPR_BUILD_CHECK_LEASE
+                    if any(
+                        build.status in (BuildStatus.pending, BuildStatus.waiting_for_srpm)
+                        for build in pending
+                    )
+                    else None
+                )
+            else:
+                _observed_copr_build_states[build_id] = status.observed_states
+                check_times[build_id] = datetime.utcnow() + get_next_copr_build_check_delay(
+                    pending,
+                )
+            logger.debug(f"Next check of copr build {build_id}: {check_times[build_id]}")
+
+    CoprBuildTargetModel.update_status_checks(check_times, errored_ids)
+
+    elapsed = time.monotonic() - start
+    logger.info(f"Checked {len(build_ids)} pending Copr builds in {elapsed:.1f}s.")
+    pushgateway.copr_builds_check_time.observe(elapsed)
+    pushgateway.push()
 
 
 def check_copr_build(build_id: int) -> bool:
@@ -244,19 +564,39 @@ def check_copr_build(build_id: int) -> bool:
     if not builds:
         logger.warning(f"Copr build {build_id} not in DB.")
         return True
-    return update_copr_builds(build_id, builds)
+
+    srpm_build = SRPMBuildModel.get_by_copr_build_id(build_id)
+    if srpm_build and srpm_build.status != BuildStatus.pending:
+        srpm_build = None
+    status = get_copr_build_status(
+        CoprClient.create_from_config_file(),
+        build_id,
+        srpm_pending=bool(srpm_build),
+    )
+    try:
+        ended, errored = update_copr_builds(build_id, builds, status, srpm_build)
+    except Exception as ex:
+        logger.debug(f"There was an exception when updating the Copr build {build_id}: {ex}")
+        return False
+
+    for build in errored:
+        build.set_status(BuildStatus.error)
+    return ended
 
 
 def update_copr_builds(
     build_id: int,
     builds: Iterable["CoprBuildTargetModel"],
-    copr_client: Optional[CoprClient] = None,
-) -> bool:
+    status: CoprBuildStatus,
+    srpm_build: Optional[SRPMBuildModel] = None,
+    observed_states: Optional[dict[str, str]] = None,
+) -> tuple[bool, list["CoprBuildTargetModel"]]:
     """
-    Updates the state of copr builds.
+    Updates the state of copr builds from the state reported by Copr.
 
     Builds which have ended will be updated into success/fail state.
-    Builds which have been pending for too long will be updated to error (timeout).
+    Builds which have been pending for too long or are no longer available
+        are returned to be set to the error state by the caller.
     Builds which have started and are waiting for SRPM will get their
         CoprBuildTargetModel and SRPMBuildModel updated (to cover the case
         where we do not correctly react to fedmsg).
@@ -264,54 +604,46 @@ def update_copr_builds(
     Args:
         build_id: ID of the copr build to update.
         builds: List of builds corresponding to the given ``build_id``.
-        copr_client: Optional CoprClient instance to use for API calls to Copr
-            (if not provided, a new one will be created).
+        status: State of the build reported by Copr.
+        srpm_build: SRPM build of the copr build if it's pending.
+        observed_states: States of the chroots observed by the last check
+            (see `CoprBuildStatus.observed_states`), the chroots whose state
+            has not changed since are not updated again.
 
     Returns:
-        Whether the run was successful and the build has ended,
-        False signals the need to retry again.
-    """
-    if copr_client is None:
-        copr_client = CoprClient.create_from_config_file()
+        Whether the build has ended and the builds to set to the error state.
 
-    try:
-        build_copr = copr_client.build_proxy.get(build_id)
-    except copr.v3.CoprNoResultException:
+    Raises:
+        Exception: If updating the state failed, the build should be checked again.
+    """
+    builds = list(builds)
+    if not status.build:
         logger.info(
             f"Copr build {build_id} no longer available. Setting it to error status and "
             f"not checking it anymore.",
         )
-        for build in builds:
-            build.set_status(BuildStatus.error)
-        return True
+        return True, builds
 
+    build_copr = status.build
     if not build_copr.ended_on and not build_copr.started_on:
         logger.info(f"The copr build {build_id} has not started yet.")
-        return False
+        return False, []
 
     logger.info(f"The status of {build_id} is {build_copr.state!r}.")
 
-    if (
-        srpm_build := SRPMBuildModel.get_by_copr_build_id(build_id)
-    ) and srpm_build.status == BuildStatus.pending:
-        try:
-            build_copr_srpm = copr_client.build_proxy.get_source_chroot(build_id)
-        except copr.v3.CoprNoResultException:
+    observed_states = observed_states or {}
+    current_states = status.observed_states
+    if srpm_build:
+        if not status.srpm:
             logger.info(
                 f"SRPM build of Copr build {build_id} no longer available. "
                 "Setting it to error status and not checking it anymore.",
             )
             srpm_build.set_status(BuildStatus.error)
-        else:
-            try:
-                update_srpm_build_state(srpm_build, build_copr, build_copr_srpm)
-            except Exception as ex:
-                logger.debug(
-                    f"There was an exception when updating the SRPM build of"
-                    f" Copr build {build_id}: {ex}",
-                )
-                return False
+        elif observed_states.get(COPR_SRPM_CHROOT) != current_states[COPR_SRPM_CHROOT]:
+            update_srpm_build_state(srpm_build, build_copr, status.srpm)
 
+    errored = []
     current_time = datetime.now(timezone.utc)
     for build in builds:
         elapsed = elapsed_seconds(begin=build.submitted_time, end=current_time)
@@ -321,7 +653,7 @@ def update_copr_builds(
                 f"{elapsed}s, probably an internal error"
                 f"occurred. Not checking it anymore.",
             )
-            build.set_status(BuildStatus.error)
+            errored.append(build)
             continue
         if build.status not in (BuildStatus.pending, BuildStatus.waiting_for_srpm):
             logger.info(
@@ -329,25 +661,19 @@ def update_copr_builds(
                 "things were taken care of already, skipping.",
             )
             continue
-        try:
-            chroot_build = copr_client.build_chroot_proxy.get(build_id, build.target)
-        except copr.v3.CoprNoResultException:
+        if not (chroot_build := status.chroots.get(build.target)):
             logger.info(
                 f"Copr build {build_id} for {build.target} no longer available. "
                 "Setting it to error status and not checking it anymore.",
             )
-            build.set_status(BuildStatus.error)
+            errored.append(build)
             continue
-        try:
-            update_copr_build_state(build, build_copr, chroot_build)
-        except Exception as ex:
-            logger.debug(
-                f"There was an exception when updating the Copr build {build_id} for"
-                f" {build.target}: {ex}",
-            )
-            return False
+        if observed_states.get(build.target) == current_states[build.target]:
+            logger.debug(f"Copr build {build_id} for {build.target} has not changed.")
+            continue
+        update_copr_build_state(build, build_copr, chroot_build)
     # Builds which we ran CoprBuildStartHandler for still need to be monitored.
-    return bool(build_copr.ended_on)
+    return bool(build_copr.ended_on), errored
 
 
 def update_srpm_build_state(
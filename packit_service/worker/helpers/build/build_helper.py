@@ -36,7 +36,7 @@ from packit_service.service.urls import get_srpm_build_info_url
 from packit_service.utils import pr_labels_match_configuration
 from packit_service.worker.helpers.job_helper import BaseJobHelper
 from packit_service.worker.monitoring import Pushgateway
-from packit_service.worker.reporting import BaseCommitStatus, DuplicateCheckMode
+from packit_service.worker.reporting import BaseCommitStatus, DuplicateCheckMode, StatusUpdate
 from packit_service.worker.result import TaskResults
 
 logger = logging.getLogger(__name__)
@@ -761,6 +761,7 @@ class BaseBuildJobHelper(BaseJobHelper):
         links_to_external_services: Optional[dict[str, str]] = None,
         update_feedback_time: Optional[Callable] = None,
     ) -> None:
+        statuses: list[StatusUpdate] = []
         for test_job in self.job_tests_all:
             if (
                 not test_job.skip_build
@@ -772,20 +773,25 @@ class BaseBuildJobHelper(BaseJobHelper):
                     chroot,
                     test_job,
                 )
-                for target in test_targets:
-                    self._report(
-                        description=description,
-                        state=state,
-                        url=url,
-                        check_names=self.get_test_check_cls(
+                statuses.extend(
+                    StatusUpdate(
+                        self.get_test_check_cls(
                             target,
                             self.project_event_identifier_for_status,
                             test_job.identifier,
                         ),
-                        markdown_content=markdown_content,
-                        links_to_external_services=links_to_external_services,
-                        update_feedback_time=update_feedback_time,
+                        state,
+                        description,
+                        url,
                     )
+                    for target in test_targets
+                )
+        self._report_batch(
+            statuses,
+            markdown_content=markdown_content,
+            links_to_external_services=links_to_external_services,
+            update_feedback_time=update_feedback_time,
+        )
 
     def report_status_to_all_for_chroot(
         self,
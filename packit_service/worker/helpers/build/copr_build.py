@@ -26,11 +26,11 @@ from packit.exceptions import (
 from packit.utils.source_script import create_source_script
 
 from packit_service import sentry_integration
-from packit_service.celerizer import celery_app
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
     BASE_RETRY_INTERVAL_IN_MINUTES_FOR_OUTAGES,
     BASE_RETRY_INTERVAL_IN_SECONDS_FOR_INTERNAL_ERRORS,
+    COPR_BUILD_FIRST_CHECK_DELAY,
     COPR_CHROOT_CHANGE_MSG,
     CUSTOM_COPR_PROJECT_NOT_ALLOWED_CONTENT,
     CUSTOM_COPR_PROJECT_NOT_ALLOWED_STATUS,
@@ -834,11 +834,10 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
                     chroot=target.target,
                 )
 
-        # release the hounds!
-        celery_app.send_task(
-            "task.babysit_copr_build",
-            args=(build_id,),
-            countdown=120,  # do the first check in 120s
+        # release the hounds! (the babysit task checks the build when it's due)
+        CoprBuildTargetModel.schedule_status_check(
+            build_id,
+            datetime.utcnow() + COPR_BUILD_FIRST_CHECK_DELAY,
         )
 
     def _visualize_chroots_diff(
@@ -0,0 +1,97 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Building blocks of the disk caches shared by the workers
+(the repository mirrors and the SRPM cache).
+
+* Each entry of a cache has its own lock (`flock`), held while the entry
+  is being created or used.
+* Least recently used entries are removed once the cache takes more
+  than its disk budget, the entries in use are skipped.
+"""
+
+import fcntl
+import logging
+import os
+import shutil
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCacheStatistics:
+    """Usage of a disk cache since the worker start."""
+
+    def __init__(self):
+        # requests served by an existing entry and those for which it was created
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0
+        # total time spent serving the requests
+        self.request_time = 0.0
+
+
+@contextmanager
+def lock(entry: Path, blocking: bool = True) -> Iterator[bool]:
+    """
+    Lock the entry of a cache.
+
+    Args:
+        entry: Path to the entry.
+        blocking: Whether to wait for the lock.
+
+    Returns:
+        Whether the lock was acquired.
+    """
+    with open(entry.with_name(f"{entry.name}.lock"), "w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def get_size(path: Path) -> int:
+    """Size of the file or of all the files in the directory."""
+    if not path.is_dir():
+        return path.stat().st_size
+    return sum(
+        (Path(root) / file).stat().st_size for root, _, files in os.walk(path) for file in files
+    )
+
+
+def evict(
+    paths: Iterable[Path],
+    disk_budget: int,
+    get_entry: Callable[[Path], Path] = lambda path: path,
+) -> None:
+    """
+    Remove the least recently used files (or directories) not to exceed the disk budget.
+
+    Args:
+        paths: Files (or directories) of the cache.
+        disk_budget: Maximum size of the files in bytes.
+        get_entry: Entry the file belongs to, the file is skipped while it's locked.
+    """
+    entries = sorted((path.stat().st_mtime, get_size(path), path) for path in paths)
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total_size <= disk_budget:
+            break
+        with lock(get_entry(path), blocking=False) as locked:
+            # skip the entries being used right now
+            if not locked:
+                continue
+            logger.info(f"Removing {path} ({size} B) from the cache.")
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+            total_size -= size
@@ -18,7 +18,6 @@ from packit.local_project import (
     LocalProject,
     LocalProjectBuilder,
 )
-from packit.utils.repo import RepositoryCache
 
 from packit_service.config import Deployment, ServiceConfig
 from packit_service.events.event_data import EventData
@@ -27,8 +26,9 @@ from packit_service.models import (
     PipelineModel,
     ProjectEventModel,
 )
+from packit_service.worker.helpers.repository_mirrors import get_repository_cache
 from packit_service.worker.monitoring import Pushgateway
-from packit_service.worker.reporting import BaseCommitStatus, StatusReporter
+from packit_service.worker.reporting import BaseCommitStatus, StatusReporter, StatusUpdate
 
 logger = logging.getLogger(__name__)
 
@@ -86,16 +86,7 @@ class BaseJobHelper:
     @property
     def local_project(self) -> LocalProject:
         if self._local_project is None:
-            builder = LocalProjectBuilder(
-                cache=(
-                    RepositoryCache(
-                        cache_path=self.service_config.repository_cache,
-                        add_new=self.service_config.add_repositories_to_repository_cache,
-                    )
-                    if self.service_config.repository_cache
-                    else None
-                ),
-            )
+            builder = LocalProjectBuilder(cache=get_repository_cache(self.service_config))
             self._local_project = builder.build(
                 git_project=self.project,
                 working_dir=self.service_config.command_handler_work_dir,
@@ -229,6 +220,37 @@ class BaseJobHelper:
             update_feedback_time=update_feedback_time,
         )
 
+    def _report_batch(
+        self,
+        statuses: list[StatusUpdate],
+        markdown_content: Optional[str] = None,
+        links_to_external_services: Optional[dict[str, str]] = None,
+        update_feedback_time: Optional[Callable] = None,
+    ) -> None:
+        """
+        Report statuses of multiple checks at once, see `StatusReporter.report_batch`.
+        """
+        if self.is_gitlab_instance and not self.is_reporting_allowed:
+            # the statuses are reported as comments one by one
+            for status in statuses:
+                self._report(
+                    description=status.description,
+                    state=status.state,
+                    url=status.url,
+                    check_names=status.check_name,
+                    markdown_content=markdown_content,
+                    links_to_external_services=links_to_external_services,
+                    update_feedback_time=update_feedback_time,
+                )
+            return
+
+        self.status_reporter.report_batch(
+            statuses,
+            markdown_content=markdown_content,
+            links_to_external_services=links_to_external_services,
+            update_feedback_time=update_feedback_time,
+        )
+
     def report_status_to_configured_job(
         self,
         description: str,
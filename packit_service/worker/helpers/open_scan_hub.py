@@ -5,6 +5,7 @@ import json
 import logging
 import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from os import getenv
 from os.path import basename
 from pathlib import Path
@@ -18,7 +19,9 @@ from packit.config import (
 from packit.exceptions import PackitException
 from sqlalchemy.exc import IntegrityError
 
+from packit_service.config import ServiceConfig
 from packit_service.constants import (
+    OPEN_SCAN_HUB_BASE_BUILD_COMMITS_CHUNK,
     OPEN_SCAN_HUB_FEATURE_DESCRIPTION,
 )
 from packit_service.models import (
@@ -32,6 +35,7 @@ from packit_service.utils import (
     download_file,
 )
 from packit_service.worker.helpers.build import CoprBuildJobHelper
+from packit_service.worker.helpers.srpm_cache import get_srpm_cache
 from packit_service.worker.reporting import BaseCommitStatus
 
 logger = logging.getLogger(__name__)
@@ -72,24 +76,37 @@ class OpenScanHubHelper:
         base_srpm_model: SRPMBuildModel,
         srpm_model: SRPMBuildModel,
     ) -> Optional[tuple[Path, Path]]:
-        def download_srpm(srpm_model: SRPMBuildModel) -> Optional[Path]:
-            if not srpm_model.url:
+        srpm_cache = get_srpm_cache(ServiceConfig.get_service_config())
+
+        for model in (base_srpm_model, srpm_model):
+            if not model.url:
                 logger.info(
-                    f"SRPMBuildModel with copr_build_id={srpm_model.copr_build_id} "
-                    "has status={srpm_model.status} "
+                    f"SRPMBuildModel with copr_build_id={model.copr_build_id} "
+                    "has status={model.status} "
                     "and empty url. Skipping download."
                 )
                 return None
-            srpm_path = Path(directory).joinpath(basename(srpm_model.url))
-            if not download_file(srpm_model.url, srpm_path):
-                logger.info(f"Downloading of SRPM {srpm_model.url} was not successful.")
+
+        def download_srpm(url: str) -> Optional[Path]:
+            srpm_path = Path(directory).joinpath(basename(url))
+            if srpm_cache:
+                downloaded = srpm_cache.fetch(url, srpm_path)
+            else:
+                downloaded = download_file(url, srpm_path)
+            if not downloaded:
+                logger.info(f"Downloading of SRPM {url} was not successful.")
                 return None
             return srpm_path
 
-        if (base_srpm_path := download_srpm(base_srpm_model)) is None:
-            return None
+        # both SRPMs are downloaded at once, the models (and their session)
+        # are used only by this thread
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            base_srpm_path, srpm_path = executor.map(
+                download_srpm,
+                (base_srpm_model.url, srpm_model.url),
+            )
 
-        if (srpm_path := download_srpm(srpm_model)) is None:
+        if base_srpm_path is None or srpm_path is None:
             return None
 
         return base_srpm_path, srpm_path
@@ -242,34 +259,37 @@ class CoprOpenScanHubHelper(OpenScanHubHelper):
             base_build_job,
         )
 
-        def get_srpm_build(commit_sha):
+        def get_srpm_build(commit_shas: list[str]) -> Optional[SRPMBuildModel]:
+            if not commit_shas:
+                return None
             logger.debug(
-                f"Searching for base build for {target_branch_commit} commit "
+                f"Searching for base build for {len(commit_shas)} commit(s) "
+                f"starting with {commit_shas[0]} "
                 f"in {base_build_owner}/{base_build_project_name} Copr project in our DB. ",
             )
-
-            builds = CoprBuildTargetModel.get_all_by(
-                commit_sha=commit_sha,
+            return CoprBuildTargetModel.get_latest_srpm_build_for_commits(
+                commit_shas=commit_shas,
                 project_name=base_build_project_name,
                 owner=base_build_owner,
                 target="fedora-rawhide-x86_64",
                 status=BuildStatus.success,
             )
-            try:
-                return next(iter(builds)).get_srpm_build()
-            except StopIteration:
-                return None
 
         target_branch_commit = self.copr_build_helper.pull_request_object.target_branch_head_commit
 
-        if srpm_build := get_srpm_build(target_branch_commit):
+        # the base build is usually the one for the head of the target branch,
+        # the history of the branch is fetched (and searched in chunks) only if it's not
+        if srpm_build := get_srpm_build([target_branch_commit]):
             return srpm_build
 
-        for target_branch_commit in self.copr_build_helper.project.get_commits(
+        commit_shas = self.copr_build_helper.project.get_commits(
             self.copr_build_helper.pull_request_object.target_branch,
-        )[1:]:
-            if srpm_build := get_srpm_build(target_branch_commit):
+        )[1:]
+        for i in range(0, len(commit_shas), OPEN_SCAN_HUB_BASE_BUILD_COMMITS_CHUNK):
+            if srpm_build := get_srpm_build(
+                commit_shas[i : i + OPEN_SCAN_HUB_BASE_BUILD_COMMITS_CHUNK],
+            ):
                 return srpm_build
-        else:
-            logger.debug("No matching base build found in our DB.")
-            return None
+
+        logger.debug("No matching base build found in our DB.")
+        return None
@@ -0,0 +1,305 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import NamedTuple, Optional
+
+import redis
+from ogr.abstract import GitProject, GitService
+from ogr.services.github import GithubService
+from ogr.services.gitlab import GitlabService
+
+from packit_service.celerizer import get_redis_config
+from packit_service.constants import (
+    RATE_LIMIT_BUDGET_CONSUMPTION_SMOOTHING,
+    RATE_LIMIT_BUDGET_UNKNOWN_RESET,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitSnapshot(NamedTuple):
+    """Rate limit as reported by the headers of the last response from the forge."""
+
+    remaining: int
+    limit: Optional[int]
+    reset: float
+    # time of the response
+    observed: float
+
+
+@dataclass
+class RateLimitBudget:
+    """
+    Rate limit budget of a forge instance (and GitHub App installation)
+    shared by the workers.
+    """
+
+    remaining: int
+    limit: int
+    # time of the reset of the rate limit
+    reset: float
+    # time of the last update of the budget
+    updated: float
+    # remaining requests at the start of the rate limit window
+    window_remaining: int
+    # tasks admitted in the rate limit window
+    admitted: int = 0
+    # smoothed consumption of the budget [requests/s]
+    consumption_rate: float = 0.0
+    # tokens of the bucket pacing the tasks [requests]
+    tokens: float = 0.0
+    tokens_updated: float = 0.0
+
+    @classmethod
+    def from_redis(cls, data: dict[bytes, bytes]) -> "RateLimitBudget":
+        return cls(
+            remaining=int(data[b"remaining"]),
+            limit=int(data[b"limit"]),
+            reset=float(data[b"reset"]),
+            updated=float(data[b"updated"]),
+            window_remaining=int(data[b"window_remaining"]),
+            admitted=int(data[b"admitted"]),
+            consumption_rate=float(data[b"consumption_rate"]),
+            tokens=float(data[b"tokens"]),
+            tokens_updated=float(data[b"tokens_updated"]),
+        )
+
+    def seconds_until_reset(self, now: float) -> float:
+        return max(self.reset - now, 1.0)
+
+    @property
+    def time_to_exhaustion(self) -> float:
+        """Predicted time until the budget is exhausted [s]."""
+        if self.consumption_rate <= 0:
+            return float("inf")
+        return self.remaining / self.consumption_rate
+
+    @property
+    def cost_per_task(self) -> float:
+        """Estimated number of requests made by a task."""
+        return max((self.window_remaining - self.remaining) / max(self.admitted, 1), 1.0)
+
+
+class RateLimitBudgets:
+    """
+    Rate limit budgets of the forges stored in Redis.
+
+    The budgets are fed from the rate limit headers of the responses to the requests
+    made by the tasks (no extra requests are made for that) and read by the handlers
+    before they run.
+
+    When the consumption of a budget predicts its exhaustion before the reset,
+    the tasks are paced by a token bucket refilled at the rate that spreads
+    the rest of the budget over the time remaining until the reset.
+    """
+
+    REDIS_KEY_PREFIX = "rate-limit-budget"
+
+    def __init__(self):
+        self._redis: Optional[redis.Redis] = None
+
+    @property
+    def redis(self) -> redis.Redis:
+        if self._redis is None:
+            redis_config = get_redis_config()
+            self._redis = redis.Redis(
+                host=redis_config["host"],
+                port=int(redis_config["port"]),
+                db=int(redis_config["db"]),
+                password=redis_config["password"],
+            )
+        return self._redis
+
+    @staticmethod
+    def get_key(project: GitProject) -> str:
+        """
+        Get the key of the budget the requests for the project are counted against.
+
+        GitHub App has a rate limit per installation (i.e. per namespace),
+        the other forges per instance (and user of the service).
+        """
+        if isinstance(project.service, GithubService):
+            return f"{project.service.instance_url}:{project.namespace}"
+        return project.service.instance_url
+
+    @staticmethod
+    def observe(service: GitService) -> None:
+        """
+        Start collecting the rate limit headers of the responses from the service.
+
+        GitHub (PyGithub) keeps the rate limit of the last response by itself.
+        """
+        if not isinstance(service, GitlabService):
+            return
+
+        session = service.gitlab_instance.session
+        if getattr(session, "rate_limit_snapshot", False) is not False:
+            return
+        session.rate_limit_snapshot = None
+
+        def store_rate_limit(response, *_, **__):
+            if (remaining := response.headers.get("RateLimit-Remaining")) is None:
+                return
+            limit = response.headers.get("RateLimit-Limit")
+            reset = response.headers.get("RateLimit-Reset")
+            now = time.time()
+            session.rate_limit_snapshot = RateLimitSnapshot(
+                remaining=int(remaining),
+                limit=int(limit) if limit else None,
+                reset=float(reset) if reset else now + RATE_LIMIT_BUDGET_UNKNOWN_RESET,
+                observed=now,
+            )
+
+        session.hooks["response"].append(store_rate_limit)
+
+    @staticmethod
+    def get_snapshot(project: GitProject) -> Optional[RateLimitSnapshot]:
+        """Get the rate limit reported by the last response to the project's requests."""
+        if isinstance(project.service, GithubService):
+            # only if the project has made any requests
+            if not (github_instance := getattr(project, "_github_instance", None)):
+                return None
+            remaining, limit = github_instance.requester.rate_limiting
+            if remaining < 0:
+                return None
+            return RateLimitSnapshot(
+                remaining=remaining,
+                limit=limit,
+                reset=float(github_instance.requester.rate_limiting_resettime),
+                # PyGithub doesn't keep the time of the last response
+                observed=time.time(),
+            )
+        if isinstance(project.service, GitlabService) and project.service._gitlab_instance:
+            return getattr(project.service.gitlab_instance.session, "rate_limit_snapshot", None)
+        return None
+
+    def get(self, project: GitProject) -> Optional[RateLimitBudget]:
+        """Get the budget of the project, `None` if unknown or already reset."""
+        try:
+            data = self.redis.hgetall(f"{self.REDIS_KEY_PREFIX}:{self.get_key(project)}")
+        except redis.RedisError as ex:
+            logger.warning(f"Failed to get the rate limit budget from Redis: {ex}")
+            return None
+        if not data:
+            return None
+        budget = RateLimitBudget.from_redis(data)
+        return budget if budget.reset > time.time() else None
+
+    def update(self, project: GitProject, snapshot: RateLimitSnapshot) -> Optional[RateLimitBudget]:
+        """
+        Update the budget of the project by the rate limit reported by the forge.
+
+        Returns:
+            The updated budget.
+        """
+        key = f"{self.REDIS_KEY_PREFIX}:{self.get_key(project)}"
+
+        def update_budget(pipeline: redis.client.Pipeline) -> RateLimitBudget:
+            now = time.time()
+            data = pipeline.hgetall(key)
+            budget = RateLimitBudget.from_redis(data) if data else None
+            if budget and budget.reset > now and snapshot.observed < budget.updated:
+                # the budget has already been updated by a newer response
+                return budget
+
+            if not budget or budget.reset <= now or snapshot.reset > budget.reset:
+                # a new rate limit window
+                budget = RateLimitBudget(
+                    remaining=snapshot.remaining,
+                    limit=snapshot.limit or snapshot.remaining,
+                    reset=snapshot.reset,
+                    updated=snapshot.observed,
+                    window_remaining=snapshot.remaining,
+                    consumption_rate=budget.consumption_rate if budget else 0.0,
+                    tokens=0.0,
+                    tokens_updated=now,
+                )
+            elif snapshot.observed > budget.updated and snapshot.remaining <= budget.remaining:
+                rate = (budget.remaining - snapshot.remaining) / (
+                    snapshot.observed - budget.updated
+                )
+                budget.consumption_rate += RATE_LIMIT_BUDGET_CONSUMPTION_SMOOTHING * (
+                    rate - budget.consumption_rate
+                )
+                budget.remaining = snapshot.remaining
+                budget.updated = snapshot.observed
+
+            pipeline.multi()
+            pipeline.hset(key, mapping=asdict(budget))
+            pipeline.expireat(key, int(budget.reset) + 1)
+            return budget
+
+        try:
+            return self.redis.transaction(update_budget, key, value_from_callable=True)
+        except redis.RedisError as ex:
+            logger.warning(f"Failed to update the rate limit budget in Redis: {ex}")
+            return None
+
+    def acquire(self, project: GitProject, threshold: int) -> float:
+        """
+        Take the estimated cost of a task from the budget of the project.
+
+        The tasks are paced only if the budget is predicted to be exhausted
+        before it resets, otherwise the bucket is kept full.
+
+        Args:
+            project: Project the task makes the requests for.
+            threshold: Requests to keep in reserve, also the size of the bucket.
+
+        Returns:
+            Time to wait before running the task [s], 0 if it can run now.
+        """
+        key = f"{self.REDIS_KEY_PREFIX}:{self.get_key(project)}"
+
+        def take_tokens(pipeline: redis.client.Pipeline) -> float:
+            now = time.time()
+            if not (data := pipeline.hgetall(key)):
+                return 0.0
+            budget = RateLimitBudget.from_redis(data)
+            seconds_until_reset = budget.seconds_until_reset(now)
+            # the rate spreading the rest of the budget until the reset
+            refill_rate = max(budget.remaining - threshold, 0) / seconds_until_reset
+            capacity = max(threshold, budget.cost_per_task)
+
+            if budget.time_to_exhaustion >= seconds_until_reset:
+                budget.tokens = capacity
+            else:
+                budget.tokens = min(
+                    capacity,
+                    budget.tokens + (now - budget.tokens_updated) * refill_rate,
+                )
+            budget.tokens_updated = now
+
+            delay = 0.0
+            if budget.tokens >= budget.cost_per_task:
+                budget.tokens -= budget.cost_per_task
+                budget.admitted += 1
+            elif refill_rate > 0:
+                delay = min(
+                    (budget.cost_per_task - budget.tokens) / refill_rate, seconds_until_reset
+                )
+            else:
+                delay = seconds_until_reset
+
+            pipeline.multi()
+            pipeline.hset(
+                key,
+                mapping={
+                    "tokens": budget.tokens,
+                    "tokens_updated": budget.tokens_updated,
+                    "admitted": budget.admitted,
+                },
+            )
+            return delay
+
+        try:
+            return self.redis.transaction(take_tokens, key, value_from_callable=True)
+        except redis.RedisError as ex:
+            logger.warning(f"Failed to acquire from the rate limit budget in Redis: {ex}")
+            return 0.0
+
+
+rate_limit_budgets = RateLimitBudgets()
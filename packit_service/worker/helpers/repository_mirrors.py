@@ -0,0 +1,133 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+import git
+from git import GitCommandError
+from ogr.parsing import RepoUrl
+from packit.utils.repo import RepositoryCache, is_git_repo
+
+from packit_service.config import ServiceConfig
+from packit_service.worker.helpers import disk_cache
+
+logger = logging.getLogger(__name__)
+
+repository_mirrors_statistics = disk_cache.DiskCacheStatistics()
+
+
+class RepositoryMirrors(RepositoryCache):
+    """
+    Pool of bare mirrors of the git repositories, one for each project URL.
+
+    * A missing mirror is created by a bare clone, an existing one is updated
+      by an incremental fetch of the branches and tags.
+    * Repositories are cloned from the mirror (locally, hard-linking the objects
+      where possible) and their `origin` remote is then pointed to the project URL.
+    * Each mirror is locked while it's being updated or cloned from, so the pool
+      can be shared by more workers, see `disk_cache`.
+    * Least recently used mirrors are removed once the mirrors take more
+      than the given disk budget.
+    """
+
+    def __init__(self, path: Union[str, Path], disk_budget: int) -> None:
+        super().__init__(cache_path=path, add_new=True)
+        self.disk_budget = disk_budget
+
+    @property
+    def cached_projects(self) -> list[str]:
+        """Mirrors we have in the pool."""
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        return [f.name for f in self.cache_path.glob("*.git")]
+
+    def get_mirror_path(self, url: str) -> Path:
+        # different namespaces and forges can have projects of the same name
+        url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return self.cache_path / f"{RepoUrl.parse(url).repo}-{url_hash}.git"
+
+    def update_mirror(self, url: str, mirror: Path) -> None:
+        """Update the mirror of the repository or create it if there is none yet."""
+        if mirror.is_dir():
+            try:
+                git.Repo(mirror).git.fetch("--prune", "--tags", "origin")
+                repository_mirrors_statistics.hits += 1
+                return
+            except GitCommandError as ex:
+                logger.warning(f"Failed to update the mirror {mirror}, recreating it: {ex}")
+                shutil.rmtree(mirror)
+
+        repository_mirrors_statistics.misses += 1
+        logger.debug(f"Creating mirror of {url} in {mirror}")
+        mirror_repo = self._clone(url=url, to_path=str(mirror), bare=True)
+        # only branches and tags, not e.g. the refs of all the pull requests
+        with mirror_repo.config_writer() as config:
+            config.set_value('remote "origin"', "fetch", "+refs/heads/*:refs/heads/*")
+
+    def get_repo(
+        self,
+        url: str,
+        directory: Union[Path, str, None] = None,
+    ) -> git.Repo:
+        """
+        Clone the repository from its (updated) mirror.
+
+        Args:
+            url: URL of the repository.
+            directory: Target path for cloning the repository.
+
+        Returns:
+            Cloned repository.
+        """
+        directory = str(directory) if directory else tempfile.mkdtemp()
+
+        if is_git_repo(directory=directory):
+            logger.debug(f"Repo already exists in {directory}.")
+            return git.Repo(directory)
+
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        mirror = self.get_mirror_path(url)
+        start = time.monotonic()
+        with disk_cache.lock(mirror):
+            self.update_mirror(url, mirror)
+            # mark the mirror as recently used
+            os.utime(mirror)
+            logger.debug(f"Cloning repo {url} -> {directory} from mirror {mirror}")
+            repo = self._clone(url=str(mirror), to_path=directory, tags=True)
+        repo.remotes.origin.set_url(url)
+
+        repository_mirrors_statistics.requests += 1
+        repository_mirrors_statistics.request_time += time.monotonic() - start
+        self.projects_cloned_using_cache.append(mirror.name)
+
+        try:
+            self.evict()
+        except OSError as ex:
+            # e.g. a mirror removed by another worker in the meantime
+            logger.warning(f"Failed to evict the mirrors: {ex}")
+        return repo
+
+    def evict(self) -> None:
+        """Remove the least recently used mirrors not to exceed the disk budget."""
+        disk_cache.evict(self.cache_path.glob("*.git"), self.disk_budget)
+
+
+def get_repository_cache(service_config: ServiceConfig) -> Optional[RepositoryCache]:
+    """Get the pool of mirrors or the repository cache, if configured."""
+    if service_config.repository_mirrors_path:
+        return RepositoryMirrors(
+            path=service_config.repository_mirrors_path,
+            disk_budget=service_config.repository_mirrors_disk_budget * 1024**3,
+        )
+    if service_config.repository_cache:
+        return RepositoryCache(
+            cache_path=service_config.repository_cache,
+            add_new=service_config.add_repositories_to_repository_cache,
+        )
+    return None
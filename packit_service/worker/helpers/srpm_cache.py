@@ -0,0 +1,194 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import time
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional, Union
+
+import requests
+
+from packit_service.config import ServiceConfig
+from packit_service.constants import SRPM_CACHE_DOWNLOAD_ATTEMPTS
+from packit_service.utils import download_file, get_user_agent
+from packit_service.worker.helpers import disk_cache
+
+logger = logging.getLogger(__name__)
+
+
+class SRPMCacheStatistics(disk_cache.DiskCacheStatistics):
+    """Usage of the SRPM cache since the worker start."""
+
+    def __init__(self):
+        super().__init__()
+        self.downloaded_bytes = 0
+
+
+srpm_cache_statistics = SRPMCacheStatistics()
+
+
+class SRPMCache:
+    """
+    Disk cache of the downloaded SRPMs, shared by the workers.
+
+    * The SRPMs are stored under the hash of their URL and their ETag (or size,
+      if the server doesn't send any), so a changed file is downloaded again.
+    * A cached SRPM is hard-linked to the requested path, the cached files
+      are never modified.
+    * An interrupted download is resumed by a range request.
+    * Each SRPM is locked while it's being downloaded or linked, so the cache
+      can be shared by more workers, see `disk_cache`.
+    * Least recently used SRPMs are removed once the cache takes more
+      than the given disk budget.
+    """
+
+    def __init__(self, path: Union[str, Path], disk_budget: int) -> None:
+        self.path = Path(path)
+        self.disk_budget = disk_budget
+
+    def get_entry_path(self, url: str, etag: Optional[str], size: Optional[str]) -> Path:
+        key = hashlib.sha256(f"{url}\n{etag or size}".encode()).hexdigest()
+        return self.path / f"{key}.src.rpm"
+
+    @staticmethod
+    def get_part_path(entry: Path) -> Path:
+        """Path of the (partially) downloaded SRPM."""
+        return entry.with_name(f"{entry.name}.part")
+
+    def fetch(self, url: str, path: Path) -> bool:
+        """
+        Get the SRPM from the cache or download it to the cache first.
+
+        Args:
+            url: URL of the SRPM.
+            path: Path to link the SRPM to.
+
+        Returns:
+            True if the SRPM is at the path, False otherwise.
+        """
+        try:
+            response = requests.head(
+                url,
+                headers={"User-Agent": get_user_agent()},
+                timeout=(10, 30),
+                allow_redirects=True,
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as ex:
+            logger.debug(f"Failed to get the headers of {url}: {ex!r}")
+            return False
+
+        etag = response.headers.get("ETag")
+        size = response.headers.get("Content-Length")
+        if not (etag or size):
+            logger.debug(f"{url} can't be cached, downloading it directly.")
+            return download_file(url, path)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        entry = self.get_entry_path(url, etag, size)
+        start = time.monotonic()
+        with disk_cache.lock(entry):
+            if entry.is_file():
+                srpm_cache_statistics.hits += 1
+                logger.debug(f"SRPM {url} found in the cache.")
+            else:
+                srpm_cache_statistics.misses += 1
+                if not self.download(url, entry, etag=etag, size=int(size) if size else None):
+                    return False
+            # mark the SRPM as recently used
+            os.utime(entry)
+            self.link(entry, path)
+
+        srpm_cache_statistics.requests += 1
+        srpm_cache_statistics.request_time += time.monotonic() - start
+
+        try:
+            self.evict()
+        except OSError as ex:
+            # e.g. an SRPM removed by another worker in the meantime
+            logger.warning(f"Failed to evict the SRPMs: {ex}")
+        return True
+
+    def download(self, url: str, entry: Path, etag: Optional[str], size: Optional[int]) -> bool:
+        """
+        Download the SRPM to the cache, resuming the previous download if there is any.
+
+        Returns:
+            True if the download was successful, False otherwise.
+        """
+        part = self.get_part_path(entry)
+        for attempt in range(1, SRPM_CACHE_DOWNLOAD_ATTEMPTS + 1):
+            offset = part.stat().st_size if part.exists() else 0
+            if size is None or offset < size:
+                headers = {"User-Agent": get_user_agent()}
+                if offset:
+                    headers["Range"] = f"bytes={offset}-"
+                    if etag:
+                        # the whole file is sent if it has changed
+                        headers["If-Range"] = etag
+                try:
+                    with requests.get(
+                        url,
+                        headers=headers,
+                        timeout=(10, 30),
+                        stream=True,
+                    ) as response:
+                        response.raise_for_status()
+                        resumed = response.status_code == HTTPStatus.PARTIAL_CONTENT
+                        with open(part, "ab" if resumed else "wb") as f:
+                            for chunk in response.iter_content(chunk_size=65536):
+                                f.write(chunk)
+                                srpm_cache_statistics.downloaded_bytes += len(chunk)
+                except requests.exceptions.RequestException as ex:
+                    logger.debug(f"Download of {url} interrupted (attempt {attempt}): {ex!r}")
+                    continue
+
+            if size is not None and part.stat().st_size != size:
+                logger.debug(f"Downloaded {url} doesn't have the expected size, discarding it.")
+                part.unlink()
+                continue
+
+            part.rename(entry)
+            return True
+
+        logger.info(f"Downloading of SRPM {url} was not successful.")
+        return False
+
+    @staticmethod
+    def link(entry: Path, path: Path) -> None:
+        path.unlink(missing_ok=True)
+        try:
+            os.link(entry, path)
+        except OSError as ex:
+            if ex.errno != errno.EXDEV:
+                raise
+            # the cache is on a different filesystem
+            shutil.copyfile(entry, path)
+
+    def evict(self) -> None:
+        """Remove the least recently used SRPMs not to exceed the disk budget."""
+        disk_cache.evict(
+            (
+                file
+                for file in self.path.iterdir()
+                if file.name.endswith((".src.rpm", ".src.rpm.part"))
+            ),
+            self.disk_budget,
+            # a partially downloaded SRPM is locked together with the SRPM
+            get_entry=lambda file: file.with_name(file.name.removesuffix(".part")),
+        )
+
+
+def get_srpm_cache(service_config: ServiceConfig) -> Optional[SRPMCache]:
+    """Get the SRPM cache, if configured."""
+    if not service_config.srpm_cache_path:
+        return None
+    return SRPMCache(
+        path=service_config.srpm_cache_path,
+        disk_budget=service_config.srpm_cache_disk_budget * 1024**3,
+    )
@@ -1,26 +1,224 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+import json
 import logging
 import re
+import threading
+import time
+from collections.abc import Iterable
 from http import HTTPStatus
 from re import Pattern
 from typing import Any, Callable, Optional
 
+import redis
 import requests
 from ogr.utils import RequestResponse
 from packit.constants import HTTP_REQUEST_TIMEOUT
 from packit.exceptions import PackitException
 
+from packit_service.celerizer import get_redis_config
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
     CONTACTS_URL,
+    TESTING_FARM_COMPOSES_CACHE_STALE_TTL,
+    TESTING_FARM_COMPOSES_CACHE_TTL,
+    TESTING_FARM_COMPOSES_REFRESH_TIMEOUT,
     TESTING_FARM_SUPPORTED_ARCHS,
 )
 
 logger = logging.getLogger(__name__)
 
 
+class ComposeCatalog:
+    """
+    Composes available in a Testing Farm ranch, with their patterns compiled
+    and the composes the distros map to memoized.
+    """
+
+    def __init__(self, composes: Iterable[str], fetched: float) -> None:
+        self.composes = frozenset(composes)
+        # time the composes were fetched from Testing Farm
+        self.fetched = fetched
+        self.matchers = tuple(re.compile(compose) for compose in sorted(self.composes))
+        # distro → (compose, whether it's available)
+        self.distro_composes: dict[str, tuple[str, bool]] = {}
+        self._matches: dict[str, bool] = {}
+
+    def matches(self, compose: str) -> bool:
+        """Check whether the compose matches any of the available composes."""
+        if (matches := self._matches.get(compose)) is None:
+            matches = self._matches[compose] = TestingFarmClient.is_compose_matching(
+                compose,
+                self.matchers,
+            )
+        return matches
+
+
+class ComposeCatalogCache:
+    """
+    Catalogs of the Testing Farm composes by the ranches.
+
+    The catalogs are kept in the worker and shared by the workers via Redis.
+    A catalog older than the TTL is still used for `stale_ttl` while it's
+    being refreshed in the background (by one of the workers), only
+    a catalog older than that (or a missing one) is fetched by the caller.
+    """
+
+    REDIS_KEY_PREFIX = "testing-farm-composes"
+
+    def __init__(
+        self,
+        ttl: int = TESTING_FARM_COMPOSES_CACHE_TTL,
+        stale_ttl: int = TESTING_FARM_COMPOSES_CACHE_STALE_TTL,
+        use_redis: bool = True,
+    ) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.use_redis = use_redis
+        self._catalogs: dict[str, ComposeCatalog] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._redis: Optional[redis.Redis] = None
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    @property
+    def redis(self) -> redis.Redis:
+        if self._redis is None:
+            redis_config = get_redis_config()
+            self._redis = redis.Redis(
+                host=redis_config["host"],
+                port=int(redis_config["port"]),
+                db=int(redis_config["db"]),
+                password=redis_config["password"],
+            )
+        return self._redis
+
+    def get(
+        self,
+        ranch: str,
+        fetch: Callable[[], Optional[set[str]]],
+    ) -> Optional[ComposeCatalog]:
+        """
+        Get the catalog of the composes of the ranch.
+
+        Args:
+            ranch: Testing Farm ranch, `public` or `redhat`.
+            fetch: Fetches the composes from Testing Farm, `None` if it fails.
+
+        Returns:
+            The catalog or `None` if it's not cached and can't be fetched.
+        """
+        now = time.time()
+        catalog = self._catalogs.get(ranch)
+        if not catalog or now - catalog.fetched >= self.ttl:
+            # possibly refreshed by another worker
+            catalog = self._load(ranch, catalog)
+
+        if catalog and now - catalog.fetched < self.ttl + self.stale_ttl:
+            self.hits += 1
+            if now - catalog.fetched >= self.ttl:
+                self._refresh_in_background(ranch, fetch)
+            return catalog
+
+        self.misses += 1
+        return self.refresh(ranch, fetch)
+
+    def refresh(
+        self,
+        ranch: str,
+        fetch: Callable[[], Optional[set[str]]],
+    ) -> Optional[ComposeCatalog]:
+        """Fetch the composes of the ranch and store them in the cache."""
+        if (composes := fetch()) is None:
+            return None
+
+        self.refreshes += 1
+        catalog = ComposeCatalog(composes, fetched=time.time())
+        with self._lock:
+            self._catalogs[ranch] = catalog
+        if self.use_redis:
+            try:
+                self.redis.set(
+                    f"{self.REDIS_KEY_PREFIX}:{ranch}",
+                    json.dumps({"composes": sorted(composes), "fetched": catalog.fetched}),
+                    ex=self.ttl + self.stale_ttl,
+                )
+            except redis.RedisError as ex:
+                logger.warning(f"Failed to store the Testing Farm composes in Redis: {ex}")
+        return catalog
+
+    def _load(self, ranch: str, catalog: Optional[ComposeCatalog]) -> Optional[ComposeCatalog]:
+        """Load the catalog of the ranch from Redis if it's newer than the given one."""
+        if not self.use_redis:
+            return catalog
+        try:
+            raw_catalog = self.redis.get(f"{self.REDIS_KEY_PREFIX}:{ranch}")
+        except redis.RedisError as ex:
+            logger.warning(f"Failed to get the Testing Farm composes from Redis: {ex}")
+            return catalog
+        if not raw_catalog:
+            return catalog
+
+        data = json.loads(raw_catalog)
+        if catalog and catalog.fetched >= data["fetched"]:
+            return catalog
+        catalog = ComposeCatalog(data["composes"], fetched=data["fetched"])
+        with self._lock:
+            self._catalogs[ranch] = catalog
+        return catalog
+
+    def _refresh_in_background(
+        self,
+        ranch: str,
+        fetch: Callable[[], Optional[set[str]]],
+    ) -> None:
+        with self._lock:
+            if ranch in self._refreshing:
+                return
+            self._refreshing.add(ranch)
+
+        if self.use_redis:
+            try:
+                # only one of the workers refreshes the catalog
+                if not self.redis.set(
+                    f"{self.REDIS_KEY_PREFIX}-refresh:{ranch}",
+                    1,
+                    nx=True,
+                    ex=TESTING_FARM_COMPOSES_REFRESH_TIMEOUT,
+                ):
+                    with self._lock:
+                        self._refreshing.discard(ranch)
+                    return
+            except redis.RedisError as ex:
+                logger.warning(f"Failed to lock the refresh of the Testing Farm composes: {ex}")
+
+        def refresh():
+            try:
+                self.refresh(ranch, fetch)
+            except Exception as ex:
+                logger.warning(f"Failed to refresh the Testing Farm composes of {ranch}: {ex}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(ranch)
+
+        threading.Thread(
+            target=refresh,
+            name=f"testing-farm-composes-{ranch}",
+            daemon=True,
+        ).start()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._catalogs.clear()
+        self.hits = self.misses = self.refreshes = 0
+
+
+compose_catalog_cache = ComposeCatalogCache()
+
+
 class TestingFarmClient:
     __test__ = False
 
@@ -156,35 +354,43 @@ class TestingFarmClient:
         payload_["notification"]["webhook"].pop("token")
         return payload_
 
-    @property
-    def available_composes(self, ranch: Optional[str] = None) -> Optional[set[str]]:
+    def fetch_composes(self, ranch: str) -> Optional[set[str]]:
         """
         Fetches available composes from the Testing Farm endpoint.
 
         Args:
-            ranch: Optional parameter that can specify ranch to fetch composes
-                of. Available options as of now are: `redhat`, or `public`.
-
-                Defaults to `None` which means that the ranch is deduced from
-                the job config.
+            ranch: Ranch to fetch composes of. Available options as of now are:
+                `redhat`, or `public`.
 
         Returns:
             Set of all available composes or `None` if error occurs.
         """
-        if ranch is None:
-            ranch = self.default_ranch
-
-        endpoint = f"composes/{ranch}"
-
-        response = self.send_testing_farm_request(endpoint=endpoint)
+        response = self.send_testing_farm_request(endpoint=f"composes/{ranch}")
         if response.status_code != 200:
             return None
 
         # {'composes': [{'name': 'CentOS-Stream-8'}, {'name': 'Fedora-Rawhide'}]}
         return {c["name"] for c in response.json()["composes"]}
 
+    @property
+    def compose_catalog(self) -> Optional[ComposeCatalog]:
+        """Catalog of the composes of the default ranch, `None` if it can't be fetched."""
+        ranch = self.default_ranch
+        return compose_catalog_cache.get(ranch, fetch=lambda: self.fetch_composes(ranch))
+
+    @property
+    def available_composes(self) -> Optional[set[str]]:
+        """
+        Composes available in the default ranch (deduced from the job config).
+
+        Returns:
+            Set of all available composes or `None` if error occurs.
+        """
+        catalog = self.compose_catalog
+        return set(catalog.composes) if catalog else None
+
     @staticmethod
-    def is_compose_matching(compose_to_check: str, composes: set[Pattern]) -> bool:
+    def is_compose_matching(compose_to_check: str, composes: Iterable[Pattern]) -> bool:
         """
         Check whether the compose matches any compose in the list of re-compiled
         composes.
@@ -206,24 +412,57 @@ class TestingFarmClient:
             compose if we were able to map the distro to compose present
             in the list of available composes, otherwise None
         """
-        composes = self.available_composes
-        if composes is None:
+        catalog = self.compose_catalog
+        if catalog is None:
             msg = "We were not able to get the available TF composes."
             logger.error(msg)
             if error_callback:
                 error_callback(msg, None)
             return None
 
-        compiled_composes = {re.compile(compose) for compose in composes}
+        if (distro_compose := catalog.distro_composes.get(distro)) is None:
+            distro_compose = catalog.distro_composes[distro] = self._map_distro_to_compose(
+                distro,
+                catalog,
+            )
+        compose, available = distro_compose
+
+        if not available:
+            msg = (
+                f"The compose {compose} (from target {distro}) does not match any compose"
+                f" in the list of available composes:\n{set(catalog.composes)}. "
+            )
+            logger.debug(msg)
+            msg += (
+                "Please, check the targets defined in your test job configuration. If you think"
+                f" your configuration is correct, get in touch with [us]({CONTACTS_URL})."
+            )
+            description = (
+                f"The compose {compose} is not available in the "
+                f"{self.default_ranch} "
+                f"Testing Farm infrastructure."
+            )
+            if error_callback:
+                error_callback(description, msg)
+            return None
+
+        return compose
+
+    def _map_distro_to_compose(self, distro: str, catalog: ComposeCatalog) -> tuple[str, bool]:
+        """
+        Map the distro to a compose.
 
+        Returns:
+            The compose and whether it's available in the catalog.
+        """
         # if the user precisely specified the compose via target
         # we should just use it instead of continuing below with our logic
         # some of those changes can change the target and result in a failure
-        if self.is_compose_matching(distro, compiled_composes):
+        if catalog.matches(distro):
             logger.debug(
                 f"Distro {distro} directly matches a compose in the compose list.",
             )
-            return distro
+            return distro, True
 
         compose = (
             distro.title()
@@ -237,8 +476,8 @@ class TestingFarmClient:
             compose = "CentOS-Stream-8"
 
         if self._use_internal_ranch:
-            if self.is_compose_matching(compose, compiled_composes):
-                return compose
+            if catalog.matches(compose):
+                return compose, True
 
             if compose == "Fedora-Rawhide":
                 compose = "Fedora-Rawhide-Nightly"
@@ -263,26 +502,7 @@ class TestingFarmClient:
             elif compose == "Oracle-Linux-8":
                 compose = "Oracle-Linux-8.6"
 
-        if not self.is_compose_matching(compose, compiled_composes):
-            msg = (
-                f"The compose {compose} (from target {distro}) does not match any compose"
-                f" in the list of available composes:\n{composes}. "
-            )
-            logger.debug(msg)
-            msg += (
-                "Please, check the targets defined in your test job configuration. If you think"
-                f" your configuration is correct, get in touch with [us]({CONTACTS_URL})."
-            )
-            description = (
-                f"The compose {compose} is not available in the "
-                f"{self.default_ranch} "
-                f"Testing Farm infrastructure."
-            )
-            if error_callback:
-                error_callback(description, msg)
-            return None
-
-        return compose
+        return compose, catalog.matches(compose)
 
     def is_supported_architecture(
         self, arch: str, error_callback: Optional[Callable[[str, Optional[str]], None]] = None
@@ -5,16 +5,21 @@
 We love you, Steve Jobs.
 """
 
+import json
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
-from functools import cached_property
+from enum import Enum
+from functools import cache, cached_property
 from re import match
+from types import MappingProxyType
 from typing import Callable, Optional, Union
 
 import celery
 from ogr.exceptions import GithubAppNotInstalledError
 from packit.config import JobConfig, JobConfigTriggerType, JobConfigView, JobType, PackageConfig
+from packit.schema import JobConfigSchema
 from packit.utils import nested_get
 
 from packit_service.config import ServiceConfig
@@ -45,7 +50,7 @@ from packit_service.utils import (
     get_comment_parser,
     get_comment_parser_fedora_ci,
     get_packit_commands_from_comment,
-    pr_labels_match_configuration,
+    labels_match_configuration,
 )
 from packit_service.worker.allowlist import Allowlist
 from packit_service.worker.handlers import (
@@ -103,6 +108,43 @@ logger = logging.getLogger(__name__)
 MANUAL_OR_RESULT_EVENTS = [abstract.comment.CommentEvent, abstract.base.Result, github.check.Rerun]
 
 
+class HandlerRole(Enum):
+    """How a handler relates to a job type."""
+
+    # the handler runs the jobs of the type
+    configured = "configured"
+    # the handler runs a job required by the jobs of the type (e.g. build for tests)
+    required = "required"
+
+
+# Handlers of the job types and their roles, built once all the handlers are registered
+# (by importing `packit_service.worker.handlers` above).
+HANDLERS_FOR_JOB_TYPE: Mapping[JobType, Mapping[type[JobHandler], HandlerRole]] = MappingProxyType(
+    {
+        job_type: MappingProxyType(
+            {
+                **dict.fromkeys(MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job_type], HandlerRole.required),
+                **dict.fromkeys(MAP_JOB_TYPE_TO_HANDLER[job_type], HandlerRole.configured),
+            },
+        )
+        for job_type in JobType
+    },
+)
+
+
+@cache
+def get_handlers_for_event_class(event_cls: type[Event]) -> frozenset[type[JobHandler]]:
+    """
+    Get the handlers reacting to the events of the given class
+    (computed once per event class).
+    """
+    return frozenset(
+        handler
+        for handler, supported_events in SUPPORTED_EVENTS_FOR_HANDLER.items()
+        if issubclass(event_cls, tuple(supported_events))
+    )
+
+
 @dataclass
 class ParsedComment:
     command: Optional[str] = None
@@ -1007,17 +1049,40 @@ class SteveJobs:
 
         return matching_jobs
 
-    def get_jobs_matching_event(
-        self,
-        monorepo_package: Optional[str] = None,
-    ) -> list[JobConfig]:
-        """
-        Get list of non-duplicated all jobs that matches with event's trigger.
+    @cached_property
+    def pr_labels(self) -> Optional[list[str]]:
+        """Labels of the PR of the event, fetched once, `None` if there is no PR."""
+        if not isinstance(self.event, abstract.base.ForgeIndependent) or not (
+            pull_request := self.event.pull_request_object
+        ):
+            logger.debug("No PR to check the labels on.")
+            return None
+        pr_labels = [label.name for label in pull_request.labels]
+        logger.info(f"Labels on PR {pull_request.id}: {pr_labels}")
+        return pr_labels
+
+    def pr_labels_match_configuration(self, job: JobConfig) -> bool:
+        """Do the labels of the PR of the event match the labels configuration of the job?"""
+        if not (job.require.label.present or job.require.label.absent):
+            return True
+        if self.pr_labels is None:
+            return True
+        return labels_match_configuration(
+            self.pr_labels,
+            configured_labels_present=job.require.label.present,
+            configured_labels_absent=job.require.label.absent,
+        )
+
+    @cached_property
+    def jobs_matching_trigger(self) -> list[JobConfig]:
+        """Jobs matching the event's trigger, computed once per event."""
+        is_manual_or_result = isinstance(self.event, tuple(MANUAL_OR_RESULT_EVENTS))
 
-        Returns:
-            List of all jobs that match the event's trigger.
-        """
         jobs_matching_trigger = []
+        # job configs are equal if their serialized forms are, keep those
+        # of the matching jobs instead of comparing every pair of jobs
+        matching_job_dumps = set()
+        schema = JobConfigSchema()
         for job in self.event.packages_config.get_job_views():
             if (
                 job.trigger == self.event.job_config_trigger_type
@@ -1025,37 +1090,39 @@ class SteveJobs:
                     not isinstance(self.event, github.check.Rerun)
                     or self.event.job_identifier == job.identifier
                 )
-                and job not in jobs_matching_trigger
+                and (job_dump := json.dumps(schema.dump(job), sort_keys=True))
+                not in matching_job_dumps
                 # Manual trigger condition
-                and (
-                    not job.manual_trigger
-                    or any(
-                        isinstance(self.event, event_type) for event_type in MANUAL_OR_RESULT_EVENTS
-                    )
-                )
+                and (not job.manual_trigger or is_manual_or_result)
                 and (
                     job.trigger != JobConfigTriggerType.pull_request
-                    or not (job.require.label.present or job.require.label.absent)
-                    or not isinstance(self.event, abstract.base.ForgeIndependent)
-                    or pr_labels_match_configuration(
-                        pull_request=self.event.pull_request_object,
-                        configured_labels_absent=job.require.label.absent,
-                        configured_labels_present=job.require.label.present,
-                    )
+                    or self.pr_labels_match_configuration(job)
                 )
             ):
+                matching_job_dumps.add(job_dump)
                 jobs_matching_trigger.append(job)
 
         jobs_matching_trigger.extend(self.check_explicit_matching())
+        return jobs_matching_trigger
 
+    def get_jobs_matching_event(
+        self,
+        monorepo_package: Optional[str] = None,
+    ) -> list[JobConfig]:
+        """
+        Get list of non-duplicated all jobs that matches with event's trigger.
+
+        Returns:
+            List of all jobs that match the event's trigger.
+        """
         if monorepo_package:
-            jobs_matching_trigger = [
+            return [
                 job
-                for job in jobs_matching_trigger
+                for job in self.jobs_matching_trigger
                 if isinstance(job, JobConfigView) and job.package == monorepo_package
             ]
 
-        return jobs_matching_trigger
+        return list(self.jobs_matching_trigger)
 
     def get_handlers_for_comment_and_rerun_event(self) -> set[type[JobHandler]]:
         """
@@ -1115,11 +1182,9 @@ class SteveJobs:
         handlers_triggered_by_job = self.get_handlers_for_comment_and_rerun_event()
 
         matching_handlers: set[type[JobHandler]] = set()
-        for job in jobs_matching_trigger:
-            for handler in (
-                MAP_JOB_TYPE_TO_HANDLER[job.type] | MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job.type]
-            ):
-                if self.is_handler_matching_the_event(
+        for job_type in {job.type for job in jobs_matching_trigger}:
+            for handler in HANDLERS_FOR_JOB_TYPE[job_type]:
+                if handler not in matching_handlers and self.is_handler_matching_the_event(
                     handler=handler,
                     allowed_handlers=handlers_triggered_by_job,
                 ):
@@ -1156,7 +1221,7 @@ class SteveJobs:
         )
 
         return (
-            isinstance(self.event, tuple(SUPPORTED_EVENTS_FOR_HANDLER[handler]))
+            handler in get_handlers_for_event_class(type(self.event))
             and handler_matches_to_comment_or_check_rerun_job
         )
 
@@ -1188,7 +1253,9 @@ class SteveJobs:
         jobs_matching_trigger: list[JobConfig] = self.get_jobs_matching_event(monorepo_package)
 
         matching_jobs: list[JobConfig] = [
-            job for job in jobs_matching_trigger if handler_kls in MAP_JOB_TYPE_TO_HANDLER[job.type]
+            job
+            for job in jobs_matching_trigger
+            if HANDLERS_FOR_JOB_TYPE[job.type].get(handler_kls) == HandlerRole.configured
         ]
 
         if not matching_jobs:
@@ -1198,7 +1265,7 @@ class SteveJobs:
             matching_jobs = [
                 job
                 for job in jobs_matching_trigger
-                if handler_kls in MAP_REQUIRED_JOB_TYPE_TO_HANDLER[job.type]
+                if HANDLERS_FOR_JOB_TYPE[job.type].get(handler_kls) == HandlerRole.required
             ]
 
         if not matching_jobs:
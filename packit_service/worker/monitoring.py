@@ -3,9 +3,17 @@
 
 import logging
 import os
+from functools import partial
 
 from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, push_to_gateway
 
+from packit_service.models import get_engine
+from packit_service.package_config_getter import package_config_cache
+from packit_service.worker.helpers.disk_cache import DiskCacheStatistics
+from packit_service.worker.helpers.repository_mirrors import repository_mirrors_statistics
+from packit_service.worker.helpers.srpm_cache import srpm_cache_statistics
+from packit_service.worker.helpers.testing_farm_client import compose_catalog_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -141,6 +149,27 @@ class Pushgateway:
             ),
         )
 
+        self.testing_farm_runs_check_time = Histogram(
+            "testing_farm_runs_check_time",
+            "Time it takes to check the states of all pending Testing Farm runs",
+            registry=self.registry,
+            buckets=(10, 30, 60, 120, 300, 600, float("inf")),
+        )
+
+        self.copr_builds_check_time = Histogram(
+            "copr_builds_check_time",
+            "Time it takes to check the states of the due pending Copr builds",
+            registry=self.registry,
+            buckets=(1, 5, 10, 30, 60, 120, 300, float("inf")),
+        )
+
+        self.testing_farm_request_time = Histogram(
+            "testing_farm_request_time",
+            "Time it takes to get the details of a Testing Farm request",
+            registry=self.registry,
+            buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, float("inf")),
+        )
+
         self.events_processed = Counter(
             "events_processed",
             "The number of events processed from the Celery queue",
@@ -191,6 +220,13 @@ class Pushgateway:
             registry=self.registry,
         )
 
+        self.rate_limit_time_to_exhaustion = Gauge(
+            "rate_limit_time_to_exhaustion",
+            "Predicted time until the rate limit budget is exhausted [s]",
+            ["budget"],
+            registry=self.registry,
+        )
+
         # Fedora CI metrics
         self.fedora_ci_koji_builds_queued = Counter(
             "fedora_ci_koji_builds_queued",
@@ -225,6 +261,13 @@ class Pushgateway:
             ),
         )
 
+        self.downstream_koji_build_submission_time = Histogram(
+            "downstream_koji_build_submission_time",
+            "Time it takes to submit a downstream Koji build for a dist-git branch",
+            registry=self.registry,
+            buckets=(1, 2.5, 5, 10, 30, 60, 120, 300, float("inf")),
+        )
+
         self.fedora_ci_test_runs_queued = Counter(
             "fedora_ci_test_runs_queued",
             "Number of Fedora CI test runs queued",
@@ -273,6 +316,118 @@ class Pushgateway:
             registry=self.registry,
         )
 
+        # the cache lives as long as the worker, hence the totals since the worker start
+        self.package_config_cache_hits = Gauge(
+            "package_config_cache_hits",
+            "Number of package configs served from the cache since the worker start",
+            registry=self.registry,
+        )
+        self.package_config_cache_hits.set_function(lambda: package_config_cache.hits)
+
+        self.package_config_cache_misses = Gauge(
+            "package_config_cache_misses",
+            "Number of package configs (for a commit) not found in the cache "
+            "since the worker start",
+            registry=self.registry,
+        )
+        self.package_config_cache_misses.set_function(lambda: package_config_cache.misses)
+
+        # repositories cloned from the pool of mirrors by the worker
+        self.add_disk_cache_gauges(
+            "repository_mirrors",
+            repository_mirrors_statistics,
+            entries="repositories",
+        )
+
+        # SRPMs downloaded for the OpenScanHub scans
+        self.add_disk_cache_gauges("srpm_cache", srpm_cache_statistics, entries="SRPMs")
+        self.srpm_cache_downloaded_bytes = Gauge(
+            "srpm_cache_downloaded_bytes",
+            "Number of bytes of the SRPMs downloaded to the cache since the worker start",
+            registry=self.registry,
+        )
+        self.srpm_cache_downloaded_bytes.set_function(
+            lambda: srpm_cache_statistics.downloaded_bytes,
+        )
+
+        # catalogs of the Testing Farm composes
+        self.testing_farm_composes_cache_hits = Gauge(
+            "testing_farm_composes_cache_hits",
+            "Number of Testing Farm compose catalogs served from the cache since the worker start",
+            registry=self.registry,
+        )
+        self.testing_farm_composes_cache_hits.set_function(lambda: compose_catalog_cache.hits)
+
+        self.testing_farm_composes_cache_misses = Gauge(
+            "testing_farm_composes_cache_misses",
+            "Number of Testing Farm compose catalogs missing in the cache (or expired) "
+            "since the worker start",
+            registry=self.registry,
+        )
+        self.testing_farm_composes_cache_misses.set_function(lambda: compose_catalog_cache.misses)
+
+        self.testing_farm_composes_cache_refreshes = Gauge(
+            "testing_farm_composes_cache_refreshes",
+            "Number of Testing Farm compose catalogs fetched by the worker since its start",
+            registry=self.registry,
+        )
+        self.testing_farm_composes_cache_refreshes.set_function(
+            lambda: compose_catalog_cache.refreshes,
+        )
+
+        # connection pool of the database engine of the worker
+        self.db_pool_connections_in_use = Gauge(
+            "db_pool_connections_in_use",
+            "Number of database connections currently checked out from the pool",
+            registry=self.registry,
+        )
+        self.db_pool_connections_in_use.set_function(lambda: get_engine().pool.checkedout())
+
+        self.db_pool_checkouts = Gauge(
+            "db_pool_checkouts",
+            "Number of database connection checkouts since the worker start",
+            registry=self.registry,
+        )
+        self.db_pool_checkouts.set_function(lambda: get_engine().pool.checkouts)
+
+        self.db_pool_checkout_wait_time = Gauge(
+            "db_pool_checkout_wait_time",
+            "Total time (in seconds) spent waiting for a database connection "
+            "since the worker start",
+            registry=self.registry,
+        )
+        self.db_pool_checkout_wait_time.set_function(lambda: get_engine().pool.checkout_wait_time)
+
+        self.db_pool_max_checkout_wait_time = Gauge(
+            "db_pool_max_checkout_wait_time",
+            "Longest time (in seconds) spent waiting for a database connection "
+            "since the worker start",
+            registry=self.registry,
+        )
+        self.db_pool_max_checkout_wait_time.set_function(
+            lambda: get_engine().pool.max_checkout_wait_time,
+        )
+
+    def add_disk_cache_gauges(
+        self,
+        name: str,
+        statistics: DiskCacheStatistics,
+        entries: str,
+    ) -> None:
+        """Add the gauges of the usage of a disk cache, see `disk_cache`."""
+        for metric, description in (
+            ("hits", f"Number of {entries} served by an existing cache entry"),
+            ("misses", f"Number of {entries} for which a new cache entry was created"),
+            ("requests", f"Number of {entries} requested from the cache"),
+            ("request_time", f"Total time (in seconds) spent getting {entries} from the cache"),
+        ):
+            gauge = Gauge(
+                f"{name}_{metric}",
+                f"{description} since the worker start",
+                registry=self.registry,
+            )
+            gauge.set_function(partial(getattr, statistics, metric))
+
     def push(self):
         if not (self.pushgateway_address and self.worker_name):
             logger.debug("Pushgateway address or worker name not defined.")
@@ -104,6 +104,82 @@ class Parser:
     we need to have method inside the `Parser` class to create objects defined in `event.py`.
     """
 
+    # Fedmsg topic fragments mapped to the parsers able to process them.
+    # The first fragment contained in the topic wins.
+    _TOPIC_TO_PARSERS: ClassVar[tuple[tuple[str, tuple[str, ...]], ...]] = (
+        (".pagure.git.receive", ("parse_pagure_push_event",)),
+        (".pagure.pull-request.flag.", ("parse_pagure_pr_flag_event",)),
+        (".pagure.pull-request.comment.", ("parse_pagure_pull_request_comment_event",)),
+        (".pagure.pull-request.", ("parse_pagure_pull_request_event",)),
+        (".copr.build.", ("parse_copr_event",)),
+        (".buildsys.task.state.change", ("parse_koji_task_event",)),
+        (".buildsys.build.state.change", ("parse_koji_build_event",)),
+        (".buildsys.tag", ("parse_koji_build_tag_event",)),
+        ("hotness.update.bug.file", ("parse_new_hotness_update_event",)),
+        ("anitya.project.version.update.v2", ("parse_anitya_version_update_event",)),
+        ("openscanhub.task.finished", ("parse_openscanhub_task_finished_event",)),
+        ("openscanhub.task.started", ("parse_openscanhub_task_started_event",)),
+        ("logdetective.analysis", ("parse_logdetective_analysis_event",)),
+    )
+
+    # GitLab webhooks carry their type in the `object_kind` key.
+    _GITLAB_OBJECT_KIND_TO_PARSERS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "merge_request": ("parse_mr_event",),
+        "note": (
+            "parse_merge_request_comment_event",
+            "parse_gitlab_issue_comment_event",
+            "parse_gitlab_commit_comment_event",
+        ),
+        "push": ("parse_gitlab_push_event",),
+        "tag_push": ("parse_gitlab_tag_push_event",),
+        "pipeline": ("parse_pipeline_event",),
+        "release": ("parse_gitlab_release_event",),
+    }
+
+    # GitHub webhooks don't carry their type in the payload (only in the header),
+    # so we pick the parsers by the top-level keys that are present.
+    _GITHUB_KEY_TO_PARSERS: ClassVar[tuple[tuple[str, tuple[str, ...]], ...]] = (
+        ("pull_request", ("parse_pr_event",)),
+        (
+            "issue",
+            ("parse_pull_request_comment_event", "parse_issue_comment_event"),
+        ),
+        ("release", ("parse_release_event",)),
+        ("pusher", ("parse_github_push_event",)),
+        ("check_run", ("parse_check_rerun_event",)),
+        ("installation", ("parse_installation_event",)),
+        ("comment", ("parse_commit_comment_event",)),
+    )
+
+    @staticmethod
+    def get_parsers_for_event(event: dict) -> list[Callable[[dict], Any]]:
+        """
+        Classify the event by its source and discriminating keys and return
+        only the parsers that can process it (in the order they should be tried).
+
+        :param event: JSON from GitHub/GitLab/Testing Farm or a squashed fedmsg
+        :return: list of parsers (static methods of `Parser`)
+        """
+        if topic := event.get("topic"):
+            names = next(
+                (names for fragment, names in Parser._TOPIC_TO_PARSERS if fragment in topic),
+                (),
+            )
+        elif event.get("source") == "testing-farm":
+            names = ("parse_testing_farm_results_event",)
+        elif object_kind := event.get("object_kind"):
+            names = Parser._GITLAB_OBJECT_KIND_TO_PARSERS.get(object_kind, ())
+        else:
+            names = tuple(
+                name
+                for key, key_names in Parser._GITHUB_KEY_TO_PARSERS
+                if key in event
+                for name in key_names
+            )
+
+        # resolve the names at runtime so that the parsers can be mocked in tests
+        return [getattr(Parser, name) for name in names]
+
     @staticmethod
     def parse_event(
         event: dict,
@@ -159,42 +235,8 @@ class Parser:
             logger.warning("No event to process!")
             return None
 
-        for response in (
-            parser(event)
-            for parser in (
-                Parser.parse_pr_event,
-                Parser.parse_pull_request_comment_event,
-                Parser.parse_issue_comment_event,
-                Parser.parse_release_event,
-                Parser.parse_github_push_event,
-                Parser.parse_check_rerun_event,
-                Parser.parse_installation_event,
-                Parser.parse_testing_farm_results_event,
-                Parser.parse_copr_event,
-                Parser.parse_mr_event,
-                Parser.parse_koji_task_event,
-                Parser.parse_koji_build_event,
-                Parser.parse_koji_build_tag_event,
-                Parser.parse_merge_request_comment_event,
-                Parser.parse_gitlab_issue_comment_event,
-                Parser.parse_gitlab_commit_comment_event,
-                Parser.parse_gitlab_push_event,
-                Parser.parse_pipeline_event,
-                Parser.parse_pagure_push_event,
-                Parser.parse_pagure_pr_flag_event,
-                Parser.parse_pagure_pull_request_comment_event,
-                Parser.parse_new_hotness_update_event,
-                Parser.parse_gitlab_release_event,
-                Parser.parse_gitlab_tag_push_event,
-                Parser.parse_anitya_version_update_event,
-                Parser.parse_openscanhub_task_finished_event,
-                Parser.parse_openscanhub_task_started_event,
-                Parser.parse_commit_comment_event,
-                Parser.parse_pagure_pull_request_event,
-                Parser.parse_logdetective_analysis_event,
-            )
-        ):
-            if response:
+        for parser in Parser.get_parsers_for_event(event):
+            if response := parser(event):
                 return response
 
         logger.debug("We don't process this event.")
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 from packit_service.worker.reporting.enums import BaseCommitStatus, DuplicateCheckMode
-from packit_service.worker.reporting.reporters.base import StatusReporter
+from packit_service.worker.reporting.reporters.base import StatusReporter, StatusUpdate
 from packit_service.worker.reporting.reporters.github import (
     StatusReporterGithubChecks,
     StatusReporterGithubStatuses,
@@ -18,6 +18,7 @@ from packit_service.worker.reporting.utils import (
 __all__ = [
     BaseCommitStatus.__name__,
     StatusReporter.__name__,
+    StatusUpdate.__name__,
     DuplicateCheckMode.__name__,
     report_in_issue_repository.__name__,
     update_message_with_configured_failure_comment_message.__name__,
@@ -2,14 +2,17 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+from collections.abc import Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Callable, Optional, Union
+from typing import Callable, NamedTuple, Optional, Union
 
 from ogr.abstract import GitProject, PullRequest
 from ogr.services.github import GithubProject
 from ogr.services.gitlab import GitlabProject
 from ogr.services.pagure import PagureProject
 
+from packit_service.constants import STATUS_REPORTING_CONCURRENCY
 from packit_service.worker.reporting.enums import (
     MAP_TO_CHECK_RUN,
     MAP_TO_COMMIT_STATUS,
@@ -21,6 +24,15 @@ from packit_service.worker.reporting.utils import has_identical_comment_in_comme
 logger = logging.getLogger(__name__)
 
 
+class StatusUpdate(NamedTuple):
+    """Status of a single check, see `StatusReporter.report_batch`."""
+
+    check_name: str
+    state: BaseCommitStatus
+    description: str
+    url: str = ""
+
+
 class StatusReporter:
     def __init__(
         self,
@@ -41,6 +53,10 @@ class StatusReporter:
         self.project_event_id: int = project_event_id
         self.pr_id: Optional[int] = pr_id
         self._pull_request_object: Optional[PullRequest] = None
+        # check name -> value of the check already set for the commit
+        self._status_snapshot: Optional[dict[str, Hashable]] = None
+        # checks reported by a comment, as setting their status failed
+        self._commented_checks: set[str] = set()
 
     @classmethod
     def get_instance(
@@ -154,6 +170,7 @@ class StatusReporter:
             check_names = [check_names]
 
         for check in check_names:
+            self._commented_checks.discard(check)
             self.set_status(
                 state=state,
                 description=description,
@@ -162,10 +179,135 @@ class StatusReporter:
                 links_to_external_services=links_to_external_services,
                 markdown_content=markdown_content,
             )
+            # the check might have ended up in a different state (e.g. a comment fallback)
+            if self._status_snapshot is not None:
+                self._status_snapshot.pop(check, None)
 
             if update_feedback_time:
                 update_feedback_time(datetime.now(timezone.utc))
 
+    def _get_status_value(
+        self,
+        state: BaseCommitStatus,
+        description: str,
+        url: str = "",
+        links_to_external_services: Optional[dict[str, str]] = None,
+        markdown_content: Optional[str] = None,
+    ) -> Hashable:
+        """
+        Get the value of a check as it is going to be stored by the forge,
+        comparable with the values in the status snapshot.
+        """
+        # descriptions are trimmed when setting the commit status
+        return self.get_commit_status(state), description[:140], url or ""
+
+    def _fetch_status_snapshot(self) -> dict[str, Hashable]:
+        """Get the values of the checks already set for the commit."""
+        snapshot: dict[str, Hashable] = {}
+        statuses = self.project_with_commit.get_commit_statuses(commit=self.commit_sha)
+        # the whole history of a check is kept, the latest status is the one displayed
+        for status in sorted(statuses, key=lambda status: status.created):
+            snapshot[status.context] = (status.state, status.comment or "", status.url or "")
+        return snapshot
+
+    @property
+    def status_snapshot(self) -> dict[str, Hashable]:
+        """
+        Snapshot of the checks already set for the commit, fetched once
+        and kept up to date by `report_batch`.
+        """
+        if self._status_snapshot is None:
+            self._status_snapshot = {}
+            if self.commit_sha:
+                try:
+                    self._status_snapshot = self._fetch_status_snapshot()
+                except Exception as ex:
+                    # not being able to skip the no-op updates is not fatal
+                    logger.debug(f"Failed to get the statuses of {self.commit_sha}: {ex!r}")
+        return self._status_snapshot
+
+    def report_batch(
+        self,
+        statuses: Iterable[StatusUpdate],
+        markdown_content: Optional[str] = None,
+        links_to_external_services: Optional[dict[str, str]] = None,
+        update_feedback_time: Optional[Callable] = None,
+    ) -> None:
+        """
+        Set statuses of multiple checks of the commit at once.
+
+        Updates that would not change the check already set for the commit
+        are dropped, the remaining ones are sent concurrently.
+
+        Args:
+            statuses: Statuses of the checks to set, if there are multiple
+                statuses for a single check, the last one is used.
+            markdown_content: In GitHub checks, we can provide a markdown content,
+                shared by all the checks.
+
+                Defaults to None
+            links_to_external_services: Direct links to external services,
+                shared by all the checks.
+
+                Defaults to None
+            update_feedback_time: a callable which tells the caller when a check
+                status has been updated.
+
+        Raises:
+            The first exception raised when setting a status, after all
+            the other statuses have been set.
+        """
+        to_report: dict[str, tuple[StatusUpdate, Hashable]] = {}
+        for status in statuses:
+            value = self._get_status_value(
+                state=status.state,
+                description=status.description,
+                url=status.url,
+                links_to_external_services=links_to_external_services,
+                markdown_content=markdown_content,
+            )
+            to_report.pop(status.check_name, None)
+            if self.status_snapshot.get(status.check_name) == value:
+                logger.debug(
+                    f"Check '{status.check_name}' is already set to '{status.state.name}'.",
+                )
+                continue
+            to_report[status.check_name] = (status, value)
+
+        if not to_report:
+            return
+
+        errors = []
+        with ThreadPoolExecutor(
+            max_workers=min(STATUS_REPORTING_CONCURRENCY, len(to_report)),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.report,
+                    state=status.state,
+                    description=status.description,
+                    url=status.url,
+                    links_to_external_services=links_to_external_services,
+                    check_names=status.check_name,
+                    markdown_content=markdown_content,
+                    update_feedback_time=update_feedback_time,
+                ): (status.check_name, value)
+                for status, value in to_report.values()
+            }
+            for future in as_completed(futures):
+                check_name, value = futures[future]
+                try:
+                    future.result()
+                except Exception as ex:
+                    logger.warning(f"Failed to set status of check '{check_name}': {ex!r}")
+                    errors.append(ex)
+                    continue
+                if check_name not in self._commented_checks:
+                    self.status_snapshot[check_name] = value
+
+        if errors:
+            raise errors[0]
+
     @staticmethod
     def is_final_state(state: BaseCommitStatus) -> bool:
         return state in {
@@ -216,6 +358,7 @@ class StatusReporter:
         If pr_id exists, adds a comment to the PR.
         Otherwise, logs a warning.
         """
+        self._commented_checks.add(check_name)
         if self.commit_sha:
             logger.debug(
                 f"Failed to set status for {self.commit_sha},"
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+from collections.abc import Hashable
 from typing import Optional
 
 from ogr.abstract import CommitStatus
@@ -64,6 +65,9 @@ class StatusReporterGithubStatuses(StatusReporter):
 class StatusReporterGithubChecks(StatusReporterGithubStatuses):
     project_with_commit: GithubProject
 
+    # separates the summary of a check run from the news sentence
+    SUMMARY_NEWS_SEPARATOR = "\n\n---\n"
+
     @staticmethod
     def _create_table(
         url: str,
@@ -86,6 +90,42 @@ class StatusReporterGithubChecks(StatusReporterGithubStatuses):
 
         return MSG_TABLE_HEADER_WITH_DETAILS + "".join(table_content) if table_content else ""
 
+    def _get_status_value(
+        self,
+        state: BaseCommitStatus,
+        description: str,
+        url: str = "",
+        links_to_external_services: Optional[dict[str, str]] = None,
+        markdown_content: Optional[str] = None,
+    ) -> Hashable:
+        state_to_set = self.get_check_run(state)
+        status = (
+            state_to_set
+            if isinstance(state_to_set, GithubCheckRunStatus)
+            else GithubCheckRunStatus.completed
+        )
+        conclusion = state_to_set if isinstance(state_to_set, GithubCheckRunResult) else None
+        summary = self._create_table(url, links_to_external_services) + (markdown_content or "")
+        return status, conclusion, description, url or None, summary
+
+    def _fetch_status_snapshot(self) -> dict[str, Hashable]:
+        snapshot: dict[str, Hashable] = {}
+        check_runs = self.project_with_commit.get_check_runs(commit_sha=self.commit_sha)
+        # every update creates a new check run, the latest one is displayed
+        for check_run in sorted(check_runs, key=lambda check_run: check_run.raw_check_run.id):
+            # the news sentence differs every time, ignore it
+            summary, _, _ = (check_run.output.summary or "").rpartition(
+                self.SUMMARY_NEWS_SEPARATOR,
+            )
+            snapshot[check_run.name] = (
+                check_run.status,
+                check_run.conclusion,
+                check_run.output.title,
+                check_run.url,
+                summary,
+            )
+        return snapshot
+
     def set_status(
         self,
         state: BaseCommitStatus,
@@ -113,8 +153,8 @@ class StatusReporterGithubChecks(StatusReporterGithubStatuses):
         summary = (
             self._create_table(url, links_to_external_services)
             + markdown_content
-            + "\n\n"
-            + f"---\n*{News.get_sentence()}*"
+            + self.SUMMARY_NEWS_SEPARATOR
+            + f"*{News.get_sentence()}*"
         )
 
         try:
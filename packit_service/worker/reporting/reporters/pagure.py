@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 import hashlib
 import logging
+from collections.abc import Hashable
 from typing import Optional
 
 from ogr.abstract import CommitStatus
@@ -24,6 +25,23 @@ class StatusReporterPagure(StatusReporter):
 
         return mapped_state
 
+    def _get_status_value(
+        self,
+        state: BaseCommitStatus,
+        description: str,
+        url: str = "",
+        links_to_external_services: Optional[dict[str, str]] = None,
+        markdown_content: Optional[str] = None,
+    ) -> Hashable:
+        return super()._get_status_value(state, description, url or CONTACTS_URL)
+
+    def _fetch_status_snapshot(self) -> dict[str, Hashable]:
+        # flags of a pull request are updated in place by their uid and ogr
+        # can list only the commit flags, so every update is sent
+        if self.pull_request_object:
+            return {}
+        return super()._fetch_status_snapshot()
+
     def set_status(
         self,
         state: BaseCommitStatus,
@@ -3,14 +3,14 @@
 
 import logging
 import socket
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from os import getenv
 from typing import ClassVar, Optional
 
 import redis
 from celery import Task
 from celery._state import get_current_task
-from celery.signals import after_setup_logger
+from celery.signals import after_setup_logger, task_postrun
 from copr.v3 import CoprException
 from ogr import __version__ as ogr_version
 from ogr.exceptions import OgrException
@@ -25,20 +25,25 @@ from packit_service.constants import (
     CELERY_DEFAULT_MAIN_TASK_NAME,
     DEFAULT_RETRY_BACKOFF,
     DEFAULT_RETRY_LIMIT,
+    DELETE_OLD_DATA_MAX_DURATION,
     REDIS_PIDBOX_TTL_SECONDS,
     USAGE_CURRENT_DATE,
-    USAGE_DATE_IN_THE_PAST,
     USAGE_DATE_IN_THE_PAST_STR,
     USAGE_PAST_DAY_DATE_STR,
     USAGE_PAST_MONTH_DATE_STR,
     USAGE_PAST_WEEK_DATE_STR,
     USAGE_PAST_YEAR_DATE_STR,
+    USAGE_ROLLUP_CHUNK,
 )
 from packit_service.models import (
     GitProjectModel,
+    Session,
     SyncReleaseTargetModel,
     VMImageBuildTargetModel,
     get_usage_data,
+    get_usage_intervals,
+    get_usage_rollup_start,
+    refresh_usage_rollup,
 )
 from packit_service.utils import (
     load_job_config,
@@ -47,6 +52,7 @@ from packit_service.utils import (
 )
 from packit_service.worker.database import (
     backup,
+    delete_old_data,
     discard_old_package_configs,
     discard_old_srpm_build_logs,
 )
@@ -118,6 +124,13 @@ class PackitVMImageBuildTimeoutException(PackitException):
     """VM image build has timed out"""
 
 
+@task_postrun.connect
+def remove_db_session(*args, **kwargs):
+    # return the connection of the task to the pool, the next task
+    # (in this thread/greenlet) starts with a new session
+    Session.remove()
+
+
 @after_setup_logger.connect
 def setup_loggers(logger, *args, **kwargs):
     # debug logs of these are super-duper verbose
@@ -255,7 +268,12 @@ def process_message(
     retry_jitter=False,  # do not jitter, as it might considerably reduce the total wait time
 )
 def babysit_copr_build(self, build_id: int):
-    """check status of a copr build and update it in DB"""
+    """
+    check status of a copr build and update it in DB
+
+    Copr builds are now checked by babysit_pending_copr_builds according to their schedule,
+    the task is kept for the tasks already sent.
+    """
     if not check_copr_build(build_id=build_id):
         raise PackitCoprBuildTimeoutException(
             f"No feedback for copr build id={build_id} yet",
@@ -909,10 +927,10 @@ def babysit_pending_tft_runs() -> None:
 @celery_app.task
 def database_maintenance() -> None:
     backup()
-    # TODO: uncomment once we did the first manual cleanup
-    # delete_old_data()
     discard_old_srpm_build_logs()
     discard_old_package_configs()
+    # last, so that the time limit of the task can't cut off the other steps
+    delete_old_data(max_duration=DELETE_OLD_DATA_MAX_DURATION)
 
 
 @celery_app.task
@@ -933,6 +951,28 @@ def run_check_onboarded_projects() -> None:
     check_onboarded_projects(almost_onboarded_projects)
 
 
+@celery_app.task
+def update_usage_rollup() -> None:
+    """Roll up the pipelines created since the last run into the hourly usage buckets
+    the usage statistics are computed from.
+
+    The history is processed in chunks, each committed separately,
+    so the initial backfill can span multiple runs.
+    """
+    if not (datetime_from := get_usage_rollup_start()):
+        logger.debug("No pipelines to roll up.")
+        return
+
+    datetime_to = datetime.now(timezone.utc).replace(
+        tzinfo=None, minute=0, second=0, microsecond=0
+    ) + timedelta(hours=1)
+    while datetime_from < datetime_to:
+        chunk_end = min(datetime_from + USAGE_ROLLUP_CHUNK, datetime_to)
+        logger.debug(f"Rolling up usage data from {datetime_from} to {chunk_end}.")
+        refresh_usage_rollup(datetime_from, chunk_end)
+        datetime_from = chunk_end
+
+
 def _get_usage_interval_data(days, hours, count) -> None:
     """Call functions collecting usage statistics and **cache** results
     to be used quicker later.
@@ -945,30 +985,11 @@ def _get_usage_interval_data(days, hours, count) -> None:
         f"Starting collecting statistics for days={days}, hours={hours}, count={count}",
     )
 
-    delta = timedelta(days=days, hours=hours)
-    current_date = USAGE_CURRENT_DATE
-    days_legend = []
-    for _ in range(count):
-        days_legend.append(current_date)
-        current_date -= delta
-
-    logger.debug(
-        f"Getting usage data datetime_from {USAGE_DATE_IN_THE_PAST} datetime_to {days_legend[-1]}",
-    )
-    get_usage_data(
-        datetime_from=USAGE_DATE_IN_THE_PAST,
-        datetime_to=days_legend[-1],
-        top=100000,
+    get_usage_intervals(
+        datetime_to=USAGE_CURRENT_DATE,
+        delta=timedelta(days=days, hours=hours),
+        count=count,
     )
-    logger.debug("Got usage data.")
-
-    for day in reversed(days_legend):
-        day_from = (day - delta).isoformat()
-        day_to = day.isoformat()
-
-        logger.warn(f"Getting usage data datetime_from {day_from} datetime_to {day_to}")
-        get_usage_data(datetime_from=day_from, datetime_to=day_to, top=100000)
-        logger.warn("Got usage data.")
 
     logger.debug(
         f"Done collecting statistics for days={days}, hours={hours}, count={count}",
@@ -23,6 +23,8 @@ from packit_service.models import (
     ProjectEventModelType,
     PullRequestModel,
 )
+from packit_service.package_config_getter import package_config_cache
+from packit_service.worker.helpers.testing_farm_client import compose_catalog_cache
 from packit_service.worker.parser import Parser
 from tests.spellbook import DATA_DIR, SAVED_HTTPD_REQS, load_the_message_from_file
 
@@ -61,6 +63,19 @@ def _reset_fedora_ci_config():
     FedoraCIConfig._instance = None
 
 
+@pytest.fixture(autouse=True)
+def _clear_package_config_cache():
+    """Don't share the cached package configs between the tests."""
+    package_config_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_compose_catalog_cache():
+    """Don't share the Testing Farm composes between the tests (nor via Redis)."""
+    compose_catalog_cache.clear()
+    flexmock(compose_catalog_cache, use_redis=False)
+
+
 @pytest.fixture(autouse=True)
 def _mock_pipeline_get_latest_datetime_for_event():
     """Mock PipelineModel.get_latest_datetime_for_event so tests don't
@@ -444,17 +459,13 @@ def add_pull_request_event_with_pr_id_9():
     flexmock(PullRequestModel).should_receive("get_by_id").with_args(9).and_return(
         db_project_object,
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="12345",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=9,
         namespace="packit-service",
         repo_name="hello-world",
         project_url="https://github.com/packit-service/hello-world",
-    ).and_return(db_project_object)
+        commit_sha="12345",
+    ).and_return((db_project_object, db_project_event))
     yield db_project_object, db_project_event
 
 
@@ -476,17 +487,13 @@ def add_pull_request_event_with_sha_0011223344():
     flexmock(PullRequestModel).should_receive("get_by_id").with_args(9).and_return(
         db_project_object,
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="0011223344",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=9,
         namespace="packit-service",
         repo_name="hello-world",
         project_url="https://github.com/packit-service/hello-world",
-    ).and_return(db_project_object)
+        commit_sha="0011223344",
+    ).and_return((db_project_object, db_project_event))
     yield db_project_object, db_project_event
 
 
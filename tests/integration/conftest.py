@@ -57,18 +57,16 @@ def mock_pr_functionality(request):
         .mock()
     )
     flexmock(LocalProject, refresh_the_arguments=lambda: None)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        project_event,
-    )
     flexmock(ProjectEventModel).should_receive("get_by_id").with_args(
         123456,
     ).and_return(project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=123,
         namespace="packit",
         repo_name="hello-world",
         project_url="https://github.com/packit/hello-world",
-    ).and_return(pr_model)
+        commit_sha=str,
+    ).and_return((pr_model, project_event))
     flexmock(PullRequestModel).should_receive("get_by_id").with_args(123).and_return(
         pr_model,
     )
@@ -103,18 +101,16 @@ def mock_push_functionality(request):
     )
 
     flexmock(LocalProject, refresh_the_arguments=lambda: None)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        project_event,
-    )
     flexmock(ProjectEventModel).should_receive("get_by_id").with_args(
         123456,
     ).and_return(project_event)
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="packit",
         repo_name="hello-world",
         project_url="https://github.com/packit/hello-world",
-    ).and_return(branch_model)
+        commit_sha=str,
+    ).and_return((branch_model, project_event))
     flexmock(GitBranchModel).should_receive("get_by_id").with_args(123).and_return(
         branch_model,
     )
@@ -151,19 +147,16 @@ def mock_release_functionality(request):
     flexmock(ProjectEventModel).should_receive("get_by_id").with_args(
         123456,
     ).and_return(project_event)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        project_event,
-    )
     flexmock(ProjectReleaseModel).should_receive("get_by_id").with_args(123).and_return(
         release_model,
     )
-    flexmock(ProjectReleaseModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_release_event").with_args(
         tag_name="0.1.0",
         namespace="packit",
         repo_name="hello-world",
         project_url="https://github.com/packit/hello-world",
         commit_hash="0e5d8b51fd5dfa460605e1497d22a76d65c6d7fd",
-    ).and_return(release_model)
+    ).and_return((release_model, project_event))
 
 
 @pytest.fixture
@@ -193,17 +186,13 @@ def bodhi_update_db_mocks():
         flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").with_args(
             task_id=79721403,
         ).and_return(None)
-        flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-            type=ProjectEventModelType.pull_request,
-            event_id=12,
-            commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
-        ).and_return(project_event)
-        flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+        flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
             pr_id=36,
             namespace="rpms",
             repo_name=package_name,
             project_url=project_url,
-        ).and_return(db_project_object)
+            commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+        ).and_return((db_project_object, project_event))
         flexmock(PipelineModel).should_receive("create").and_return(run_model_flexmock)
 
     return _setup
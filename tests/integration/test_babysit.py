@@ -2,11 +2,16 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 import requests
-from copr.v3 import Client, CoprNoResultException
+from copr.v3 import Client
 from flexmock import flexmock
+from munch import Munch
 from packit.config import (
     CommonPackageConfig,
     JobConfig,
@@ -18,6 +23,10 @@ from packit.copr_helper import CoprHelper
 
 import packit_service.worker.helpers.build.babysit
 from packit_service import events
+from packit_service.constants import (
+    COPR_BUILD_CHECK_CONCURRENCY,
+    TESTING_FARM_POLLING_CONCURRENCY,
+)
 from packit_service.models import (
     BuildStatus,
     CoprBuildTargetModel,
@@ -35,12 +44,15 @@ from packit_service.worker.handlers.testing_farm import (
     DownstreamTestingFarmResultsHandler,
 )
 from packit_service.worker.helpers.build.babysit import (
+    CoprBuildStatus,
     check_copr_build,
     check_pending_copr_builds,
     check_pending_testing_farm_runs,
+    get_next_copr_build_check_delay,
     update_copr_builds,
     update_testing_farm_run,
 )
+from packit_service.worker.parser import Parser
 from packit_service.worker.tasks import (
     run_copr_build_end_handler,
     run_copr_build_start_handler,
@@ -92,6 +104,11 @@ def test_check_copr_build_already_successful():
             .with_args(1)
             .and_return(flexmock(ended_on="timestamp", state="completed"))
             .mock(),
+            build_chroot_proxy=flexmock()
+            .should_receive("get_list")
+            .with_args(1)
+            .and_return([])
+            .mock(),
         ),
     )
     assert check_copr_build(build_id=1)
@@ -180,9 +197,9 @@ def test_check_copr_build_updated(
             )
             .mock(),
             build_chroot_proxy=flexmock()
-            .should_receive("get")
-            .with_args(1, "the-target")
-            .and_return(flexmock(ended_on="timestamp", state="succeeded"))
+            .should_receive("get_list")
+            .with_args(1)
+            .and_return([flexmock(name="the-target", ended_on="timestamp", state="succeeded")])
             .mock(),
         ),
     )
@@ -265,10 +282,14 @@ def test_check_copr_build_waiting_started(add_pull_request_event_with_sha_123456
             )
             .mock(),
             build_chroot_proxy=flexmock()
-            .should_receive("get")
-            .with_args(1, "the-target")
+            .should_receive("get_list")
+            .with_args(1)
             .and_return(
-                flexmock(started_on="timestamp", ended_on=None, state="succeeded"),
+                [
+                    flexmock(
+                        name="the-target", started_on="timestamp", ended_on=None, state="succeeded"
+                    )
+                ]
             )
             .mock(),
         ),
@@ -371,10 +392,14 @@ def test_check_copr_build_waiting_srpm_failed(add_pull_request_event_with_sha_12
             .and_return(flexmock(state="failed"))
             .mock(),
             build_chroot_proxy=flexmock()
-            .should_receive("get")
-            .with_args(1, "the-target")
+            .should_receive("get_list")
+            .with_args(1)
             .and_return(
-                flexmock(started_on="timestamp", ended_on=None, state="succeeded"),
+                [
+                    flexmock(
+                        name="the-target", started_on="timestamp", ended_on=None, state="succeeded"
+                    )
+                ]
             )
             .mock(),
         ),
@@ -459,10 +484,14 @@ def test_check_copr_build_waiting_already_started(
             )
             .mock(),
             build_chroot_proxy=flexmock()
-            .should_receive("get")
-            .with_args(1, "the-target")
+            .should_receive("get_list")
+            .with_args(1)
             .and_return(
-                flexmock(started_on="timestamp", ended_on=None, state="succeeded"),
+                [
+                    flexmock(
+                        name="the-target", started_on="timestamp", ended_on=None, state="succeeded"
+                    )
+                ]
             )
             .mock(),
         ),
@@ -483,94 +512,275 @@ def test_check_copr_build_waiting_already_started(
     assert not check_copr_build(build_id=1)
 
 
-def test_check_copr_build_not_exists():
+@pytest.fixture()
+def copr_api_stand_in():
+    """
+    Local HTTP server answering the Copr API requests with a delay.
+
+    The builds are served from the `builds` dictionary (build ID → build data
+    with chroots by their names), the requests are counted by their endpoints.
+    """
+    builds: dict[int, dict] = {}
+    requests_count: dict[str, int] = {}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(0.05)
+            path, _, query = self.path.partition("?")
+            endpoint, _, build_id = path.removeprefix("/api_3/").rpartition("/")
+            if endpoint == "build-chroot":
+                endpoint, build_id = "build-chroot/list", query.removeprefix("build_id=")
+            with lock:
+                requests_count[endpoint] = requests_count.get(endpoint, 0) + 1
+
+            if build := builds.get(int(build_id)):
+                code = 200
+                if endpoint == "build":
+                    data = {key: value for key, value in build.items() if key != "chroots"}
+                elif endpoint == "build/source-chroot":
+                    data = {"state": build["source_state"]}
+                else:
+                    data = {
+                        "items": [
+                            {"name": name, "state": state}
+                            for name, state in build["chroots"].items()
+                        ],
+                        "meta": {},
+                    }
+            else:
+                code, data = 404, {"error": f"Build {build_id} does not exist."}
+            body = json.dumps(data).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
     flexmock(Client).should_receive("create_from_config_file").and_return(
-        flexmock(
-            build_proxy=flexmock()
-            .should_receive("get")
-            .with_args(1)
-            .and_raise(CoprNoResultException, "Build 1 does not exist")
-            .mock(),
-        ),
+        Client(config={"copr_url": f"http://127.0.0.1:{server.server_address[1]}"}),
     )
-    builds = []
-    for i in range(2):
-        builds.append(flexmock(status=BuildStatus.pending, build_id=1))
-        builds[i].should_receive("set_status").with_args(BuildStatus.error).once()
-    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
-        BuildStatus.pending,
+    flexmock(packit_service.worker.helpers.build.babysit, _observed_copr_build_states={})
+    yield builds, requests_count
+    server.shutdown()
+    server.server_close()
+
+
+def copr_build(build_id: int, target: str = "fedora-rawhide-x86_64"):
+    return flexmock(
+        id=build_id * 10 + len(target),
+        build_id=str(build_id),
+        target=target,
+        status=BuildStatus.pending,
+        submitted_time=datetime.datetime.utcnow(),
+        build_start_time=None,
+    )
+
+
+def test_check_copr_build_not_exists(copr_api_stand_in):
+    builds = [copr_build(1, "fedora-rawhide-x86_64"), copr_build(1, "fedora-40-x86_64")]
+    flexmock(CoprBuildTargetModel).should_receive("pop_due_status_checks").and_return([1])
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_ids").with_args(
+        [1],
     ).and_return(builds)
+    flexmock(SRPMBuildModel).should_receive("get_all_by_copr_build_ids").and_return([])
+    flexmock(CoprBuildTargetModel).should_receive("update_status_checks").with_args(
+        {1: None},
+        [build.id for build in builds],
+    ).once()
     check_pending_copr_builds()
 
 
-def test_check_update_copr_builds_timeout():
-    flexmock(Client).should_receive("create_from_config_file").and_return(
-        flexmock(
-            build_proxy=flexmock()
-            .should_receive("get")
-            .with_args(1)
-            .and_return(
-                flexmock(
-                    ended_on=True,
-                    state="completed",
-                    source_package={
-                        "name": "source_package_name",
-                        "url": "https://some.host/my.srpm",
-                    },
-                ),
-            )
-            .mock(),
-            build_chroot_proxy=flexmock()
-            .should_receive("get")
-            .with_args(1, "the-target")
-            .and_return(flexmock(ended_on="timestamp", state="succeeded"))
-            .mock(),
-        ),
-    )
+def test_update_copr_builds_timeout():
     build = flexmock(
         status=BuildStatus.pending,
         build_id="1",
+        target="the-target",
         submitted_time=datetime.datetime.utcnow() - datetime.timedelta(weeks=2),
     )
-    build.should_receive("set_status").with_args(BuildStatus.error).once()
-
-    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
-        BuildStatus.pending,
-    ).and_return([build])
-    flexmock(SRPMBuildModel).should_receive("get_by_copr_build_id").and_return(
-        flexmock(status=BuildStatus.success),
+    status = CoprBuildStatus(
+        build=Munch(
+            ended_on=True,
+            state="completed",
+            source_package={"name": "source_package_name", "url": "https://some.host/my.srpm"},
+        ),
+        chroots={"the-target": Munch(name="the-target", ended_on="timestamp", state="succeeded")},
     )
-    update_copr_builds(1, [build])
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_build_state",
+    ).never()
+    assert update_copr_builds(1, [build], status) == (True, [build])
 
 
 def test_check_pending_copr_builds_no_builds():
-    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
-        BuildStatus.pending,
-    ).and_return([])
+    flexmock(CoprBuildTargetModel).should_receive("pop_due_status_checks").and_return([])
+    flexmock(Client).should_receive("create_from_config_file").never()
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
         "update_copr_builds",
     ).never()
     check_pending_copr_builds()
 
 
-def test_check_pending_copr_builds():
-    client = flexmock()
-    flexmock(Client).should_receive("create_from_config_file").and_return(client)
-
-    build1 = flexmock(status=BuildStatus.pending, build_id="1")
-    build2 = flexmock(status=BuildStatus.pending, build_id="2")
-    build3 = flexmock(status=BuildStatus.pending, build_id="1")
-    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
-        BuildStatus.pending,
+def test_check_pending_copr_builds(copr_api_stand_in):
+    copr_builds, requests_count = copr_api_stand_in
+    copr_builds[1] = {
+        "state": "running",
+        "started_on": 1700000000,
+        "ended_on": None,
+        "source_state": "succeeded",
+        "chroots": {"fedora-rawhide-x86_64": "running", "fedora-40-x86_64": "pending"},
+    }
+    copr_builds[2] = {
+        "state": "succeeded",
+        "started_on": 1700000000,
+        "ended_on": 1700000100,
+        "chroots": {"fedora-rawhide-x86_64": "succeeded"},
+    }
+    build1 = copr_build(1, "fedora-rawhide-x86_64")
+    build2 = copr_build(2, "fedora-rawhide-x86_64")
+    build3 = copr_build(1, "fedora-40-x86_64")
+    srpm_build = flexmock(copr_build_id="1", status=BuildStatus.pending)
+    flexmock(CoprBuildTargetModel).should_receive("pop_due_status_checks").with_args(
+        limit=int,
+        lease=datetime.timedelta,
+    ).and_return([1, 2])
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_ids").with_args(
+        [1, 2],
     ).and_return([build1, build2, build3])
+    flexmock(SRPMBuildModel).should_receive("get_all_by_copr_build_ids").with_args(
+        [1, 2],
+    ).and_return([srpm_build])
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
-        "update_copr_builds",
-    ).with_args(1, [build1, build3], copr_client=client).once()
+        "update_srpm_build_state",
+    ).with_args(srpm_build, object, object).once()
+    updated = []
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
-        "update_copr_builds",
-    ).with_args(2, [build2], copr_client=client).once()
+        "update_copr_build_state",
+    ).replace_with(lambda build, build_copr, chroot: updated.append((build, chroot.state)))
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "get_next_copr_build_check_delay",
+    ).with_args([build1, build3]).and_return(datetime.timedelta(minutes=5))
+    status_checks = []
+    flexmock(CoprBuildTargetModel).should_receive("update_status_checks").replace_with(
+        lambda check_times, errored_ids: status_checks.append((check_times, errored_ids)),
+    )
+
     check_pending_copr_builds()
 
+    assert updated == [(build1, "running"), (build3, "pending"), (build2, "succeeded")]
+    assert requests_count == {"build": 2, "build-chroot/list": 2, "build/source-chroot": 1}
+    ((check_times, errored_ids),) = status_checks
+    assert errored_ids == []
+    # the end handler has not finished the build 2 yet, it's checked again later
+    assert isinstance(check_times[2], datetime.datetime)
+    assert isinstance(check_times[1], datetime.datetime)
+
+    # none of the chroots of the build 1 has changed since, they are not updated again
+    flexmock(CoprBuildTargetModel).should_receive("pop_due_status_checks").and_return([1])
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_ids").and_return(
+        [build1, build3],
+    )
+    flexmock(SRPMBuildModel).should_receive("get_all_by_copr_build_ids").and_return([srpm_build])
+    check_pending_copr_builds()
+    assert len(updated) == 3
+    assert len(status_checks) == 2
+    assert requests_count == {"build": 3, "build-chroot/list": 3, "build/source-chroot": 2}
+
+    # one of the chroots has started while the state of the whole build is the same,
+    # only the chroot is updated
+    copr_builds[1]["chroots"]["fedora-40-x86_64"] = "running"
+    check_pending_copr_builds()
+    assert updated[3:] == [(build3, "running")]
+    assert len(status_checks) == 3
+
+    # the build 2 has been finished by the end handler, it's not checked anymore
+    build2.status = BuildStatus.success
+    flexmock(CoprBuildTargetModel).should_receive("pop_due_status_checks").and_return([2])
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_ids").and_return([build2])
+    flexmock(SRPMBuildModel).should_receive("get_all_by_copr_build_ids").and_return([])
+    check_pending_copr_builds()
+    assert status_checks[3] == ({2: None}, [])
+
+
+def test_check_pending_copr_builds_concurrently(copr_api_stand_in):
+    copr_builds, requests_count = copr_api_stand_in
+    build_ids = list(range(1, 201))
+    builds = []
+    for build_id in build_ids:
+        copr_builds[build_id] = {
+            "state": "running",
+            "started_on": 1700000000,
+            "ended_on": None,
+            "chroots": {"fedora-rawhide-x86_64": "running"},
+        }
+        builds.append(copr_build(build_id))
+    flexmock(CoprBuildTargetModel).should_receive("pop_due_status_checks").and_return(build_ids)
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_build_ids").and_return(builds).once()
+    flexmock(SRPMBuildModel).should_receive("get_all_by_copr_build_ids").and_return([]).once()
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_build_state",
+    ).times(len(builds))
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "get_expected_copr_build_durations",
+    ).and_return({})
+    # the next checks of all the builds are scheduled at once
+    flexmock(CoprBuildTargetModel).should_receive("update_status_checks").with_args(
+        dict,
+        [],
+    ).once()
+    # every check waits until `COPR_BUILD_CHECK_CONCURRENCY` checks are running at once
+    # (and fails otherwise)
+    barrier = threading.Barrier(COPR_BUILD_CHECK_CONCURRENCY, timeout=10)
+    get_copr_build_status = packit_service.worker.helpers.build.babysit.get_copr_build_status
+
+    def get_copr_build_status_together(*args):
+        barrier.wait()
+        return get_copr_build_status(*args)
+
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "get_copr_build_status",
+    ).replace_with(get_copr_build_status_together)
+
+    check_pending_copr_builds()
+    assert requests_count == {"build": len(builds), "build-chroot/list": len(builds)}
+
+
+@pytest.mark.parametrize(
+    "started_minutes_ago, expected_delay",
+    [
+        pytest.param(None, datetime.timedelta(minutes=20), id="not-started"),
+        pytest.param(5, datetime.timedelta(minutes=15), id="running"),
+        pytest.param(19, datetime.timedelta(minutes=1), id="about-to-end"),
+        pytest.param(100, datetime.timedelta(minutes=40), id="overdue"),
+        pytest.param(1000, datetime.timedelta(hours=1), id="long-overdue"),
+    ],
+)
+def test_get_next_copr_build_check_delay(started_minutes_ago, expected_delay):
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "get_expected_copr_build_durations",
+    ).and_return({"fedora-rawhide-x86_64": datetime.timedelta(minutes=20)})
+    now = datetime.datetime.utcnow()
+    build = flexmock(
+        status=BuildStatus.pending,
+        target="fedora-rawhide-x86_64",
+        submitted_time=now,
+        build_start_time=(
+            now - datetime.timedelta(minutes=started_minutes_ago)
+            if started_minutes_ago is not None
+            else None
+        ),
+    )
+    finished_build = flexmock(status=BuildStatus.success, target="fedora-40-x86_64")
+
+    delay = get_next_copr_build_check_delay([build, finished_build])
+    assert abs(delay - expected_delay) < datetime.timedelta(seconds=5)
+
 
 def test_check_pending_testing_farm_runs_no_runs():
     flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
@@ -580,7 +790,7 @@ def test_check_pending_testing_farm_runs_no_runs():
         TestingFarmResult.cancel_requested,
     ).and_return([])
     # No request should be performed
-    flexmock(requests).should_receive("get").never()
+    flexmock(requests.Session).should_receive("get").never()
     check_pending_testing_farm_runs()
 
 
@@ -630,7 +840,11 @@ def test_check_pending_testing_farm_runs(created):
         pipeline_id=pipeline_id,
     ).and_return(run)
     url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(requests.Session).should_receive("get").with_args(
+        url,
+        headers={},
+        timeout=30,
+    ).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -638,6 +852,8 @@ def test_check_pending_testing_farm_runs(created):
                 "created": "2021-11-01 17:22:36.061250",
             },
             ok=lambda: True,
+            status_code=200,
+            headers={},
         ),
     ).once()
     flexmock(events.testing_farm.Result).should_receive("get_packages_config").and_return(
@@ -724,7 +940,11 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
         pipeline_id=pipeline_id,
     ).and_return(run)
     url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(requests.Session).should_receive("get").with_args(
+        url,
+        headers={},
+        timeout=30,
+    ).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -732,6 +952,8 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
                 "created": "2021-11-01 17:22:36.061250",
             },
             ok=lambda: True,
+            status_code=200,
+            headers={},
         ),
     ).once()
     flexmock(events.testing_farm.Result).should_receive("get_packages_config").and_return(
@@ -776,6 +998,87 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
     check_pending_testing_farm_runs()
 
 
+@pytest.fixture()
+def testing_farm_api_stand_in():
+    """
+    Local HTTP server answering the Testing Farm requests.
+
+    Every request waits until `TESTING_FARM_POLLING_CONCURRENCY` requests are being
+    handled at once (and fails otherwise), the details are sent with an ETag.
+    """
+
+    barrier = threading.Barrier(TESTING_FARM_POLLING_CONCURRENCY, timeout=10)
+    requests_headers = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_headers.append(dict(self.headers))
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                self.send_response(503)
+                self.end_headers()
+                return
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps(
+                {
+                    "id": self.path.rsplit("/", 1)[-1],
+                    "state": "running",
+                    "updated": "2021-11-01T17:22:36.061250",
+                },
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/", requests_headers
+    server.shutdown()
+    server.server_close()
+
+
+def test_check_pending_testing_farm_runs_concurrently(testing_farm_api_stand_in):
+    api_url, requests_headers = testing_farm_api_stand_in
+    runs = [
+        flexmock(pipeline_id=str(pipeline_id), submitted_time=None)
+        for pipeline_id in range(2 * TESTING_FARM_POLLING_CONCURRENCY)
+    ]
+    flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").and_return(runs)
+    observed_states = {}
+    flexmock(
+        packit_service.worker.helpers.build.babysit,
+        TESTING_FARM_API_URL=api_url,
+        _observed_testing_farm_states=observed_states,
+    )
+    # the requests are sent concurrently (by the barrier of the server)
+    # and the responses of the later checks are not processed, nothing has changed
+    flexmock(Parser).should_receive("parse_data_from_testing_farm").and_return(
+        flexmock(result=TestingFarmResult.running),
+    ).times(len(runs))
+
+    check_pending_testing_farm_runs()
+    assert len(requests_headers) == len(runs)
+    assert all("If-None-Match" not in headers for headers in requests_headers)
+
+    # the requests are sent conditionally on every check, nothing has changed
+    for check in (2, 3):
+        check_pending_testing_farm_runs()
+        assert len(requests_headers) == check * len(runs)
+        assert all(headers["If-None-Match"] == '"v1"' for headers in requests_headers[len(runs) :])
+    assert len(observed_states) == len(runs)
+
+
 def test_update_testing_farm_run_downstream():
     """
     Test that update_testing_farm_run correctly handles downstream tests.
@@ -21,8 +21,6 @@ from packit_service.constants import DEFAULT_RETRY_LIMIT
 from packit_service.models import (
     BodhiUpdateGroupModel,
     BodhiUpdateTargetModel,
-    GitBranchModel,
-    KojiBuildTagModel,
     KojiBuildTargetModel,
     PipelineModel,
     ProjectEventModel,
@@ -100,8 +98,8 @@ def test_bodhi_update_for_unknown_koji_build(koji_build_completed_old_format):
     flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").with_args(
         task_id=79721403,
     ).and_return(None)
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        git_branch_model_flexmock,
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").and_return(
+        (git_branch_model_flexmock, None)
     )
     flexmock(PipelineModel).should_receive("create").and_return(run_model_flexmock)
     group_model = flexmock(
@@ -119,7 +117,6 @@ def test_bodhi_update_for_unknown_koji_build(koji_build_completed_old_format):
             ),
         ],
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create")
     flexmock(BodhiUpdateGroupModel).should_receive("create").and_return(group_model)
     flexmock(BodhiUpdateTargetModel).should_receive(
         "get_all_successful_or_in_progress_by_nvrs",
@@ -210,10 +207,9 @@ def test_bodhi_update_for_unknown_koji_build_failed(koji_build_completed_old_for
     flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").with_args(
         task_id=79721403,
     ).and_return(None)
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        git_branch_model_flexmock,
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").and_return(
+        (git_branch_model_flexmock, None)
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create")
     flexmock(PipelineModel).should_receive("create").and_return(run_model_flexmock)
     group_model = flexmock(
         id=12,
@@ -323,11 +319,10 @@ def test_bodhi_update_for_unknown_koji_build_failed_issue_created(
     flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").with_args(
         task_id=79721403,
     ).and_return(None)
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        git_branch_model_flexmock,
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").and_return(
+        (git_branch_model_flexmock, None)
     )
     flexmock(PipelineModel).should_receive("create").and_return(run_model_flexmock)
-    flexmock(ProjectEventModel).should_receive("get_or_create")
     group_model = flexmock(
         grouped_targets=[
             flexmock(
@@ -450,11 +445,10 @@ def test_bodhi_update_for_unknown_koji_build_failed_issue_comment(
     flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").with_args(
         task_id=79721403,
     ).and_return(None)
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        git_branch_model_flexmock,
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").and_return(
+        (git_branch_model_flexmock, None)
     )
     flexmock(PipelineModel).should_receive("create").and_return(run_model_flexmock)
-    flexmock(ProjectEventModel).should_receive("get_or_create")
     group_model = flexmock(
         grouped_targets=[
             flexmock(
@@ -581,11 +575,6 @@ def test_bodhi_update_build_not_tagged_yet(
         status="queued",
         bodhi_update_group=group_model,
     ).and_return()
-    git_branch_model_flexmock = flexmock(
-        id=1,
-        job_config_trigger_type=JobConfigTriggerType.commit,
-        project_event_model_type=ProjectEventModelType.branch_push,
-    )
     flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").with_args(
         task_id=79721403,
     ).and_return(
@@ -601,9 +590,6 @@ def test_bodhi_update_build_not_tagged_yet(
             group_of_targets=flexmock(runs=[flexmock()]),
         ),
     )
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        git_branch_model_flexmock,
-    )
     flexmock(PipelineModel).should_receive("create").and_return(run_model_flexmock)
 
     task_mock = flexmock(
@@ -715,11 +701,10 @@ def test_bodhi_update_for_unknown_koji_build_not_for_unfinished(
     flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").with_args(
         task_id=79721403,
     ).and_return(None)
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        git_branch_model_flexmock,
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").and_return(
+        (git_branch_model_flexmock, None)
     )
     flexmock(PipelineModel).should_receive("create").and_return(run_model_flexmock)
-    flexmock(ProjectEventModel).should_receive("get_or_create")
     flexmock(KojiBuildTargetModel).should_receive("create").with_args(
         build_id="1864700",
         commit_sha="0eb3e12005cb18f15d3054020f7ac934c01eae08",
@@ -875,9 +860,6 @@ def test_bodhi_update_for_not_configured_branch(koji_build_completed_old_format)
     flexmock(KojiBuildTargetModel).should_receive("get_by_task_id").with_args(
         task_id=79721403,
     ).and_return(None)
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        git_branch_model_flexmock,
-    )
     flexmock(PipelineModel).should_receive("create").and_return(run_model_flexmock)
     flexmock(KojiBuildTargetModel).should_receive("create").with_args(
         build_id="1864700",
@@ -1150,20 +1132,13 @@ def test_bodhi_update_from_sidetag(
     flexmock(group).should_receive("apply_async").once()
     flexmock(Signature).should_receive("apply_async").once()
 
-    flexmock(KojiBuildTagModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_koji_build_tag_event").with_args(
         task_id=str(task_id),
         koji_tag_name=sidetag_name,
-        target="f40",
         namespace="rpms",
         repo_name="python-specfile",
         project_url="https://src.fedoraproject.org/rpms/python-specfile",
-    ).and_return(flexmock(id=1, project_event_model_type="koji_build_tag"))
-
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type="koji_build_tag",
-        event_id=1,
-        commit_sha=None,
-    ).and_return(flexmock())
+    ).and_return((flexmock(id=1, project_event_model_type="koji_build_tag"), flexmock()))
 
     flexmock(LocalProject, refresh_the_arguments=lambda: None)
 
@@ -16,7 +16,6 @@ from packit_service.constants import (
     TASK_ACCEPTED,
 )
 from packit_service.models import (
-    GitBranchModel,
     ProjectEventModel,
     ProjectEventModelType,
 )
@@ -69,17 +68,13 @@ def mock_commit_comment_functionality(request):
         .should_receive("set_packages_config")
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="eea05dd6fab70d8c4afc10b58ef14ecb25e4f9d8",
-    ).and_return(db_project_event)
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="packit",
         project_url="https://github.com/packit/packit",
         repo_name="packit",
-    ).and_return(db_project_object)
+        commit_sha="eea05dd6fab70d8c4afc10b58ef14ecb25e4f9d8",
+    ).and_return((db_project_object, db_project_event))
     flexmock(LocalProject, refresh_the_arguments=lambda: None)
     flexmock(LocalProjectBuilder, _refresh_the_state=lambda *args: flexmock())
     flexmock(Allowlist, check_and_report=True)
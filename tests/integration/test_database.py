@@ -7,7 +7,7 @@ from pathlib import Path
 from boto3.s3.transfer import S3Transfer
 from flexmock import flexmock
 
-from packit_service.models import ProjectEventModel, SRPMBuildModel
+from packit_service.models import PackagesConfigModel, ProjectEventModel, SRPMBuildModel
 from packit_service.worker import database
 
 
@@ -27,6 +27,7 @@ def test_discard_old_package_configs():
     flexmock(ProjectEventModel).should_receive(
         "get_and_reset_older_than_with_packages_config",
     ).and_return([event_model1, event_model2]).once()
+    flexmock(PackagesConfigModel).should_receive("delete_unreferenced").and_return(1).once()
     database.discard_old_package_configs()
 
 
@@ -27,7 +27,6 @@ from packit.utils.repo import RepositoryCache
 from packit_service.config import ProjectToSync, ServiceConfig
 from packit_service.constants import DEFAULT_RETRY_LIMIT, SANDCASTLE_WORK_DIR
 from packit_service.models import (
-    GitBranchModel,
     GitProjectModel,
     KojiBuildGroupModel,
     KojiBuildTargetModel,
@@ -80,22 +79,21 @@ def test_sync_from_downstream():
         recursive=False,
     ).and_return(["buildah.spec", ".packit.yaml"])
 
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock(type=ProjectEventModelType.branch_push, event_id=9))
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
+        commit_sha="abcd",
     ).and_return(
-        flexmock(
-            id=9,
-            job_config_trigger_type=JobConfigTriggerType.commit,
-            project_event_model_type=ProjectEventModelType.branch_push,
-        ),
+        (
+            flexmock(
+                id=9,
+                job_config_trigger_type=JobConfigTriggerType.commit,
+                project_event_model_type=ProjectEventModelType.branch_push,
+            ),
+            flexmock(type=ProjectEventModelType.branch_push, event_id=9),
+        )
     )
 
     flexmock(ServiceConfig).should_receive("get_service_config").and_return(
@@ -166,22 +164,21 @@ def test_do_not_sync_from_downstream_on_a_different_branch():
         recursive=False,
     ).and_return(["buildah.spec", ".packit.yaml"])
 
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock(type=ProjectEventModelType.branch_push, event_id=9))
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
+        commit_sha="abcd",
     ).and_return(
-        flexmock(
-            id=9,
-            job_config_trigger_type=JobConfigTriggerType.commit,
-            project_event_model_type=ProjectEventModelType.branch_push,
-        ),
+        (
+            flexmock(
+                id=9,
+                job_config_trigger_type=JobConfigTriggerType.commit,
+                project_event_model_type=ProjectEventModelType.branch_push,
+            ),
+            flexmock(type=ProjectEventModelType.branch_push, event_id=9),
+        )
     )
 
     flexmock(ServiceConfig).should_receive("get_service_config").and_return(
@@ -254,17 +251,13 @@ def test_downstream_koji_build(sidetag_group):
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock(type=ProjectEventModelType.branch_push, event_id=9))
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
-    ).and_return(db_project_object)
+        commit_sha="abcd",
+    ).and_return((db_project_object, flexmock(type=ProjectEventModelType.branch_push, event_id=9)))
     flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
         db_project_event,
     )
@@ -333,7 +326,7 @@ def test_downstream_koji_build(sidetag_group):
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
+        "get_all_successful_or_in_progress_by_nvrs",
     ).and_return({koji_build})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
@@ -404,17 +397,13 @@ def test_downstream_koji_build_failure_no_issue():
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock(type=ProjectEventModelType.branch_push, event_id=9))
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
-    ).and_return(db_project_object)
+        commit_sha="abcd",
+    ).and_return((db_project_object, flexmock(type=ProjectEventModelType.branch_push, event_id=9)))
     flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
         db_project_event,
     )
@@ -438,7 +427,7 @@ def test_downstream_koji_build_failure_no_issue():
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
+        "get_all_successful_or_in_progress_by_nvrs",
     ).and_return({koji_build})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(id=1, grouped_targets=[koji_build]),
@@ -473,6 +462,98 @@ def test_downstream_koji_build_failure_no_issue():
         )
 
 
+def test_downstream_koji_build_retry_submits_failed_only():
+    packit_yaml = (
+        "{'specfile_path': 'buildah.spec',"
+        "'jobs': [{'trigger': 'commit', 'job': 'koji_build', 'allowed_committers': "
+        "['rhcontainerbot'], 'dist_git_branches': ['main', 'f41']}],"
+        "'downstream_package_name': 'buildah'}"
+    )
+    pagure_project_mock = flexmock(
+        PagureProject,
+        full_repo_name="rpms/buildah",
+        get_web_url=lambda: "https://src.fedoraproject.org/rpms/buildah",
+        default_branch="main",
+    )
+    flexmock(PagureProject).should_receive("get_pr").never()
+    pagure_project_mock.should_receive("get_files").with_args(
+        ref="main",
+        filter_regex=r".+\.spec$",
+    ).and_return(["buildah.spec"])
+    pagure_project_mock.should_receive("get_file_content").with_args(
+        path=".packit.yaml",
+        ref="main",
+        headers=dict,
+    ).and_return(packit_yaml)
+    pagure_project_mock.should_receive("get_files").with_args(
+        ref="main",
+        recursive=False,
+    ).and_return(["buildah.spec", ".packit.yaml"])
+
+    db_project_object = flexmock(
+        id=9,
+        job_config_trigger_type=JobConfigTriggerType.commit,
+        project_event_model_type=ProjectEventModelType.branch_push,
+    )
+    db_project_event = (
+        flexmock(type=ProjectEventModelType.branch_push, event_id=9)
+        .should_receive("get_project_event_object")
+        .and_return(db_project_object)
+        .mock()
+    )
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").and_return(
+        (db_project_object, db_project_event)
+    )
+
+    # submitted by the previous try, the submission of the other one failed
+    submitted_koji_build = flexmock(target="f41", status="pending", sidetag=None, nvr="f41-nvr")
+    submitted_koji_build.should_receive("set_status").never()
+    failed_koji_build = flexmock(
+        target="main",
+        status="retry",
+        sidetag=None,
+        nvr="main-nvr",
+        set_status=lambda x: None,
+        set_task_id=lambda x: None,
+        set_web_url=lambda x: None,
+        set_build_submission_stdout=lambda x: None,
+    )
+    flexmock(KojiBuildGroupModel).should_receive("create").never()
+    flexmock(KojiBuildGroupModel).should_receive("get_by_id").with_args(1).and_return(
+        flexmock(id=1, grouped_targets=[submitted_koji_build, failed_koji_build]),
+    )
+    flexmock(KojiBuildTargetModel).should_receive(
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({failed_koji_build})
+    flexmock(KojiHelper).should_receive("get_build_info").and_return(None)
+
+    flexmock(IsRunConditionSatisfied).should_receive("pre_check").and_return(True)
+
+    flexmock(Pushgateway).should_receive("push").and_return()
+    flexmock(LocalProjectBuilder, _refresh_the_state=lambda *args: None)
+    flexmock(group).should_receive("apply_async").once()
+    flexmock(PackitAPI).should_receive("build").with_args(
+        dist_git_branch="main",
+        scratch=False,
+        nowait=True,
+        from_upstream=False,
+        koji_target=None,
+    ).and_return("").once()
+
+    processing_results = SteveJobs().process_message(distgit_commit_event())
+    event_dict, _, job_config, package_config = get_parameters_from_results(
+        processing_results,
+    )
+    results = run_downstream_koji_build(
+        package_config=package_config,
+        event=event_dict,
+        job_config=job_config,
+        koji_group_model_id=1,
+    )
+
+    assert first_dict_value(results["job"])["success"]
+
+
 def test_downstream_koji_build_failure_issue_created():
     packit_yaml = (
         "{'specfile_path': 'buildah.spec',"
@@ -513,17 +594,13 @@ def test_downstream_koji_build_failure_issue_created():
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock(type=ProjectEventModelType.branch_push, event_id=9))
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
-    ).and_return(db_project_object)
+        commit_sha="abcd",
+    ).and_return((db_project_object, flexmock(type=ProjectEventModelType.branch_push, event_id=9)))
     flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
         db_project_event,
     )
@@ -550,7 +627,7 @@ def test_downstream_koji_build_failure_issue_created():
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
+        "get_all_successful_or_in_progress_by_nvrs",
     ).and_return({koji_build})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
@@ -630,17 +707,13 @@ def test_downstream_koji_build_failure_issue_comment():
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock(type=ProjectEventModelType.branch_push, event_id=9))
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
-    ).and_return(db_project_object)
+        commit_sha="abcd",
+    ).and_return((db_project_object, flexmock(type=ProjectEventModelType.branch_push, event_id=9)))
     flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
         db_project_event,
     )
@@ -665,7 +738,7 @@ def test_downstream_koji_build_failure_issue_comment():
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
+        "get_all_successful_or_in_progress_by_nvrs",
     ).and_return({koji_build})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
@@ -736,13 +809,6 @@ def test_downstream_koji_build_no_config():
     ).and_return(["buildah.spec", "Makefile"])
     flexmock(PackageConfigGetter).should_call("get_package_config_from_repo").once()
 
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
-        branch_name="main",
-        namespace="rpms",
-        repo_name="buildah",
-        project_url="https://src.fedoraproject.org/rpms/buildah",
-    ).and_return(flexmock(id=9, job_config_trigger_type=JobConfigTriggerType.commit))
-
     flexmock(ServiceConfig).should_receive("get_service_config").and_return(
         ServiceConfig(
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
@@ -829,17 +895,13 @@ def test_downstream_koji_build_where_multiple_branches_defined(jobs_config):
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock(type=ProjectEventModelType.branch_push, event_id=9))
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
-    ).and_return(db_project_object)
+        commit_sha="abcd",
+    ).and_return((db_project_object, flexmock(type=ProjectEventModelType.branch_push, event_id=9)))
     flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
         db_project_event,
     )
@@ -865,7 +927,7 @@ def test_downstream_koji_build_where_multiple_branches_defined(jobs_config):
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
+        "get_all_successful_or_in_progress_by_nvrs",
     ).and_return({koji_build})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
@@ -961,22 +1023,21 @@ def test_do_not_run_downstream_koji_build_for_a_different_branch(jobs_config):
         recursive=False,
     ).and_return(["buildah.spec", ".packit.yaml"])
 
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock(type=ProjectEventModelType.branch_push, event_id=9))
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
+        commit_sha="abcd",
     ).and_return(
-        flexmock(
-            id=9,
-            job_config_trigger_type=JobConfigTriggerType.commit,
-            project_event_model_type=ProjectEventModelType.branch_push,
-        ),
+        (
+            flexmock(
+                id=9,
+                job_config_trigger_type=JobConfigTriggerType.commit,
+                project_event_model_type=ProjectEventModelType.branch_push,
+            ),
+            flexmock(type=ProjectEventModelType.branch_push, event_id=9),
+        )
     )
 
     flexmock(Pushgateway).should_receive("push").times(1).and_return()
@@ -1014,18 +1075,6 @@ def test_precheck_koji_build_push(
             id=342,
         ),
     )
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
-        branch_name="f36",
-        namespace="rpms",
-        project_url="https://src.fedoraproject.org/rpms/packit",
-        repo_name="packit",
-    ).and_return(
-        flexmock(
-            id=13,
-            job_config_trigger_type=JobConfigTriggerType.commit,
-            project_event_model_type=ProjectEventModelType.branch_push,
-        ),
-    )
 
     # flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
     #     type=ProjectEventModel.pull_request, event_id=342
@@ -1077,18 +1126,6 @@ def test_precheck_koji_build_push_pr(
             id=342,
         ),
     )
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
-        branch_name="f36",
-        namespace="rpms",
-        project_url="https://src.fedoraproject.org/rpms/packit",
-        repo_name="packit",
-    ).and_return(
-        flexmock(
-            id=13,
-            job_config_trigger_type=JobConfigTriggerType.commit,
-            project_event_model_type=ProjectEventModelType.branch_push,
-        ),
-    )
 
     # flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
     #     type=ProjectEventModel.pull_request, event_id=342
@@ -23,7 +23,6 @@ from packit_service.models import (
     PipelineModel,
     ProjectEventModel,
     ProjectEventModelType,
-    PullRequestModel,
 )
 from packit_service.worker.handlers import distgit
 from packit_service.worker.jobs import SteveJobs
@@ -124,20 +123,13 @@ def test_downstream_koji_scratch_build(distgit_pr_event, target_branch, uid, che
     db_project_event = (
         flexmock().should_receive("get_project_event_object").and_return(db_project_object).mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock())
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=2,
         namespace="rpms",
         repo_name="optee_os",
         project_url="https://src.fedoraproject.org/rpms/optee_os",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
-    )
+        commit_sha="abcd",
+    ).and_return((db_project_object, db_project_event))
     flexmock(PipelineModel).should_receive("create")
 
     flexmock(utils).should_receive("get_eln_packages").and_return(["optee_os"] if eln else [])
@@ -17,10 +17,8 @@ from packit.config import (
 from packit_service.config import ServiceConfig
 from packit_service.constants import KOJI_PRODUCTION_BUILDS_ISSUE
 from packit_service.models import (
-    GitBranchModel,
     ProjectEventModel,
     ProjectEventModelType,
-    PullRequestModel,
 )
 from packit_service.worker.handlers import (
     CoprBuildHandler,
@@ -89,17 +87,13 @@ def test_precheck(github_pr_event):
     db_project_event = (
         flexmock().should_receive("get_project_event_object").and_return(db_project_object).mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=342,
-        commit_sha="528b803be6f93e19ca4130bf4976f2800a3004c4",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=342,
         namespace="packit-service",
         repo_name="packit",
         project_url="https://github.com/packit-service/packit",
-    ).and_return(db_project_object)
+        commit_sha="528b803be6f93e19ca4130bf4976f2800a3004c4",
+    ).and_return((db_project_object, db_project_event))
 
     package_config = PackageConfig(
         jobs=[
@@ -138,17 +132,13 @@ def test_precheck_gitlab(gitlab_mr_event):
     db_project_event = (
         flexmock().should_receive("get_project_event_object").and_return(db_project_object).mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=1,
-        commit_sha="1f6a716aa7a618a9ffe56970d77177d99d100022",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=1,
         namespace="testing/packit",
         repo_name="hello-there",
         project_url="https://gitlab.com/testing/packit/hello-there",
-    ).and_return(db_project_object)
+        commit_sha="1f6a716aa7a618a9ffe56970d77177d99d100022",
+    ).and_return((db_project_object, db_project_event))
     package_config = PackageConfig(
         jobs=[
             JobConfig(
@@ -193,13 +183,8 @@ def test_precheck_push(github_push_event):
     db_project_event = (
         flexmock().should_receive("get_project_event_object").and_return(db_project_object).mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=1,
-        commit_sha="04885ff850b0fa0e206cd09db73565703d48f99b",
-    ).and_return(db_project_event)
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        db_project_object,
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").and_return(
+        (db_project_object, db_project_event)
     )
     jc = JobConfig(
         type=JobType.copr_build,
@@ -246,13 +231,8 @@ def test_precheck_push_to_a_different_branch(github_push_event):
     db_project_event = (
         flexmock().should_receive("get_project_event_object").and_return(db_project_object).mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=1,
-        commit_sha="04885ff850b0fa0e206cd09db73565703d48f99b",
-    ).and_return(db_project_event)
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        db_project_object,
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").and_return(
+        (db_project_object, db_project_event)
     )
 
     package_config = PackageConfig(
@@ -283,10 +263,6 @@ def test_precheck_push_to_a_different_branch(github_push_event):
 
 
 def test_precheck_push_actor_check(github_push_event):
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        flexmock(id=1, job_config_trigger_type=JobConfigTriggerType.commit),
-    )
-
     package_config = PackageConfig(
         packages={"package": {}},
         jobs=[
@@ -323,17 +299,13 @@ def test_precheck_koji_build_non_scratch(github_pr_event):
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=342,
         namespace="packit-service",
         repo_name="packit",
         project_url="https://github.com/packit-service/packit",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=342,
         commit_sha="528b803be6f93e19ca4130bf4976f2800a3004c4",
-    ).and_return(db_project_event)
+    ).and_return((db_project_object, db_project_event))
     flexmock(StatusReporterGithubChecks).should_receive("set_status").with_args(
         state=BaseCommitStatus.neutral,
         description="Non-scratch builds not possible from upstream.",
@@ -3,6 +3,7 @@
 
 import json
 import shutil
+from contextlib import nullcontext
 from datetime import datetime
 
 import pytest
@@ -26,7 +27,6 @@ from packit_service.events import github, gitlab
 from packit_service.models import (
     BodhiUpdateGroupModel,
     BodhiUpdateTargetModel,
-    IssueModel,
     KojiBuildGroupModel,
     KojiBuildTargetModel,
     PipelineModel,
@@ -272,12 +272,9 @@ def test_issue_comment_propose_downstream_handler(
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.issue,
-        event_id=123,
-        commit_sha=None,
-    ).and_return(db_project_event)
-    flexmock(IssueModel).should_receive("get_or_create").and_return(db_project_object)
+    flexmock(ProjectEventModel).should_receive("add_issue_event").and_return(
+        (db_project_object, db_project_event)
+    )
 
     run_model = flexmock(PipelineModel)
     propose_downstream_model = flexmock(sync_release_targets=[])
@@ -417,9 +414,8 @@ def mock_repository_issue_retriggering():
         .mock()
     )
 
-    flexmock(IssueModel).should_receive("get_or_create").and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
+    flexmock(ProjectEventModel).should_receive("add_issue_event").and_return(
+        (db_project_object, db_project_event)
     )
     flexmock(PipelineModel).should_receive("create")
 
@@ -455,11 +451,8 @@ def mock_repository_issue_retriggering():
 
     flexmock(KojiBuildTargetModel).should_receive("create")
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).with_args(nvr_f37).and_return({koji_build_f37})
-    flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
-    ).with_args(nvr_f38).and_return({koji_build_f38})
+        "get_all_successful_or_in_progress_by_nvrs",
+    ).and_return({koji_build_f37, koji_build_f38})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build_f38, koji_build_f37]),
     )
@@ -633,6 +626,9 @@ def test_issue_comment_retrigger_koji_build_handler(
     flexmock(RetriggerDownstreamKojiBuildHandler).should_receive(
         "packit_api",
     ).and_return(packit_api)
+    flexmock(RetriggerDownstreamKojiBuildHandler).should_receive(
+        "get_packit_apis_for_branches",
+    ).with_args(["f38", "f37"]).and_return(nullcontext({"f37": packit_api, "f38": packit_api}))
     flexmock(RetriggerDownstreamKojiBuildHandler).should_receive(
         "local_project",
     ).and_return(flexmock())
@@ -684,6 +680,9 @@ def test_issue_comment_retrigger_koji_build_error_msg(
     flexmock(RetriggerDownstreamKojiBuildHandler).should_receive(
         "packit_api",
     ).and_return(packit_api)
+    flexmock(RetriggerDownstreamKojiBuildHandler).should_receive(
+        "get_packit_apis_for_branches",
+    ).with_args(["f38", "f37"]).and_return(nullcontext({"f37": packit_api, "f38": packit_api}))
     msg = (
         "Packit failed on creating Koji build in dist-git (an url):"
         "\n\n<table><tr>"
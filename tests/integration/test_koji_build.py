@@ -14,7 +14,6 @@ from packit.utils.koji_helper import KojiHelper
 
 from packit_service.events import pagure
 from packit_service.models import (
-    GitBranchModel,
     KojiBuildGroupModel,
     KojiBuildTargetModel,
     PipelineModel,
@@ -67,13 +66,6 @@ def test_downstream_koji_build_report_known_build(koji_build_fixture, request):
         recursive=False,
     ).and_return(["python-ogr.spec", ".packit.yaml"])
 
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
-        branch_name="main",
-        namespace="rpms",
-        repo_name="python-ogr",
-        project_url="https://src.fedoraproject.org/rpms/python-ogr",
-    ).and_return(flexmock(id=9, job_config_trigger_type=JobConfigTriggerType.commit))
-
     # 1*KojiBuildReportHandler
     flexmock(group).should_receive("apply_async").once()
     flexmock(Pushgateway).should_receive("push").times(2).and_return()
@@ -161,11 +153,8 @@ def test_koji_build_error_msg(distgit_push_packit):
     flexmock(pagure.push.Commit).should_receive("db_project_object").and_return(
         db_project_object,
     )
-    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
-        db_project_object,
-    )
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").and_return(
+        (db_project_object, db_project_event)
     )
     flexmock(PipelineModel).should_receive("create")
 
@@ -186,7 +175,7 @@ def test_koji_build_error_msg(distgit_push_packit):
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
+        "get_all_successful_or_in_progress_by_nvrs",
     ).and_return({koji_build})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
@@ -19,13 +19,11 @@ from packit_service import utils as service_utils
 from packit_service.config import FedoraCISettings, ServiceConfig
 from packit_service.constants import SANDCASTLE_WORK_DIR
 from packit_service.models import (
-    GitBranchModel,
     KojiBuildGroupModel,
     KojiBuildTargetModel,
     PipelineModel,
     ProjectEventModel,
     ProjectEventModelType,
-    PullRequestModel,
 )
 from packit_service.worker.checker.run_condition import IsRunConditionSatisfied
 from packit_service.worker.handlers import distgit as distgit_handlers
@@ -86,6 +84,7 @@ def mock_distgit_pr_functionality():
             ),
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
+            repository_mirrors_path=None,
             add_repositories_to_repository_cache=False,
             deployment=Deployment.stg,
         )
@@ -108,20 +107,13 @@ def mock_distgit_pr_functionality():
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock())
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=2,
         namespace="rpms",
         repo_name="optee_os",
         project_url="https://src.fedoraproject.org/rpms/optee_os",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
-    )
+        commit_sha="889f07af35d27bbcaf9c535c17a63b974aa42ee3",
+    ).and_return((db_project_object, db_project_event))
 
     # Infrastructure no-ops
     flexmock(PipelineModel).should_receive("create")
@@ -350,20 +342,13 @@ def test_downstream_koji_build_cancel_running(monkeypatch):
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock())
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
-    )
+        commit_sha="abcd",
+    ).and_return((db_project_object, db_project_event))
 
     # Infrastructure no-ops
     flexmock(PipelineModel).should_receive("create")
@@ -463,20 +448,13 @@ def test_downstream_koji_build_cancel_uses_event_based_filtering(monkeypatch):
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock())
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="main",
         namespace="rpms",
         repo_name="buildah",
         project_url="https://src.fedoraproject.org/rpms/buildah",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
-    )
+        commit_sha="abcd",
+    ).and_return((db_project_object, db_project_event))
 
     # Infrastructure no-ops
     flexmock(PipelineModel).should_receive("create")
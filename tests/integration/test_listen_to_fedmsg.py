@@ -43,7 +43,6 @@ from packit_service.models import (
     ProjectEventModel,
     ProjectEventModelType,
     ProjectReleaseModel,
-    PullRequestModel,
     SidetagModel,
     SRPMBuildModel,
     TestingFarmResult,
@@ -3375,6 +3374,7 @@ def test_pagure_pr_updated(pagure_pr_updated, project_namespace, project_repo):
             koji_web_url="",
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
+            repository_mirrors_path=None,
             add_repositories_to_repository_cache=False,
             deployment=Deployment.stg,
             testing_farm_secret="secret token",
@@ -3397,20 +3397,13 @@ def test_pagure_pr_updated(pagure_pr_updated, project_namespace, project_repo):
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock())
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=32,
         namespace=project_namespace,
         repo_name=project_repo,
         project_url=f"https://src.fedoraproject.org/{project_namespace}/{project_repo}",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
-    )
+        commit_sha="f2f041328d629719c5ff31a08e800638d5df497f",
+    ).and_return((db_project_object, db_project_event))
 
     pipeline = flexmock()
     flexmock(PipelineModel).should_receive("create").and_return(pipeline)
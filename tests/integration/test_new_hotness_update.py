@@ -23,7 +23,6 @@ from packit_service.models import (
     PipelineModel,
     ProjectEventModel,
     ProjectEventModelType,
-    ProjectReleaseModel,
     SyncReleaseJobType,
     SyncReleaseModel,
     SyncReleasePullRequestModel,
@@ -82,18 +81,13 @@ def sync_release_model():
     release_event = (
         flexmock().should_receive("get_project_event_object").and_return(release_db_object).mock()
     )
-    flexmock(ProjectReleaseModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_release_event").with_args(
         tag_name="7.0.3",
         namespace="packit-service",
         repo_name="hello-world",
         project_url="https://github.com/packit-service/hello-world",
         commit_hash=None,
-    ).and_return(release_db_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.release,
-        event_id=13,
-        commit_sha=None,
-    ).and_return(release_event)
+    ).and_return((release_db_object, release_event))
 
     run_model = flexmock(PipelineModel)
     sync_release_model = flexmock(id=123, sync_release_targets=[])
@@ -204,17 +204,13 @@ def mock_pr_comment_functionality(request):
         .should_receive("set_packages_config")
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="12345",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=9,
         namespace="packit-service",
         repo_name="hello-world",
         project_url="https://github.com/packit-service/hello-world",
-    ).and_return(db_project_object)
+        commit_sha="12345",
+    ).and_return((db_project_object, db_project_event))
     flexmock(LocalProject, refresh_the_arguments=lambda: None)
     flexmock(LocalProjectBuilder, _refresh_the_state=lambda *args: flexmock())
     flexmock(Allowlist, check_and_report=True)
@@ -537,17 +533,13 @@ def test_pr_comment_production_build_handler(pr_production_build_comment_event):
     flexmock(LocalProject, refresh_the_arguments=lambda: None)
     flexmock(Allowlist, check_and_report=True)
 
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="12345",
-    ).and_return(project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=9,
         namespace="packit-service",
         repo_name="hello-world",
         project_url="https://github.com/packit-service/hello-world",
-    ).and_return(db_project_object)
+        commit_sha="12345",
+    ).and_return((db_project_object, project_event))
     flexmock(KojiBuildJobHelper).should_receive("run_koji_build").and_return(
         TaskResults(success=True, details={}),
     )
@@ -1660,7 +1652,7 @@ def test_pr_test_command_handler_not_allowed_external_contributor_on_internal_TF
         },
     ]
     packit_yaml = "{'specfile_path': 'the-specfile.spec', 'jobs': " + str(jobs) + "}"
-    db_project_object, _ = add_pull_request_event_with_pr_id_9
+    db_project_object, db_project_event = add_pull_request_event_with_pr_id_9
     pr = flexmock(head_commit="12345")
     flexmock(GithubProject).should_receive("get_pr").and_return(pr)
     comment = flexmock()
@@ -1678,12 +1670,13 @@ def test_pr_test_command_handler_not_allowed_external_contributor_on_internal_TF
 
     flexmock(LocalProject, refresh_the_arguments=lambda: None)
     flexmock(Allowlist, check_and_report=True)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=9,
         namespace="packit-service",
         repo_name="hello-world",
         project_url="https://github.com/packit-service/hello-world",
-    ).and_return(db_project_object).times(5)
+        commit_sha="12345",
+    ).and_return((db_project_object, db_project_event)).times(5)
     pr_embedded_command_comment_event["comment"]["body"] = "/packit test"
     flexmock(
         GithubProject,
@@ -1709,7 +1702,7 @@ def test_pr_build_command_handler_not_allowed_external_contributor_on_internal_T
     add_pull_request_event_with_pr_id_9,
     pr_embedded_command_comment_event,
 ):
-    db_project_object, _ = add_pull_request_event_with_pr_id_9
+    db_project_object, db_project_event = add_pull_request_event_with_pr_id_9
     jobs = [
         {
             "trigger": "pull_request",
@@ -1740,12 +1733,13 @@ def test_pr_build_command_handler_not_allowed_external_contributor_on_internal_T
 
     flexmock(LocalProject, refresh_the_arguments=lambda: None)
     flexmock(Allowlist, check_and_report=True)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=9,
         namespace="packit-service",
         repo_name="hello-world",
         project_url="https://github.com/packit-service/hello-world",
-    ).and_return(db_project_object).times(8)
+        commit_sha="12345",
+    ).and_return((db_project_object, db_project_event)).times(8)
     pr_embedded_command_comment_event["comment"]["body"] = "/packit build"
     flexmock(
         GithubProject,
@@ -1860,17 +1854,13 @@ def test_retest_failed(
         .should_receive("set_packages_config")
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="12345",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=9,
         namespace="packit-service",
         repo_name="hello-world",
         project_url="https://github.com/packit-service/hello-world",
-    ).and_return(db_project_object)
+        commit_sha="12345",
+    ).and_return((db_project_object, db_project_event))
     run_model = flexmock()
     flexmock(PipelineModel).should_receive("create").and_return(run_model)
     flexmock(TFTTestRunGroupModel).should_receive("create").with_args(
@@ -2092,14 +2082,6 @@ def test_invalid_packit_command_with_config(
     mock_pr_comment_functionality,
     pr_embedded_command_comment_event,
 ):
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
-        pr_id=9,
-        namespace="packit-service",
-        repo_name="hello-world",
-        project_url="https://github.com/packit-service/hello-world",
-    ).and_return(
-        flexmock(id=9, job_config_trigger_type=JobConfigTriggerType.pull_request),
-    )
     ServiceConfig.get_service_config().comment_command_prefix = "/packit"
     pr_embedded_command_comment_event["comment"]["body"] = "/packit i-hate-testing-with-flexmock"
     flexmock(
@@ -2507,7 +2489,7 @@ def test_koji_build_retrigger_via_dist_git_pr_comment(pagure_pr_comment_added):
 
     flexmock(KojiBuildTargetModel).should_receive("create").and_return(koji_build)
     flexmock(KojiBuildTargetModel).should_receive(
-        "get_all_successful_or_in_progress_by_nvr",
+        "get_all_successful_or_in_progress_by_nvrs",
     ).and_return({koji_build})
     flexmock(KojiBuildGroupModel).should_receive("create").and_return(
         flexmock(grouped_targets=[koji_build]),
@@ -2524,17 +2506,13 @@ def test_koji_build_retrigger_via_dist_git_pr_comment(pagure_pr_comment_added):
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=12,
-        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=pagure_pr_comment_added["pullrequest"]["id"],
         namespace=pagure_pr_comment_added["pullrequest"]["project"]["namespace"],
         repo_name=pagure_pr_comment_added["pullrequest"]["project"]["name"],
         project_url=pagure_pr_comment_added["pullrequest"]["project"]["full_url"],
-    ).and_return(db_project_object)
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).and_return((db_project_object, db_project_event))
 
     pr_mock = (
         flexmock(target_branch="the_distgit_branch")
@@ -2658,6 +2636,7 @@ def test_downstream_koji_scratch_build_retrigger_via_dist_git_pr_comment(
             ),
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
+            repository_mirrors_path=None,
             add_repositories_to_repository_cache=False,
             deployment=Deployment.stg,
             comment_command_prefix="/packit",
@@ -2683,20 +2662,13 @@ def test_downstream_koji_scratch_build_retrigger_via_dist_git_pr_comment(
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock())
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=36,
         namespace="rpms",
         repo_name="python-teamcity-messages",
         project_url="https://src.fedoraproject.org/rpms/python-teamcity-messages",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
-    )
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).and_return((db_project_object, db_project_event))
     flexmock(PipelineModel).should_receive("create")
 
     koji_build = flexmock(
@@ -3057,17 +3029,13 @@ def test_pull_from_upstream_retrigger_via_dist_git_pr_comment(pagure_pr_comment_
         .mock()
     )
     run_model = flexmock(PipelineModel)
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=12,
-        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=pagure_pr_comment_added["pullrequest"]["id"],
         namespace=pagure_pr_comment_added["pullrequest"]["project"]["namespace"],
         repo_name=pagure_pr_comment_added["pullrequest"]["project"]["name"],
         project_url=pagure_pr_comment_added["pullrequest"]["project"]["full_url"],
-    ).and_return(db_project_object)
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).and_return((db_project_object, db_project_event))
     sync_release_model = flexmock(id=123, sync_release_targets=[])
     flexmock(SyncReleaseModel).should_receive("create_with_new_run").with_args(
         status=SyncReleaseStatus.running,
@@ -3230,17 +3198,13 @@ def test_pull_from_upstream_retrigger_via_dist_git_pr_comment_non_git(
         .mock()
     )
     run_model = flexmock(PipelineModel)
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=12,
-        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=pagure_pr_comment_added["pullrequest"]["id"],
         namespace=pagure_pr_comment_added["pullrequest"]["project"]["namespace"],
         repo_name=pagure_pr_comment_added["pullrequest"]["project"]["name"],
         project_url=pagure_pr_comment_added["pullrequest"]["project"]["full_url"],
-    ).and_return(db_project_object)
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).and_return((db_project_object, db_project_event))
     sync_release_model = flexmock(id=123, sync_release_targets=[])
     flexmock(SyncReleaseModel).should_receive("create_with_new_run").with_args(
         status=SyncReleaseStatus.running,
@@ -3429,17 +3393,13 @@ def _run_pull_from_upstream_with_version(
         .mock()
     )
     run_model = flexmock(PipelineModel)
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=12,
-        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=pagure_pr_comment_added["pullrequest"]["id"],
         namespace=pagure_pr_comment_added["pullrequest"]["project"]["namespace"],
         repo_name=pagure_pr_comment_added["pullrequest"]["project"]["name"],
         project_url=pagure_pr_comment_added["pullrequest"]["project"]["full_url"],
-    ).and_return(db_project_object)
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).and_return((db_project_object, db_project_event))
     sync_release_model = flexmock(id=123, sync_release_targets=[])
     flexmock(SyncReleaseModel).should_receive("create_with_new_run").with_args(
         status=SyncReleaseStatus.running,
@@ -3581,17 +3541,13 @@ def test_koji_build_tag_via_dist_git_pr_comment(pagure_pr_comment_added, all_bra
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=12,
-        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=pagure_pr_comment_added["pullrequest"]["id"],
         namespace=pagure_pr_comment_added["pullrequest"]["project"]["namespace"],
         repo_name=pagure_pr_comment_added["pullrequest"]["project"]["name"],
         project_url=pagure_pr_comment_added["pullrequest"]["project"]["full_url"],
-    ).and_return(db_project_object)
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).and_return((db_project_object, db_project_event))
 
     pr_mock = (
         flexmock(target_branch="f40")
@@ -3751,6 +3707,7 @@ def _test_downstream_tf_retrigger_common(
             ),
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
+            repository_mirrors_path=None,
             add_repositories_to_repository_cache=False,
             deployment=Deployment.stg,
             comment_command_prefix="/packit",
@@ -3778,20 +3735,13 @@ def _test_downstream_tf_retrigger_common(
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock())
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=36,
         namespace="rpms",
         repo_name="python-teamcity-messages",
         project_url="https://src.fedoraproject.org/rpms/python-teamcity-messages",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
-    )
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).and_return((db_project_object, db_project_event))
 
     run = flexmock(test_run_group=None)
     koji_build = flexmock(
@@ -4029,6 +3979,7 @@ def test_downstream_testing_farm_retrigger_rawhide_pr_eln_package_fedora_ci(
             ),
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
+            repository_mirrors_path=None,
             add_repositories_to_repository_cache=False,
             deployment=Deployment.stg,
             comment_command_prefix="/packit",
@@ -4056,20 +4007,13 @@ def test_downstream_testing_farm_retrigger_rawhide_pr_eln_package_fedora_ci(
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock())
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=36,
         namespace="rpms",
         repo_name="python-teamcity-messages",
         project_url="https://src.fedoraproject.org/rpms/python-teamcity-messages",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
-    )
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).and_return((db_project_object, db_project_event))
 
     run = flexmock(test_run_group=None)
     koji_build = flexmock(
@@ -4216,6 +4160,7 @@ def test_downstream_build_retrigger_rawhide_pr_eln_package_fedora_ci(
             ),
             command_handler_work_dir=SANDCASTLE_WORK_DIR,
             repository_cache="/tmp/repository-cache",
+            repository_mirrors_path=None,
             add_repositories_to_repository_cache=False,
             deployment=Deployment.stg,
             comment_command_prefix="/packit",
@@ -4245,20 +4190,13 @@ def test_downstream_build_retrigger_rawhide_pr_eln_package_fedora_ci(
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=9,
-        commit_sha="abcd",
-    ).and_return(flexmock())
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=36,
         namespace="rpms",
         repo_name="python-teamcity-messages",
         project_url="https://src.fedoraproject.org/rpms/python-teamcity-messages",
-    ).and_return(db_project_object)
-    flexmock(ProjectEventModel).should_receive("get_or_create").and_return(
-        db_project_event,
-    )
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).and_return((db_project_object, db_project_event))
     flexmock(PipelineModel).should_receive("create")
 
     flexmock(utils).should_receive("get_eln_packages").and_return(["python-teamcity-messages"])
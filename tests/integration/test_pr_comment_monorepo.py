@@ -19,7 +19,6 @@ from packit_service.constants import (
 from packit_service.models import (
     ProjectEventModel,
     ProjectEventModelType,
-    PullRequestModel,
 )
 from packit_service.worker.allowlist import Allowlist
 from packit_service.worker.helpers.build.copr_build import CoprBuildJobHelper
@@ -72,17 +71,13 @@ def mock_pr_comment_monorepo_functionality(request):
         .should_receive("set_packages_config")
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=1418,
-        commit_sha="12345",
-    ).and_return(db_project_event)
-    flexmock(PullRequestModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").with_args(
         pr_id=1418,
         namespace="packit",
         repo_name="hello-world",
         project_url="https://github.com/packit/hello-world",
-    ).and_return(db_project_object)
+        commit_sha="12345",
+    ).and_return((db_project_object, db_project_event))
     flexmock(LocalProject, refresh_the_arguments=lambda: None)
     flexmock(LocalProjectBuilder, _refresh_the_state=lambda *args: flexmock())
     flexmock(Allowlist, check_and_report=True)
@@ -25,7 +25,6 @@ from packit_service.models import (
     PipelineModel,
     ProjectEventModel,
     ProjectEventModelType,
-    ProjectReleaseModel,
     SyncReleaseJobType,
     SyncReleaseModel,
     SyncReleasePullRequestModel,
@@ -72,18 +71,13 @@ def propose_downstream_model(sync_release_pr_model):
         .mock()
     )
     run_model = flexmock(PipelineModel)
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.release,
-        event_id=12,
-        commit_sha="123456",
-    ).and_return(db_project_event)
-    flexmock(ProjectReleaseModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_release_event").with_args(
         tag_name="0.3.0",
         namespace="packit-service",
         repo_name="hello-world",
         project_url="https://github.com/packit-service/hello-world",
         commit_hash="123456",
-    ).and_return(db_project_object).twice()
+    ).twice().and_return((db_project_object, db_project_event))
     propose_downstream_model = flexmock(id=123, sync_release_targets=[])
     flexmock(SyncReleaseModel).should_receive("create_with_new_run").with_args(
         status=SyncReleaseStatus.running,
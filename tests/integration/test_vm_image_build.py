@@ -15,7 +15,6 @@ from packit_service.models import (
     PipelineModel,
     ProjectEventModel,
     ProjectEventModelType,
-    PullRequestModel,
     VMImageBuildTargetModel,
 )
 from packit_service.worker.allowlist import Allowlist
@@ -76,18 +75,16 @@ def test_vm_image_build(github_vm_image_build_comment):
         recursive=False,
     ).and_return(["packit.spec", ".packit.yaml"])
 
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=1,
-        commit_sha="123456",
-    ).and_return(flexmock(type=ProjectEventModelType.pull_request, event_id=1))
-    flexmock(PullRequestModel).should_receive("get_or_create").and_return(
-        flexmock(
-            job_config_trigger_type=JobConfigTriggerType.pull_request,
-            project_event_model_type=ProjectEventModelType.pull_request,
-            id=1,
-            commit_sha="123456",
-        ),
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").and_return(
+        (
+            flexmock(
+                job_config_trigger_type=JobConfigTriggerType.pull_request,
+                project_event_model_type=ProjectEventModelType.pull_request,
+                id=1,
+                commit_sha="123456",
+            ),
+            flexmock(type=ProjectEventModelType.pull_request, event_id=1),
+        )
     )
     flexmock(Allowlist).should_receive("check_and_report").and_return(True)
 
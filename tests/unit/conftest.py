@@ -20,7 +20,6 @@ from packit_service.models import (
     LogDetectiveRunModel,
     ProjectEventModel,
     ProjectEventModelType,
-    PullRequestModel,
 )
 from packit_service.utils import get_comment_parser, get_comment_parser_fedora_ci
 
@@ -132,9 +131,6 @@ def add_pull_request_event_with_empty_sha():
         project_event_model_type=ProjectEventModelType.pull_request,
         commit_sha="",
     )
-    flexmock(PullRequestModel).should_receive("get_or_create").and_return(
-        db_project_object,
-    )
     db_project_event = (
         flexmock(id=2, type=ProjectEventModelType.pull_request, commit_sha="")
         .should_receive("get_project_event_object")
@@ -142,11 +138,9 @@ def add_pull_request_event_with_empty_sha():
         .mock()
     )
 
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=123,
-        commit_sha="",
-    ).and_return(db_project_event)
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").and_return(
+        (db_project_object, db_project_event),
+    )
     yield db_project_object, db_project_event
 
 
@@ -791,18 +791,14 @@ def test_parse_commit_comment_commit(commit_comment):
         "stable",
     ).and_return([commit_sha])
 
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.branch_push,
-        event_id=123,
-        commit_sha=commit_sha,
-    ).and_return(flexmock())
-    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_branch_push_event").with_args(
         branch_name="stable",
         namespace="packit",
         project_url="https://github.com/packit/packit",
         repo_name="packit",
+        commit_sha=commit_sha,
     ).and_return(
-        flexmock(project_event_model_type=ProjectEventModelType.branch_push, id=123),
+        (flexmock(project_event_model_type=ProjectEventModelType.branch_push, id=123), flexmock())
     )
 
     assert event_object.packages_config
@@ -842,19 +838,14 @@ def test_parse_commit_comment_release(commit_comment):
         flexmock(git_tag=flexmock(commit_sha=commit_sha)),
     )
 
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.release,
-        event_id=123,
-        commit_sha=commit_sha,
-    ).and_return(flexmock())
-    flexmock(ProjectReleaseModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_release_event").with_args(
         tag_name="1.0.0",
         namespace="packit",
         repo_name="packit",
         project_url="https://github.com/packit/packit",
         commit_hash=commit_sha,
     ).and_return(
-        flexmock(project_event_model_type=ProjectEventModelType.release, id=123),
+        (flexmock(project_event_model_type=ProjectEventModelType.release, id=123), flexmock())
     )
 
     assert event_object.packages_config
@@ -16,7 +16,6 @@ from packit_service.events.gitlab import (
     push,
     release,
 )
-from packit_service.models import PullRequestModel
 from packit_service.package_config_getter import PackageConfigGetter
 from packit_service.worker.parser import Parser
 from tests.spellbook import DATA_DIR
@@ -361,7 +360,6 @@ def test_parse_gitlab_pipeline(gitlab_mr_pipeline):
         == "https://gitlab.com/redhat/centos-stream/rpms/luksmeta/-/merge_requests/4"
     )
 
-    flexmock(PullRequestModel).should_receive("get_or_create").and_return(flexmock())
     # assert event_object.db_project_object
     assert isinstance(event_object.project, GitlabProject)
     assert event_object.project.full_repo_name == "redhat/centos-stream/rpms/luksmeta"
@@ -43,6 +43,12 @@ from packit_service.worker.reporting import BaseCommitStatus, StatusReporter
 EXPECTED_TESTING_FARM_CHECK_NAME = "testing-farm:fedora-rawhide-x86_64"
 
 
+@pytest.fixture(autouse=True)
+def invalidate_allowlist_cache():
+    yield
+    DBAllowlist.invalidate_cache()
+
+
 @pytest.fixture()
 def allowlist():
     return Allowlist(service_config=ServiceConfig.get_service_config())
@@ -112,14 +118,10 @@ def allowlist_entries():
 
 
 def mock_model(entries, namespaces):
-    for queried_namespace in namespaces:
-        (
-            flexmock(DBAllowlist)
-            .should_receive("get_namespace")
-            .with_args(queried_namespace)
-            .and_return(entries.get(queried_namespace))
-            .ordered()
-        )
+    DBAllowlist.invalidate_cache()
+    flexmock(DBAllowlist).should_receive("get_all").and_return(
+        [entries[namespace] for namespace in namespaces if entries.get(namespace)],
+    )
 
 
 @pytest.fixture()
@@ -10,11 +10,25 @@ from packit_service.constants import (
     RATE_LIMIT_THRESHOLD,
     RATE_LIMITED_QUEUE_EXPIRES_SECONDS,
 )
+from packit_service.worker.handlers import abstract
 from packit_service.worker.handlers.abstract import (
     JobHandler,
     RateLimitRequeueException,
     TaskName,
 )
+from packit_service.worker.helpers.rate_limit import RateLimitBudget, RateLimitSnapshot
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_budgets():
+    """Fixture that keeps the rate limit budgets out of Redis"""
+    budgets = flexmock(abstract.rate_limit_budgets)
+    budgets.should_receive("observe")
+    budgets.should_receive("get").and_return(None)
+    budgets.should_receive("update").and_return(None)
+    budgets.should_receive("acquire").and_return(0)
+    budgets.should_receive("get_key").and_return("https://github.com:test")
+    return budgets
 
 
 @pytest.fixture
@@ -180,3 +194,73 @@ def test_check_rate_limit_remaining_project_exception(
 
     # Should return without raising
     handler.check_rate_limit_remaining()
+
+
+def test_check_rate_limit_remaining_from_budget(handler, rate_limit_budgets, monkeypatch):
+    """Test that the shared budget is used instead of asking the service"""
+    mock_service = flexmock()
+    mock_service.should_receive("get_rate_limit_remaining").never()
+    handler._project = flexmock(service=mock_service, namespace="test", repo="repo")
+    rate_limit_budgets.should_receive("get").and_return(
+        RateLimitBudget(
+            remaining=RATE_LIMIT_THRESHOLD + 100,
+            limit=5000,
+            reset=2000.0,
+            updated=1000.0,
+            window_remaining=5000,
+        ),
+    )
+
+    mock_request = flexmock(kwargs={}, delivery_info={"routing_key": "short-running"})
+    mock_app = flexmock(
+        current_worker_task=flexmock(name=TaskName.copr_build, request=mock_request)
+    )
+    monkeypatch.setattr("packit_service.celerizer.celery_app", mock_app)
+    flexmock(abstract).should_receive("signature").never()
+
+    # Should return without raising
+    handler.check_rate_limit_remaining()
+
+
+def test_check_rate_limit_remaining_paced(handler, rate_limit_budgets, monkeypatch):
+    """Test that the task is delayed when the budget would be exhausted before the reset"""
+    mock_service = flexmock(
+        get_rate_limit_remaining=lambda namespace=None, repo=None: RATE_LIMIT_THRESHOLD + 100
+    )
+    handler._project = flexmock(service=mock_service, namespace="test", repo="repo")
+    rate_limit_budgets.should_receive("acquire").and_return(42.0).once()
+
+    mock_request = flexmock(kwargs={"event": {}}, delivery_info={"routing_key": "short-running"})
+    mock_app = flexmock(
+        current_worker_task=flexmock(name=TaskName.copr_build, request=mock_request)
+    )
+    monkeypatch.setattr("packit_service.celerizer.celery_app", mock_app)
+
+    mock_sig = flexmock()
+    flexmock(abstract).should_receive("signature").and_return(mock_sig).once()
+    mock_sig.should_receive("apply_async").with_args(
+        queue=CELERY_TASK_RATE_LIMITED_QUEUE,
+        expires=42.0 + RATE_LIMITED_QUEUE_EXPIRES_SECONDS,
+        countdown=42.0,
+    ).once()
+
+    with pytest.raises(RateLimitRequeueException):
+        handler.check_rate_limit_remaining()
+
+
+def test_update_rate_limit_budget(handler, rate_limit_budgets):
+    """Test that the budget is updated by the rate limit seen by the task"""
+    handler._rate_limit_project = project = flexmock()
+    snapshot = RateLimitSnapshot(remaining=4000, limit=5000, reset=2000.0, observed=1000.0)
+    budget = flexmock(time_to_exhaustion=600.0)
+    rate_limit_budgets.should_receive("get_snapshot").with_args(project).and_return(snapshot)
+    rate_limit_budgets.should_receive("update").with_args(project, snapshot).and_return(
+        budget
+    ).once()
+    gauge = flexmock()
+    gauge.should_receive("set").with_args(600.0).once()
+    handler.pushgateway = flexmock(
+        rate_limit_time_to_exhaustion=flexmock(labels=lambda budget: gauge)
+    )
+
+    handler.update_rate_limit_budget()
@@ -4,6 +4,7 @@
 import pytest
 from flexmock import flexmock
 from marshmallow import ValidationError
+from packit.config import CommonPackageConfig, PackageConfig
 from packit.exceptions import PackitConfigException
 
 from packit_service import package_config_getter
@@ -13,7 +14,7 @@ from packit_service.config import (
     ServiceConfig,
 )
 from packit_service.constants import TESTING_FARM_API_URL
-from packit_service.package_config_getter import PackageConfigGetter
+from packit_service.package_config_getter import PackageConfigGetter, package_config_cache
 from packit_service.worker.reporting import create_issue_if_needed
 
 
@@ -208,6 +209,35 @@ def test_get_package_config_from_repo(
     )
 
 
+def test_get_package_config_from_repo_cached():
+    """Config read from a commit is cached and a fresh instance is returned on a hit."""
+    commit_sha = "f" * 40
+    project = flexmock(
+        service=flexmock(instance_url="https://github.com"),
+        namespace="packit",
+        repo="ogr",
+    )
+    package_config = PackageConfig(
+        packages={"ogr": CommonPackageConfig(specfile_path="python-ogr.spec")},
+    )
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        flexmock(package_config_path_override=None, package_config_cache_in_redis=False),
+    )
+    flexmock(package_config_getter).should_receive("get_package_config_from_repo").with_args(
+        project=project,
+        ref=commit_sha,
+        package_config_path=None,
+    ).once().and_return(package_config)
+
+    first = PackageConfigGetter.get_package_config_from_repo(project=project, reference=commit_sha)
+    second = PackageConfigGetter.get_package_config_from_repo(project=project, reference=commit_sha)
+
+    assert first is package_config
+    assert second == package_config
+    assert second is not package_config
+    assert (package_config_cache.hits, package_config_cache.misses) == (1, 1)
+
+
 def test_get_package_config_from_repo_no_project():
     """When neither a project nor a base_project is provided,
     None is returned and no exception is raised.
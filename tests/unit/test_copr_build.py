@@ -7,7 +7,6 @@ from typing import Optional
 
 import packit
 import pytest
-from celery import Celery
 from copr.v3 import Client, CoprAuthException
 from copr.v3.proxies.build import BuildProxy
 from flexmock import flexmock
@@ -51,7 +50,6 @@ from packit_service.models import (
     GitProjectModel,
     ProjectEventModel,
     ProjectEventModelType,
-    PullRequestModel,
     SRPMBuildModel,
 )
 from packit_service.worker.celery_task import CeleryTask
@@ -331,7 +329,10 @@ def test_run_copr_build_from_source_script(github_pr_event, srpm_build_deps):
         ),
     )
 
-    flexmock(Celery).should_receive("send_task").once()
+    flexmock(CoprBuildTargetModel).should_receive("schedule_status_check").with_args(
+        2,
+        datetime,
+    ).once()
     handler = CoprBuildHandler(
         package_config=helper.package_config,
         job_config=helper.job_config,
@@ -608,7 +609,10 @@ def test_handle_rpm_build_start(github_pr_event, sync_test_job_statuses_with_bui
     target.should_receive("set_build_id").with_args("1").once()
     target.should_receive("set_web_url").with_args(web_url).once()
 
-    flexmock(Celery).should_receive("send_task").once()
+    flexmock(CoprBuildTargetModel).should_receive("schedule_status_check").with_args(
+        1,
+        datetime,
+    ).once()
     helper.handle_rpm_build_start(flexmock(grouped_targets=[target]), 1, "copr-url")
 
 
@@ -1005,15 +1009,14 @@ def test_check_if_actor_can_run_job_and_report(jobs, should_pass):
         id=123,
         project_event_model_type=ProjectEventModelType.pull_request,
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=123,
-        commit_sha="abcdef",
-    ).and_return(
-        flexmock().should_receive("get_project_event_object").and_return(db_project_object).mock(),
-    )
-    flexmock(PullRequestModel).should_receive("get_or_create").and_return(
-        db_project_object,
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").and_return(
+        (
+            db_project_object,
+            flexmock()
+            .should_receive("get_project_event_object")
+            .and_return(db_project_object)
+            .mock(),
+        )
     )
 
     gh_project = flexmock(namespace="n", repo="r")
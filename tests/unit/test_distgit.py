@@ -1,7 +1,9 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 import json
+from contextlib import nullcontext
 
+import git
 import pytest
 from fasjson_client import Client
 from flexmock import flexmock
@@ -9,6 +11,7 @@ from ogr.parsing import parse_git_repo
 from ogr.services.github import GithubService
 from packit.api import PackitAPI
 from packit.config.notifications import NotificationsConfig
+from packit.exceptions import PackitException
 
 from packit_service.events.event_data import EventData
 from packit_service.worker.checker.run_condition import IsRunConditionSatisfied
@@ -249,3 +252,87 @@ def test_filter_tags(tags, upstream_tag_include, upstream_tag_exclude, expected)
         None,
     )
     assert handler._filter_tags(tags) == expected
+
+
+def test_get_packit_apis_for_branches(tmp_path):
+    repo = git.Repo.init(tmp_path / "dist-git", initial_branch="rawhide")
+    repo.index.commit("Initial commit")
+    repo.create_head("f40")
+
+    handler = DownstreamKojiBuildHandler(
+        None,
+        flexmock(scratch=False),
+        {"event_type": "unknown", "git_ref": "rawhide"},
+        None,
+    )
+    packit_api = flexmock(
+        dg=flexmock(
+            local_project=flexmock(git_repo=repo, git_project=None, git_url=None),
+        ),
+    )
+    flexmock(DownstreamKojiBuildHandler).should_receive("packit_api").and_return(packit_api)
+    flexmock(DownstreamKojiBuildHandler).should_receive("service_config").and_return(
+        flexmock(command_handler_work_dir=str(tmp_path)),
+    )
+    flexmock(PackitAPI).should_receive("init_kerberos_ticket").twice()
+
+    with handler.get_packit_apis_for_branches(["rawhide"]) as packit_apis:
+        assert packit_apis == {"rawhide": packit_api}
+
+    with handler.get_packit_apis_for_branches(["rawhide", "f40"]) as packit_apis:
+        working_dirs = {
+            branch: api.downstream_local_project.working_dir for branch, api in packit_apis.items()
+        }
+        assert len(set(working_dirs.values())) == 2
+        # each branch can be checked out in its own worktree at the same time
+        for branch, api in packit_apis.items():
+            api.downstream_local_project.git_repo.git.switch(branch)
+
+    assert not any(working_dir.exists() for working_dir in working_dirs.values())
+    assert len(repo.git.worktree("list").splitlines()) == 1
+
+
+def test_run_for_targets_concurrently():
+    class Test(AbstractSyncReleaseHandler):
+        pass
+
+    handler = Test(None, None, {"event_type": "unknown"}, None)
+    flexmock(Test).should_receive("service_config").and_return(
+        flexmock(sync_release_concurrency=2),
+    )
+    targets = [flexmock(branch=branch) for branch in ("rawhide", "f41", "f40", "f39")]
+    run_model = flexmock(sync_release_targets=targets)
+
+    # the first branch is synced alone
+    flexmock(handler).should_receive("run_for_target").with_args(
+        run_model,
+        targets[0],
+        tag="1.0.0",
+        version=None,
+    ).and_return("rawhide failed").once()
+    # f41 was already processed
+    flexmock(handler).should_receive("start_target").replace_with(
+        lambda model: None if model.branch == "f41" else f"url-{model.branch}",
+    )
+    packit_api = flexmock()
+    flexmock(handler).should_receive("get_packit_apis_for_branches").with_args(
+        ["f40", "f39"],
+    ).and_return(nullcontext({"f40": packit_api, "f39": packit_api})).once()
+    flexmock(handler).should_receive("get_sync_release_kwargs").replace_with(
+        lambda branch, tag, version: {"dist_git_branch": branch, "tag": tag},
+    )
+    flexmock(handler).should_receive("sync_branch_concurrently").replace_with(
+        lambda packit_api, kwargs: (
+            (None, PackitException("f39 failed"), "logs")
+            if kwargs["dist_git_branch"] == "f39"
+            else ((flexmock(), {}), None, "logs")
+        ),
+    ).twice()
+    flexmock(handler).should_receive("finish_target").replace_with(
+        lambda model, url, collect_logs, result, exception: (str(exception) if exception else None),
+    ).twice()
+
+    assert handler.run_for_targets_concurrently(run_model, tag="1.0.0") == {
+        "rawhide": "rawhide failed",
+        "f39": "f39 failed",
+    }
@@ -0,0 +1,91 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import json
+import time
+from contextlib import nullcontext
+
+import pytest
+from flexmock import flexmock
+
+from packit_service.service import ingress
+from packit_service.service.ingress import (
+    PublishingFailed,
+    WebhookPublisher,
+    strip_payload,
+)
+from tests.spellbook import DATA_DIR
+
+
+def test_strip_payload():
+    event = json.loads((DATA_DIR / "webhooks" / "github" / "push.json").read_text())
+
+    stripped = strip_payload(event)
+
+    assert stripped["ref"] == event["ref"]
+    assert stripped["repository"]["owner"]["login"] == event["repository"]["owner"]["login"]
+    assert "hooks_url" not in stripped["repository"]
+    assert len(stripped["commits"]) == len(event["commits"])
+    assert all("modified" not in commit for commit in stripped["commits"])
+    assert len(json.dumps(stripped)) < len(json.dumps(event)) / 2
+
+
+def test_publish():
+    producer = flexmock()
+    flexmock(ingress.celery_app).should_receive("producer_or_acquire").and_return(
+        nullcontext(producer),
+    )
+    flexmock(ingress.celery_app).should_receive("send_task").with_args(
+        name="task.steve_jobs.process_message",
+        kwargs={
+            "event": {"action": "opened", "number": 1},
+            "source": "github",
+            "event_type": "pull_request",
+        },
+        compression="zlib",
+        producer=producer,
+    ).once()
+
+    WebhookPublisher().publish(
+        event={"action": "opened", "number": 1, "hook_id": 42},
+        source="github",
+        event_type="pull_request",
+        received=time.monotonic(),
+    )
+
+
+def test_publish_failed():
+    flexmock(ingress.celery_app).should_receive("producer_or_acquire").and_return(
+        nullcontext(flexmock()),
+    )
+    flexmock(ingress.celery_app).should_receive("send_task").and_raise(ConnectionError)
+
+    with pytest.raises(PublishingFailed):
+        WebhookPublisher().publish(
+            event={"action": "opened"},
+            source="github",
+            event_type="pull_request",
+            received=time.monotonic(),
+        )
+
+
+def test_publish_batch():
+    flexmock(ingress.celery_app).should_receive("producer_or_acquire").and_return(
+        nullcontext(flexmock()),
+    ).once()
+    results = iter([None, ConnectionError("Connection refused")])
+
+    def send_task(**_):
+        if isinstance(result := next(results), Exception):
+            raise result
+
+    flexmock(ingress.celery_app).should_receive("send_task").replace_with(send_task)
+    batch = [
+        ({"event": {}, "source": "gitlab", "event_type": "Push Hook"}, time.monotonic(), future)
+        for future in (ingress.Future(), ingress.Future())
+    ]
+
+    WebhookPublisher.publish_batch(batch)
+
+    assert batch[0][2].result() is None
+    assert isinstance(batch[1][2].exception(), ConnectionError)
@@ -14,6 +14,7 @@ from packit.config import (
     JobType,
     PackageConfig,
 )
+from packit.config.requirements import LabelRequirementsConfig, RequirementsConfig
 
 from packit_service.config import ServiceConfig
 from packit_service.constants import COMMENT_REACTION
@@ -3364,6 +3365,77 @@ def test_get_jobs_matching_trigger(
     assert result == SteveJobs(event).get_jobs_matching_event()
 
 
+def test_get_jobs_matching_trigger_labels_fetched_once():
+    jobs = [
+        JobConfig(
+            type=JobType.copr_build,
+            trigger=JobConfigTriggerType.pull_request,
+            packages={
+                "package": CommonPackageConfig(
+                    require=RequirementsConfig(label=LabelRequirementsConfig(present=["build"])),
+                ),
+            },
+        ),
+        JobConfig(
+            type=JobType.tests,
+            trigger=JobConfigTriggerType.pull_request,
+            packages={
+                "package": CommonPackageConfig(
+                    require=RequirementsConfig(
+                        label=LabelRequirementsConfig(absent=["skip-tests"])
+                    ),
+                ),
+            },
+        ),
+        JobConfig(
+            type=JobType.tests,
+            trigger=JobConfigTriggerType.pull_request,
+            packages={
+                "package": CommonPackageConfig(
+                    identifier="skipped",
+                    require=RequirementsConfig(
+                        label=LabelRequirementsConfig(present=["skip-tests"])
+                    ),
+                ),
+            },
+        ),
+    ]
+    labels_fetched = []
+
+    class PullRequest:
+        id = 1
+
+        @property
+        def labels(self):
+            labels_fetched.append(True)
+            return [flexmock(name="build")]
+
+    pull_request = PullRequest()
+
+    class Event(github.pr.Action):
+        def __init__(self):
+            pass
+
+        @property
+        def job_config_trigger_type(self):
+            return JobConfigTriggerType.pull_request
+
+        @property
+        def packages_config(self):
+            return flexmock(get_job_views=lambda: jobs)
+
+        @property
+        def pull_request_object(self):
+            return pull_request
+
+    steve = SteveJobs(Event())
+    assert steve.get_jobs_matching_event() == jobs[:2]
+    # the matching is done once per event
+    assert steve.get_config_for_handler_kls(CoprBuildHandler) == jobs[:1]
+    assert steve.get_config_for_handler_kls(TestingFarmHandler) == jobs[1:2]
+    assert len(labels_fetched) == 1
+
+
 @pytest.mark.parametrize(
     "event_kls,jobs,handler_kls,tasks_created,identifier",
     [
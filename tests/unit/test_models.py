@@ -5,11 +5,17 @@ from datetime import datetime, timedelta
 
 import pytest
 from flexmock import flexmock
+from sqlalchemy import create_engine, text
 
+from packit_service.config import ServiceConfig
 from packit_service.models import (
+    MonitoredQueuePool,
+    ProjectIdSet,
     TestingFarmResult,
     filter_most_recent_target_models_by_status,
     filter_most_recent_target_names_by_status,
+    get_engine,
+    get_engine_options,
 )
 
 
@@ -65,3 +71,84 @@ def test_filter_most_recent_target_names_by_status(models):
         models,
         [TestingFarmResult.passed],
     ) == {("target-a", "")}
+
+
+@pytest.mark.parametrize(
+    "config_options, concurrency, expected_options",
+    [
+        pytest.param(
+            {},
+            "1",
+            {"pool_pre_ping": True, "pool_size": 5},
+            id="defaults",
+        ),
+        pytest.param(
+            {},
+            "16",
+            {"pool_pre_ping": True, "pool_size": 16},
+            id="defaults, concurrent worker",
+        ),
+        pytest.param(
+            {
+                "db_pool_size": 20,
+                "db_max_overflow": 0,
+                "db_pool_recycle": 1800,
+                "db_pool_pre_ping": False,
+            },
+            "16",
+            {"pool_pre_ping": False, "pool_size": 20, "max_overflow": 0, "pool_recycle": 1800},
+            id="configured",
+        ),
+    ],
+)
+def test_get_engine_options(monkeypatch, config_options, concurrency, expected_options):
+    monkeypatch.setenv("CONCURRENCY", concurrency)
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        ServiceConfig(**config_options),
+    )
+
+    options = get_engine_options()
+
+    assert options.pop("poolclass") is MonitoredQueuePool
+    options.pop("echo")
+    assert options == expected_options
+
+
+def test_get_engine():
+    get_engine.cache_clear()
+    # the config is read when the engine is first used, not on import
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        ServiceConfig(db_pool_size=20),
+    ).once()
+
+    try:
+        engine = get_engine()
+        assert get_engine() is engine
+        assert engine.pool.size() == 20
+    finally:
+        get_engine.cache_clear()
+
+
+def test_monitored_queue_pool(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", poolclass=MonitoredQueuePool)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert engine.pool.checkedout() == 1
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert engine.pool.checkedout() == 0
+    assert engine.pool.checkouts == 2
+    assert 0 <= engine.pool.max_checkout_wait_time <= engine.pool.checkout_wait_time
+
+
+def test_project_id_set():
+    projects = ProjectIdSet.from_ids([1, 8, 1000])
+    other_projects = ProjectIdSet.from_ids([8, 9])
+
+    assert len(ProjectIdSet()) == 0
+    assert len(projects) == 3
+    assert set(projects | other_projects) == {1, 8, 9, 1000}
+    assert set(projects - other_projects) == {1, 1000}
+    assert projects == ProjectIdSet.from_ids([1000, 1, 8, 8])
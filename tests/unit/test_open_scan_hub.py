@@ -96,38 +96,39 @@ def prepare_openscanhub_db_and_handler(
 
 
 @pytest.mark.parametrize(
-    "build_models",
+    "base_srpm_builds",
     [
+        [(["abcdef"], flexmock(url="base-srpm-url"))],
         [
-            (
-                "abcdef",
-                [flexmock(identifier=None, get_srpm_build=lambda: flexmock(url="base-srpm-url"))],
-            )
+            (["abcdef"], None),
+            (["fedcba"], flexmock(url="base-srpm-url")),
         ],
         [
-            ("abcdef", []),
-            (
-                "fedcba",
-                [flexmock(identifier=None, get_srpm_build=lambda: flexmock(url="base-srpm-url"))],
-            ),
+            (["abcdef"], None),
+            (["fedcba"], None),
+            (["012345"], flexmock(url="base-srpm-url")),
         ],
     ],
 )
-def test_handle_scan(build_models):
+def test_handle_scan(base_srpm_builds):
+    # the history of the target branch is searched one commit at a time
+    flexmock(open_scan_hub, OPEN_SCAN_HUB_BASE_BUILD_COMMITS_CHUNK=1)
     srpm_mock = flexmock(url="https://some-url/my-srpm.src.rpm")
     flexmock(copr.CoprBuild).should_receive("from_event_dict").and_return(
         flexmock(chroot="fedora-rawhide-x86_64", build_id="123", pr_id=12),
     )
     flexmock(open_scan_hub).should_receive("download_file").twice().and_return(True)
 
-    for commit_sha, models in build_models:
-        flexmock(CoprBuildTargetModel).should_receive("get_all_by").with_args(
-            commit_sha=commit_sha,
+    for commit_shas, base_srpm_build in base_srpm_builds:
+        flexmock(CoprBuildTargetModel).should_receive(
+            "get_latest_srpm_build_for_commits",
+        ).with_args(
+            commit_shas=commit_shas,
             project_name="commit-project",
             owner="user-123",
             target="fedora-rawhide-x86_64",
             status=BuildStatus.success,
-        ).and_return(models).once()
+        ).and_return(base_srpm_build).once()
 
     flexmock(PackitAPI).should_receive("run_osh_build").once().and_return(
         'some\nmultiline\noutput\n{"id": 123}\nand\nmore\n{"url": "scan-url"}\n',
@@ -153,7 +154,7 @@ def test_handle_scan(build_models):
             target_branch="main",
             target_branch_head_commit="abcdef",
         ),
-        get_commits=lambda ref: ["abcdef", "fedcba"],
+        get_commits=lambda ref: ["abcdef", "fedcba", "012345"],
     )
 
     CoprOpenScanHubHelper(
@@ -0,0 +1,170 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+
+from packit_service.service.ingress import strip_payload
+from packit_service.worker.parser import Parser
+from tests.spellbook import DATA_DIR, squash_the_message_structure_like_listener
+
+
+def load_event(path: str) -> dict:
+    event = json.loads((DATA_DIR / path).read_text())
+    if "body" in event or "msg" in event:
+        return squash_the_message_structure_like_listener(event)
+    return event
+
+
+@pytest.mark.parametrize(
+    "path, parsers",
+    [
+        pytest.param(
+            "webhooks/github/pr.json",
+            ["parse_pr_event"],
+            id="github-pr",
+        ),
+        pytest.param(
+            "webhooks/github/pr_comment_copr_build.json",
+            [
+                "parse_pull_request_comment_event",
+                "parse_issue_comment_event",
+                "parse_installation_event",
+                "parse_commit_comment_event",
+            ],
+            id="github-pr-comment",
+        ),
+        pytest.param(
+            "webhooks/github/push.json",
+            ["parse_github_push_event"],
+            id="github-push",
+        ),
+        pytest.param(
+            "webhooks/github/checkrun_rerequested.json",
+            ["parse_check_rerun_event", "parse_installation_event"],
+            id="github-check-rerun",
+        ),
+        pytest.param(
+            "webhooks/gitlab/mr_event.json",
+            ["parse_mr_event"],
+            id="gitlab-mr",
+        ),
+        pytest.param(
+            "webhooks/gitlab/mr_comment.json",
+            [
+                "parse_merge_request_comment_event",
+                "parse_gitlab_issue_comment_event",
+                "parse_gitlab_commit_comment_event",
+            ],
+            id="gitlab-note",
+        ),
+        pytest.param(
+            "webhooks/gitlab/tag_push.json",
+            ["parse_gitlab_tag_push_event"],
+            id="gitlab-tag-push",
+        ),
+        pytest.param(
+            "webhooks/testing_farm/notification.json",
+            ["parse_testing_farm_results_event"],
+            id="testing-farm",
+        ),
+        pytest.param(
+            "fedmsg/copr_build_end.json",
+            ["parse_copr_event"],
+            id="copr",
+        ),
+        pytest.param(
+            "fedmsg/koji_build_scratch_end.json",
+            ["parse_koji_task_event"],
+            id="koji-task",
+        ),
+        pytest.param(
+            "fedmsg/koji_build_completed_rawhide.json",
+            ["parse_koji_build_event"],
+            id="koji-build",
+        ),
+        pytest.param(
+            "fedmsg/koji_build_tagged.json",
+            ["parse_koji_build_tag_event"],
+            id="koji-tag",
+        ),
+        pytest.param(
+            "fedmsg/distgit_commit.json",
+            ["parse_pagure_push_event"],
+            id="pagure-push",
+        ),
+        pytest.param(
+            "fedmsg/pagure_pr_flag_updated.json",
+            ["parse_pagure_pr_flag_event"],
+            id="pagure-pr-flag",
+        ),
+        pytest.param(
+            "fedmsg/pagure_pr_comment.json",
+            ["parse_pagure_pull_request_comment_event"],
+            id="pagure-pr-comment",
+        ),
+        pytest.param(
+            "fedmsg/pagure_pr_rebased.json",
+            ["parse_pagure_pull_request_event"],
+            id="pagure-pr",
+        ),
+        pytest.param(
+            "fedmsg/new_hotness_update.json",
+            ["parse_new_hotness_update_event"],
+            id="new-hotness",
+        ),
+        pytest.param(
+            "fedmsg/anitya_version_update.json",
+            ["parse_anitya_version_update_event"],
+            id="anitya",
+        ),
+        pytest.param(
+            "fedmsg/open_scan_hub_task_started.json",
+            ["parse_openscanhub_task_started_event"],
+            id="openscanhub-started",
+        ),
+        pytest.param(
+            "fedmsg/logdetective_analysis_result.json",
+            ["parse_logdetective_analysis_event"],
+            id="logdetective",
+        ),
+    ],
+)
+def test_get_parsers_for_event(path, parsers):
+    assert [parser.__name__ for parser in Parser.get_parsers_for_event(load_event(path))] == parsers
+
+
+def test_get_parsers_for_unknown_event():
+    assert Parser.get_parsers_for_event({"topic": "org.fedoraproject.prod.bodhi.update"}) == []
+    assert Parser.get_parsers_for_event({"object_kind": "deployment"}) == []
+    assert Parser.parse_event({"zen": "Keep it logically awesome."}) is None
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "webhooks/github/pr.json",
+        "webhooks/github/pr_comment_copr_build.json",
+        "webhooks/github/push_branch.json",
+        "webhooks/github/release.json",
+        "webhooks/github/installation_created.json",
+        "webhooks/github/issue_propose_downstream.json",
+        "webhooks/github/commit_comment.json",
+        "webhooks/gitlab/mr_event.json",
+        "webhooks/gitlab/mr_comment.json",
+        "webhooks/gitlab/push_with_many_commits.json",
+        "webhooks/gitlab/tag_push.json",
+        "webhooks/gitlab/release.json",
+        "webhooks/gitlab/issue_comment.json",
+        "webhooks/gitlab/commit_comment.json",
+        "webhooks/gitlab/mr_pipeline.json",
+    ],
+)
+def test_parse_stripped_webhook(path):
+    event = load_event(path)
+    parsed = Parser.parse_event(event)
+    parsed_stripped = Parser.parse_event(strip_payload(event))
+
+    assert parsed
+    assert {**vars(parsed_stripped), "created_at": None} == {**vars(parsed), "created_at": None}
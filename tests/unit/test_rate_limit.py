@@ -0,0 +1,177 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import time
+
+import pytest
+from flexmock import flexmock
+from ogr.services.github import GithubProject, GithubService
+from ogr.services.gitlab import GitlabService
+
+from packit_service.worker.helpers.rate_limit import (
+    RateLimitBudgets,
+    RateLimitSnapshot,
+)
+
+
+class FakeRedis:
+    """Redis hashes and (optimistic) transactions over them."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(
+            {k.encode(): str(v).encode() for k, v in mapping.items()},
+        )
+
+    def multi(self):
+        pass
+
+    def expireat(self, key, when):
+        pass
+
+    def transaction(self, func, *watches, value_from_callable=False):
+        return func(self)
+
+
+@pytest.fixture()
+def budgets():
+    budgets = RateLimitBudgets()
+    budgets._redis = FakeRedis()
+    return budgets
+
+
+@pytest.fixture()
+def project():
+    return GithubProject(
+        namespace="packit",
+        repo="ogr",
+        service=GithubService(token="token"),
+    )
+
+
+def test_get_key(project):
+    assert RateLimitBudgets.get_key(project) == "https://github.com:packit"
+    gitlab_project = flexmock(
+        service=GitlabService(instance_url="https://gitlab.com"),
+        namespace="packit",
+    )
+    assert RateLimitBudgets.get_key(gitlab_project) == "https://gitlab.com"
+
+
+def test_get_snapshot(project):
+    assert RateLimitBudgets.get_snapshot(project) is None
+
+    requester = flexmock(rate_limiting=(4000, 5000), rate_limiting_resettime=1700000000)
+    project._github_instance = flexmock(requester=requester)
+    flexmock(time).should_receive("time").and_return(1699999000.0)
+    assert RateLimitBudgets.get_snapshot(project) == RateLimitSnapshot(
+        remaining=4000,
+        limit=5000,
+        reset=1700000000.0,
+        observed=1699999000.0,
+    )
+
+
+def test_update(budgets, project):
+    reset = time.time() + 3600
+    flexmock(time).should_receive("time").and_return(1000.0, 1010.0, 1010.0).one_by_one()
+
+    budgets.update(
+        project,
+        RateLimitSnapshot(remaining=5000, limit=5000, reset=reset, observed=1000.0),
+    )
+    budget = budgets.update(
+        project,
+        RateLimitSnapshot(remaining=4900, limit=5000, reset=reset, observed=1010.0),
+    )
+
+    assert budget.remaining == 4900
+    assert budget.window_remaining == 5000
+    # 100 requests in 10 s, smoothed
+    assert budget.consumption_rate == pytest.approx(3.0)
+    assert budget.time_to_exhaustion == pytest.approx(4900 / 3.0)
+    assert budgets.get(project) == budget
+
+
+def test_update_window(budgets, project):
+    reset = time.time() + 60
+    flexmock(time).should_receive("time").and_return(1000.0, 1010.0, 1020.0, 1030.0).one_by_one()
+
+    budgets.update(
+        project,
+        RateLimitSnapshot(remaining=5000, limit=5000, reset=reset, observed=1000.0),
+    )
+    # the rate limit resets later, a new window
+    budget = budgets.update(
+        project,
+        RateLimitSnapshot(remaining=4900, limit=5000, reset=reset + 10, observed=1010.0),
+    )
+    assert budget.window_remaining == 4900
+    assert budget.remaining == 4900
+    assert budget.reset == reset + 10
+
+    # a response older than the last update is ignored
+    budget = budgets.update(
+        project,
+        RateLimitSnapshot(remaining=4990, limit=5000, reset=reset + 10, observed=1005.0),
+    )
+    assert budget.window_remaining == 4900
+    assert budget.remaining == 4900
+    assert budget.updated == 1010.0
+
+    # the same window
+    budget = budgets.update(
+        project,
+        RateLimitSnapshot(remaining=4800, limit=5000, reset=reset + 10, observed=1030.0),
+    )
+    assert budget.window_remaining == 4900
+    assert budget.remaining == 4800
+    assert budget.reset == reset + 10
+
+
+def test_get_reset_budget(budgets, project):
+    budgets.update(
+        project,
+        RateLimitSnapshot(remaining=10, limit=5000, reset=time.time() - 1, observed=time.time()),
+    )
+    assert budgets.get(project) is None
+
+
+def test_acquire_not_paced(budgets, project):
+    reset = time.time() + 3600
+    budgets.update(
+        project,
+        RateLimitSnapshot(remaining=5000, limit=5000, reset=reset, observed=time.time()),
+    )
+
+    assert budgets.acquire(project, threshold=200) == 0
+    assert budgets.get(project).admitted == 1
+
+
+def test_acquire_paced(budgets, project):
+    reset = time.time() + 1000
+    budgets.update(
+        project,
+        RateLimitSnapshot(remaining=1200, limit=5000, reset=reset, observed=time.time()),
+    )
+    key = f"{RateLimitBudgets.REDIS_KEY_PREFIX}:{RateLimitBudgets.get_key(project)}"
+    # consuming 10 requests/s, exhausted in 120 s, 100 requests per task
+    budgets.redis.hset(
+        key,
+        mapping={
+            "consumption_rate": 10.0,
+            "window_remaining": 2200,
+            "admitted": 10,
+            "tokens": 0.0,
+            "tokens_updated": time.time(),
+        },
+    )
+
+    # the rest of the budget (above the threshold) is spread over 1000 s, i.e. 1 request/s
+    assert budgets.acquire(project, threshold=200) == pytest.approx(100, rel=0.05)
+    assert budgets.get(project).admitted == 10
@@ -27,6 +27,7 @@ from packit_service.worker.reporting import (
     StatusReporterGithubChecks,
     StatusReporterGithubStatuses,
     StatusReporterGitlab,
+    StatusUpdate,
     update_message_with_configured_failure_comment_message,
 )
 from packit_service.worker.reporting.news import News
@@ -621,6 +622,124 @@ def test_status_instead_check(
     reporter.set_status(state, title, check_name, url)
 
 
+def test_report_batch_github_check():
+    flexmock(News).should_receive("get_sentence").and_return("Interesting news.")
+    url = "https://dashboard.packit.dev/jobs/copr/1"
+
+    reporter = StatusReporter.get_instance(
+        project=GithubProject(None, None, None),
+        commit_sha="7654321",
+        project_event_id=1,
+        packit_user="packit",
+    )
+    already_set = flexmock(
+        name="testing-farm:fedora-rawhide-x86_64",
+        status=GithubCheckRunStatus.completed,
+        conclusion=GithubCheckRunResult.success,
+        url=url,
+        output=flexmock(
+            title="Tests passed",
+            summary=create_table_content(url, None) + "\n\n---\n*Old news.*",
+        ),
+        raw_check_run=flexmock(id=2),
+    )
+    outdated = flexmock(
+        name="testing-farm:fedora-rawhide-x86_64",
+        status=GithubCheckRunStatus.in_progress,
+        conclusion=None,
+        url=url,
+        output=flexmock(title="Tests are running", summary=""),
+        raw_check_run=flexmock(id=1),
+    )
+    flexmock(GithubProject).should_receive("get_check_runs").with_args(
+        commit_sha="7654321",
+    ).and_return([already_set, outdated]).once()
+
+    flexmock(GithubProject).should_receive("create_check_run").with_args(
+        name="testing-farm:fedora-rawhide-x86_64",
+        commit_sha=str,
+        url=str,
+        external_id=str,
+        status=object,
+        conclusion=object,
+        output=dict,
+    ).never()
+    for chroot in ("fedora-40-x86_64", "fedora-41-x86_64"):
+        flexmock(GithubProject).should_receive("create_check_run").with_args(
+            name=f"testing-farm:{chroot}",
+            commit_sha="7654321",
+            url=url,
+            external_id="1",
+            status=GithubCheckRunStatus.completed,
+            conclusion=GithubCheckRunResult.success,
+            output=create_github_check_run_output(
+                "Tests passed",
+                create_table_content(url, None) + "\n\n---\n*Interesting news.*",
+            ),
+        ).once()
+
+    statuses = [
+        StatusUpdate(f"testing-farm:{chroot}", BaseCommitStatus.success, "Tests passed", url)
+        for chroot in ("fedora-rawhide-x86_64", "fedora-40-x86_64", "fedora-41-x86_64")
+    ]
+    reporter.report_batch(statuses)
+    # the snapshot is kept up to date, nothing is sent again
+    reporter.report_batch(statuses)
+
+
+def test_report_batch_gitlab():
+    reporter = StatusReporter.get_instance(
+        project=GitlabProject(None, None, None),
+        commit_sha="7654321",
+        packit_user="packit",
+    )
+    flexmock(GitlabProject).should_receive("get_commit_statuses").with_args(
+        commit="7654321",
+    ).and_return(
+        [
+            flexmock(
+                context="rpm-build:fedora-rawhide-x86_64",
+                state=CommitStatus.running,
+                comment="Building RPM ...",
+                url="https://dashboard.packit.dev/jobs/copr/1",
+                created=1,
+            ),
+            flexmock(
+                context="rpm-build:fedora-40-x86_64",
+                state=CommitStatus.running,
+                comment="Building RPM ...",
+                url="https://dashboard.packit.dev/jobs/copr/2",
+                created=2,
+            ),
+        ],
+    ).once()
+    flexmock(GitlabProject).should_receive("set_commit_status").with_args(
+        "7654321",
+        CommitStatus.failure,
+        "https://dashboard.packit.dev/jobs/copr/1",
+        "RPM build failed.",
+        "rpm-build:fedora-rawhide-x86_64",
+        trim=True,
+    ).once()
+
+    reporter.report_batch(
+        [
+            StatusUpdate(
+                "rpm-build:fedora-rawhide-x86_64",
+                BaseCommitStatus.error,
+                "RPM build failed.",
+                "https://dashboard.packit.dev/jobs/copr/1",
+            ),
+            StatusUpdate(
+                "rpm-build:fedora-40-x86_64",
+                BaseCommitStatus.running,
+                "Building RPM ...",
+                "https://dashboard.packit.dev/jobs/copr/2",
+            ),
+        ],
+    )
+
+
 def test_create_table():
     assert create_table_content(
         "dashboard.packit.dev-url",
@@ -806,3 +925,29 @@ def test_update_message_with_configured_failure_comment_message(
         ),
     )
     assert update_message_with_configured_failure_comment_message(comment, job_config) == result
+
+
+def test_report_batch_gitlab_comment_fallback():
+    reporter = StatusReporter.get_instance(
+        project=GitlabProject(None, None, None),
+        commit_sha="7654321",
+        packit_user="packit",
+    )
+    flexmock(GitlabProject).should_receive("get_commit_statuses").and_return([]).once()
+
+    exception = GitlabAPIException()
+    exception.__cause__ = GitlabError(response_code=403)
+    flexmock(GitlabProject).should_receive("set_commit_status").and_raise(exception).twice()
+    flexmock(reporter).should_receive("_add_commit_comment_with_status").twice()
+
+    statuses = [
+        StatusUpdate(
+            "rpm-build:fedora-rawhide-x86_64",
+            BaseCommitStatus.error,
+            "RPM build failed.",
+            "https://dashboard.packit.dev/jobs/copr/1",
+        ),
+    ]
+    reporter.report_batch(statuses)
+    # the status has not been set, so it is not skipped the next time
+    reporter.report_batch(statuses)
@@ -0,0 +1,87 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import git
+import pytest
+from flexmock import flexmock
+from packit.utils.repo import RepositoryCache
+
+from packit_service.worker.helpers import disk_cache
+from packit_service.worker.helpers.repository_mirrors import (
+    RepositoryMirrors,
+    get_repository_cache,
+    repository_mirrors_statistics,
+)
+
+
+@pytest.fixture()
+def upstream(tmp_path):
+    repo = git.Repo.init(tmp_path / "upstream" / "cockpit", initial_branch="main")
+    (tmp_path / "upstream" / "cockpit" / "README").write_text("cockpit")
+    repo.index.add(["README"])
+    repo.index.commit("Initial commit")
+    repo.create_tag("1.0")
+    return repo
+
+
+def commit(repo: git.Repo, message: str):
+    readme = f"{repo.working_tree_dir}/README"
+    with open(readme, "a") as f:
+        f.write(message)
+    repo.index.add([readme])
+    return repo.index.commit(message)
+
+
+def test_get_repo(tmp_path, upstream):
+    url = upstream.working_tree_dir
+    mirrors = RepositoryMirrors(tmp_path / "mirrors", disk_budget=1024**3)
+    flexmock(repository_mirrors_statistics, hits=0, misses=0, requests=0, request_time=0.0)
+
+    repo = mirrors.get_repo(url, tmp_path / "first")
+    assert repo.active_branch.name == "main"
+    assert repo.remotes.origin.url == url
+    assert repository_mirrors_statistics.misses == 1
+
+    new_commit = commit(upstream, "Second commit")
+    upstream.create_tag("2.0")
+
+    # the mirror is updated incrementally
+    repo = mirrors.get_repo(url, tmp_path / "second")
+    assert repo.head.commit == new_commit
+    assert {tag.name for tag in repo.tags} == {"1.0", "2.0"}
+    assert repository_mirrors_statistics.hits == 1
+    assert repository_mirrors_statistics.requests == 2
+    assert mirrors.cached_projects == [mirrors.get_mirror_path(url).name]
+
+
+def test_evict(tmp_path, upstream):
+    mirrors = RepositoryMirrors(tmp_path / "mirrors", disk_budget=1024**3)
+    mirrors.get_repo(upstream.working_tree_dir, tmp_path / "clone")
+    mirror = mirrors.get_mirror_path(upstream.working_tree_dir)
+
+    mirrors.disk_budget = 0
+    # the mirror in use is kept
+    with disk_cache.lock(mirror):
+        mirrors.evict()
+    assert mirror.is_dir()
+
+    mirrors.evict()
+    assert not mirror.exists()
+
+
+@pytest.mark.parametrize(
+    "repository_mirrors_path, repository_cache, expected_type",
+    [
+        ("/mirrors", "/cache", RepositoryMirrors),
+        (None, "/cache", RepositoryCache),
+        (None, None, type(None)),
+    ],
+)
+def test_get_repository_cache(repository_mirrors_path, repository_cache, expected_type):
+    service_config = flexmock(
+        repository_mirrors_path=repository_mirrors_path,
+        repository_mirrors_disk_budget=1,
+        repository_cache=repository_cache,
+        add_repositories_to_repository_cache=False,
+    )
+    assert type(get_repository_cache(service_config)) is expected_type
@@ -0,0 +1,121 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+from flexmock import flexmock
+
+from packit_service.worker.helpers import disk_cache
+from packit_service.worker.helpers import srpm_cache as srpm_cache_module
+from packit_service.worker.helpers.srpm_cache import (
+    SRPMCache,
+    SRPMCacheStatistics,
+    get_srpm_cache,
+)
+
+SRPM = b"srpm content" * 1000
+
+
+class SRPMRequestHandler(BaseHTTPRequestHandler):
+    """Serves `SRPM` with an ETag, supports the range requests."""
+
+    requests: ClassVar[list[dict]] = []
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(SRPM)))
+        self.end_headers()
+
+    def do_GET(self):
+        self.requests.append(dict(self.headers))
+        offset = 0
+        if (range_header := self.headers.get("Range")) and self.headers.get("If-Range") == '"v1"':
+            offset = int(range_header.removeprefix("bytes=").removesuffix("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {offset}-{len(SRPM) - 1}/{len(SRPM)}")
+        else:
+            self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(SRPM) - offset))
+        self.end_headers()
+        self.wfile.write(SRPM[offset:])
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture()
+def srpm_url():
+    SRPMRequestHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SRPMRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/my.src.rpm"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def statistics():
+    statistics = SRPMCacheStatistics()
+    flexmock(srpm_cache_module, srpm_cache_statistics=statistics)
+    return statistics
+
+
+def test_fetch_hit_is_hard_link(tmp_path, srpm_url, statistics):
+    cache = SRPMCache(tmp_path / "cache", disk_budget=10 * len(SRPM))
+
+    for i in range(2):
+        path = tmp_path / f"my-{i}.src.rpm"
+        assert cache.fetch(srpm_url, path)
+        assert path.read_bytes() == SRPM
+
+    entry = cache.get_entry_path(srpm_url, '"v1"', str(len(SRPM)))
+    assert os.path.samefile(entry, tmp_path / "my-0.src.rpm")
+    assert os.path.samefile(entry, tmp_path / "my-1.src.rpm")
+    assert len(SRPMRequestHandler.requests) == 1
+    assert (statistics.hits, statistics.misses, statistics.requests) == (1, 1, 2)
+    assert statistics.downloaded_bytes == len(SRPM)
+
+
+def test_fetch_resumes_download(tmp_path, srpm_url, statistics):
+    cache = SRPMCache(tmp_path / "cache", disk_budget=10 * len(SRPM))
+    cache.path.mkdir()
+    entry = cache.get_entry_path(srpm_url, '"v1"', str(len(SRPM)))
+    # interrupted download
+    cache.get_part_path(entry).write_bytes(SRPM[:5000])
+
+    assert cache.fetch(srpm_url, tmp_path / "my.src.rpm")
+
+    assert (tmp_path / "my.src.rpm").read_bytes() == SRPM
+    assert not cache.get_part_path(entry).exists()
+    (request,) = SRPMRequestHandler.requests
+    assert request["Range"] == "bytes=5000-"
+    assert request["If-Range"] == '"v1"'
+    assert statistics.downloaded_bytes == len(SRPM) - 5000
+
+
+def test_evict(tmp_path):
+    cache = SRPMCache(tmp_path, disk_budget=250)
+    for i, name in enumerate(("a.src.rpm", "b.src.rpm", "c.src.rpm.part", "d.src.rpm")):
+        (tmp_path / name).write_bytes(b"x" * 100)
+        os.utime(tmp_path / name, (1000 + i, 1000 + i))
+
+    with disk_cache.lock(tmp_path / "a.src.rpm"):
+        cache.evict()
+
+    # the least recently used SRPM is locked, the next ones are removed instead
+    assert sorted(file.name for file in tmp_path.iterdir() if file.suffix != ".lock") == [
+        "a.src.rpm",
+        "d.src.rpm",
+    ]
+
+
+def test_get_srpm_cache():
+    assert get_srpm_cache(flexmock(srpm_cache_path=None)) is None
+    cache = get_srpm_cache(flexmock(srpm_cache_path="/tmp/srpms", srpm_cache_disk_budget=2))
+    assert cache.disk_budget == 2 * 1024**3
@@ -28,7 +28,6 @@ from packit_service.models import (
     PipelineModel,
     ProjectEventModel,
     ProjectEventModelType,
-    ProjectReleaseModel,
     SyncReleaseJobType,
     SyncReleaseModel,
     SyncReleasePullRequestModel,
@@ -125,18 +124,13 @@ def test_process_message(event, private, enabled_private_namespaces, success):
         .and_return(db_project_object)
         .mock()
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.release,
-        event_id=12,
-        commit_sha="12345",
-    ).and_return(db_project_event)
-    flexmock(ProjectReleaseModel).should_receive("get_or_create").with_args(
+    flexmock(ProjectEventModel).should_receive("add_release_event").with_args(
         tag_name="1.2.3",
         namespace="the-namespace",
         repo_name="the-repo",
         project_url="https://github.com/the-namespace/the-repo",
         commit_hash="12345",
-    ).and_return(db_project_object).times(2 if success else 0)
+    ).times(2 if success else 0).and_return((db_project_object, db_project_event))
     propose_downstream_model = flexmock(sync_release_targets=[])
     flexmock(SyncReleaseModel).should_receive("create_with_new_run").with_args(
         status=SyncReleaseStatus.running,
@@ -2174,15 +2174,14 @@ def test_check_if_actor_can_run_job_and_report(jobs, event, should_pass):
         id=123,
         project_event_model_type=ProjectEventModelType.pull_request,
     )
-    flexmock(ProjectEventModel).should_receive("get_or_create").with_args(
-        type=ProjectEventModelType.pull_request,
-        event_id=123,
-        commit_sha="abcdef",
-    ).and_return(
-        flexmock().should_receive("get_project_event_object").and_return(db_project_object).mock(),
-    )
-    flexmock(PullRequestModel).should_receive("get_or_create").and_return(
-        db_project_object,
+    flexmock(ProjectEventModel).should_receive("add_pull_request_event").and_return(
+        (
+            db_project_object,
+            flexmock()
+            .should_receive("get_project_event_object")
+            .and_return(db_project_object)
+            .mock(),
+        )
     )
 
     gh_project = flexmock(namespace="n", repo="r")
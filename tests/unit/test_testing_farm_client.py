@@ -0,0 +1,93 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import time
+
+import pytest
+from flexmock import flexmock
+
+from packit_service.worker.helpers import testing_farm_client
+from packit_service.worker.helpers.testing_farm_client import (
+    ComposeCatalog,
+    ComposeCatalogCache,
+    TestingFarmClient,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value.encode() if isinstance(value, str) else str(value).encode()
+        return True
+
+
+@pytest.fixture()
+def cache():
+    cache = ComposeCatalogCache(ttl=10, stale_ttl=100)
+    cache._redis = FakeRedis()
+    flexmock(testing_farm_client, compose_catalog_cache=cache)
+    return cache
+
+
+def test_distro2compose_memoized(cache):
+    client = TestingFarmClient(api_url="https://tf", token="token", use_internal_tf=True)
+    response = flexmock(
+        status_code=200,
+        json=lambda: {"composes": [{"name": "Fedora-4\\d-Updated"}, {"name": "CentOS-Stream-9"}]},
+    )
+    flexmock(client).should_receive("send_testing_farm_request").with_args(
+        endpoint="composes/redhat",
+    ).and_return(response).once()
+
+    for _ in range(3):
+        assert client.distro2compose("fedora-41") == "Fedora-41-Updated"
+        assert client.distro2compose("centos-stream-9") == "CentOS-Stream-9"
+        assert client.distro2compose("fedora-39", error_callback=lambda *_: None) is None
+
+    catalog = cache.get("redhat", fetch=lambda: None)
+    assert catalog.distro_composes == {
+        "fedora-41": ("Fedora-41-Updated", True),
+        "centos-stream-9": ("CentOS-Stream-9", True),
+        "fedora-39": ("Fedora-39-Updated", False),
+    }
+    assert (cache.hits, cache.misses, cache.refreshes) == (9, 1, 1)
+
+
+def test_get_shared_via_redis(cache):
+    assert cache.get("public", fetch=lambda: {"Fedora-41"}).composes == {"Fedora-41"}
+
+    # another worker
+    other_cache = ComposeCatalogCache(ttl=10, stale_ttl=100)
+    other_cache._redis = cache.redis
+    catalog = other_cache.get("public", fetch=lambda: pytest.fail("Composes fetched again"))
+    assert catalog.composes == {"Fedora-41"}
+    assert (other_cache.hits, other_cache.misses) == (1, 0)
+
+
+def test_get_stale_while_revalidate(cache):
+    stale_catalog = ComposeCatalog({"Fedora-40"}, fetched=time.time() - 50)
+    cache._catalogs["public"] = stale_catalog
+
+    # the stale catalog is served while it's refreshed in the background
+    assert cache.get("public", fetch=lambda: {"Fedora-41"}) is stale_catalog
+    for _ in range(50):
+        if cache.refreshes:
+            break
+        time.sleep(0.1)
+    assert cache.get("public", fetch=lambda: None).composes == {"Fedora-41"}
+    assert (cache.hits, cache.misses, cache.refreshes) == (2, 0, 1)
+
+
+def test_get_expired(cache):
+    cache._catalogs["public"] = ComposeCatalog({"Fedora-40"}, fetched=time.time() - 500)
+
+    assert cache.get("public", fetch=lambda: None) is None
+    assert cache.get("public", fetch=lambda: {"Fedora-41"}).composes == {"Fedora-41"}
+    assert (cache.hits, cache.misses, cache.refreshes) == (0, 2, 1)
@@ -1,5 +1,10 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import git
 import pytest
 import requests
 from flexmock import flexmock
@@ -7,6 +12,9 @@ from packit.config.aliases import Distro
 
 from packit_service.utils import (
     aliases,
+    collect_packit_logs,
+    create_worktrees,
+    gather_packit_logs_to_buffer,
     get_default_tf_mapping,
     only_once,
     pr_labels_match_configuration,
@@ -236,3 +244,34 @@ def test_verify_artifact_network_failure():
     flexmock(requests).should_receive("get").and_raise(requests.exceptions.ConnectionError)
 
     assert verify_artifact(url) is False
+
+
+def test_create_worktrees(tmp_path):
+    repo = git.Repo.init(tmp_path / "repo", initial_branch="main")
+    repo.index.commit("Initial commit")
+    repo.create_head("f40")
+
+    with create_worktrees(repo, 2, tmp_path) as worktrees:
+        assert len(worktrees) == 2
+        worktrees[0].git.switch("main")
+        worktrees[1].git.switch("f40")
+        working_dirs = [Path(worktree.working_tree_dir) for worktree in worktrees]
+
+    assert not any(working_dir.exists() for working_dir in working_dirs)
+    assert len(repo.git.worktree("list").splitlines()) == 1
+    assert not repo.head.is_detached
+    assert repo.active_branch.name == "main"
+
+
+def test_gather_packit_logs_of_current_thread_only():
+    buffer, handler = gather_packit_logs_to_buffer(
+        logging_level=logging.DEBUG,
+        current_thread_only=True,
+    )
+    logging.getLogger("packit").info("current thread")
+    with ThreadPoolExecutor() as executor:
+        executor.submit(logging.getLogger("packit").info, "another thread").result()
+
+    logs = collect_packit_logs(buffer=buffer, handler=handler)
+    assert "current thread" in logs
+    assert "another thread" not in logs
@@ -32,7 +32,9 @@ from packit_service.models import (
     GithubInstallationModel,
     GitProjectModel,
     IssueModel,
+    JobUsageModel,
     KojiBuildGroupModel,
+    KojiBuildTagModel,
     KojiBuildTargetModel,
     KojiTagRequestGroupModel,
     KojiTagRequestTargetModel,
@@ -42,10 +44,12 @@ from packit_service.models import (
     LogDetectiveRunModel,
     OSHScanModel,
     OSHScanStatus,
+    PackagesConfigModel,
     PipelineModel,
     ProjectAuthenticationIssueModel,
     ProjectEventModel,
     ProjectEventModelType,
+    ProjectEventUsageModel,
     ProjectReleaseModel,
     PullRequestModel,
     SourceGitPRDistGitPRModel,
@@ -224,6 +228,9 @@ def clean_db():
 
         session.query(PipelineModel).delete()
         session.query(ProjectEventModel).delete()
+        session.query(PackagesConfigModel).delete()
+        session.query(ProjectEventUsageModel).delete()
+        session.query(JobUsageModel).delete()
 
         session.query(tf_copr_association_table).delete()
         session.query(tf_koji_association_table).delete()
@@ -244,6 +251,7 @@ def clean_db():
         session.query(ProjectReleaseModel).delete()
         session.query(PullRequestModel).delete()
         session.query(IssueModel).delete()
+        session.query(KojiBuildTagModel).delete()
         session.query(ProjectAuthenticationIssueModel).delete()
 
         session.query(GitProjectModel).delete()
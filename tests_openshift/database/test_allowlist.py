@@ -4,7 +4,7 @@
 # Create multiple allowlist entries
 import pytest
 
-from packit_service.models import AllowlistModel, sa_session_transaction
+from packit_service.models import AllowlistModel, AllowlistStatus, sa_session_transaction
 
 
 @pytest.fixture()
@@ -66,3 +66,25 @@ def test_remove_namespace(clean_before_and_after, multiple_allowlist_entries):
     assert AllowlistModel.get_namespace("Rayquaza").namespace == "Rayquaza"
     AllowlistModel.remove_namespace("Rayquaza")
     assert AllowlistModel.get_namespace("Rayquaza") is None
+
+
+def test_get_namespace_and_parents_statuses(clean_before_and_after):
+    AllowlistModel.add_namespace(namespace="github.com/packit", status="approved_manually")
+    AllowlistModel.add_namespace(namespace="github.com/packit/ogr.git", status="waiting")
+
+    assert AllowlistModel.get_namespace_and_parents_statuses("github.com/packit/ogr.git") == [
+        AllowlistStatus.waiting,
+        AllowlistStatus.approved_manually,
+    ]
+    assert AllowlistModel.get_namespace_and_parents_statuses("github.com/packit/packit.git") == [
+        AllowlistStatus.approved_manually,
+    ]
+    assert AllowlistModel.get_namespace_and_parents_statuses("gitlab.com/packit") == []
+
+    # changes of the allowlist invalidate the cache
+    AllowlistModel.add_namespace(namespace="github.com/packit", status="denied")
+    assert AllowlistModel.get_namespace_and_parents_statuses("github.com/packit/packit.git") == [
+        AllowlistStatus.denied,
+    ]
+    AllowlistModel.remove_namespace("github.com/packit")
+    assert AllowlistModel.get_namespace_and_parents_statuses("github.com/packit/packit.git") == []
@@ -1,12 +1,14 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import pytest
-from sqlalchemy import null
+from sqlalchemy import null, select
 from sqlalchemy.exc import IntegrityError, ProgrammingError
 
+from packit_service import models
 from packit_service.models import (
     BodhiUpdateTargetModel,
     BuildStatus,
@@ -15,17 +17,23 @@ from packit_service.models import (
     GitBranchModel,
     GithubInstallationModel,
     GitProjectModel,
+    IssueModel,
+    JobUsageModel,
     KojiBuildGroupModel,
+    KojiBuildTagModel,
     KojiBuildTargetModel,
     LogDetectiveBuildSystem,
     LogDetectiveResult,
     LogDetectiveRunGroupModel,
     LogDetectiveRunModel,
     OSHScanModel,
+    PackagesConfigModel,
     PipelineModel,
     ProjectAuthenticationIssueModel,
     ProjectEventModel,
     ProjectEventModelType,
+    ProjectEventUsageModel,
+    ProjectIdSet,
     ProjectReleaseModel,
     PullRequestModel,
     Session,
@@ -39,6 +47,10 @@ from packit_service.models import (
     TestingFarmResult,
     TFTTestRunGroupModel,
     TFTTestRunTargetModel,
+    create_session,
+    get_usage_intervals,
+    get_usage_rollup_start,
+    refresh_usage_rollup,
     sa_session_transaction,
 )
 from tests_openshift.conftest import SampleValues
@@ -70,6 +82,60 @@ def test_create_pr_project_event_model(clean_before_and_after, pr_project_event_
     assert pr.pr_id == 342
 
 
+def test_add_project_event_concurrently(clean_before_and_after):
+    def add_events(_):
+        try:
+            return [
+                (project_event_object.id, project_event.id)
+                for project_event_object, project_event in (
+                    ProjectEventModel.add_pull_request_event(
+                        pr_id=SampleValues.pr_id,
+                        namespace=SampleValues.repo_namespace,
+                        repo_name=SampleValues.repo_name,
+                        project_url=SampleValues.project_url,
+                        commit_sha=SampleValues.commit_sha,
+                    ),
+                    ProjectEventModel.add_issue_event(
+                        issue_id=SampleValues.issue_id,
+                        namespace=SampleValues.repo_namespace,
+                        repo_name=SampleValues.repo_name,
+                        project_url=SampleValues.project_url,
+                    ),
+                )
+            ]
+        finally:
+            Session.remove()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(add_events, range(64)))
+
+    assert all(result == results[0] for result in results)
+    with sa_session_transaction() as session:
+        assert session.query(GitProjectModel).count() == 1
+        assert session.query(PullRequestModel).count() == 1
+        assert session.query(IssueModel).count() == 1
+        assert session.query(ProjectEventModel).count() == 2
+
+
+def test_get_or_create_with_null_identifiers(clean_before_and_after):
+    tags = [
+        KojiBuildTagModel.get_or_create(
+            task_id=SampleValues.build_id,
+            koji_tag_name=None,
+            target=None,
+            namespace=None,
+            repo_name=SampleValues.repo_name,
+            project_url=SampleValues.project_url,
+        )
+        for _ in range(2)
+    ]
+
+    assert tags[0].id == tags[1].id
+    with sa_session_transaction() as session:
+        assert session.query(GitProjectModel).count() == 1
+        assert session.query(KojiBuildTagModel).count() == 1
+
+
 def test_create_release_project_event_model(
     clean_before_and_after,
     release_project_event_model,
@@ -141,6 +207,21 @@ def test_get_merged_chroots(clean_before_and_after, too_many_copr_builds):
     assert ["fedora-43-x86_64"] in builds_list[2].target
 
 
+@pytest.mark.parametrize("window", [2, 1000])
+def test_get_merged_chroots_before(
+    clean_before_and_after, too_many_copr_builds, monkeypatch, window
+):
+    monkeypatch.setattr(models, "MERGED_ROWS_ID_WINDOW", window)
+    expected = [build.build_id for build in CoprBuildTargetModel.get_merged_chroots(10, 20)]
+
+    previous_page = list(CoprBuildTargetModel.get_merged_chroots(0, 10))
+    builds_list = list(
+        CoprBuildTargetModel.get_merged_chroots(0, 10, before=previous_page[-1].new_id),
+    )
+    assert [build.build_id for build in builds_list] == expected
+    assert len(builds_list[0].status) == 2
+
+
 def test_get_merged_chroots_filtering(clean_before_and_after, copr_builds_for_filtering):
     """Test that get_merged_chroots properly filters out builds without srpm."""
     merged_builds = list(CoprBuildTargetModel.get_merged_chroots(0, 100))
@@ -190,6 +271,78 @@ def test_get_copr_build(clean_before_and_after, a_copr_build_for_pr):
     assert b4.id == a_copr_build_for_pr.id
 
 
+def test_pop_due_status_checks(clean_before_and_after, multiple_copr_builds):
+    now = datetime.utcnow()
+    CoprBuildTargetModel.schedule_status_check(SampleValues.build_id, now - timedelta(minutes=1))
+    # finished builds are not checked
+    CoprBuildTargetModel.schedule_status_check(
+        SampleValues.different_build_id,
+        now - timedelta(minutes=2),
+    )
+    CoprBuildTargetModel.schedule_status_check(
+        SampleValues.another_different_build_id,
+        None,
+    )
+
+    assert CoprBuildTargetModel.pop_due_status_checks(
+        limit=10,
+        lease=timedelta(minutes=10),
+    ) == [int(SampleValues.build_id)]
+    # leased
+    assert not CoprBuildTargetModel.pop_due_status_checks(limit=10, lease=timedelta(minutes=10))
+
+    CoprBuildTargetModel.schedule_status_check(SampleValues.build_id, None)
+    assert all(
+        build.next_status_check is None
+        for build in CoprBuildTargetModel.get_all_by_build_id(SampleValues.build_id)
+    )
+
+
+def test_update_status_checks(clean_before_and_after, multiple_copr_builds):
+    builds = list(
+        CoprBuildTargetModel.get_all_by_build_ids(
+            [SampleValues.build_id, int(SampleValues.different_build_id)],
+        ),
+    )
+    assert {build.build_id for build in builds} == {
+        SampleValues.build_id,
+        SampleValues.different_build_id,
+    }
+    errored = next(build for build in builds if build.build_id == SampleValues.build_id)
+    next_check = datetime.utcnow().replace(microsecond=0) + timedelta(minutes=5)
+
+    CoprBuildTargetModel.update_status_checks(
+        {
+            int(SampleValues.build_id): next_check,
+            int(SampleValues.different_build_id): None,
+        },
+        errored_ids=[errored.id],
+    )
+
+    for build in CoprBuildTargetModel.get_all_by_build_id(SampleValues.build_id):
+        assert build.next_status_check == next_check
+        assert (build.status == BuildStatus.error) == (build.id == errored.id)
+    assert all(
+        build.next_status_check is None
+        for build in CoprBuildTargetModel.get_all_by_build_id(SampleValues.different_build_id)
+    )
+
+
+def test_get_average_build_durations(clean_before_and_after, multiple_copr_builds):
+    start = datetime.utcnow() - timedelta(hours=1)
+    for build, duration in zip(multiple_copr_builds, (10, 20, 30, 50)):
+        build.set_start_time(start)
+        build.set_end_time(start + timedelta(minutes=duration))
+
+    # the pending build is not taken into account
+    assert CoprBuildTargetModel.get_average_build_durations(sample_size=10) == {
+        SampleValues.target: timedelta(minutes=30),
+    }
+    assert CoprBuildTargetModel.get_average_build_durations(sample_size=1) == {
+        SampleValues.target: timedelta(minutes=50),
+    }
+
+
 def test_copr_build_set_status(clean_before_and_after, a_copr_build_for_pr):
     assert a_copr_build_for_pr.status == BuildStatus.pending
     a_copr_build_for_pr.set_status(BuildStatus.success)
@@ -331,6 +484,14 @@ def test_get_srpm_builds_in_give_range(
     assert builds_list[0].status == "success"
 
 
+def test_get_srpm_builds_before(clean_before_and_after, too_many_copr_builds):
+    builds_list = list(SRPMBuildModel.get_range(0, 10))
+    next_builds_list = list(SRPMBuildModel.get_range(0, 10, before=builds_list[-1].id))
+    assert [build.id for build in next_builds_list] == [
+        build.id for build in SRPMBuildModel.get_range(10, 20)
+    ]
+
+
 def test_get_all_builds(clean_before_and_after, multiple_copr_builds):
     builds_list = list(CoprBuildTargetModel.get_all())
     assert len({builds_list[i].id for i in range(4)})
@@ -470,6 +631,51 @@ def test_copr_get_all_by_ordering_by_id_desc(clean_before_and_after, pr_project_
     assert latest_build.build_id == "10020464"
 
 
+def test_copr_get_latest_srpm_build_for_commits(
+    clean_before_and_after,
+    pr_project_event_model,
+    different_pr_project_event_model,
+):
+    srpm_builds = []
+    for project_event_model in (
+        pr_project_event_model,
+        different_pr_project_event_model,
+        different_pr_project_event_model,
+    ):
+        srpm_build, run_model = SRPMBuildModel.create_with_new_run(
+            project_event_model=project_event_model,
+        )
+        group, _ = CoprBuildGroupModel.create(run_model)
+        CoprBuildTargetModel.create(
+            build_id=str(len(srpm_builds)),
+            project_name=SampleValues.project,
+            owner=SampleValues.owner,
+            web_url=None,
+            target=SampleValues.target,
+            status=BuildStatus.success,
+            copr_build_group=group,
+        )
+        srpm_builds.append(srpm_build)
+
+    def get_latest_srpm_build(commit_shas, status=BuildStatus.success):
+        return CoprBuildTargetModel.get_latest_srpm_build_for_commits(
+            commit_shas=commit_shas,
+            project_name=SampleValues.project,
+            owner=SampleValues.owner,
+            target=SampleValues.target,
+            status=status,
+        )
+
+    # the first commit with a build wins, the latest of its builds
+    assert (
+        get_latest_srpm_build([SampleValues.different_commit_sha, SampleValues.commit_sha]).id
+        == srpm_builds[2].id
+    )
+    assert get_latest_srpm_build(["unknown-sha", SampleValues.commit_sha]).id == srpm_builds[0].id
+    assert not get_latest_srpm_build([SampleValues.commit_sha], status=BuildStatus.failure)
+    assert not get_latest_srpm_build([])
+
+
 def test_multiple_pr_models(clean_before_and_after):
     pr1 = PullRequestModel.get_or_create(
         pr_id=1,
@@ -982,6 +1188,18 @@ def test_merged_chroots_on_tests_without_build(
         assert len(item.test_run_group_id[0]) == 1
 
 
+def test_merged_chroots_on_tests_without_build_before(
+    clean_before_and_after,
+    runs_without_build,
+):
+    (first, second) = PipelineModel.get_merged_chroots(0, 10)
+    assert [
+        run.merged_id for run in PipelineModel.get_merged_chroots(0, 10, before=first.merged_id)
+    ] == [
+        second.merged_id,
+    ]
+
+
 def test_tf_get_all_by_commit_target(clean_before_and_after, multiple_new_test_runs):
     test_list = list(
         TFTTestRunTargetModel.get_all_by_commit_target(
@@ -1215,6 +1433,55 @@ def test_project_event_get_and_reset_older_than_with_packages_config(
     )
 
 
+def test_project_event_packages_config_stored_once(
+    clean_before_and_after,
+    branch_project_event_model,
+    pr_project_event_model,
+):
+    branch_project_event_model.set_packages_config({"key": "value", "other": 1})
+    pr_project_event_model.set_packages_config({"other": 1, "key": "value"})
+
+    assert branch_project_event_model.packages_config == {"key": "value", "other": 1}
+    assert (
+        branch_project_event_model.packages_config_hash
+        == pr_project_event_model.packages_config_hash
+    )
+    with sa_session_transaction() as session:
+        assert session.query(PackagesConfigModel).count() == 1
+
+    PipelineModel.create(project_event=pr_project_event_model)
+    assert [
+        event.id
+        for event in ProjectEventModel.get_and_reset_older_than_with_packages_config(
+            timedelta(days=1),
+        )
+    ] == [branch_project_event_model.id]
+    # still used by the pull request event
+    assert PackagesConfigModel.delete_unreferenced() == 0
+
+    pr_project_event_model.runs[0].datetime = datetime(2024, 4, 8, 12, 0, 0)
+    assert ProjectEventModel.get_and_reset_older_than_with_packages_config(timedelta(days=1))
+    assert PackagesConfigModel.delete_unreferenced() == 1
+    assert pr_project_event_model.packages_config is None
+
+
+def test_delete_unreferenced_packages_config_locked(
+    clean_before_and_after,
+    branch_project_event_model,
+):
+    branch_project_event_model.set_packages_config({"key": "value"})
+    branch_project_event_model.packages_config_hash = None
+    with sa_session_transaction(commit=True) as session:
+        session.add(branch_project_event_model)
+
+    # e.g. being referenced by a concurrent `set_packages_config`
+    with create_session() as session:
+        session.execute(select(PackagesConfigModel).with_for_update())
+        assert PackagesConfigModel.delete_unreferenced() == 0
+
+    assert PackagesConfigModel.delete_unreferenced() == 1
+
+
 def test_create_scan(clean_before_and_after, a_scan):
     assert a_scan.task_id == 123
     assert a_scan.status == "succeeded"
@@ -1827,3 +2094,85 @@ def test_set_log_detective_run_model_status_time_update(clean_before_and_after):
     run = LogDetectiveRunModel.get_by_log_detective_analysis_id("uuid-build-without-time")
 
     assert run.submitted_time == new_time
+
+
+def test_refresh_usage_rollup(clean_before_and_after, pr_project_event_model):
+    assert get_usage_rollup_start() is None
+
+    for _ in range(2):
+        _, run_model = SRPMBuildModel.create_with_new_run(
+            project_event_model=pr_project_event_model,
+        )
+    CoprBuildGroupModel.create(run_model)
+
+    datetime_from = get_usage_rollup_start()
+    assert datetime_from == run_model.datetime.replace(minute=0, second=0, microsecond=0)
+
+    # rolling up the same period again replaces the buckets
+    for _ in range(2):
+        refresh_usage_rollup(datetime_from, datetime_from + timedelta(hours=2))
+
+    with sa_session_transaction() as session:
+        project_event_usage = session.query(ProjectEventUsageModel).all()
+        assert len(project_event_usage) == 1
+        assert project_event_usage[0].bucket == datetime_from
+        assert project_event_usage[0].project_event_type == ProjectEventModelType.pull_request
+        assert project_event_usage[0].event_id == pr_project_event_model.event_id
+
+        job_usage = {usage.job_type: usage.job_runs for usage in session.query(JobUsageModel).all()}
+        assert job_usage == {"srpm_builds": 2, "copr_build_groups": 1}
+
+    assert get_usage_rollup_start() == datetime_from - timedelta(days=1)
+
+
+def test_refresh_usage_rollup_job_in_more_buckets(clean_before_and_after, pr_project_event_model):
+    _, run_model = SRPMBuildModel.create_with_new_run(project_event_model=pr_project_event_model)
+    group, _ = CoprBuildGroupModel.create(run_model)
+    # the same job run by another pipeline an hour later
+    with sa_session_transaction(commit=True) as session:
+        session.add(
+            PipelineModel(
+                project_event_id=run_model.project_event_id,
+                copr_build_group_id=group.id,
+                datetime=run_model.datetime + timedelta(hours=1),
+            ),
+        )
+    bucket = run_model.datetime.replace(minute=0, second=0, microsecond=0)
+
+    # also when the period starts after the first pipeline of the job
+    refresh_usage_rollup(bucket + timedelta(hours=1), bucket + timedelta(hours=3))
+    refresh_usage_rollup(bucket, bucket + timedelta(hours=1))
+
+    with sa_session_transaction() as session:
+        copr_usage = (
+            session.query(JobUsageModel.bucket, JobUsageModel.job_runs)
+            .filter_by(job_type="copr_build_groups")
+            .all()
+        )
+    assert copr_usage == [(bucket, 1)]
+
+
+def test_get_usage_intervals(clean_before_and_after, pr_project_event_model):
+    _, run_model = SRPMBuildModel.create_with_new_run(project_event_model=pr_project_event_model)
+    CoprBuildGroupModel.create(run_model)
+    bucket = run_model.datetime.replace(minute=0, second=0, microsecond=0)
+    refresh_usage_rollup(bucket, bucket + timedelta(hours=1))
+    project_id = pr_project_event_model.get_project_event_object().project_id
+
+    # the pipeline is in the last interval, the first one and in the past
+    for datetime_to, past, intervals in (
+        (bucket + timedelta(hours=1), set(), [set(), {project_id}]),
+        (bucket + timedelta(hours=2), set(), [{project_id}, set()]),
+        (bucket + timedelta(hours=3), {project_id}, [set(), set()]),
+    ):
+        usage = get_usage_intervals.__wrapped__(
+            datetime_to=datetime_to, delta=timedelta(hours=1), count=2
+        )
+
+        assert usage["past_active_projects"] == ProjectIdSet.from_ids(past)
+        assert usage["active_projects"] == [ProjectIdSet.from_ids(ids) for ids in intervals]
+        assert usage["past_job_projects"]["copr_build_groups"] == ProjectIdSet.from_ids(past)
+        assert usage["job_projects"]["srpm_builds"] == usage["active_projects"]
+        assert usage["job_projects"]["koji_build_groups"] == [ProjectIdSet()] * 2
+        assert usage["events"]["pull_request"] == [len(ids) for ids in intervals]
+        assert usage["jobs"]["copr_build_groups"] == [len(ids) for ids in intervals]
@@ -0,0 +1,294 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Plans and latencies of the lookups of the builds and test runs by the commit SHA
+on a synthetic dataset of a million pipelines (`QUERY_PLANS_PIPELINES`).
+
+Every pipeline has its SRPM, Copr, Koji and Testing Farm group with one target,
+two pipelines (e.g. a retrigger) belong to one project event.
+"""
+
+import hashlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from os import getenv
+
+import pytest
+from sqlalchemy import (
+    Select,
+    String,
+    case,
+    cast,
+    event,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    text,
+)
+
+from packit_service.models import (
+    BuildStatus,
+    CoprBuildGroupModel,
+    CoprBuildTargetModel,
+    KojiBuildGroupModel,
+    KojiBuildTargetModel,
+    PipelineModel,
+    ProjectEventModel,
+    ProjectEventModelType,
+    SRPMBuildModel,
+    TestingFarmResult,
+    TFTTestRunGroupModel,
+    TFTTestRunTargetModel,
+    get_engine,
+    sa_session_transaction,
+)
+from tests_openshift.conftest import clean_db
+
+PIPELINES = int(getenv("QUERY_PLANS_PIPELINES", "1000000"))
+# planning and execution time of a single query [ms], generous so that it doesn't
+# depend on the machine
+LATENCY_BUDGET = 250
+
+PROJECTS = 10000
+TARGETS = ("fedora-rawhide-x86_64", "fedora-41-x86_64", "epel-9-x86_64")
+# tables filled with the synthetic data
+SEEDED_TABLES = (
+    "project_events",
+    "srpm_builds",
+    "copr_build_groups",
+    "copr_build_targets",
+    "koji_build_groups",
+    "koji_build_targets",
+    "tft_test_run_groups",
+    "tft_test_run_targets",
+    "pipelines",
+)
+
+
+def insert_rows(session, model, columns: list[str], rows: Select) -> None:
+    """
+    Insert the selected rows into the table of the model and analyze it,
+    the foreign keys referencing it are checked by plans based on its statistics.
+    """
+    table = inspect(model).local_table
+    session.execute(insert(table).from_select(columns, rows))
+    session.execute(text(f"ANALYZE {table.name}"))
+
+
+def seed(session) -> None:
+    i = func.generate_series(1, PIPELINES).column_valued("i")
+    event_i = func.generate_series(1, (PIPELINES + 1) // 2).column_valued("i")
+    project_name = literal("project-") + cast(i % PROJECTS, String)
+    target = case(dict(enumerate(TARGETS)), value=i % 3)
+
+    insert_rows(
+        session,
+        ProjectEventModel,
+        ["id", "type", "event_id", "commit_sha"],
+        select(
+            event_i,
+            literal(ProjectEventModelType.pull_request, ProjectEventModel.type.type),
+            event_i,
+            func.md5(cast(event_i, String)),
+        ),
+    )
+    insert_rows(
+        session,
+        SRPMBuildModel,
+        ["id", "status", "url"],
+        select(
+            i,
+            literal(BuildStatus.success, SRPMBuildModel.status.type),
+            literal("https://copr.fedorainfracloud.org/srpm-") + cast(i, String),
+        ),
+    )
+    for group_model in (CoprBuildGroupModel, KojiBuildGroupModel, TFTTestRunGroupModel):
+        insert_rows(session, group_model, ["id"], select(i))
+    insert_rows(
+        session,
+        CoprBuildTargetModel,
+        ["id", "build_id", "status", "target", "project_name", "owner", "copr_build_group_id"],
+        select(
+            i,
+            cast(i, String),
+            literal(BuildStatus.success, CoprBuildTargetModel.status.type),
+            target,
+            project_name,
+            literal("packit"),
+            i,
+        ),
+    )
+    insert_rows(
+        session,
+        KojiBuildTargetModel,
+        ["id", "task_id", "status", "target", "scratch", "koji_build_group_id"],
+        select(i, cast(i, String), literal("success"), target, literal(True), i),
+    )
+    insert_rows(
+        session,
+        TFTTestRunTargetModel,
+        ["id", "pipeline_id", "status", "target", "tft_test_run_group_id"],
+        select(
+            i,
+            cast(i, String),
+            literal(TestingFarmResult.passed, TFTTestRunTargetModel.status.type),
+            target,
+            i,
+        ),
+    )
+    insert_rows(
+        session,
+        PipelineModel,
+        [
+            "id",
+            "project_event_id",
+            "srpm_build_id",
+            "copr_build_group_id",
+            "koji_build_group_id",
+            "test_run_group_id",
+        ],
+        select(i, (i + 1) // 2, i, i, i, i),
+    )
+
+
+def truncate_seeded_tables() -> None:
+    """
+    Remove all the rows of the seeded tables (`clean_db` keeps some of them,
+    e.g. the Koji build groups) and restart their IDs, which the seed sets
+    explicitly without advancing the sequences.
+    """
+    with sa_session_transaction(commit=True) as session:
+        session.execute(text(f"TRUNCATE {', '.join(SEEDED_TABLES)} RESTART IDENTITY CASCADE"))
+
+
+@pytest.fixture(scope="module")
+def pipelines():
+    clean_db()
+    truncate_seeded_tables()
+    with sa_session_transaction(commit=True) as session:
+        seed(session)
+    with get_engine().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for table in SEEDED_TABLES:
+            connection.execute(text(f"VACUUM ANALYZE {table}"))
+    yield
+    truncate_seeded_tables()
+
+
+@contextmanager
+def captured_queries() -> Iterator[list[tuple[str, dict]]]:
+    """Capture the SQL statements (and their parameters) sent to the database."""
+    queries = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        queries.append((statement, parameters))
+
+    event.listen(get_engine(), "before_cursor_execute", capture)
+    try:
+        yield queries
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", capture)
+
+
+def explain(statement: str, parameters: dict) -> dict:
+    with get_engine().connect() as connection:
+        (plan,) = connection.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}",
+            parameters,
+        ).scalar()
+    return plan
+
+
+def get_nodes(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from get_nodes(child)
+
+
+# a pipeline in the middle of the dataset
+PIPELINE = PIPELINES // 2
+COMMIT_SHA = hashlib.md5(str((PIPELINE + 1) // 2).encode()).hexdigest()
+TARGET = TARGETS[PIPELINE % 3]
+PROJECT_NAME = f"project-{PIPELINE % PROJECTS}"
+
+
+@pytest.mark.parametrize(
+    "lookup, expected_indexes",
+    [
+        pytest.param(
+            lambda commit_sha: CoprBuildTargetModel.get_all_by(
+                commit_sha=commit_sha,
+                project_name=PROJECT_NAME,
+                owner="packit",
+                target=TARGET,
+                status=BuildStatus.success,
+            ).all(),
+            {"ix_project_events_commit_sha_id"},
+            id="copr_get_all_by",
+        ),
+        pytest.param(
+            lambda commit_sha: CoprBuildTargetModel.get_all_by_commit(commit_sha).all(),
+            {
+                "ix_project_events_commit_sha_id",
+                "ix_pipelines_project_event_id_copr_build_group_id",
+                "ix_copr_build_targets_copr_build_group_id_project_name_target",
+            },
+            id="copr_get_all_by_commit",
+        ),
+        pytest.param(
+            lambda commit_sha: CoprBuildTargetModel.get_latest_srpm_build_for_commits(
+                commit_shas=[commit_sha],
+                project_name=PROJECT_NAME,
+                owner="packit",
+                target=TARGET,
+                status=BuildStatus.success,
+            ),
+            set(),
+            id="copr_get_latest_srpm_build_for_commits",
+        ),
+        pytest.param(
+            lambda commit_sha: TFTTestRunTargetModel.get_all_by_commit_target(
+                commit_sha=commit_sha,
+                target=TARGET,
+            ).all(),
+            {
+                "ix_project_events_commit_sha_id",
+                "ix_pipelines_project_event_id_test_run_group_id",
+                "ix_tft_test_run_targets_tft_test_run_group_id_target",
+            },
+            id="tft_get_all_by_commit_target",
+        ),
+        pytest.param(
+            lambda commit_sha: (
+                KojiBuildTargetModel.get_last_successful_scratch_by_commit_target(
+                    commit_sha=commit_sha,
+                    target=TARGET,
+                )
+            ),
+            {
+                "ix_project_events_commit_sha_id",
+                "ix_pipelines_project_event_id_koji_build_group_id",
+                "ix_koji_build_targets_koji_build_group_id_target",
+            },
+            id="koji_get_last_successful_scratch_by_commit_target",
+        ),
+    ],
+)
+def test_lookup_by_commit(pipelines, lookup, expected_indexes):
+    with captured_queries() as queries:
+        assert lookup(COMMIT_SHA)
+
+    (query,) = (query for query in queries if query[0].lstrip().startswith("SELECT"))
+    plan = explain(*query)
+    nodes = list(get_nodes(plan["Plan"]))
+
+    sequential_scans = {
+        node["Relation Name"]
+        for node in nodes
+        if node["Node Type"] == "Seq Scan" and node["Relation Name"] in SEEDED_TABLES
+    }
+    assert not sequential_scans, f"Sequential scans of {sequential_scans}"
+    assert expected_indexes <= {node.get("Index Name") for node in nodes}
+    assert plan["Planning Time"] + plan["Execution Time"] <= LATENCY_BUDGET
@@ -3,6 +3,7 @@
 
 import logging
 import threading
+from datetime import datetime, timedelta
 
 import pytest
 from celery.canvas import Signature
@@ -35,6 +36,7 @@ from packit_service.models import (
     sa_session_transaction,
 )
 from packit_service.utils import load_package_config
+from packit_service.worker.database import delete_old_data
 from packit_service.worker.handlers import TestingFarmHandler
 from packit_service.worker.handlers.copr import CoprBuildHandler
 from packit_service.worker.helpers.build import babysit
@@ -213,6 +215,9 @@ def test_check_copr_build(clean_before_and_after, packit_build_752):
         BUILD_ID,
         "fedora-rawhide-x86_64",
     ).and_return(chroot_response)
+    flexmock(BuildChrootProxy).should_receive("get_list").with_args(
+        BUILD_ID,
+    ).and_return([chroot_response])
 
     pr = flexmock(source_project=flexmock(), target_branch="main")
     pr.should_receive("get_comments").and_return([])
@@ -518,8 +523,9 @@ def test_copr_build_race_condition_concurrent_packages(
         event_id=pr.id,
         commit_sha=commit_sha,
     )
-    # Store the ID to avoid thread-safety issues with SQLAlchemy sessions
+    # Store the IDs to avoid thread-safety issues with SQLAlchemy sessions
     project_event_id = project_event.id
+    pr_model_id = pr.id
 
     # Package configurations - each package will get a different build_id when submitted
     packages = [
@@ -697,7 +703,7 @@ def test_copr_build_race_condition_concurrent_packages(
                 "project_url": "https://github.com/containers/container-libs",
                 "actor": "packit",
                 "event_id": project_event_id,
-                "pr_id": pr.id,
+                "pr_id": pr_model_id,
                 "commit_sha": commit_sha,
                 "git_ref": commit_sha,
             }
@@ -1195,3 +1201,34 @@ def test_copr_build_race_condition_concurrent_packages(
             f"eln: {group_eln.submitted_time}, "
             f"centos: {group_centos.submitted_time}"
         )
+
+
+def test_delete_old_data(clean_before_and_after, a_copr_build_for_pr):
+    with sa_session_transaction(commit=True) as session:
+        for pipeline in session.query(PipelineModel):
+            pipeline.datetime = datetime.utcnow() - timedelta(days=800)
+            session.add(pipeline)
+
+    # nothing is deleted
+    assert delete_old_data(age="2 years", dry_run=True)
+    assert not delete_old_data(age="2 years", batch_size=1, max_duration=timedelta(0))
+    assert CoprBuildTargetModel.get_by_id(a_copr_build_for_pr.id)
+
+    assert delete_old_data(age="2 years", batch_size=1)
+    with sa_session_transaction() as session:
+        assert not session.query(PipelineModel).count()
+        assert not session.query(ProjectEventModel).count()
+        assert not session.query(PullRequestModel).count()
+        assert not session.query(SRPMBuildModel).count()
+        assert not session.query(CoprBuildGroupModel).count()
+        assert not session.query(CoprBuildTargetModel).count()
+
+
+def test_delete_old_data_group_without_targets(clean_before_and_after):
+    with sa_session_transaction(commit=True) as session:
+        session.add(CoprBuildGroupModel())
+
+    # would never finish if the group was selected as an orphaned target
+    assert delete_old_data(age="2 years", batch_size=1, max_duration=timedelta(minutes=1))
+    with sa_session_transaction() as session:
+        assert not session.query(CoprBuildGroupModel).count()
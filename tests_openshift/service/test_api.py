@@ -1,18 +1,28 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 import datetime
+from urllib.parse import urlencode
 
 import pytest
 from flask import url_for
 from packit.utils import nested_get
+from sqlalchemy import event
 
 from packit_service.models import (
+    BuildStatus,
+    CoprBuildGroupModel,
+    CoprBuildTargetModel,
+    GitProjectModel,
     PipelineModel,
+    SRPMBuildModel,
     SyncReleaseStatus,
     SyncReleaseTargetStatus,
     TestingFarmResult,
+    get_engine,
+    sa_session_transaction,
 )
 from packit_service.service.api.runs import process_runs
+from packit_service.worker.tasks import update_usage_rollup
 from tests_openshift.conftest import SampleValues
 
 
@@ -80,6 +90,53 @@ def test_pagination(client, clean_before_and_after, too_many_copr_builds):
     assert len(response_dict_2) == 30  # three builds, but two unique build ids
 
 
+def test_cursor_pagination(client, clean_before_and_after, too_many_copr_builds):
+    url = url_for("api.copr-builds_copr_builds_list")
+    all_builds = client.get(url + "?per_page=50").json
+    assert len(all_builds) > 20
+
+    response = client.get(url + "?per_page=10")
+    assert response.headers["Content-Range"] == "copr-builds 1-10/*"
+    builds = response.json
+    while "Link" in response.headers:
+        cursor = response.headers["X-Next-Cursor"]
+        assert response.headers["Link"].endswith(f'{urlencode({"cursor": cursor})}>; rel="next"')
+        response = client.get(url + f"?per_page=10&cursor={cursor}")
+        assert response.status_code == 206
+        # the position of a page requested by a cursor is not known
+        assert "Content-Range" not in response.headers
+        builds += response.json
+    assert "X-Next-Cursor" not in response.headers
+
+    # the same builds in the same order, no page overlaps
+    assert [build["build_id"] for build in builds] == [build["build_id"] for build in all_builds]
+
+
+def test_cursor_pagination_projects(client, clean_before_and_after, multiple_forge_projects):
+    GitProjectModel.get_or_create(None, "repo", "https://github.com/repo")
+    url = url_for("api.projects_projects_list")
+    all_projects = client.get(url + "?per_page=50").json
+
+    response = client.get(url + "?per_page=2")
+    projects = response.json
+    while "X-Next-Cursor" in response.headers:
+        response = client.get(url + f"?per_page=2&cursor={response.headers['X-Next-Cursor']}")
+        assert response.status_code in (200, 206)
+        projects += response.json
+
+    # the project without a namespace is listed (last) as well
+    assert [project["project_url"] for project in projects] == [
+        project["project_url"] for project in all_projects
+    ]
+    assert len(projects) == 5
+    assert projects[-1]["namespace"] is None
+
+
+def test_cursor_pagination_invalid_cursor(client):
+    response = client.get(url_for("api.copr-builds_copr_builds_list") + "?cursor=invalid")
+    assert response.status_code == 400
+
+
 # Test detailed build info
 def test_detailed_copr_build_info(client, clean_before_and_after, a_copr_build_for_pr):
     response = client.get(
@@ -557,6 +614,56 @@ def test_process_runs_without_build(clean_before_and_after, runs_without_build):
         assert item["trigger"]
 
 
+def count_queries_of_process_runs(first: int, last: int) -> tuple[int, list[dict]]:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    # start with an empty identity map, as the API does
+    with sa_session_transaction() as session:
+        session.expunge_all()
+
+    event.listen(get_engine(), "before_cursor_execute", before_cursor_execute)
+    try:
+        result = process_runs(PipelineModel.get_merged_chroots(first, last))
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", before_cursor_execute)
+    return len(statements), result
+
+
+def test_process_runs_query_count(clean_before_and_after, pr_project_event_model):
+    for i in range(10):
+        _, run_model = SRPMBuildModel.create_with_new_run(
+            project_event_model=pr_project_event_model,
+            package_name=SampleValues.package_name,
+        )
+        group, _ = CoprBuildGroupModel.create(run_model)
+        for target in ("fedora-42-x86_64", "fedora-rawhide-x86_64"):
+            CoprBuildTargetModel.create(
+                build_id=str(i),
+                project_name=SampleValues.project,
+                owner=SampleValues.owner,
+                web_url=SampleValues.copr_web_url,
+                target=target,
+                status=BuildStatus.success,
+                copr_build_group=group,
+            )
+
+    queries_for_one_run, result = count_queries_of_process_runs(0, 1)
+    assert len(result) == 1
+    queries_for_all_runs, result = count_queries_of_process_runs(0, 10)
+    assert len(result) == 10
+
+    # the number of queries must not grow with the number of runs on the page
+    assert queries_for_all_runs == queries_for_one_run
+    for item in result:
+        assert item["srpm"]
+        assert len(item["copr"]) == 2
+        assert item["trigger"]["pr_id"] == SampleValues.pr_id
+        assert item["trigger"]["repo_name"] == SampleValues.repo_name
+
+
 def test_propose_downstream_list_releases(
     client,
     clean_before_and_after,
@@ -799,6 +906,11 @@ def test_detailed_pull_from_upstream_without_pr_model(
     assert response_dict["downstream_prs"] == []
 
 
+@pytest.fixture()
+def usage_rollup(full_database):
+    update_usage_rollup()
+
+
 @pytest.mark.parametrize(
     "key_to_check",
     [
@@ -822,6 +934,7 @@ def test_usage_info_structure(
     client,
     clean_before_and_after,
     full_database,
+    usage_rollup,
     key_to_check,
 ):
     response = client.get(url_for("api.usage_usage"))
@@ -830,14 +943,14 @@ def test_usage_info_structure(
     assert nested_get(response_dict, *key_to_check.split("/")) is not None
 
 
-def test_usage_info_datetime(client, clean_before_and_after, full_database):
+def test_usage_info_datetime(client, clean_before_and_after, full_database, usage_rollup):
     response = client.get(url_for("api.usage_usage") + "?to=2022-12-12")
     response_dict = response.json
 
     assert response_dict["active_projects"]["project_count"] == 0
 
 
-def test_usage_info_top(client, clean_before_and_after, full_database):
+def test_usage_info_top(client, clean_before_and_after, full_database, usage_rollup):
     response = client.get(url_for("api.usage_usage") + "?top=0")
     response_dict = response.json
 
@@ -880,6 +993,7 @@ def test_usage_info_values(
     client,
     clean_before_and_after,
     full_database,
+    usage_rollup,
     key_to_check,
     expected_value,
 ):
@@ -893,6 +1007,7 @@ def test_project_usage_info(
     client,
     clean_before_and_after,
     full_database,
+    usage_rollup,
 ):
     response = client.get(
         url_for(